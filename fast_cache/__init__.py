@@ -1,5 +1,11 @@
 from .integration import FastAPICache
-from .backends.backend import CacheBackend
+from .batch import BatchLoader
+from .write_behind import WriteBehindQueue
+from .refresh_ahead import RefreshAheadScheduler
+from .metrics import CacheMetrics, LatencyHistogram
+from .tracing import CacheObserver, OperationEvent, OpenTelemetryObserver
+from .recording import TraceRecord, TraceWriter, read_trace
+from .backends.backend import CacheBackend, CacheEntry, VersionedValue, WrapperBackend
 
 from .backends.redis import RedisBackend
 from .backends.memory import InMemoryBackend
@@ -8,11 +14,25 @@ from .backends.memcached import MemcachedBackend
 from .backends.mongodb import MongoDBBackend
 from .backends.google_firestore import FirestoreBackend
 from .backends.dynamodb import DynamoDBBackend
+from .backends.sync_to_async import SyncToAsyncBackend
+from .backends.metrics import MetricsBackend
+from .backends.tracing import TracingBackend
+from .backends.recording import RecordingBackend
+from .backends.shadow import ShadowBackend
+from .backends.circuit_breaker import CircuitBreaker, CircuitBreakerBackend
+from .backends.hedged import HedgedBackend
+from .backends.sharded import HashRing, ShardedBackend
 
 __all__ = [
     "FastAPICache",
+    "BatchLoader",
+    "WriteBehindQueue",
+    "RefreshAheadScheduler",
     "RedisBackend",
     "CacheBackend",
+    "CacheEntry",
+    "VersionedValue",
+    "WrapperBackend",
     "InMemoryBackend",
     "PostgresBackend",
     "cache",
@@ -20,6 +40,24 @@ __all__ = [
     "MongoDBBackend",
     "FirestoreBackend",
     "DynamoDBBackend",
+    "SyncToAsyncBackend",
+    "CacheMetrics",
+    "LatencyHistogram",
+    "MetricsBackend",
+    "CacheObserver",
+    "OperationEvent",
+    "OpenTelemetryObserver",
+    "TracingBackend",
+    "TraceRecord",
+    "TraceWriter",
+    "read_trace",
+    "RecordingBackend",
+    "ShadowBackend",
+    "CircuitBreaker",
+    "CircuitBreakerBackend",
+    "HedgedBackend",
+    "HashRing",
+    "ShardedBackend",
 ]
 
 
@@ -1,16 +1,309 @@
+import asyncio
+import hashlib
+import inspect
+import pickle
+import re
+import threading
+import time
+import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from datetime import timedelta
 
 
+class CacheEntry(NamedTuple):
+    """
+    A cached value with its metadata, as returned by `CacheBackend.get_with_meta`.
+
+    Attributes:
+        value (Any): The cached value.
+        ttl (Optional[float]): Seconds until the entry expires, or None if it
+            never expires or the backend cannot tell.
+        created_at (Optional[float]): Unix time at which the entry was written,
+            or None if the backend does not track it.
+    """
+
+    value: Any
+    ttl: Optional[float] = None
+    created_at: Optional[float] = None
+
+
+class VersionedValue(NamedTuple):
+    """
+    A cached value with the version it was read at.
+
+    Attributes:
+        value (Any): The cached value.
+        version (Any): Opaque token to pass to `CacheBackend.set_if_version`.
+    """
+
+    value: Any
+    version: Any
+
+
+class _LocalLocks:
+    """
+    Process-local named locks that expire, the fallback lock primitive.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._held: Dict[Tuple[int, str], Tuple[str, float]] = {}
+
+    def acquire(self, owner: object, name: str, timeout: float) -> Optional[str]:
+        """
+        Take the lock ``name`` of ``owner`` unless a live holder has it.
+
+        Returns:
+            Optional[str]: The token proving ownership, or None if held.
+        """
+        now = time.monotonic()
+        with self._lock:
+            held = self._held.get((id(owner), name))
+            if held is not None and held[1] > now:
+                return None
+            token = uuid.uuid4().hex
+            self._held[(id(owner), name)] = (token, now + timeout)
+            return token
+
+    def release(self, owner: object, name: str, token: str) -> None:
+        """
+        Release the lock if ``token`` still owns it.
+        """
+        with self._lock:
+            held = self._held.get((id(owner), name))
+            if held is not None and held[0] == token:
+                del self._held[(id(owner), name)]
+
+
+_local_locks = _LocalLocks()
+
+
+# Compare-and-set rounds a default tag index update takes before giving up.
+_TAG_RETRIES = 16
+
+
+def _tag_kwargs(tags: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """
+    Keyword arguments passing ``tags`` on to a wrapped backend's `set`.
+
+    Tags are only passed when given, so wrapped backends written before tags
+    existed keep working.
+    """
+    return {} if tags is None else {"tags": tags}
+
+
+def _stale_expire(
+    expire: Optional[Union[int, timedelta]], stale_ttl: float
+) -> Optional[Union[int, timedelta]]:
+    """
+    Expiration to store a `CacheBackend.get_or_set` value with, so it stays
+    servable for ``stale_ttl`` seconds after it goes stale.
+    """
+    if not stale_ttl or expire is None:
+        return expire
+    seconds = expire.total_seconds() if isinstance(expire, timedelta) else expire
+    return timedelta(seconds=seconds + stale_ttl)
+
+
+def _is_fresh(entry: CacheEntry, stale_ttl: float) -> bool:
+    """
+    Whether a `CacheBackend.get_or_set` entry is still within its expiration.
+
+    Entries whose TTL the backend cannot report count as fresh.
+    """
+    return entry.ttl is None or entry.ttl > stale_ttl
+
+
+def _counter_ttl_error(backend: "CacheBackend", method: str) -> str:
+    """
+    Message for a default counter with an expiry on a backend without TTLs.
+    """
+    return (
+        f"{type(backend).__name__} does not report remaining TTLs, so the default "
+        f"counters would drop their expiry; override incr/aincr or {method}"
+    )
+
+
+def _cost_kwargs(backend: "CacheBackend", cost: Optional[float]) -> Dict[str, Any]:
+    """
+    Keyword arguments passing a measured ``cost`` on to ``backend``'s `set`.
+
+    The cost is only passed to backends that declare `CacheBackend.cost_aware`.
+    """
+    return {"cost": cost} if cost is not None and backend.cost_aware else {}
+
+
+def _set_args(
+    backend: "CacheBackend",
+    key: str,
+    value: Any,
+    expire: Optional[Union[int, timedelta]],
+    tags: Optional[Sequence[str]],
+    cost: Optional[float],
+) -> tuple:
+    """
+    Positional arguments of a `set` call, for wrappers that forward positionally.
+
+    Like `_tag_kwargs` and `_cost_kwargs`, trailing arguments are only passed
+    when given and, for ``cost``, accepted by ``backend``.
+    """
+    if _cost_kwargs(backend, cost):
+        return (key, value, expire, tags, cost)
+    return (key, value, expire) if tags is None else (key, value, expire, tags)
+
+
+# Keys backends store for their own use (compute locks and the default tag
+# index); key iteration does not list them.
+_INTERNAL_PREFIXES = ("__lock__:", "__tag__:")
+
+
+def _prefix_upper(prefix: str) -> str:
+    """
+    The smallest string greater than every string starting with ``prefix``.
+
+    Bounds a key range ``prefix <= key < _prefix_upper(prefix)`` in code point
+    order, which is also the byte order of the UTF-8 encoding. ``prefix`` must
+    hold a character other than U+10FFFF, as a namespaced prefix always does.
+    """
+    stripped = prefix.rstrip("\U0010ffff")
+    following = ord(stripped[-1]) + 1
+    if 0xD800 <= following <= 0xDFFF:
+        # Surrogates cannot be encoded; skip to the next encodable character.
+        following = 0xE000
+    return stripped[:-1] + chr(following)
+
+
+# Counters written by `incr` are stored as plain integers, not pickles; no
+# pickle consists of digits only. Memcached may pad a decremented counter.
+_COUNTER = re.compile(rb"-?[0-9]+ *")
+
+
 class CacheBackend(ABC):
     """
     Abstract base class for cache backends.
 
     All cache backend implementations must inherit from this class and implement
     both synchronous and asynchronous methods for cache operations.
+
+    Attributes:
+        blocking_async_ops (frozenset): Names of async methods (e.g. ``"aget"``)
+            that perform blocking I/O despite being coroutines. `SyncToAsyncBackend`
+            in ``"auto"`` mode runs the matching sync method on its thread pool
+            instead of calling these on the event loop.
+        cost_aware (bool): Whether `set` and `aset` accept a ``cost`` keyword:
+            the seconds the value took to compute, which `FastAPICache.cached`
+            and `get_or_set` measure on every miss. `InMemoryBackend` uses it
+            for cost-aware eviction; wrappers take the flag of what they wrap.
+            A subclass that overrides `set` or `aset` without a ``cost``
+            parameter is not cost-aware unless it sets the flag itself.
     """
 
+    blocking_async_ops: frozenset = frozenset()
+    cost_aware: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "cost_aware" in cls.__dict__ or not cls.cost_aware:
+            return
+        for name in ("set", "aset"):
+            method = cls.__dict__.get(name)
+            if method is None:
+                continue
+            parameters = inspect.signature(method).parameters.values()
+            if not any(
+                parameter.name == "cost" or parameter.kind is parameter.VAR_KEYWORD
+                for parameter in parameters
+            ):
+                cls.cost_aware = False
+                return
+
+    #: Instrumentation attached with `_add_listener` (`MetricsBackend`,
+    #: `TracingBackend`); notified about errors a backend swallows and about
+    #: payloads it serializes.
+    _listeners: tuple = ()
+
+    def _add_listener(self, listener: Any) -> None:
+        """
+        Attach instrumentation to the backend that performs the I/O.
+
+        `WrapperBackend` forwards the listener to the wrapped backend, so it
+        reaches the backend that actually reports errors and payloads.
+
+        Args:
+            listener (Any): Object with ``on_error(operation, exc)`` and
+                ``on_payload(operation, size, seconds)`` methods.
+        """
+        self._listeners = self._listeners + (listener,)
+
+    def _report_error(self, operation: str, exc: BaseException) -> None:
+        """
+        Notify attached instrumentation of an error the backend handled itself.
+
+        Backends that turn failures into cache misses call this so that an
+        outage remains visible in metrics and traces.
+
+        Args:
+            operation (str): The sync operation name, e.g. ``"get"``.
+            exc (BaseException): The swallowed exception.
+        """
+        for listener in self._listeners:
+            listener.on_error(operation, exc)
+
+    def _dumps(self, value: Any, protocol: Optional[int] = None) -> bytes:
+        """
+        Serialize a value for storage, reporting payload size and time.
+
+        Args:
+            value (Any): The value to serialize.
+            protocol (Optional[int]): Pickle protocol; the default if omitted.
+
+        Returns:
+            bytes: The pickled value.
+        """
+        if not self._listeners:
+            return pickle.dumps(value, protocol)
+        started = time.perf_counter()
+        data = pickle.dumps(value, protocol)
+        elapsed = time.perf_counter() - started
+        for listener in self._listeners:
+            listener.on_payload("set", len(data), elapsed)
+        return data
+
+    def _loads(self, data: bytes) -> Any:
+        """
+        Deserialize a stored payload, reporting payload size and time.
+
+        Args:
+            data (bytes): The pickled value, or a counter.
+
+        Returns:
+            Any: The deserialized value.
+        """
+        if isinstance(data, int) or _COUNTER.fullmatch(data):
+            return int(data)
+        if not self._listeners:
+            return pickle.loads(data)
+        started = time.perf_counter()
+        value = pickle.loads(data)
+        elapsed = time.perf_counter() - started
+        for listener in self._listeners:
+            listener.on_payload("get", len(data), elapsed)
+        return value
+
     @abstractmethod
     async def aget(self, key: str) -> Optional[Any]:
         """
@@ -39,7 +332,11 @@ class CacheBackend(ABC):
 
     @abstractmethod
     async def aset(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Asynchronously set a value in the cache.
@@ -48,12 +345,18 @@ class CacheBackend(ABC):
             key (str): The key under which to store the value.
             value (Any): The value to store.
             expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+            tags (Optional[Sequence[str]]): Tags to invalidate the entry by,
+                see `ainvalidate_tags`.
         """
         pass
 
     @abstractmethod
     def set(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Synchronously set a value in the cache.
@@ -62,6 +365,8 @@ class CacheBackend(ABC):
             key (str): The key under which to store the value.
             value (Any): The value to store.
             expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+            tags (Optional[Sequence[str]]): Tags to invalidate the entry by,
+                see `invalidate_tags`.
         """
         pass
 
@@ -124,3 +429,1063 @@ class CacheBackend(ABC):
             bool: True if the key exists, False otherwise.
         """
         pass
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """
+        Asynchronously retrieve a value with its remaining TTL and creation time.
+
+        The default implementation wraps `aget` and reports no metadata.
+        Backends override it to read the value and its metadata in one round
+        trip.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if not found.
+        """
+        value = await self.aget(key)
+        return None if value is None else CacheEntry(value)
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """
+        Synchronously retrieve a value with its remaining TTL and creation time.
+
+        The default implementation wraps `get` and reports no metadata.
+        Backends override it to read the value and its metadata in one round
+        trip.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if not found.
+        """
+        value = self.get(key)
+        return None if value is None else CacheEntry(value)
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Asynchronously retrieve a value and restart its expiration.
+
+        The default implementation writes the value back with `aset`. Backends
+        override it to only update the expiry, without resending the value.
+
+        Args:
+            key (str): The key to retrieve.
+            expire (Optional[Union[int, timedelta]]): The new expiration time,
+                counted from now. If None, the entry no longer expires.
+
+        Returns:
+            Optional[Any]: The cached value, or None if not found.
+        """
+        value = await self.aget(key)
+        if value is not None:
+            await self.aset(key, value, expire=expire)
+        return value
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Synchronously retrieve a value and restart its expiration.
+
+        The default implementation writes the value back with `set`. Backends
+        override it to only update the expiry, without resending the value.
+
+        Args:
+            key (str): The key to retrieve.
+            expire (Optional[Union[int, timedelta]]): The new expiration time,
+                counted from now. If None, the entry no longer expires.
+
+        Returns:
+            Optional[Any]: The cached value, or None if not found.
+        """
+        value = self.get(key)
+        if value is not None:
+            self.set(key, value, expire=expire)
+        return value
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Asynchronously restart the expiration of an entry without reading it.
+
+        Args:
+            key (str): The key to touch.
+            expire (Optional[Union[int, timedelta]]): The new expiration time,
+                counted from now. If None, the entry no longer expires.
+
+        Returns:
+            bool: True if the key exists, False otherwise.
+        """
+        return await self.aget_and_touch(key, expire) is not None
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Synchronously restart the expiration of an entry without reading it.
+
+        Args:
+            key (str): The key to touch.
+            expire (Optional[Union[int, timedelta]]): The new expiration time,
+                counted from now. If None, the entry no longer expires.
+
+        Returns:
+            bool: True if the key exists, False otherwise.
+        """
+        return self.get_and_touch(key, expire) is not None
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """
+        Asynchronously add ``delta`` to a counter, creating it if missing.
+
+        The default implementation reads the counter and writes it back, so
+        concurrent increments can be lost. Backends override it with their
+        store's atomic increment.
+
+        Args:
+            key (str): The counter key.
+            delta (int): The amount to add; negative to decrement. Defaults to 1.
+            expire (Optional[Union[int, timedelta]]): Expiration time of a new
+                counter. An existing counter keeps its expiry, which makes
+                fixed-window rate limits a single call.
+
+        Returns:
+            Optional[int]: The new value, or None if the store failed.
+
+        Raises:
+            NotImplementedError: If ``expire`` is set and the backend does not
+                override `aget_with_meta`, so it cannot report the remaining TTL
+                the counter must keep.
+        """
+        if (
+            expire is not None
+            and type(self).aget_with_meta is CacheBackend.aget_with_meta
+        ):
+            raise NotImplementedError(_counter_ttl_error(self, "aget_with_meta"))
+        entry = await self.aget_with_meta(key)
+        if entry is None:
+            await self.aset(key, delta, expire=expire)
+            return delta
+        value = entry.value + delta
+        ttl = None if entry.ttl is None else timedelta(seconds=entry.ttl)
+        await self.aset(key, value, expire=ttl)
+        return value
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """
+        Synchronously add ``delta`` to a counter, creating it if missing.
+
+        The default implementation reads the counter and writes it back, so
+        concurrent increments can be lost. Backends override it with their
+        store's atomic increment.
+
+        Args:
+            key (str): The counter key.
+            delta (int): The amount to add; negative to decrement. Defaults to 1.
+            expire (Optional[Union[int, timedelta]]): Expiration time of a new
+                counter. An existing counter keeps its expiry, which makes
+                fixed-window rate limits a single call.
+
+        Returns:
+            Optional[int]: The new value, or None if the store failed.
+
+        Raises:
+            NotImplementedError: If ``expire`` is set and the backend does not
+                override `get_with_meta`, so it cannot report the remaining TTL
+                the counter must keep.
+        """
+        if (
+            expire is not None
+            and type(self).get_with_meta is CacheBackend.get_with_meta
+        ):
+            raise NotImplementedError(_counter_ttl_error(self, "get_with_meta"))
+        entry = self.get_with_meta(key)
+        if entry is None:
+            self.set(key, delta, expire=expire)
+            return delta
+        value = entry.value + delta
+        ttl = None if entry.ttl is None else timedelta(seconds=entry.ttl)
+        self.set(key, value, expire=ttl)
+        return value
+
+    async def adecr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """
+        Asynchronously subtract ``delta`` from a counter. See `aincr`.
+        """
+        return await self.aincr(key, -delta, expire=expire)
+
+    def decr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """
+        Synchronously subtract ``delta`` from a counter. See `incr`.
+        """
+        return self.incr(key, -delta, expire=expire)
+
+    @staticmethod
+    def _digest(value: Any) -> str:
+        """
+        Version token of a value for the default versioned writes.
+        """
+        return hashlib.blake2b(pickle.dumps(value), digest_size=16).hexdigest()
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Asynchronously retrieve a value with its version, for `aset_if_version`.
+
+        The default implementation uses a digest of the value as the version.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            Optional[VersionedValue]: The value and its version, or None if
+            not found.
+        """
+        value = await self.aget(key)
+        return None if value is None else VersionedValue(value, self._digest(value))
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Synchronously retrieve a value with its version, for `set_if_version`.
+
+        The default implementation uses a digest of the value as the version.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            Optional[VersionedValue]: The value and its version, or None if
+            not found.
+        """
+        value = self.get(key)
+        return None if value is None else VersionedValue(value, self._digest(value))
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Asynchronously store a value only if the entry is still at ``version``.
+
+        The default implementation compares and writes in two calls, so it
+        is not atomic. Backends override it with their store's conditional
+        write.
+
+        Args:
+            key (str): The key to store the value under.
+            value (Any): The value to store.
+            version (Any): The version from `aget_versioned`, or None to store
+                the value only if the key does not exist.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+
+        Returns:
+            bool: True if the value was stored, False if the entry changed.
+        """
+        current = await self.aget_versioned(key)
+        if (None if current is None else current.version) != version:
+            return False
+        await self.aset(key, value, expire=expire)
+        return True
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Synchronously store a value only if the entry is still at ``version``.
+
+        Together with `get_versioned` this is a compare-and-set: a writer
+        holding an old version cannot overwrite a newer value.
+
+        The default implementation compares and writes in two calls, so it
+        is not atomic. Backends override it with their store's conditional
+        write.
+
+        Args:
+            key (str): The key to store the value under.
+            value (Any): The value to store.
+            version (Any): The version from `get_versioned`, or None to store
+                the value only if the key does not exist.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+
+        Returns:
+            bool: True if the value was stored, False if the entry changed.
+        """
+        current = self.get_versioned(key)
+        if (None if current is None else current.version) != version:
+            return False
+        self.set(key, value, expire=expire)
+        return True
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Asynchronously retrieve several values from the cache.
+
+        The default implementation issues one `aget` per key. Backends override
+        it with a native multi-get so the whole batch costs one round trip.
+
+        Args:
+            keys (Sequence[str]): The keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The cached values of the keys that were found.
+        """
+        result = {}
+        for key in keys:
+            value = await self.aget(key)
+            if value is not None:
+                result[key] = value
+        return result
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Synchronously retrieve several values from the cache.
+
+        The default implementation issues one `get` per key. Backends override
+        it with a native multi-get so the whole batch costs one round trip.
+
+        Args:
+            keys (Sequence[str]): The keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The cached values of the keys that were found.
+        """
+        result = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                result[key] = value
+        return result
+
+    async def aset_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """
+        Asynchronously set several values in the cache.
+
+        The default implementation issues one `aset` per item. Backends override
+        it with a pipeline or multi-set where available.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+        """
+        for key, value in items.items():
+            await self.aset(key, value, expire=expire)
+
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """
+        Synchronously set several values in the cache.
+
+        The default implementation issues one `set` per item. Backends override
+        it with a pipeline or multi-set where available.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+        """
+        for key, value in items.items():
+            self.set(key, value, expire=expire)
+
+    def _tag_key(self, tag: str) -> str:
+        """
+        Key of the entry holding a tag's keys in the default tag index.
+        """
+        return f"__tag__:{tag}"
+
+    def _add_tags(self, key: str, tags: Sequence[str]) -> None:
+        """
+        Add a key to the default tag index, for backends without a native one.
+
+        Each tag's keys are kept as a set under `_tag_key`, updated with
+        `get_versioned` and `set_if_version` so concurrent writers do not
+        lose each other's keys.
+
+        Args:
+            key (str): The cache key.
+            tags (Sequence[str]): The key's tags.
+        """
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            for _ in range(_TAG_RETRIES):
+                entry = self.get_versioned(tag_key)
+                keys = frozenset() if entry is None else entry.value
+                if key in keys or self.set_if_version(
+                    tag_key, keys | {key}, None if entry is None else entry.version
+                ):
+                    break
+
+    async def _aadd_tags(self, key: str, tags: Sequence[str]) -> None:
+        """
+        Asynchronously add a key to the default tag index. See `_add_tags`.
+        """
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            for _ in range(_TAG_RETRIES):
+                entry = await self.aget_versioned(tag_key)
+                keys = frozenset() if entry is None else entry.value
+                if key in keys or await self.aset_if_version(
+                    tag_key, keys | {key}, None if entry is None else entry.version
+                ):
+                    break
+
+    def invalidate_tags(self, tags: Sequence[str]) -> None:
+        """
+        Synchronously delete every entry stored with any of ``tags``.
+
+        The default implementation reads the keys from the tag index kept by
+        `_add_tags`, deletes them and empties the index entry, unless a key
+        was added meanwhile. Backends override it with their native index.
+
+        Args:
+            tags (Sequence[str]): The tags to invalidate.
+        """
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            for _ in range(_TAG_RETRIES):
+                entry = self.get_versioned(tag_key)
+                if not entry or not entry.value:
+                    break
+                for key in entry.value:
+                    self.delete(key)
+                if self.set_if_version(tag_key, frozenset(), entry.version):
+                    break
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """
+        Asynchronously delete every entry stored with any of ``tags``.
+
+        See `invalidate_tags`.
+
+        Args:
+            tags (Sequence[str]): The tags to invalidate.
+        """
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            for _ in range(_TAG_RETRIES):
+                entry = await self.aget_versioned(tag_key)
+                if not entry or not entry.value:
+                    break
+                for key in entry.value:
+                    await self.adelete(key)
+                if await self.aset_if_version(tag_key, frozenset(), entry.version):
+                    break
+
+    def iter_keys(self, prefix: str = "", batch_size: int = 100) -> Iterator[str]:
+        """
+        Synchronously iterate over the keys in the namespace starting with ``prefix``.
+
+        Keys are fetched ``batch_size`` at a time with the store's cursor, so
+        memory stays constant however many keys match. Keys written or deleted
+        during the iteration may or may not be listed, and expired entries the
+        store has not removed yet may be. Backends that cannot list their keys
+        raise `NotImplementedError`.
+
+        Args:
+            prefix (str): Only list keys starting with this prefix.
+            batch_size (int): How many keys to fetch per round trip.
+
+        Yields:
+            str: The keys, without the namespace.
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot list its keys")
+
+    async def aiter_keys(
+        self, prefix: str = "", batch_size: int = 100
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously iterate over the keys in the namespace starting with ``prefix``.
+
+        See `iter_keys`.
+
+        Args:
+            prefix (str): Only list keys starting with this prefix.
+            batch_size (int): How many keys to fetch per round trip.
+
+        Yields:
+            str: The keys, without the namespace.
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot list its keys")
+        yield  # pragma: no cover - makes this an async generator
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Synchronously delete every entry whose key starts with ``prefix``.
+
+        The default implementation deletes the keys listed by `iter_keys` one
+        by one. Backends override it with a range or pattern delete.
+
+        Args:
+            prefix (str): The key prefix, without the namespace.
+
+        Returns:
+            int: How many entries were deleted.
+        """
+        deleted = 0
+        for key in self.iter_keys(prefix):
+            self.delete(key)
+            deleted += 1
+        return deleted
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """
+        Asynchronously delete every entry whose key starts with ``prefix``.
+
+        See `delete_prefix`.
+
+        Args:
+            prefix (str): The key prefix, without the namespace.
+
+        Returns:
+            int: How many entries were deleted.
+        """
+        deleted = 0
+        async for key in self.aiter_keys(prefix):
+            await self.adelete(key)
+            deleted += 1
+        return deleted
+
+    def _acquire_lock(self, key: str, timeout: float) -> Optional[Any]:
+        """
+        Try to take the compute lock of a key, without waiting.
+
+        Backends override this with their store's native primitive so the lock
+        holds across processes; the default is a lock local to this process.
+        `WrapperBackend` forwards to the wrapped backend.
+
+        Args:
+            key (str): The cache key the lock guards.
+            timeout (float): Seconds after which the lock expires even if it
+                is never released.
+
+        Returns:
+            Optional[Any]: A token to pass to `_release_lock`, or None if
+            another caller holds the lock.
+
+        Raises:
+            Exception: If the store cannot be reached.
+        """
+        return _local_locks.acquire(self, key, timeout)
+
+    def _release_lock(self, key: str, token: Any) -> None:
+        """
+        Release a compute lock if ``token`` still owns it.
+
+        Args:
+            key (str): The cache key the lock guards.
+            token (Any): The token returned by `_acquire_lock`.
+        """
+        _local_locks.release(self, key, token)
+
+    async def _aacquire_lock(self, key: str, timeout: float) -> Optional[Any]:
+        """
+        Asynchronously try to take the compute lock of a key, without waiting.
+
+        See `_acquire_lock`.
+        """
+        return _local_locks.acquire(self, key, timeout)
+
+    async def _arelease_lock(self, key: str, token: Any) -> None:
+        """
+        Asynchronously release a compute lock. See `_release_lock`.
+        """
+        _local_locks.release(self, key, token)
+
+    def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        expire: Optional[Union[int, timedelta]] = None,
+        lock_timeout: float = 10.0,
+        tags: Optional[Sequence[str]] = None,
+        stale_ttl: float = 0.0,
+    ) -> Any:
+        """
+        Synchronously return a cached value, computing it once across all callers.
+
+        On a miss, the caller that takes the key's lock runs ``loader`` and
+        stores the result; concurrent callers, in this or other processes,
+        poll the cache until the value appears. A caller that waited
+        ``lock_timeout`` seconds, or whose backend cannot lock, runs ``loader``
+        itself.
+
+        With ``stale_ttl``, values are stored for ``stale_ttl`` seconds past
+        ``expire``. Once a value is past ``expire``, the caller that takes the
+        lock recomputes it while every other caller is served the stale value
+        at once, so only cold keys make callers wait.
+
+        Args:
+            key (str): The cache key.
+            loader (Callable[[], Any]): Computes the value on a miss.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+            lock_timeout (float): Seconds the lock is held at most, which is
+                also how long other callers wait. Set it above the loader's
+                usual run time. Defaults to 10.
+            tags (Optional[Sequence[str]]): Tags of the stored value.
+            stale_ttl (float): Seconds a value stays servable after ``expire``
+                while one caller recomputes it. Needs an ``expire`` and a
+                backend whose `get_with_meta` reports TTLs. Other readers of
+                the key see the value until the stale period ends too.
+                Defaults to 0, which serves no stale values.
+
+        Returns:
+            Any: The cached or computed value.
+        """
+        stored_expire = _stale_expire(expire, stale_ttl)
+
+        def load() -> Any:
+            started = time.perf_counter()
+            result = loader()
+            if result is not None:
+                self.set(
+                    key,
+                    result,
+                    expire=stored_expire,
+                    **_tag_kwargs(tags),
+                    **_cost_kwargs(self, time.perf_counter() - started),
+                )
+            return result
+
+        if stale_ttl and expire is not None:
+            entry = self.get_with_meta(key)
+            if entry is not None:
+                if _is_fresh(entry, stale_ttl):
+                    return entry.value
+                try:
+                    token = self._acquire_lock(key, lock_timeout)
+                except Exception:
+                    token = None
+                if token is None:
+                    # Another caller is recomputing it.
+                    return entry.value
+                try:
+                    current = self.get_with_meta(key)
+                    if current is not None and _is_fresh(current, stale_ttl):
+                        return current.value
+                    value = load()
+                    return entry.value if value is None else value
+                finally:
+                    self._release_lock(key, token)
+        else:
+            value = self.get(key)
+            if value is not None:
+                return value
+        deadline = time.monotonic() + lock_timeout
+        delay = 0.005
+        while True:
+            try:
+                token = self._acquire_lock(key, lock_timeout)
+            except Exception:
+                break
+            if token is not None:
+                try:
+                    # Another caller may have stored the value since our miss.
+                    value = self.get(key)
+                    return value if value is not None else load()
+                finally:
+                    self._release_lock(key, token)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.1)
+            value = self.get(key)
+            if value is not None:
+                return value
+        return load()
+
+    async def aget_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Union[Any, Awaitable[Any]]],
+        expire: Optional[Union[int, timedelta]] = None,
+        lock_timeout: float = 10.0,
+        tags: Optional[Sequence[str]] = None,
+        stale_ttl: float = 0.0,
+    ) -> Any:
+        """
+        Asynchronously return a cached value, computing it once across all callers.
+
+        See `get_or_set`; ``loader`` may be a plain or a coroutine function.
+
+        Args:
+            key (str): The cache key.
+            loader (Callable[[], Union[Any, Awaitable[Any]]]): Computes the
+                value on a miss.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+            lock_timeout (float): Seconds the lock is held at most, which is
+                also how long other callers wait. Defaults to 10.
+            tags (Optional[Sequence[str]]): Tags of the stored value.
+            stale_ttl (float): Seconds a value stays servable after ``expire``
+                while one caller recomputes it. Defaults to 0.
+
+        Returns:
+            Any: The cached or computed value.
+        """
+        stored_expire = _stale_expire(expire, stale_ttl)
+
+        async def load() -> Any:
+            started = time.perf_counter()
+            result = loader()
+            if inspect.isawaitable(result):
+                result = await result
+            if result is not None:
+                await self.aset(
+                    key,
+                    result,
+                    expire=stored_expire,
+                    **_tag_kwargs(tags),
+                    **_cost_kwargs(self, time.perf_counter() - started),
+                )
+            return result
+
+        if stale_ttl and expire is not None:
+            entry = await self.aget_with_meta(key)
+            if entry is not None:
+                if _is_fresh(entry, stale_ttl):
+                    return entry.value
+                try:
+                    token = await self._aacquire_lock(key, lock_timeout)
+                except Exception:
+                    token = None
+                if token is None:
+                    # Another caller is recomputing it.
+                    return entry.value
+                try:
+                    current = await self.aget_with_meta(key)
+                    if current is not None and _is_fresh(current, stale_ttl):
+                        return current.value
+                    value = await load()
+                    return entry.value if value is None else value
+                finally:
+                    await self._arelease_lock(key, token)
+        else:
+            value = await self.aget(key)
+            if value is not None:
+                return value
+        deadline = time.monotonic() + lock_timeout
+        delay = 0.005
+        while True:
+            try:
+                token = await self._aacquire_lock(key, lock_timeout)
+            except Exception:
+                break
+            if token is not None:
+                try:
+                    # Another caller may have stored the value since our miss.
+                    value = await self.aget(key)
+                    return value if value is not None else await load()
+                finally:
+                    await self._arelease_lock(key, token)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.1)
+            value = await self.aget(key)
+            if value is not None:
+                return value
+        return await load()
+
+
+def _close_backend(backend: CacheBackend) -> None:
+    """
+    Close ``backend`` if it has a synchronous ``close`` method.
+    """
+    close: Optional[Callable] = getattr(backend, "close", None)
+    if close is not None and not inspect.iscoroutinefunction(close):
+        close()
+
+
+async def _aclose_backend(backend: CacheBackend) -> None:
+    """
+    Close ``backend`` with its ``aclose`` method, or ``close`` if it has none.
+    """
+    close = getattr(backend, "aclose", None) or getattr(backend, "close", None)
+    if close is not None:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+
+
+class WrapperBackend(CacheBackend):
+    """
+    Base class of backends that wrap another backend.
+
+    Every operation is forwarded to the wrapped backend, including the compute
+    lock hooks behind `get_or_set` and attached instrumentation. Subclasses
+    override the operations they observe or change; a wrapper that guards or
+    measures calls (e.g. `CircuitBreakerBackend`, `MetricsBackend`) also
+    overrides `_acquire_lock` and `_release_lock`, so lock calls go through it
+    like any other operation.
+
+    Args:
+        backend (CacheBackend): The backend to wrap.
+
+    Notes:
+        - `blocking_async_ops` and `cost_aware` are taken from the wrapped
+          backend.
+    """
+
+    def __init__(self, backend: CacheBackend) -> None:
+        self._backend = backend
+        self.blocking_async_ops = backend.blocking_async_ops
+        self.cost_aware = backend.cost_aware
+
+    def _add_listener(self, listener: Any) -> None:
+        """
+        Attach instrumentation to the wrapped backend.
+        """
+        self._backend._add_listener(listener)
+
+    def _acquire_lock(self, key: str, timeout: float) -> Optional[Any]:
+        """Take the wrapped backend's compute lock. See `CacheBackend._acquire_lock`."""
+        return self._backend._acquire_lock(key, timeout)
+
+    def _release_lock(self, key: str, token: Any) -> None:
+        """Release the wrapped backend's compute lock."""
+        self._backend._release_lock(key, token)
+
+    async def _aacquire_lock(self, key: str, timeout: float) -> Optional[Any]:
+        """Asynchronously take the wrapped backend's compute lock."""
+        return await self._backend._aacquire_lock(key, timeout)
+
+    async def _arelease_lock(self, key: str, token: Any) -> None:
+        """Asynchronously release the wrapped backend's compute lock."""
+        await self._backend._arelease_lock(key, token)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retrieve a value from the wrapped backend."""
+        return self._backend.get(key)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Asynchronously retrieve a value from the wrapped backend."""
+        return await self._backend.aget(key)
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Retrieve a value with its metadata from the wrapped backend."""
+        return self._backend.get_with_meta(key)
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Asynchronously retrieve a value with its metadata from the wrapped backend."""
+        return await self._backend.aget_with_meta(key)
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Retrieve a value and restart its expiration in the wrapped backend."""
+        return self._backend.get_and_touch(key, expire)
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Asynchronously retrieve a value and restart its expiration."""
+        return await self._backend.aget_and_touch(key, expire)
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Restart a key's expiration in the wrapped backend."""
+        return self._backend.touch(key, expire)
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Asynchronously restart a key's expiration in the wrapped backend."""
+        return await self._backend.atouch(key, expire)
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Add ``delta`` to a counter of the wrapped backend."""
+        return self._backend.incr(key, delta, expire)
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Asynchronously add ``delta`` to a counter of the wrapped backend."""
+        return await self._backend.aincr(key, delta, expire)
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Retrieve a value with its version from the wrapped backend."""
+        return self._backend.get_versioned(key)
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Asynchronously retrieve a value with its version from the wrapped backend."""
+        return await self._backend.aget_versioned(key)
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Store a value in the wrapped backend if its version is unchanged."""
+        return self._backend.set_if_version(key, value, version, expire)
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Asynchronously store a value if its version is unchanged."""
+        return await self._backend.aset_if_version(key, value, version, expire)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Store a value in the wrapped backend."""
+        self._backend.set(
+            key,
+            value,
+            expire,
+            **_tag_kwargs(tags),
+            **_cost_kwargs(self._backend, cost),
+        )
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Asynchronously store a value in the wrapped backend."""
+        await self._backend.aset(
+            key,
+            value,
+            expire,
+            **_tag_kwargs(tags),
+            **_cost_kwargs(self._backend, cost),
+        )
+
+    def delete(self, key: str) -> None:
+        """Delete a value from the wrapped backend."""
+        self._backend.delete(key)
+
+    async def adelete(self, key: str) -> None:
+        """Asynchronously delete a value from the wrapped backend."""
+        await self._backend.adelete(key)
+
+    def clear(self) -> None:
+        """Clear the wrapped backend."""
+        self._backend.clear()
+
+    async def aclear(self) -> None:
+        """Asynchronously clear the wrapped backend."""
+        await self._backend.aclear()
+
+    def has(self, key: str) -> bool:
+        """Check for a key in the wrapped backend."""
+        return self._backend.has(key)
+
+    async def ahas(self, key: str) -> bool:
+        """Asynchronously check for a key in the wrapped backend."""
+        return await self._backend.ahas(key)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Retrieve several values from the wrapped backend."""
+        return self._backend.get_many(keys)
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Asynchronously retrieve several values from the wrapped backend."""
+        return await self._backend.aget_many(keys)
+
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Store several values in the wrapped backend."""
+        self._backend.set_many(items, expire)
+
+    async def aset_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Asynchronously store several values in the wrapped backend."""
+        await self._backend.aset_many(items, expire)
+
+    def invalidate_tags(self, tags: Sequence[str]) -> None:
+        """Delete every key carrying one of the tags from the wrapped backend."""
+        self._backend.invalidate_tags(tags)
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """Asynchronously delete every key carrying one of the tags."""
+        await self._backend.ainvalidate_tags(tags)
+
+    def iter_keys(self, prefix: str = "", batch_size: int = 100) -> Iterator[str]:
+        """Iterate over the wrapped backend's keys starting with ``prefix``."""
+        return self._backend.iter_keys(prefix, batch_size)
+
+    async def aiter_keys(
+        self, prefix: str = "", batch_size: int = 100
+    ) -> AsyncIterator[str]:
+        """Asynchronously iterate over the keys starting with ``prefix``."""
+        async for key in self._backend.aiter_keys(prefix, batch_size):
+            yield key
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete the wrapped backend's entries whose key starts with ``prefix``."""
+        return self._backend.delete_prefix(prefix)
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """Asynchronously delete the entries under ``prefix``."""
+        return await self._backend.adelete_prefix(prefix)
+
+    def close(self) -> None:
+        """
+        Close the wrapped backend.
+        """
+        _close_backend(self._backend)
+
+    async def aclose(self) -> None:
+        """
+        Asynchronously close the wrapped backend.
+        """
+        await _aclose_backend(self._backend)
@@ -0,0 +1,653 @@
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import timedelta
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from .backend import (
+    CacheBackend,
+    CacheEntry,
+    VersionedValue,
+    WrapperBackend,
+    _local_locks,
+    _set_args,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Sync operation names accepted as keys of ``timeouts``.
+OPERATIONS = (
+    "get",
+    "get_with_meta",
+    "get_and_touch",
+    "touch",
+    "incr",
+    "get_versioned",
+    "set",
+    "set_if_version",
+    "delete",
+    "clear",
+    "invalidate_tags",
+    "delete_prefix",
+    "has",
+    "get_many",
+    "set_many",
+    "lock",
+    "unlock",
+)
+
+# Backend methods behind the compute lock operations, sync and async.
+_LOCK_METHODS = {
+    "lock": ("_acquire_lock", "_aacquire_lock"),
+    "unlock": ("_release_lock", "_arelease_lock"),
+}
+
+# Fallback of a lock call that did not succeed.
+_UNAVAILABLE = object()
+
+# Set for the duration of a protected call; the wrapped backend flips the cell
+# through `CircuitBreakerBackend.on_error` when it swallows an exception.
+_call_failed: contextvars.ContextVar[Optional[list]] = contextvars.ContextVar(
+    "fast_cache_call_failed", default=None
+)
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker over a sliding window of recent calls.
+
+    The breaker starts closed. When at least ``min_calls`` of the last
+    ``window`` calls were recorded and the share of failures reaches
+    ``failure_rate``, it opens and rejects calls for ``reset_timeout`` seconds.
+    It then turns half-open and admits up to ``half_open_calls`` concurrent
+    probes: a successful probe closes it, a failed one opens it again.
+
+    Args:
+        failure_rate (float): Share of failed calls that opens the breaker.
+            Defaults to 0.5.
+        window (int): Number of recent calls considered. Defaults to 20.
+        min_calls (int): Calls required in the window before the breaker can
+            open. Defaults to 10.
+        reset_timeout (float): Seconds to stay open before probing. Defaults to 5.
+        half_open_calls (int): Concurrent probes allowed while half-open.
+            Defaults to 1.
+        clock (Callable[[], float]): Clock for the open period. Defaults to
+            `time.monotonic`.
+
+    Raises:
+        ValueError: If ``failure_rate`` is not in (0, 1] or ``min_calls``
+            exceeds ``window``.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        reset_timeout: float = 5.0,
+        half_open_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0.0 < failure_rate <= 1.0:
+            raise ValueError("failure_rate must be in (0, 1]")
+        if min_calls > window:
+            raise ValueError("min_calls must not exceed window")
+        self._failure_rate = failure_rate
+        self._min_calls = min_calls
+        self._reset_timeout = reset_timeout
+        self._half_open_calls = half_open_calls
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._outcomes: deque = deque(maxlen=window)
+        self._failures = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._times_opened = 0
+
+    @property
+    def state(self) -> str:
+        """
+        The current state: ``"closed"``, ``"open"`` or ``"half_open"``.
+        """
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        """
+        Return the state, moving from open to half-open once the timeout passed;
+        lock held.
+        """
+        if (
+            self._state == OPEN
+            and self._clock() - self._opened_at >= self._reset_timeout
+        ):
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Decide whether a call may go to the backend.
+
+        Every allowed call must be followed by exactly one `record`.
+
+        Returns:
+            bool: True if the call may proceed.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._probes < self._half_open_calls:
+                self._probes += 1
+                return True
+            return False
+
+    def record(self, success: bool) -> None:
+        """
+        Record the outcome of an allowed call.
+
+        Args:
+            success (bool): Whether the call succeeded in time.
+        """
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+                if success:
+                    self._close()
+                else:
+                    self._open()
+                return
+            if self._state == OPEN:
+                # A call admitted before the breaker opened.
+                return
+
+            if len(self._outcomes) == self._outcomes.maxlen and not self._outcomes[0]:
+                self._failures -= 1
+            self._outcomes.append(success)
+            if not success:
+                self._failures += 1
+                calls = len(self._outcomes)
+                if (
+                    calls >= self._min_calls
+                    and self._failures >= self._failure_rate * calls
+                ):
+                    self._open()
+
+    def _open(self) -> None:
+        """
+        Open the breaker; lock held.
+        """
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._times_opened += 1
+
+    def _close(self) -> None:
+        """
+        Close the breaker and forget past outcomes; lock held.
+        """
+        self._state = CLOSED
+        self._outcomes.clear()
+        self._failures = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the breaker's state.
+
+        Returns:
+            Dict[str, Any]: ``state``, ``window_calls``, ``window_failures`` and
+            ``times_opened``.
+        """
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "window_calls": len(self._outcomes),
+                "window_failures": self._failures,
+                "times_opened": self._times_opened,
+            }
+
+
+class _LocalToken(NamedTuple):
+    """
+    Token of a process-local lock taken while the backend was unavailable.
+    """
+
+    token: str
+
+
+class CircuitBreakerBackend(WrapperBackend):
+    """
+    Wrapper that bounds each operation by a timeout and sheds a failing backend.
+
+    Calls that exceed their timeout budget or fail are turned into cache misses
+    (lookups) or skipped (writes), so a degraded cache costs at most the budget
+    instead of a socket timeout. Failures, including errors the wrapped backend
+    swallows itself (as `RedisBackend` does), feed a `CircuitBreaker`; while it
+    is open the backend is not called at all, so decorated endpoints go
+    straight to computing their result. Half-open probes restore the cache once
+    the backend recovers.
+
+    Args:
+        backend (CacheBackend): The backend to protect.
+        timeouts (Optional[Union[float, Mapping[str, float]]]): Timeout in
+            seconds for every operation, or per sync operation name, e.g.
+            ``{"get": 0.005, "set": 0.02}``. Operations without a timeout are
+            not bounded. Defaults to None.
+        breaker (Optional[CircuitBreaker]): The breaker to use. Defaults to a
+            `CircuitBreaker` with default settings.
+        max_workers (int): Threads used to bound sync calls and blocking async
+            calls. Defaults to 8.
+
+    Raises:
+        ValueError: If ``timeouts`` names an unknown operation.
+
+    Notes:
+        - Async calls are bounded with `asyncio.wait_for`. Sync calls with a
+          timeout, and async calls listed in the backend's
+          `blocking_async_ops`, run on the wrapper's thread pool so the caller
+          can stop waiting; a timed-out call keeps its thread until the
+          backend returns, so also configure client socket timeouts.
+        - While the breaker is open, writes and deletes are dropped, so entries
+          may be stale when it closes again. Keep TTLs short on data that must
+          not outlive an invalidation.
+        - Timeouts and failures are reported to attached metrics and tracing
+          as errors of the wrapped backend.
+        - The compute locks of `get_or_set` are the ``lock`` and ``unlock``
+          operations. While they do not succeed, callers fall back to a lock
+          local to this process, so each process still computes a missing
+          value once.
+        - Key iteration is forwarded as is: it spans many calls, so it has no
+          budget and does not count towards the breaker.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        timeouts: Optional[Union[float, Mapping[str, float]]] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        max_workers: int = 8,
+    ) -> None:
+        if timeouts is None:
+            timeouts = {}
+        elif not isinstance(timeouts, Mapping):
+            timeouts = dict.fromkeys(OPERATIONS, timeouts)
+        unknown = set(timeouts) - set(OPERATIONS)
+        if unknown:
+            raise ValueError(f"Unknown operations in timeouts: {sorted(unknown)}")
+
+        super().__init__(backend)
+        self._timeouts: Dict[str, float] = dict(timeouts)
+        self._breaker = breaker if breaker is not None else CircuitBreaker()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fast-cache-breaker"
+        )
+
+        reporter = backend
+        while isinstance(getattr(reporter, "_backend", None), CacheBackend):
+            reporter = reporter._backend
+        self._reporter = reporter
+
+        self._stats_lock = threading.Lock()
+        self._counters = {"calls": 0, "failures": 0, "timeouts": 0, "bypassed": 0}
+        backend._add_listener(self)
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """
+        The circuit breaker guarding the backend.
+        """
+        return self._breaker
+
+    def on_error(self, operation: str, exc: BaseException) -> None:
+        """
+        Mark the current call as failed when the backend swallows an error.
+
+        Args:
+            operation (str): The sync operation name.
+            exc (BaseException): The swallowed exception.
+        """
+        cell = _call_failed.get()
+        if cell is not None:
+            cell[0] = True
+
+    def on_payload(self, operation: str, size: int, seconds: float) -> None:
+        """
+        Ignore payloads.
+        """
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._counters[name] += 1
+
+    def _failed(self, op: str, exc: BaseException, fallback: Any) -> Any:
+        """
+        Record a failed or timed-out call and return the fallback result.
+        """
+        self._breaker.record(False)
+        self._count("timeouts" if isinstance(exc, TimeoutError) else "failures")
+        self._reporter._report_error(op, exc)
+        return fallback
+
+    def _call(self, op: str, fallback: Any, *args: Any) -> Any:
+        """
+        Run a sync operation within its budget, if the breaker allows it.
+
+        Args:
+            op (str): The sync operation name.
+            fallback (Any): Result when the call is bypassed, fails or times out.
+            *args: Arguments for the operation.
+
+        Returns:
+            Any: The operation result or ``fallback``.
+        """
+        if not self._breaker.allow():
+            self._count("bypassed")
+            return fallback
+        self._count("calls")
+        func = getattr(self._backend, _LOCK_METHODS.get(op, (op,))[0])
+        timeout = self._timeouts.get(op)
+        cell = [False]
+        token = _call_failed.set(cell)
+        try:
+            if timeout is None:
+                result = func(*args)
+            else:
+                future = self._executor.submit(
+                    contextvars.copy_context().run, func, *args
+                )
+                try:
+                    result = future.result(timeout)
+                except FutureTimeoutError:
+                    future.cancel()
+                    raise TimeoutError(f"{op} exceeded {timeout}s") from None
+        except Exception as exc:
+            return self._failed(op, exc, fallback)
+        finally:
+            _call_failed.reset(token)
+        self._breaker.record(not cell[0])
+        return result
+
+    async def _acall(self, op: str, fallback: Any, *args: Any) -> Any:
+        """
+        Await an async operation within its budget, if the breaker allows it.
+
+        Args:
+            op (str): The sync operation name.
+            fallback (Any): Result when the call is bypassed, fails or times out.
+            *args: Arguments for the operation.
+
+        Returns:
+            Any: The operation result or ``fallback``.
+        """
+        if not self._breaker.allow():
+            self._count("bypassed")
+            return fallback
+        self._count("calls")
+        timeout = self._timeouts.get(op)
+        cell = [False]
+        token = _call_failed.set(cell)
+        sync_name, async_name = _LOCK_METHODS.get(op, (op, f"a{op}"))
+        try:
+            if async_name in self._backend.blocking_async_ops:
+                awaitable = asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    contextvars.copy_context().run,
+                    getattr(self._backend, sync_name),
+                    *args,
+                )
+            else:
+                awaitable = getattr(self._backend, async_name)(*args)
+            try:
+                result = await asyncio.wait_for(awaitable, timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"{op} exceeded {timeout}s") from None
+        except Exception as exc:
+            return self._failed(op, exc, fallback)
+        finally:
+            _call_failed.reset(token)
+        self._breaker.record(not cell[0])
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report calls made, failures, timeouts and bypassed calls.
+
+        Returns:
+            Dict[str, Any]: ``calls``, ``failures``, ``timeouts`` and
+            ``bypassed`` counters, and the breaker's `CircuitBreaker.stats`
+            under ``breaker``.
+        """
+        with self._stats_lock:
+            stats: Dict[str, Any] = dict(self._counters)
+        stats["breaker"] = self._breaker.stats()
+        return stats
+
+    def _local_lock(self, key: str, timeout: float) -> Optional[_LocalToken]:
+        """
+        Take the process-local fallback lock of a key.
+        """
+        token = _local_locks.acquire(self, key, timeout)
+        return None if token is None else _LocalToken(token)
+
+    def _acquire_lock(self, key: str, timeout: float) -> Optional[Any]:
+        """Take a compute lock; a process-local one if the call does not succeed."""
+        token = self._call("lock", _UNAVAILABLE, key, timeout)
+        return self._local_lock(key, timeout) if token is _UNAVAILABLE else token
+
+    async def _aacquire_lock(self, key: str, timeout: float) -> Optional[Any]:
+        """Asynchronously take a compute lock. See `_acquire_lock`."""
+        token = await self._acall("lock", _UNAVAILABLE, key, timeout)
+        return self._local_lock(key, timeout) if token is _UNAVAILABLE else token
+
+    def _release_lock(self, key: str, token: Any) -> None:
+        """Release a compute lock; skipped if the call does not succeed."""
+        if isinstance(token, _LocalToken):
+            _local_locks.release(self, key, token.token)
+        else:
+            self._call("unlock", None, key, token)
+
+    async def _arelease_lock(self, key: str, token: Any) -> None:
+        """Asynchronously release a compute lock. See `_release_lock`."""
+        if isinstance(token, _LocalToken):
+            _local_locks.release(self, key, token.token)
+        else:
+            await self._acall("unlock", None, key, token)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retrieve a value; a miss if the call is bypassed, fails or times out."""
+        return self._call("get", None, key)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Asynchronously retrieve a value; a miss if the call does not succeed."""
+        return await self._acall("get", None, key)
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Retrieve a value with its metadata; a miss if the call does not succeed."""
+        return self._call("get_with_meta", None, key)
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Asynchronously retrieve a value with its metadata; a miss on failure."""
+        return await self._acall("get_with_meta", None, key)
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Retrieve a value and restart its expiration; a miss on failure."""
+        return self._call("get_and_touch", None, key, expire)
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Asynchronously retrieve a value and restart its expiration; a miss on failure."""
+        return await self._acall("get_and_touch", None, key, expire)
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Restart an entry's expiration; False if the call does not succeed."""
+        return self._call("touch", False, key, expire)
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Asynchronously restart an entry's expiration; False on failure."""
+        return await self._acall("touch", False, key, expire)
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Add to a counter; None if the call is bypassed, fails or times out."""
+        return self._call("incr", None, key, delta, expire)
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Asynchronously add to a counter; None if the call does not succeed."""
+        return await self._acall("incr", None, key, delta, expire)
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Retrieve a value with its version; a miss if the call does not succeed."""
+        return self._call("get_versioned", None, key)
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Asynchronously retrieve a value with its version; a miss on failure."""
+        return await self._acall("get_versioned", None, key)
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Store a value if its version is unchanged; False if the call does not succeed."""
+        return self._call("set_if_version", False, key, value, version, expire)
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Asynchronously store a value if its version is unchanged; False on failure."""
+        return await self._acall("set_if_version", False, key, value, version, expire)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Store a value; skipped if the call is bypassed, fails or times out."""
+        self._call("set", None, *_set_args(self, key, value, expire, tags, cost))
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Asynchronously store a value; skipped if the call does not succeed."""
+        await self._acall("set", None, *_set_args(self, key, value, expire, tags, cost))
+
+    def invalidate_tags(self, tags: Sequence[str]) -> None:
+        """Delete tagged keys; skipped if the call is bypassed, fails or times out."""
+        self._call("invalidate_tags", None, tags)
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """Asynchronously delete tagged keys; skipped if the call does not succeed."""
+        await self._acall("invalidate_tags", None, tags)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete the entries under ``prefix``; 0 if the call does not succeed."""
+        return self._call("delete_prefix", 0, prefix)
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """Asynchronously delete the entries under ``prefix``; 0 on failure."""
+        return await self._acall("delete_prefix", 0, prefix)
+
+    def delete(self, key: str) -> None:
+        """Delete a value; skipped if the call is bypassed, fails or times out."""
+        self._call("delete", None, key)
+
+    async def adelete(self, key: str) -> None:
+        """Asynchronously delete a value; skipped if the call does not succeed."""
+        await self._acall("delete", None, key)
+
+    def clear(self) -> None:
+        """Clear the namespace; skipped if the call is bypassed, fails or times out."""
+        self._call("clear", None)
+
+    async def aclear(self) -> None:
+        """Asynchronously clear the namespace; skipped if the call does not succeed."""
+        await self._acall("clear", None)
+
+    def has(self, key: str) -> bool:
+        """Check for a key; False if the call is bypassed, fails or times out."""
+        return self._call("has", False, key)
+
+    async def ahas(self, key: str) -> bool:
+        """Asynchronously check for a key; False if the call does not succeed."""
+        return await self._acall("has", False, key)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Retrieve several values; empty if the call does not succeed."""
+        return self._call("get_many", {}, keys)
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Asynchronously retrieve several values; empty if the call does not succeed."""
+        return await self._acall("get_many", {}, keys)
+
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Store several values; skipped if the call does not succeed."""
+        self._call("set_many", None, items, expire)
+
+    async def aset_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Asynchronously store several values; skipped if the call does not succeed."""
+        await self._acall("set_many", None, items, expire)
+
+    def close(self) -> None:
+        """
+        Close the wrapped backend and the wrapper's thread pool.
+        """
+        self._executor.shutdown(wait=False)
+        super().close()
+
+    async def aclose(self) -> None:
+        """
+        Asynchronously close the wrapped backend and the wrapper's thread pool.
+        """
+        self._executor.shutdown(wait=False)
+        await super().aclose()
@@ -1,10 +1,22 @@
 import hashlib
-from typing import Any, Optional, Union
+import math
+import uuid
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
 from datetime import timedelta
+from decimal import Decimal
 import pickle
 import time
 
-from .backend import CacheBackend
+from .backend import _INTERNAL_PREFIXES, CacheBackend, CacheEntry, VersionedValue
 
 
 class DynamoDBBackend(CacheBackend):
@@ -77,6 +89,7 @@ class DynamoDBBackend(CacheBackend):
 
         # Initialize async session
         self._async_resource = None
+        self._async_service = None
         self._async_table = None
         self._async_session = aioboto3.Session()
 
@@ -92,10 +105,10 @@ class DynamoDBBackend(CacheBackend):
             )
 
             # Enter the context and get the actual resource
-            actual_resource = await self._async_resource.__aenter__()
+            self._async_service = await self._async_resource.__aenter__()
 
             # Create the table from the actual resource
-            self._async_table = await actual_resource.Table(self._table_name)
+            self._async_table = await self._async_service.Table(self._table_name)
 
         return self._async_table
 
@@ -194,7 +207,7 @@ class DynamoDBBackend(CacheBackend):
         Returns:
             bytes: Serialized value.
         """
-        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        return self._dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
 
     def _deserialize_value(self, data: bytes) -> Any:
         """
@@ -206,7 +219,10 @@ class DynamoDBBackend(CacheBackend):
         Returns:
             Any: Deserialized value.
         """
-        return pickle.loads(bytes(data))
+        if isinstance(data, Decimal):
+            # Counters written by `incr` are stored as numbers.
+            return int(data)
+        return self._loads(bytes(data))
 
     def _build_item(
         self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
@@ -225,6 +241,8 @@ class DynamoDBBackend(CacheBackend):
         item = {
             "cache_key": self._make_key(key),
             "value": self._serialize_value(value),
+            "created_at": int(time.time()),
+            "version": uuid.uuid4().hex,
         }
 
         ttl = self._get_ttl(expire)
@@ -257,7 +275,72 @@ class DynamoDBBackend(CacheBackend):
                 return None
             value = self._deserialize_value(item["value"])
             return value
-        except Exception:
+        except Exception as exc:
+            self._report_error("get", exc)
+            return None
+
+    def _to_entry(self, item: dict) -> CacheEntry:
+        """
+        Build a `CacheEntry` from a live DynamoDB item.
+
+        Args:
+            item (dict): DynamoDB item.
+
+        Returns:
+            CacheEntry: The value with its remaining TTL and creation time
+            (None for items written without them).
+        """
+        ttl = float(item["ttl"]) - time.time() if "ttl" in item else None
+        created_at = float(item["created_at"]) if "created_at" in item else None
+        return CacheEntry(self._deserialize_value(item["value"]), ttl, created_at)
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """
+        Synchronously retrieve a value with its remaining TTL and creation time.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            Optional[CacheEntry]: The entry from a single item read, or None if
+            not found. Both times have a resolution of one second.
+        """
+        try:
+            response = self._sync_table.get_item(Key={"cache_key": self._make_key(key)})
+            item = response.get("Item")
+            if item is None:
+                return None
+            if self._is_expired(item):
+                self.delete(key)
+                return None
+            return self._to_entry(item)
+        except Exception as exc:
+            self._report_error("get", exc)
+            return None
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """
+        Asynchronously retrieve a value with its remaining TTL and creation time.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            Optional[CacheEntry]: The entry from a single item read, or None if
+            not found. Both times have a resolution of one second.
+        """
+        try:
+            table = await self._get_async_table()
+            response = await table.get_item(Key={"cache_key": self._make_key(key)})
+            item = response.get("Item")
+            if item is None:
+                return None
+            if self._is_expired(item):
+                await self.adelete(key)
+                return None
+            return self._to_entry(item)
+        except Exception as exc:
+            self._report_error("get", exc)
             return None
 
     async def aget(self, key: str) -> Optional[Any]:
@@ -285,28 +368,44 @@ class DynamoDBBackend(CacheBackend):
                 return None
 
             return self._deserialize_value(item["value"])
-        except Exception:
+        except Exception as exc:
+            self._report_error("get", exc)
             return None
 
     def set(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Synchronously set a value in the cache.
 
+        Tags use the default tag index: one item per tag listing its keys,
+        updated with conditional writes. A global secondary index cannot key
+        on a multi-valued attribute, so it cannot serve as the tag index.
+
         Args:
             key (str): The key under which to store the value.
             value (Any): The value to store.
             expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+            tags (Optional[Sequence[str]]): Tags to invalidate the entry by.
         """
         try:
             item = self._build_item(key, value, expire)
             self._sync_table.put_item(Item=item)
-        except Exception:
-            pass
+            if tags:
+                self._add_tags(key, tags)
+        except Exception as exc:
+            self._report_error("set", exc)
 
     async def aset(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Asynchronously set a value in the cache.
@@ -315,13 +414,266 @@ class DynamoDBBackend(CacheBackend):
             key (str): The key under which to store the value.
             value (Any): The value to store.
             expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+            tags (Optional[Sequence[str]]): Tags to invalidate the entry by, see `set`.
         """
         try:
             table = await self._get_async_table()
             item = self._build_item(key, value, expire)
             await table.put_item(Item=item)
-        except Exception:
-            pass
+            if tags:
+                await self._aadd_tags(key, tags)
+        except Exception as exc:
+            self._report_error("set", exc)
+
+    def _touch_request(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Dict[str, Any]:
+        """
+        Build the conditional ``UpdateItem`` arguments that restart an expiry.
+
+        The condition skips missing and expired items, so a touch never
+        creates an item.
+        """
+        ttl = self._get_ttl(expire)
+        request = {
+            "Key": {"cache_key": self._make_key(key)},
+            "ConditionExpression": (
+                "attribute_exists(cache_key) AND "
+                "(attribute_not_exists(#ttl) OR #ttl >= :now)"
+            ),
+            "ExpressionAttributeNames": {"#ttl": "ttl"},
+            "ExpressionAttributeValues": {":now": int(time.time())},
+        }
+        if ttl is None:
+            request["UpdateExpression"] = "REMOVE #ttl"
+        else:
+            request["UpdateExpression"] = "SET #ttl = :ttl"
+            request["ExpressionAttributeValues"][":ttl"] = ttl
+        return request
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Synchronously retrieve a value and restart its expiration.
+
+        A single conditional ``UpdateItem`` changes the ``ttl`` attribute and
+        returns the item.
+
+        Args:
+            key (str): The key to retrieve.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+                If None, the item no longer expires.
+
+        Returns:
+            Optional[Any]: The cached value, or None if not found.
+        """
+        try:
+            response = self._sync_table.update_item(
+                ReturnValues="ALL_NEW", **self._touch_request(key, expire)
+            )
+            return self._deserialize_value(response["Attributes"]["value"])
+        except Exception as exc:
+            if not self._condition_failed(exc):
+                self._report_error("get", exc)
+            return None
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Synchronously restart the expiration of an item with ``UpdateItem``.
+
+        Args:
+            key (str): The key to touch.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+                If None, the item no longer expires.
+
+        Returns:
+            bool: True if the key exists and is not expired, False otherwise.
+        """
+        try:
+            self._sync_table.update_item(**self._touch_request(key, expire))
+            return True
+        except Exception as exc:
+            if not self._condition_failed(exc):
+                self._report_error("touch", exc)
+            return False
+
+    def _incr_request(
+        self, key: str, delta: int, expire: Optional[Union[int, timedelta]]
+    ) -> Dict[str, Any]:
+        """
+        Build the ``UpdateItem`` arguments that add to a live counter.
+
+        ``ADD`` creates a missing counter; ``if_not_exists`` gives a new
+        counter its creation time and expiry.
+        """
+        values: Dict[str, Any] = {
+            ":delta": delta,
+            ":now": int(time.time()),
+            ":version": uuid.uuid4().hex,
+        }
+        update = (
+            "ADD #value :delta SET created_at = if_not_exists(created_at, :now), "
+            "version = :version"
+        )
+        ttl = self._get_ttl(expire)
+        if ttl is not None:
+            update += ", #ttl = if_not_exists(#ttl, :ttl)"
+            values[":ttl"] = ttl
+        return {
+            "Key": {"cache_key": self._make_key(key)},
+            "UpdateExpression": update,
+            "ConditionExpression": "attribute_not_exists(#ttl) OR #ttl >= :now",
+            "ExpressionAttributeNames": {"#value": "value", "#ttl": "ttl"},
+            "ExpressionAttributeValues": values,
+            "ReturnValues": "UPDATED_NEW",
+        }
+
+    def _to_versioned(self, item: Optional[dict]) -> Optional[VersionedValue]:
+        """
+        Build a `VersionedValue` from an item, or None if it is missing or expired.
+        """
+        if item is None or self._is_expired(item):
+            return None
+        return VersionedValue(
+            self._deserialize_value(item["value"]), item.get("version")
+        )
+
+    def _version_request(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[str],
+        expire: Optional[Union[int, timedelta]],
+    ) -> Dict[str, Any]:
+        """
+        Build the conditional ``PutItem`` arguments of `set_if_version`.
+
+        The put replaces a live item still at ``version``, or, without a
+        version, only a missing or expired item.
+        """
+        names = {"#ttl": "ttl"}
+        values: Dict[str, Any] = {":now": int(time.time())}
+        if version is None:
+            condition = "attribute_not_exists(cache_key) OR #ttl < :now"
+        else:
+            condition = (
+                "#version = :version AND (attribute_not_exists(#ttl) OR #ttl >= :now)"
+            )
+            names["#version"] = "version"
+            values[":version"] = version
+        return {
+            "Item": self._build_item(key, value, expire),
+            "ConditionExpression": condition,
+            "ExpressionAttributeNames": names,
+            "ExpressionAttributeValues": values,
+        }
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Synchronously retrieve a value with its ``version`` attribute.
+
+        Every write gives the item a new random version.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            Optional[VersionedValue]: The value and its version, or None if
+            not found.
+        """
+        try:
+            response = self._sync_table.get_item(Key={"cache_key": self._make_key(key)})
+            return self._to_versioned(response.get("Item"))
+        except Exception as exc:
+            self._report_error("get", exc)
+            return None
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[str],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Synchronously store a value only if the item is still at ``version``.
+
+        A conditional ``PutItem`` on the ``version`` attribute, which DynamoDB
+        checks and writes atomically.
+
+        Args:
+            key (str): The key under which to store the value.
+            value (Any): The value to store.
+            version (Optional[str]): The version from `get_versioned`, or None
+                to store the value only if the key does not exist.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+
+        Returns:
+            bool: True if the value was stored, False if the item changed or
+            the call failed.
+        """
+        try:
+            self._sync_table.put_item(
+                **self._version_request(key, value, version, expire)
+            )
+            return True
+        except Exception as exc:
+            if not self._condition_failed(exc):
+                self._report_error("set", exc)
+            return False
+
+    def _expired_request(self, key: str) -> Dict[str, Any]:
+        """
+        Build the ``DeleteItem`` arguments that remove an expired item.
+        """
+        return {
+            "Key": {"cache_key": self._make_key(key)},
+            "ConditionExpression": "#ttl < :now",
+            "ExpressionAttributeNames": {"#ttl": "ttl"},
+            "ExpressionAttributeValues": {":now": int(time.time())},
+        }
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """
+        Synchronously add ``delta`` to a counter with an ``ADD`` update.
+
+        An expired counter that DynamoDB has not removed yet fails the update's
+        condition; it is deleted and the update retried.
+
+        Args:
+            key (str): The counter key.
+            delta (int): The amount to add; negative to decrement. Defaults to 1.
+            expire (Optional[Union[int, timedelta]]): Expiration time of a new
+                counter, with a resolution of one second; an existing counter
+                keeps its expiry.
+
+        Returns:
+            Optional[int]: The new value, or None if the call failed.
+        """
+        try:
+            for _ in range(2):
+                try:
+                    response = self._sync_table.update_item(
+                        **self._incr_request(key, delta, expire)
+                    )
+                    return int(response["Attributes"]["value"])
+                except Exception as exc:
+                    if not self._condition_failed(exc):
+                        raise
+                try:
+                    self._sync_table.delete_item(**self._expired_request(key))
+                except Exception as exc:
+                    if not self._condition_failed(exc):
+                        raise
+        except Exception as exc:
+            self._report_error("incr", exc)
+        return None
 
     def delete(self, key: str) -> None:
         """
@@ -332,8 +684,108 @@ class DynamoDBBackend(CacheBackend):
         """
         try:
             self._sync_table.delete_item(Key={"cache_key": self._make_key(key)})
-        except Exception:
-            pass
+        except Exception as exc:
+            self._report_error("delete", exc)
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Asynchronously retrieve a value and restart its expiration.
+
+        See `get_and_touch`.
+        """
+        try:
+            table = await self._get_async_table()
+            response = await table.update_item(
+                ReturnValues="ALL_NEW", **self._touch_request(key, expire)
+            )
+            return self._deserialize_value(response["Attributes"]["value"])
+        except Exception as exc:
+            if not self._condition_failed(exc):
+                self._report_error("get", exc)
+            return None
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Asynchronously restart the expiration of an item.
+
+        See `touch`.
+        """
+        try:
+            table = await self._get_async_table()
+            await table.update_item(**self._touch_request(key, expire))
+            return True
+        except Exception as exc:
+            if not self._condition_failed(exc):
+                self._report_error("touch", exc)
+            return False
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """
+        Asynchronously add ``delta`` to a counter with an ``ADD`` update.
+
+        See `incr`.
+        """
+        try:
+            table = await self._get_async_table()
+            for _ in range(2):
+                try:
+                    response = await table.update_item(
+                        **self._incr_request(key, delta, expire)
+                    )
+                    return int(response["Attributes"]["value"])
+                except Exception as exc:
+                    if not self._condition_failed(exc):
+                        raise
+                try:
+                    await table.delete_item(**self._expired_request(key))
+                except Exception as exc:
+                    if not self._condition_failed(exc):
+                        raise
+        except Exception as exc:
+            self._report_error("incr", exc)
+        return None
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Asynchronously retrieve a value with its ``version`` attribute.
+
+        See `get_versioned`.
+        """
+        try:
+            table = await self._get_async_table()
+            response = await table.get_item(Key={"cache_key": self._make_key(key)})
+            return self._to_versioned(response.get("Item"))
+        except Exception as exc:
+            self._report_error("get", exc)
+            return None
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[str],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Asynchronously store a value only if the item is still at ``version``.
+
+        See `set_if_version`.
+        """
+        try:
+            table = await self._get_async_table()
+            await table.put_item(**self._version_request(key, value, version, expire))
+            return True
+        except Exception as exc:
+            if not self._condition_failed(exc):
+                self._report_error("set", exc)
+            return False
 
     async def adelete(self, key: str) -> None:
         """
@@ -345,8 +797,8 @@ class DynamoDBBackend(CacheBackend):
         try:
             table = await self._get_async_table()
             await table.delete_item(Key={"cache_key": self._make_key(key)})
-        except Exception:
-            pass
+        except Exception as exc:
+            self._report_error("delete", exc)
 
     def has(self, key: str) -> bool:
         """
@@ -376,7 +828,8 @@ class DynamoDBBackend(CacheBackend):
                 return False
 
             return True
-        except Exception:
+        except Exception as exc:
+            self._report_error("has", exc)
             return False
 
     async def ahas(self, key: str) -> bool:
@@ -408,7 +861,8 @@ class DynamoDBBackend(CacheBackend):
                 return False
 
             return True
-        except Exception:
+        except Exception as exc:
+            self._report_error("has", exc)
             return False
 
     def clear(self) -> None:
@@ -443,8 +897,8 @@ class DynamoDBBackend(CacheBackend):
                         for item in response["Items"]:
                             batch.delete_item(Key={"cache_key": item["cache_key"]})
 
-        except Exception:
-            pass
+        except Exception as exc:
+            self._report_error("clear", exc)
 
     async def aclear(self) -> None:
         """
@@ -482,8 +936,278 @@ class DynamoDBBackend(CacheBackend):
                                 Key={"cache_key": item["cache_key"]}
                             )
 
-        except Exception:
-            pass
+        except Exception as exc:
+            self._report_error("clear", exc)
+
+    def _scan_request(self, prefix: str, page_size: int) -> Dict[str, Any]:
+        """
+        Build the paginated Scan of the items whose key starts with ``prefix``.
+
+        The table's only key is the partition key, so the prefix cannot be
+        a Query condition; ``Limit`` bounds each page to ``page_size`` items
+        read, so a page may hold fewer matching items.
+        """
+        return {
+            "FilterExpression": "begins_with(cache_key, :prefix)",
+            "ExpressionAttributeValues": {":prefix": f"{self._namespace}:{prefix}"},
+            "ProjectionExpression": "cache_key, #ttl",
+            "ExpressionAttributeNames": {"#ttl": "ttl"},
+            "Limit": page_size,
+        }
+
+    def _page_keys(self, items: Sequence[dict]) -> list:
+        """
+        Extract the live, non-internal keys of a Scan page, without the namespace.
+        """
+        offset = len(self._namespace) + 1
+        keys = []
+        for item in items:
+            key = item["cache_key"][offset:]
+            if not self._is_expired(item) and not key.startswith(_INTERNAL_PREFIXES):
+                keys.append(key)
+        return keys
+
+    def iter_keys(self, prefix: str = "", batch_size: int = 100) -> Iterator[str]:
+        """
+        Synchronously iterate over the keys starting with ``prefix``.
+
+        Pages through a Scan, one page of ``batch_size`` items in memory at a
+        time. Keys longer than 1 KB are stored hashed, so they are listed as
+        ``hash:<sha256>``.
+
+        Args:
+            prefix (str): Only list keys starting with this prefix.
+            batch_size (int): How many items each Scan page reads.
+
+        Yields:
+            str: The keys of live entries, without the namespace.
+        """
+        request = self._scan_request(prefix, batch_size)
+        try:
+            while True:
+                response = self._sync_table.scan(**request)
+                yield from self._page_keys(response.get("Items", []))
+                if "LastEvaluatedKey" not in response:
+                    return
+                request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except Exception as exc:
+            self._report_error("iter_keys", exc)
+
+    async def aiter_keys(
+        self, prefix: str = "", batch_size: int = 100
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously iterate over the keys starting with ``prefix``.
+
+        See `iter_keys`.
+
+        Args:
+            prefix (str): Only list keys starting with this prefix.
+            batch_size (int): How many items each Scan page reads.
+
+        Yields:
+            str: The keys of live entries, without the namespace.
+        """
+        request = self._scan_request(prefix, batch_size)
+        try:
+            table = await self._get_async_table()
+            while True:
+                response = await table.scan(**request)
+                for key in self._page_keys(response.get("Items", [])):
+                    yield key
+                if "LastEvaluatedKey" not in response:
+                    return
+                request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except Exception as exc:
+            self._report_error("iter_keys", exc)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Synchronously delete every entry whose key starts with ``prefix``.
+
+        Each Scan page is deleted with a batch writer before the next page is
+        read.
+
+        Args:
+            prefix (str): The key prefix, without the namespace.
+
+        Returns:
+            int: How many items were deleted, expired ones included.
+        """
+        deleted = 0
+        request = self._scan_request(prefix, 500)
+        try:
+            while True:
+                response = self._sync_table.scan(**request)
+                items = response.get("Items", [])
+                if items:
+                    with self._sync_table.batch_writer() as batch:
+                        for item in items:
+                            batch.delete_item(Key={"cache_key": item["cache_key"]})
+                    deleted += len(items)
+                if "LastEvaluatedKey" not in response:
+                    break
+                request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except Exception as exc:
+            self._report_error("delete_prefix", exc)
+        return deleted
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """
+        Asynchronously delete every entry whose key starts with ``prefix``.
+
+        See `delete_prefix`.
+
+        Args:
+            prefix (str): The key prefix, without the namespace.
+
+        Returns:
+            int: How many items were deleted, expired ones included.
+        """
+        deleted = 0
+        request = self._scan_request(prefix, 500)
+        try:
+            table = await self._get_async_table()
+            while True:
+                response = await table.scan(**request)
+                items = response.get("Items", [])
+                if items:
+                    async with table.batch_writer() as batch:
+                        for item in items:
+                            await batch.delete_item(
+                                Key={"cache_key": item["cache_key"]}
+                            )
+                    deleted += len(items)
+                if "LastEvaluatedKey" not in response:
+                    break
+                request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except Exception as exc:
+            self._report_error("delete_prefix", exc)
+        return deleted
+
+    def _batch_get_requests(self, keys: Sequence[str]):
+        """
+        Split keys into BatchGetItem request payloads of at most 100 keys.
+
+        Args:
+            keys (Sequence[str]): The original (non-namespaced) keys.
+
+        Returns:
+            Tuple[Dict[str, str], list]: Namespaced key to original key, and
+            the `RequestItems` payloads.
+        """
+        mapping = {self._make_key(key): key for key in keys}
+        cache_keys = [{"cache_key": k} for k in mapping]
+        requests = [
+            {self._table_name: {"Keys": cache_keys[i : i + 100]}}
+            for i in range(0, len(cache_keys), 100)
+        ]
+        return mapping, requests
+
+    def _collect_batch_items(
+        self, response: dict, mapping: Dict[str, str], result: Dict[str, Any]
+    ) -> Optional[dict]:
+        """
+        Decode the items of a BatchGetItem response into ``result``.
+
+        Args:
+            response (dict): The BatchGetItem response.
+            mapping (Dict[str, str]): Namespaced key to original key.
+            result (Dict[str, Any]): Accumulator for decoded values.
+
+        Returns:
+            Optional[dict]: The unprocessed keys to retry, if any.
+        """
+        for item in response.get("Responses", {}).get(self._table_name, []):
+            if not self._is_expired(item):
+                result[mapping[item["cache_key"]]] = self._deserialize_value(
+                    item["value"]
+                )
+        return response.get("UnprocessedKeys") or None
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Synchronously retrieve several values with BatchGetItem.
+
+        Args:
+            keys (Sequence[str]): The keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The cached values of the keys that were found.
+        """
+        result: Dict[str, Any] = {}
+        try:
+            mapping, requests = self._batch_get_requests(keys)
+            for request in requests:
+                while request:
+                    response = self._sync_resource.batch_get_item(RequestItems=request)
+                    request = self._collect_batch_items(response, mapping, result)
+        except Exception as exc:
+            self._report_error("get_many", exc)
+        return result
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Asynchronously retrieve several values with BatchGetItem.
+
+        Args:
+            keys (Sequence[str]): The keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The cached values of the keys that were found.
+        """
+        result: Dict[str, Any] = {}
+        try:
+            await self._get_async_table()
+            mapping, requests = self._batch_get_requests(keys)
+            for request in requests:
+                while request:
+                    response = await self._async_service.batch_get_item(
+                        RequestItems=request
+                    )
+                    request = self._collect_batch_items(response, mapping, result)
+        except Exception as exc:
+            self._report_error("get_many", exc)
+        return result
+
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """
+        Synchronously set several values with a batch writer.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+        """
+        try:
+            with self._sync_table.batch_writer() as batch:
+                for key, value in items.items():
+                    batch.put_item(Item=self._build_item(key, value, expire))
+        except Exception as exc:
+            self._report_error("set_many", exc)
+
+    async def aset_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """
+        Asynchronously set several values with a batch writer.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+        """
+        try:
+            table = await self._get_async_table()
+            async with table.batch_writer() as batch:
+                for key, value in items.items():
+                    await batch.put_item(Item=self._build_item(key, value, expire))
+        except Exception as exc:
+            self._report_error("set_many", exc)
 
     async def close(self) -> None:
         """
@@ -492,4 +1216,104 @@ class DynamoDBBackend(CacheBackend):
         if self._async_resource:
             await self._async_resource.__aexit__(None, None, None)
             self._async_resource = None
+            self._async_service = None
             self._async_table = None
+
+    def _lock_request(self, key: str, timeout: float) -> Dict[str, Any]:
+        """
+        Build the conditional ``PutItem`` arguments that take a compute lock.
+
+        The put only succeeds if no lock item exists or the existing one has
+        expired, which DynamoDB evaluates atomically.
+        """
+        now = time.time()
+        return {
+            "Item": {
+                "cache_key": self._make_key(f"__lock__:{key}"),
+                "token": uuid.uuid4().hex,
+                "ttl": math.ceil(now + timeout),
+            },
+            "ConditionExpression": "attribute_not_exists(cache_key) OR #ttl < :now",
+            "ExpressionAttributeNames": {"#ttl": "ttl"},
+            "ExpressionAttributeValues": {":now": int(now)},
+        }
+
+    def _unlock_request(self, key: str, token: str) -> Dict[str, Any]:
+        """
+        Build the conditional ``DeleteItem`` arguments that release a lock.
+        """
+        return {
+            "Key": {"cache_key": self._make_key(f"__lock__:{key}")},
+            "ConditionExpression": "#token = :token",
+            "ExpressionAttributeNames": {"#token": "token"},
+            "ExpressionAttributeValues": {":token": token},
+        }
+
+    @staticmethod
+    def _condition_failed(exc: Exception) -> bool:
+        """
+        Check whether an exception is a failed condition of a conditional write.
+        """
+        response = getattr(exc, "response", None) or {}
+        code = response.get("Error", {}).get("Code")
+        return code == "ConditionalCheckFailedException"
+
+    def _acquire_lock(self, key: str, timeout: float) -> Optional[str]:
+        """
+        Take a key's compute lock with a conditional ``PutItem``.
+
+        Args:
+            key (str): The cache key the lock guards.
+            timeout (float): Seconds until the lock expires, rounded up to
+                whole seconds.
+
+        Returns:
+            Optional[str]: The lock token, or None if the lock is held.
+        """
+        request = self._lock_request(key, timeout)
+        try:
+            self._sync_table.put_item(**request)
+        except Exception as exc:
+            if self._condition_failed(exc):
+                return None
+            self._report_error("lock", exc)
+            raise
+        return request["Item"]["token"]
+
+    def _release_lock(self, key: str, token: str) -> None:
+        """
+        Delete a compute lock if ``token`` still owns it.
+        """
+        try:
+            self._sync_table.delete_item(**self._unlock_request(key, token))
+        except Exception as exc:
+            if not self._condition_failed(exc):
+                self._report_error("lock", exc)
+
+    async def _aacquire_lock(self, key: str, timeout: float) -> Optional[str]:
+        """
+        Asynchronously take a key's compute lock with a conditional ``PutItem``.
+
+        See `_acquire_lock`.
+        """
+        request = self._lock_request(key, timeout)
+        try:
+            table = await self._get_async_table()
+            await table.put_item(**request)
+        except Exception as exc:
+            if self._condition_failed(exc):
+                return None
+            self._report_error("lock", exc)
+            raise
+        return request["Item"]["token"]
+
+    async def _arelease_lock(self, key: str, token: str) -> None:
+        """
+        Asynchronously delete a compute lock if ``token`` still owns it.
+        """
+        try:
+            table = await self._get_async_table()
+            await table.delete_item(**self._unlock_request(key, token))
+        except Exception as exc:
+            if not self._condition_failed(exc):
+                self._report_error("lock", exc)
@@ -1,12 +1,28 @@
 import pickle
 import threading
+import uuid
 import time
-from typing import Any, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
 from datetime import timedelta
 
 from apscheduler.schedulers.background import BackgroundScheduler
 
-from .backend import CacheBackend
+from .backend import (
+    _INTERNAL_PREFIXES,
+    CacheBackend,
+    CacheEntry,
+    VersionedValue,
+    _prefix_upper,
+)
 
 
 class FirestoreBackend(CacheBackend):
@@ -174,13 +190,17 @@ class FirestoreBackend(CacheBackend):
             data = doc.to_dict()
             if not self._is_expired(data.get("expires_at")):
                 try:
-                    return pickle.loads(data["value"])
+                    return self._loads(data["value"])
                 except (pickle.UnpicklingError, KeyError):
                     return None
         return None
 
     def set(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Synchronously stores a value in the cache under the specified key.
@@ -195,6 +215,8 @@ class FirestoreBackend(CacheBackend):
             expire (Optional[Union[int, timedelta]], optional): The expiration time
                 for the cache entry. Can be specified as an integer (seconds) or a
                 timedelta. If None, the entry does not expire.
+            tags (Optional[Sequence[str]], optional): Tags to invalidate the
+                entry by, stored in the document's ``tags`` array.
 
         Notes:
             - The value is serialized using pickle.
@@ -203,13 +225,445 @@ class FirestoreBackend(CacheBackend):
         doc_ref = self._sync_db.collection(self._collection_name).document(
             self._make_key(key)
         )
-        data = {"value": pickle.dumps(value)}
+        data = {
+            "key": self._key_field(key),
+            "value": self._dumps(value),
+            "created_at": time.time(),
+        }
         exptime = self._compute_expire_at(expire)
         if exptime is not None:
             data["expires_at"] = exptime
+        if tags:
+            data["tags"] = self._tag_values(tags)
 
         doc_ref.set(data)
 
+    def _key_field(self, key: str) -> str:
+        """
+        The namespaced key stored in a document's ``key`` field.
+
+        Document IDs are hashes, so prefix scans query this field instead;
+        Firestore indexes it automatically.
+        """
+        return f"{self._namespace}:{key}"
+
+    def _prefix_query(self, db: Any, prefix: str, limit: int) -> Any:
+        """
+        Builds the query of the first ``limit`` documents whose key starts with
+        ``prefix``, in key order.
+        """
+        k_prefix = self._key_field(prefix)
+        return (
+            db.collection(self._collection_name)
+            .where("key", ">=", k_prefix)
+            .where("key", "<", _prefix_upper(k_prefix))
+            .order_by("key")
+            .limit(limit)
+        )
+
+    def _page_keys(self, docs: Sequence[Any]) -> list:
+        """
+        Extracts the live, non-internal keys of a page, without the namespace.
+        """
+        offset = len(self._key_field(""))
+        keys = []
+        for doc in docs:
+            data = doc.to_dict()
+            key = data["key"][offset:]
+            if not self._is_expired(data.get("expires_at")) and not key.startswith(
+                _INTERNAL_PREFIXES
+            ):
+                keys.append(key)
+        return keys
+
+    def iter_keys(self, prefix: str = "", batch_size: int = 100) -> Iterator[str]:
+        """
+        Synchronously iterates over the keys starting with ``prefix``, in key order.
+
+        Pages of ``batch_size`` documents are read with a range query on the
+        ``key`` field, each starting after the last key of the previous page.
+        Documents written before the ``key`` field existed are not listed.
+
+        Args:
+            prefix (str): Only list keys starting with this prefix.
+            batch_size (int): How many documents to read per query.
+
+        Yields:
+            str: The keys of live entries, without the namespace.
+        """
+        query = self._prefix_query(self._sync_db, prefix, batch_size).select(
+            ["key", "expires_at"]
+        )
+        page = query
+        while True:
+            docs = list(page.stream())
+            yield from self._page_keys(docs)
+            if len(docs) < batch_size:
+                return
+            page = query.start_after({"key": docs[-1].get("key")})
+
+    async def aiter_keys(
+        self, prefix: str = "", batch_size: int = 100
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously iterates over the keys starting with ``prefix``, in key order.
+
+        See `iter_keys`.
+
+        Args:
+            prefix (str): Only list keys starting with this prefix.
+            batch_size (int): How many documents to read per query.
+
+        Yields:
+            str: The keys of live entries, without the namespace.
+        """
+        query = self._prefix_query(self._async_db, prefix, batch_size).select(
+            ["key", "expires_at"]
+        )
+        page = query
+        while True:
+            docs = [doc async for doc in page.stream()]
+            for key in self._page_keys(docs):
+                yield key
+            if len(docs) < batch_size:
+                return
+            page = query.start_after({"key": docs[-1].get("key")})
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Synchronously deletes every entry whose key starts with ``prefix``.
+
+        The first 500 matching documents are read and deleted in one batch
+        until none are left.
+
+        Args:
+            prefix (str): The key prefix, without the namespace.
+
+        Returns:
+            int: How many documents were deleted, expired ones included.
+        """
+        query = self._prefix_query(self._sync_db, prefix, 500).select(["key"])
+        deleted = 0
+        while True:
+            docs = list(query.stream())
+            if not docs:
+                return deleted
+            batch = self._sync_db.batch()
+            for doc in docs:
+                batch.delete(doc.reference)
+            batch.commit()
+            deleted += len(docs)
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """
+        Asynchronously deletes every entry whose key starts with ``prefix``.
+
+        See `delete_prefix`.
+
+        Args:
+            prefix (str): The key prefix, without the namespace.
+
+        Returns:
+            int: How many documents were deleted, expired ones included.
+        """
+        query = self._prefix_query(self._async_db, prefix, 500).select(["key"])
+        deleted = 0
+        while True:
+            docs = [doc async for doc in query.stream()]
+            if not docs:
+                return deleted
+            batch = self._async_db.batch()
+            for doc in docs:
+                batch.delete(doc.reference)
+            await batch.commit()
+            deleted += len(docs)
+
+    def _tag_values(self, tags: Sequence[str]) -> list:
+        """
+        Namespaces tags, since namespaces share the collection.
+        """
+        return [f"{self._namespace}:{tag}" for tag in tags]
+
+    def _tagged_queries(self, db: Any, tags: Sequence[str]) -> list:
+        """
+        Builds the queries for the documents of several tags.
+
+        ``array_contains_any`` takes at most 30 values, so longer tag lists
+        are split over several queries.
+        """
+        values = self._tag_values(tags)
+        collection = db.collection(self._collection_name)
+        return [
+            collection.where("tags", "array_contains_any", values[i : i + 30])
+            for i in range(0, len(values), 30)
+        ]
+
+    def invalidate_tags(self, tags: Sequence[str]) -> None:
+        """
+        Synchronously deletes every entry stored with any of ``tags``.
+
+        Firestore indexes array fields automatically, so the documents are
+        found with ``array_contains_any`` queries and deleted in batches.
+
+        Args:
+            tags (Sequence[str]): The tags to invalidate.
+        """
+        batch = self._sync_db.batch()
+        count = 0
+        for query in self._tagged_queries(self._sync_db, tags):
+            for doc in query.stream():
+                batch.delete(doc.reference)
+                count += 1
+                if count == 500:
+                    batch.commit()
+                    batch = self._sync_db.batch()
+                    count = 0
+        if count > 0:
+            batch.commit()
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """
+        Asynchronously deletes every entry stored with any of ``tags``.
+
+        See `invalidate_tags`.
+        """
+        batch = self._async_db.batch()
+        count = 0
+        for query in self._tagged_queries(self._async_db, tags):
+            async for doc in query.stream():
+                batch.delete(doc.reference)
+                count += 1
+                if count == 500:
+                    await batch.commit()
+                    batch = self._async_db.batch()
+                    count = 0
+        if count > 0:
+            await batch.commit()
+
+    def _expiry_update(self, expire: Optional[Union[int, timedelta]]) -> Dict[str, Any]:
+        """
+        Build the field update that restarts or removes a document's expiry.
+        """
+        from google.cloud import firestore
+
+        exptime = self._compute_expire_at(expire)
+        return {"expires_at": firestore.DELETE_FIELD if exptime is None else exptime}
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Synchronously retrieves a value and restarts its expiration.
+
+        The document is read, then only its ``expires_at`` field is updated,
+        on the condition that the document has not changed since the read.
+
+        Args:
+            key (str): The cache key to retrieve.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+                If None, the entry no longer expires.
+
+        Returns:
+            Optional[Any]: The cached Python object, or None if not found or expired.
+
+        Notes:
+            - If the document changes between the read and the update, the
+              value read is returned and the expiry is left as written.
+        """
+        doc_ref = self._sync_db.collection(self._collection_name).document(
+            self._make_key(key)
+        )
+        doc = doc_ref.get()
+        entry = self._to_entry(doc)
+        if entry is None:
+            return None
+        try:
+            doc_ref.update(
+                self._expiry_update(expire),
+                option=self._sync_db.write_option(last_update_time=doc.update_time),
+            )
+        except Exception as exc:
+            self._report_error("touch", exc)
+        return entry.value
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Synchronously restarts the expiration of an entry.
+
+        Args:
+            key (str): The cache key to touch.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+                If None, the entry no longer expires.
+
+        Returns:
+            bool: True if the key exists and is not expired, False otherwise.
+        """
+        return self.get_and_touch(key, expire) is not None
+
+    def _incr_write(
+        self,
+        transaction: Any,
+        doc_ref: Any,
+        snapshot: Any,
+        key: str,
+        delta: int,
+        expire: Optional[Union[int, timedelta]],
+    ) -> int:
+        """
+        Write the incremented counter inside a transaction.
+
+        A missing or expired counter is replaced by a new one holding
+        ``delta``; otherwise only ``value`` is updated.
+        """
+        data = snapshot.to_dict() if snapshot.exists else None
+        if data is not None and not self._is_expired(data.get("expires_at")):
+            value = data["value"] + delta
+            transaction.update(doc_ref, {"value": value})
+            return value
+        data = {"key": self._key_field(key), "value": delta, "created_at": time.time()}
+        exptime = self._compute_expire_at(expire)
+        if exptime is not None:
+            data["expires_at"] = exptime
+        transaction.set(doc_ref, data)
+        return delta
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> int:
+        """
+        Synchronously adds ``delta`` to a counter in a transaction.
+
+        Args:
+            key (str): The counter key.
+            delta (int): The amount to add; negative to decrement. Defaults to 1.
+            expire (Optional[Union[int, timedelta]]): Expiration time of a new
+                counter; an existing counter keeps its expiry.
+
+        Returns:
+            int: The new value.
+
+        Notes:
+            - A transaction rather than ``Increment``, which cannot report the
+              new value or restart an expired counter. Firestore retries it
+              when concurrent increments conflict.
+        """
+        from google.cloud import firestore
+
+        doc_ref = self._sync_db.collection(self._collection_name).document(
+            self._make_key(key)
+        )
+
+        @firestore.transactional
+        def add(transaction) -> int:
+            snapshot = doc_ref.get(transaction=transaction)
+            return self._incr_write(transaction, doc_ref, snapshot, key, delta, expire)
+
+        return add(self._sync_db.transaction())
+
+    def _to_versioned(self, doc) -> Optional[VersionedValue]:
+        """
+        Turns a document snapshot into a `VersionedValue` versioned by its update time.
+        """
+        entry = self._to_entry(doc)
+        return None if entry is None else VersionedValue(entry.value, doc.update_time)
+
+    def _version_data(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]],
+        update: bool,
+    ) -> Dict[str, Any]:
+        """
+        Builds the fields of a versioned write.
+
+        An update replacing a document also removes an expiry it no longer has.
+        """
+        data = {
+            "key": self._key_field(key),
+            "value": self._dumps(value),
+            "created_at": time.time(),
+        }
+        if update:
+            data.update(self._expiry_update(expire))
+        else:
+            exptime = self._compute_expire_at(expire)
+            if exptime is not None:
+                data["expires_at"] = exptime
+        return data
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Synchronously retrieves a value with its version.
+
+        The version is the document's update time, which Firestore changes on
+        every write of the document.
+
+        Args:
+            key (str): The cache key to retrieve.
+
+        Returns:
+            Optional[VersionedValue]: The value and its version, or None if
+            not found or expired.
+
+        Notes:
+            - `touch` updates the document too, so it also changes the version.
+        """
+        doc_ref = self._sync_db.collection(self._collection_name).document(
+            self._make_key(key)
+        )
+        return self._to_versioned(doc_ref.get())
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Synchronously stores a value only if the document is still at ``version``.
+
+        The write carries a ``last_update_time`` precondition, which Firestore
+        checks atomically. Without a version, the document is created, which
+        fails if it exists; an expired document is replaced under the
+        precondition of its own update time.
+
+        Args:
+            key (str): The cache key to store the value under.
+            value (Any): The Python object to cache.
+            version (Any): The version from `get_versioned`, or None to store
+                the value only if the key does not exist.
+            expire (Optional[Union[int, timedelta]], optional): The expiration time.
+
+        Returns:
+            bool: True if the value was stored, False if the document changed.
+        """
+        from google.api_core.exceptions import Conflict, FailedPrecondition, NotFound
+
+        doc_ref = self._sync_db.collection(self._collection_name).document(
+            self._make_key(key)
+        )
+        if version is None:
+            doc = doc_ref.get()
+            if doc.exists and self._to_entry(doc) is not None:
+                return False
+            version = doc.update_time if doc.exists else None
+        try:
+            if version is None:
+                doc_ref.create(self._version_data(key, value, expire, update=False))
+            else:
+                doc_ref.update(
+                    self._version_data(key, value, expire, update=True),
+                    option=self._sync_db.write_option(last_update_time=version),
+                )
+        except (Conflict, FailedPrecondition, NotFound):
+            return False
+        return True
+
     def delete(self, key: str) -> None:
         """
         Synchronously deletes a cache entry by key.
@@ -268,6 +722,68 @@ class FirestoreBackend(CacheBackend):
             return not self._is_expired(data.get("expires_at"))
         return False
 
+    def _to_entry(self, doc) -> Optional[CacheEntry]:
+        """
+        Turns a document snapshot into a `CacheEntry`.
+
+        Args:
+            doc (DocumentSnapshot): The fetched document.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if the document is missing,
+            expired or cannot be decoded.
+        """
+        if not doc.exists:
+            return None
+        data = doc.to_dict()
+        expires_at = data.get("expires_at")
+        if self._is_expired(expires_at):
+            return None
+        try:
+            value = self._loads(data["value"])
+        except (pickle.UnpicklingError, KeyError):
+            return None
+        ttl = None if expires_at is None else expires_at - time.time()
+        return CacheEntry(value, ttl, data.get("created_at"))
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """
+        Synchronously retrieves a value with its remaining TTL and creation time.
+
+        Args:
+            key (str): The cache key to retrieve.
+
+        Returns:
+            Optional[CacheEntry]: The entry from a single document read, or None
+            if not found or expired.
+
+        Notes:
+            - ``expires_at`` has a resolution of one second, and so has the TTL.
+        """
+        doc_ref = self._sync_db.collection(self._collection_name).document(
+            self._make_key(key)
+        )
+        return self._to_entry(doc_ref.get())
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """
+        Asynchronously retrieves a value with its remaining TTL and creation time.
+
+        Args:
+            key (str): The cache key to retrieve.
+
+        Returns:
+            Optional[CacheEntry]: The entry from a single document read, or None
+            if not found or expired.
+
+        Notes:
+            - ``expires_at`` has a resolution of one second, and so has the TTL.
+        """
+        doc_ref = self._async_db.collection(self._collection_name).document(
+            self._make_key(key)
+        )
+        return self._to_entry(await doc_ref.get())
+
     async def aget(self, key: str) -> Optional[Any]:
         """
         Asynchronously retrieves a value from the cache by key.
@@ -294,14 +810,18 @@ class FirestoreBackend(CacheBackend):
             data = doc.to_dict()
             if not self._is_expired(data.get("expires_at")):
                 try:
-                    return pickle.loads(data["value"])
+                    return self._loads(data["value"])
                 except (pickle.UnpicklingError, KeyError):
                     # Handle potential deserialization errors or missing value field
                     return None
         return None
 
     async def aset(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Asynchronously stores a value in the cache under the specified key.
@@ -316,6 +836,8 @@ class FirestoreBackend(CacheBackend):
             expire (Optional[Union[int, timedelta]], optional): The expiration time
                 for the cache entry. Can be specified as an integer (seconds) or a
                 timedelta. If None, the entry does not expire.
+            tags (Optional[Sequence[str]], optional): Tags to invalidate the
+                entry by, stored in the document's ``tags`` array.
 
         Notes:
             - The value is serialized using pickle.
@@ -324,14 +846,123 @@ class FirestoreBackend(CacheBackend):
         doc_ref = self._async_db.collection(self._collection_name).document(
             self._make_key(key)
         )
-        data = {"value": pickle.dumps(value)}
+        data = {
+            "key": self._key_field(key),
+            "value": self._dumps(value),
+            "created_at": time.time(),
+        }
         exptime = self._compute_expire_at(expire)
 
         if expire is not None:
             data["expires_at"] = exptime
+        if tags:
+            data["tags"] = self._tag_values(tags)
 
         await doc_ref.set(data)
 
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Asynchronously retrieves a value and restarts its expiration.
+
+        See `get_and_touch`.
+        """
+        doc_ref = self._async_db.collection(self._collection_name).document(
+            self._make_key(key)
+        )
+        doc = await doc_ref.get()
+        entry = self._to_entry(doc)
+        if entry is None:
+            return None
+        try:
+            await doc_ref.update(
+                self._expiry_update(expire),
+                option=self._async_db.write_option(last_update_time=doc.update_time),
+            )
+        except Exception as exc:
+            self._report_error("touch", exc)
+        return entry.value
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Asynchronously restarts the expiration of an entry.
+
+        See `touch`.
+        """
+        return await self.aget_and_touch(key, expire) is not None
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> int:
+        """
+        Asynchronously adds ``delta`` to a counter in a transaction.
+
+        See `incr`.
+        """
+        from google.cloud import firestore
+
+        doc_ref = self._async_db.collection(self._collection_name).document(
+            self._make_key(key)
+        )
+
+        @firestore.async_transactional
+        async def add(transaction) -> int:
+            snapshot = await doc_ref.get(transaction=transaction)
+            return self._incr_write(transaction, doc_ref, snapshot, key, delta, expire)
+
+        return await add(self._async_db.transaction())
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Asynchronously retrieves a value with its version.
+
+        See `get_versioned`.
+        """
+        doc_ref = self._async_db.collection(self._collection_name).document(
+            self._make_key(key)
+        )
+        return self._to_versioned(await doc_ref.get())
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Asynchronously stores a value only if the document is still at ``version``.
+
+        See `set_if_version`.
+        """
+        from google.api_core.exceptions import Conflict, FailedPrecondition, NotFound
+
+        doc_ref = self._async_db.collection(self._collection_name).document(
+            self._make_key(key)
+        )
+        if version is None:
+            doc = await doc_ref.get()
+            if doc.exists and self._to_entry(doc) is not None:
+                return False
+            version = doc.update_time if doc.exists else None
+        try:
+            if version is None:
+                await doc_ref.create(
+                    self._version_data(key, value, expire, update=False)
+                )
+            else:
+                await doc_ref.update(
+                    self._version_data(key, value, expire, update=True),
+                    option=self._async_db.write_option(last_update_time=version),
+                )
+        except (Conflict, FailedPrecondition, NotFound):
+            return False
+        return True
+
     async def adelete(self, key: str) -> None:
         """
         Asynchronously deletes a cache entry by key.
@@ -390,6 +1021,138 @@ class FirestoreBackend(CacheBackend):
             return not self._is_expired(data.get("expires_at"))
         return False
 
+    def _decode_snapshots(self, snapshots, mapping: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Decodes document snapshots returned by `get_all`.
+
+        Args:
+            snapshots: Iterable of Firestore document snapshots.
+            mapping (Dict[str, str]): Document ID to original cache key.
+
+        Returns:
+            Dict[str, Any]: The values of the documents that exist and are not expired.
+        """
+        result = {}
+        for doc in snapshots:
+            if not doc.exists:
+                continue
+            data = doc.to_dict()
+            if self._is_expired(data.get("expires_at")):
+                continue
+            try:
+                result[mapping[doc.id]] = self._loads(data["value"])
+            except (pickle.UnpicklingError, KeyError):
+                continue
+        return result
+
+    def _batch_payload(
+        self, items: Mapping[str, Any], expire: Optional[Union[int, timedelta]]
+    ) -> list:
+        """
+        Builds the document IDs and data for a batched write.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]]): The expiration time.
+
+        Returns:
+            list: `(document_id, data)` pairs.
+        """
+        exptime = self._compute_expire_at(expire)
+        payload = []
+        for key, value in items.items():
+            data = {
+                "key": self._key_field(key),
+                "value": self._dumps(value),
+                "created_at": time.time(),
+            }
+            if exptime is not None:
+                data["expires_at"] = exptime
+            payload.append((self._make_key(key), data))
+        return payload
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Synchronously retrieves several values with a single batched read.
+
+        Args:
+            keys (Sequence[str]): The cache keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The values of the keys that are present and not expired.
+
+        Notes:
+            - Uses `Client.get_all`, which fetches all documents in one RPC.
+        """
+        if not keys:
+            return {}
+        collection = self._sync_db.collection(self._collection_name)
+        mapping = {self._make_key(key): key for key in keys}
+        refs = [collection.document(doc_id) for doc_id in mapping]
+        return self._decode_snapshots(self._sync_db.get_all(refs), mapping)
+
+    def set_many(
+        self, items: Mapping[str, Any], expire: Optional[Union[int, timedelta]] = None
+    ) -> None:
+        """
+        Synchronously stores several values with batched writes.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]], optional): The expiration time
+                applied to every item.
+
+        Notes:
+            - Writes are committed in batches of up to 500 documents.
+        """
+        collection = self._sync_db.collection(self._collection_name)
+        payload = self._batch_payload(items, expire)
+        for start in range(0, len(payload), 500):
+            batch = self._sync_db.batch()
+            for doc_id, data in payload[start : start + 500]:
+                batch.set(collection.document(doc_id), data)
+            batch.commit()
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Asynchronously retrieves several values with a single batched read.
+
+        Args:
+            keys (Sequence[str]): The cache keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The values of the keys that are present and not expired.
+        """
+        if not keys:
+            return {}
+        collection = self._async_db.collection(self._collection_name)
+        mapping = {self._make_key(key): key for key in keys}
+        refs = [collection.document(doc_id) for doc_id in mapping]
+        snapshots = [doc async for doc in self._async_db.get_all(refs)]
+        return self._decode_snapshots(snapshots, mapping)
+
+    async def aset_many(
+        self, items: Mapping[str, Any], expire: Optional[Union[int, timedelta]] = None
+    ) -> None:
+        """
+        Asynchronously stores several values with batched writes.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]], optional): The expiration time
+                applied to every item.
+
+        Notes:
+            - Writes are committed in batches of up to 500 documents.
+        """
+        collection = self._async_db.collection(self._collection_name)
+        payload = self._batch_payload(items, expire)
+        for start in range(0, len(payload), 500):
+            batch = self._async_db.batch()
+            for doc_id, data in payload[start : start + 500]:
+                batch.set(collection.document(doc_id), data)
+            await batch.commit()
+
     def close(self) -> None:
         """
         Closes the synchronous Firestore client and stops the cleanup scheduler.
@@ -503,3 +1266,98 @@ class FirestoreBackend(CacheBackend):
                 count = 0
         if count > 0:
             batch.commit()
+
+    def _lock_ref(self, db: Any, key: str) -> Any:
+        """
+        Get the document reference of a key's compute lock.
+        """
+        return db.collection(self._collection_name).document(
+            self._make_key(f"__lock__:{key}")
+        )
+
+    def _acquire_lock(self, key: str, timeout: float) -> Optional[str]:
+        """
+        Take a key's compute lock in a transaction.
+
+        The transaction reads the lock document and writes it only if it is
+        missing or expired; Firestore retries it if a concurrent caller wrote
+        the document in between.
+
+        Args:
+            key (str): The cache key the lock guards.
+            timeout (float): Seconds until the lock expires.
+
+        Returns:
+            Optional[str]: The lock token, or None if the lock is held.
+        """
+        from google.cloud import firestore
+
+        ref = self._lock_ref(self._sync_db, key)
+        token = uuid.uuid4().hex
+
+        @firestore.transactional
+        def take(transaction) -> Optional[str]:
+            snapshot = ref.get(transaction=transaction)
+            if snapshot.exists and not self._is_expired(
+                snapshot.to_dict().get("expires_at")
+            ):
+                return None
+            transaction.set(ref, {"token": token, "expires_at": time.time() + timeout})
+            return token
+
+        return take(self._sync_db.transaction())
+
+    def _release_lock(self, key: str, token: str) -> None:
+        """
+        Delete a compute lock in a transaction if ``token`` still owns it.
+        """
+        from google.cloud import firestore
+
+        ref = self._lock_ref(self._sync_db, key)
+
+        @firestore.transactional
+        def drop(transaction) -> None:
+            snapshot = ref.get(transaction=transaction)
+            if snapshot.exists and snapshot.to_dict().get("token") == token:
+                transaction.delete(ref)
+
+        drop(self._sync_db.transaction())
+
+    async def _aacquire_lock(self, key: str, timeout: float) -> Optional[str]:
+        """
+        Asynchronously take a key's compute lock in a transaction.
+
+        See `_acquire_lock`.
+        """
+        from google.cloud import firestore
+
+        ref = self._lock_ref(self._async_db, key)
+        token = uuid.uuid4().hex
+
+        @firestore.async_transactional
+        async def take(transaction) -> Optional[str]:
+            snapshot = await ref.get(transaction=transaction)
+            if snapshot.exists and not self._is_expired(
+                snapshot.to_dict().get("expires_at")
+            ):
+                return None
+            transaction.set(ref, {"token": token, "expires_at": time.time() + timeout})
+            return token
+
+        return await take(self._async_db.transaction())
+
+    async def _arelease_lock(self, key: str, token: str) -> None:
+        """
+        Asynchronously delete a compute lock if ``token`` still owns it.
+        """
+        from google.cloud import firestore
+
+        ref = self._lock_ref(self._async_db, key)
+
+        @firestore.async_transactional
+        async def drop(transaction) -> None:
+            snapshot = await ref.get(transaction=transaction)
+            if snapshot.exists and snapshot.to_dict().get("token") == token:
+                transaction.delete(ref)
+
+        await drop(self._async_db.transaction())
@@ -0,0 +1,522 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from ..metrics import LatencyHistogram
+from .backend import (
+    CacheBackend,
+    CacheEntry,
+    VersionedValue,
+    WrapperBackend,
+    _aclose_backend,
+    _close_backend,
+    _set_args,
+)
+
+
+class HedgedBackend(WrapperBackend):
+    """
+    Wrapper that hedges reads across redundant backends to cut tail latency.
+
+    A read goes to the first backend. If it has not answered after the hedge
+    delay, the same read is sent to the next backend, and the first answer
+    wins; the other request is cancelled (async) or ignored (sync). The delay
+    tracks a percentile of recent read latencies, so only the slowest reads
+    are hedged, and a token budget caps hedges to a fixed share of reads.
+
+    Args:
+        backends (Sequence[CacheBackend]): Two or more backends holding the
+            same data, e.g. replicas of one store or independent caches. The
+            first is preferred.
+        percentile (float): Latency percentile used as the hedge delay.
+            Defaults to 0.95.
+        initial_delay (float): Hedge delay in seconds until enough reads were
+            observed. Defaults to 0.01.
+        min_delay (float): Lower bound of the hedge delay. Defaults to 0.0005.
+        max_delay (float): Upper bound of the hedge delay. Defaults to 1.0.
+        max_hedge_ratio (float): Hedges allowed per read, on average.
+            Defaults to 0.05, i.e. at most 5% extra read load.
+        window (int): Reads per latency window; the delay is recomputed from
+            each completed window. Defaults to 1000.
+        write_to (str): ``"all"`` sends writes to every backend, ``"first"``
+            only to the first one (for read replicas of a single primary).
+            Defaults to ``"all"``.
+        max_workers (int): Threads used to hedge sync reads. Defaults to 8.
+
+    Raises:
+        ValueError: If fewer than two backends are given, or ``write_to`` or
+            ``percentile`` is invalid.
+
+    Notes:
+        - If a backend raises, the read moves on to the next backend at once
+          without using the budget; the error is raised only if all fail.
+        - Sync reads run on the wrapper's thread pool so the caller can stop
+          waiting for a slow backend; a losing sync request still completes
+          in the background.
+        - Reads return the first answer, so with lagging replicas a hedged read
+          may return a miss or an older value.
+        - Key iteration and the compute locks of `get_or_set` use the first
+          backend only.
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[CacheBackend],
+        percentile: float = 0.95,
+        initial_delay: float = 0.01,
+        min_delay: float = 0.0005,
+        max_delay: float = 1.0,
+        max_hedge_ratio: float = 0.05,
+        window: int = 1000,
+        write_to: str = "all",
+        max_workers: int = 8,
+    ) -> None:
+        if len(backends) < 2:
+            raise ValueError("HedgedBackend needs at least two backends")
+        if write_to not in ("all", "first"):
+            raise ValueError("write_to must be 'all' or 'first'")
+        if not 0.0 < percentile < 1.0:
+            raise ValueError("percentile must be between 0 and 1")
+
+        super().__init__(backends[0])
+        self._backends: List[CacheBackend] = list(backends)
+        self._writers = self._backends if write_to == "all" else self._backends[:1]
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._delay = min(max(initial_delay, min_delay), max_delay)
+        self._ratio = max_hedge_ratio
+        self._window = window
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fast-cache-hedge"
+        )
+        self.blocking_async_ops = frozenset().union(
+            *(backend.blocking_async_ops for backend in self._backends)
+        )
+        self.cost_aware = all(backend.cost_aware for backend in self._writers)
+
+        self._lock = threading.Lock()
+        self._latency = LatencyHistogram()
+        # Budget starts with one token so an early stall can be hedged.
+        self._tokens = 1.0
+        self._counters = {"reads": 0, "hedges": 0, "hedge_wins": 0, "denied": 0}
+
+    def _add_listener(self, listener: Any) -> None:
+        """
+        Attach instrumentation to every hedged backend.
+
+        Args:
+            listener (Any): The listener, see `CacheBackend._add_listener`.
+        """
+        for backend in self._backends:
+            backend._add_listener(listener)
+
+    @property
+    def delay(self) -> float:
+        """
+        The current hedge delay in seconds.
+        """
+        return self._delay
+
+    def _start_read(self) -> None:
+        """
+        Count a read and add its share to the hedge budget.
+        """
+        with self._lock:
+            self._counters["reads"] += 1
+            self._tokens = min(self._tokens + self._ratio, 10.0)
+
+    def _take_token(self) -> bool:
+        """
+        Spend one hedge from the budget.
+
+        Returns:
+            bool: True if the budget allowed the hedge.
+        """
+        with self._lock:
+            # Tolerate rounding from adding fractional shares.
+            if self._tokens >= 1.0 - 1e-9:
+                self._tokens -= 1.0
+                self._counters["hedges"] += 1
+                return True
+            self._counters["denied"] += 1
+            return False
+
+    def _finish_read(self, seconds: float, winner: int) -> None:
+        """
+        Record a read's latency and recompute the delay after each window.
+
+        Args:
+            seconds (float): Time until the first answer.
+            winner (int): Index of the backend that answered.
+        """
+        with self._lock:
+            if winner > 0:
+                self._counters["hedge_wins"] += 1
+            self._latency.record(seconds)
+            if self._latency.count >= self._window:
+                delay = self._latency.quantile(self._percentile)
+                self._delay = min(max(delay, self._min_delay), self._max_delay)
+                self._latency = LatencyHistogram()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report how often reads were hedged.
+
+        Returns:
+            Dict[str, Any]: ``reads``, ``hedges``, ``hedge_wins`` (hedges that
+            answered first), ``denied`` (hedges the budget refused),
+            ``hedge_ratio`` (hedges / reads) and the current ``delay``.
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+        stats["hedge_ratio"] = (
+            stats["hedges"] / stats["reads"] if stats["reads"] else 0.0
+        )
+        stats["delay"] = self._delay
+        return stats
+
+    async def _aread(self, op: str, *args: Any) -> Any:
+        """
+        Run an async read with hedging.
+
+        Args:
+            op (str): The async method name.
+            *args: Arguments for the method.
+
+        Returns:
+            Any: The first successful answer.
+        """
+        self._start_read()
+        started = time.perf_counter()
+        tasks: Dict[asyncio.Task, int] = {}
+        error: Optional[BaseException] = None
+        next_index = 0
+        hedging = True
+
+        def launch() -> None:
+            nonlocal next_index
+            backend = self._backends[next_index]
+            tasks[asyncio.ensure_future(getattr(backend, op)(*args))] = next_index
+            next_index += 1
+
+        launch()
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(
+                    tasks,
+                    timeout=self._delay,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    index = tasks.pop(task)
+                    if task.exception() is None:
+                        self._finish_read(time.perf_counter() - started, index)
+                        return task.result()
+                    error = task.exception()
+                if next_index < len(self._backends):
+                    if not tasks:
+                        launch()
+                    elif not done and hedging:
+                        if self._take_token():
+                            launch()
+                        else:
+                            hedging = False
+        finally:
+            for task in tasks:
+                task.cancel()
+        raise error
+
+    def _read(self, op: str, *args: Any) -> Any:
+        """
+        Run a sync read with hedging on the wrapper's thread pool.
+
+        Args:
+            op (str): The sync method name.
+            *args: Arguments for the method.
+
+        Returns:
+            Any: The first successful answer.
+        """
+        self._start_read()
+        started = time.perf_counter()
+        futures: Dict[concurrent.futures.Future, int] = {}
+        error: Optional[BaseException] = None
+        next_index = 0
+        hedging = True
+
+        def launch() -> None:
+            nonlocal next_index
+            backend = self._backends[next_index]
+            # Run in a copy of the caller's context so tracing state follows.
+            context = contextvars.copy_context()
+            future = self._executor.submit(context.run, getattr(backend, op), *args)
+            futures[future] = next_index
+            next_index += 1
+
+        launch()
+        while futures:
+            done, _ = concurrent.futures.wait(
+                futures,
+                timeout=self._delay,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                index = futures.pop(future)
+                if future.exception() is None:
+                    for other in futures:
+                        other.cancel()
+                    self._finish_read(time.perf_counter() - started, index)
+                    return future.result()
+                error = future.exception()
+            if next_index < len(self._backends):
+                if not futures:
+                    launch()
+                elif not done and hedging:
+                    if self._take_token():
+                        launch()
+                    else:
+                        hedging = False
+        raise error
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retrieve a value, hedging slow reads."""
+        return self._read("get", key)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Asynchronously retrieve a value, hedging slow reads."""
+        return await self._aread("aget", key)
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Retrieve a value with its metadata, hedging slow reads."""
+        return self._read("get_with_meta", key)
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Asynchronously retrieve a value with its metadata, hedging slow reads."""
+        return await self._aread("aget_with_meta", key)
+
+    def has(self, key: str) -> bool:
+        """Check for a key, hedging slow reads."""
+        return self._read("has", key)
+
+    async def ahas(self, key: str) -> bool:
+        """Asynchronously check for a key, hedging slow reads."""
+        return await self._aread("ahas", key)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Retrieve several values, hedging slow reads."""
+        return self._read("get_many", keys)
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Asynchronously retrieve several values, hedging slow reads."""
+        return await self._aread("aget_many", keys)
+
+    def _write(self, op: str, *args: Any) -> Any:
+        """
+        Apply a sync write to the write backends in order.
+
+        Returns:
+            Any: The result of the first backend.
+        """
+        results = [getattr(backend, op)(*args) for backend in self._writers]
+        return results[0]
+
+    async def _awrite(self, op: str, *args: Any) -> Any:
+        """
+        Apply an async write to the write backends concurrently.
+
+        Returns:
+            Any: The result of the first backend.
+        """
+        results = await asyncio.gather(
+            *(getattr(backend, op)(*args) for backend in self._writers),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results[0]
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Store a value in the write backends."""
+        self._write("set", *_set_args(self, key, value, expire, tags, cost))
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Asynchronously store a value in the write backends."""
+        await self._awrite("aset", *_set_args(self, key, value, expire, tags, cost))
+
+    def invalidate_tags(self, tags: Sequence[str]) -> None:
+        """Delete every key carrying one of the tags from the write backends."""
+        self._write("invalidate_tags", tags)
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """Asynchronously delete tagged keys from the write backends."""
+        await self._awrite("ainvalidate_tags", tags)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete the entries under ``prefix`` from the write backends."""
+        return self._write("delete_prefix", prefix)
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """Asynchronously delete the entries under ``prefix`` from the write backends."""
+        return await self._awrite("adelete_prefix", prefix)
+
+    def delete(self, key: str) -> None:
+        """Delete a value from the write backends."""
+        self._write("delete", key)
+
+    async def adelete(self, key: str) -> None:
+        """Asynchronously delete a value from the write backends."""
+        await self._awrite("adelete", key)
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Retrieve a value with a hedged read, then touch it in the write backends."""
+        value = self._read("get", key)
+        if value is not None:
+            self._write("touch", key, expire)
+        return value
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Asynchronously retrieve a value with a hedged read, then touch it."""
+        value = await self._aread("aget", key)
+        if value is not None:
+            await self._awrite("atouch", key, expire)
+        return value
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Restart an entry's expiration in the write backends."""
+        return self._write("touch", key, expire)
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Asynchronously restart an entry's expiration in the write backends."""
+        return await self._awrite("atouch", key, expire)
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Add to a counter in the write backends; the first one's value is returned."""
+        return self._write("incr", key, delta, expire)
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Asynchronously add to a counter in the write backends."""
+        return await self._awrite("aincr", key, delta, expire)
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Retrieve a value with its version from the first backend.
+
+        Versions are specific to one backend, so this read is not hedged.
+        """
+        return self._backend.get_versioned(key)
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Asynchronously retrieve a value with its version from the first backend."""
+        return await self._backend.aget_versioned(key)
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Store a value in the first backend if its version is unchanged, then in the others."""
+        stored = self._backend.set_if_version(key, value, version, expire)
+        if stored:
+            for backend in self._writers[1:]:
+                backend.set(key, value, expire)
+        return stored
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Asynchronously store a value if its version is unchanged, then in the others."""
+        stored = await self._backend.aset_if_version(key, value, version, expire)
+        if stored and len(self._writers) > 1:
+            await asyncio.gather(
+                *(backend.aset(key, value, expire) for backend in self._writers[1:])
+            )
+        return stored
+
+    def clear(self) -> None:
+        """Clear the namespace in the write backends."""
+        self._write("clear")
+
+    async def aclear(self) -> None:
+        """Asynchronously clear the namespace in the write backends."""
+        await self._awrite("aclear")
+
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Store several values in the write backends."""
+        self._write("set_many", items, expire)
+
+    async def aset_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Asynchronously store several values in the write backends."""
+        await self._awrite("aset_many", items, expire)
+
+    def close(self) -> None:
+        """
+        Close every backend and the wrapper's thread pool.
+        """
+        self._executor.shutdown(wait=False)
+        for backend in self._backends:
+            _close_backend(backend)
+
+    async def aclose(self) -> None:
+        """
+        Asynchronously close every backend and the wrapper's thread pool.
+        """
+        self._executor.shutdown(wait=False)
+        for backend in self._backends:
+            await _aclose_backend(backend)
@@ -1,7 +1,9 @@
-import pickle
-from typing import Any, Optional, Union
+import asyncio
+import math
+import uuid
+from typing import Any, Dict, Mapping, Optional, Sequence, Union
 from datetime import timedelta
-from .backend import CacheBackend
+from .backend import CacheBackend, VersionedValue
 
 
 class MemcachedBackend(CacheBackend):
@@ -28,6 +30,8 @@ class MemcachedBackend(CacheBackend):
         - Both synchronous and asynchronous Memcached clients are initialized.
         - The async client is created per event loop.
         - All cache keys are automatically namespaced.
+        - `get_with_meta` reports no TTL or creation time: neither client exposes
+          Memcached's meta commands, and the classic protocol cannot read them.
     """
 
     def __init__(
@@ -99,12 +103,17 @@ class MemcachedBackend(CacheBackend):
         """
         try:
             value = self._sync_client.get(self._make_key(key))
-            return pickle.loads(value) if value else None
-        except Exception:
+            return self._loads(value) if value else None
+        except Exception as exc:
+            self._report_error("get", exc)
             return None
 
     def set(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Synchronously stores a value in the cache under the specified key.
@@ -119,11 +128,16 @@ class MemcachedBackend(CacheBackend):
             expire (Optional[Union[int, timedelta]], optional): The expiration time
                 for the cache entry. Can be specified as an integer (seconds) or a
                 timedelta. If None, the entry does not expire.
+            tags (Optional[Sequence[str]], optional): Tags to invalidate the
+                entry by.
 
         Notes:
             - The value is serialized using pickle.
             - Thread-safe for Memcached client.
             - Expiration is handled by Memcached.
+            - Memcached has no sets, so tags use the default tag index: one
+              entry per tag listing its keys, updated with ``gets``/``cas``.
+              Memcached may evict those entries like any other.
         """
         try:
             exptime = (
@@ -132,10 +146,12 @@ class MemcachedBackend(CacheBackend):
                 else (expire or 0)
             )
             self._sync_client.set(
-                self._make_key(key), pickle.dumps(value), expire=exptime
+                self._make_key(key), self._dumps(value), expire=exptime
             )
-        except Exception:
-            pass
+            if tags:
+                self._add_tags(key, tags)
+        except Exception as exc:
+            self._report_error("set", exc)
 
     def delete(self, key: str) -> None:
         """
@@ -152,8 +168,8 @@ class MemcachedBackend(CacheBackend):
         """
         try:
             self._sync_client.delete(self._make_key(key))
-        except Exception:
-            pass
+        except Exception as exc:
+            self._report_error("delete", exc)
 
     def clear(self) -> None:
         """
@@ -170,8 +186,8 @@ class MemcachedBackend(CacheBackend):
 
         try:
             self._sync_client.flush_all()
-        except Exception:
-            pass
+        except Exception as exc:
+            self._report_error("clear", exc)
 
     def has(self, key: str) -> bool:
         """
@@ -189,7 +205,8 @@ class MemcachedBackend(CacheBackend):
         """
         try:
             return self._sync_client.get(self._make_key(key)) is not None
-        except Exception:
+        except Exception as exc:
+            self._report_error("has", exc)
             return False
 
     async def aget(self, key: str) -> Optional[Any]:
@@ -211,12 +228,17 @@ class MemcachedBackend(CacheBackend):
         """
         try:
             value = await self._async_client.get(self._make_key(key))
-            return pickle.loads(value) if value else None
-        except Exception:
+            return self._loads(value) if value else None
+        except Exception as exc:
+            self._report_error("get", exc)
             return None
 
     async def aset(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Asynchronously stores a value in the cache under the specified key.
@@ -231,6 +253,8 @@ class MemcachedBackend(CacheBackend):
             expire (Optional[Union[int, timedelta]], optional): The expiration time
                 for the cache entry. Can be specified as an integer (seconds) or a
                 timedelta. If None, the entry does not expire.
+            tags (Optional[Sequence[str]], optional): Tags to invalidate the
+                entry by, see `set`.
 
         Notes:
             - The value is serialized using pickle.
@@ -244,10 +268,12 @@ class MemcachedBackend(CacheBackend):
                 else (expire or 0)
             )
             await self._async_client.set(
-                self._make_key(key), pickle.dumps(value), exptime=exptime
+                self._make_key(key), self._dumps(value), exptime=exptime
             )
-        except Exception:
-            pass
+            if tags:
+                await self._aadd_tags(key, tags)
+        except Exception as exc:
+            self._report_error("set", exc)
 
     async def adelete(self, key: str) -> None:
         """
@@ -264,8 +290,8 @@ class MemcachedBackend(CacheBackend):
         """
         try:
             await self._async_client.delete(self._make_key(key))
-        except Exception:
-            pass
+        except Exception as exc:
+            self._report_error("delete", exc)
 
     async def aclear(self) -> None:
         """
@@ -281,8 +307,8 @@ class MemcachedBackend(CacheBackend):
         """
         try:
             await self._async_client.flush_all()
-        except Exception:
-            pass
+        except Exception as exc:
+            self._report_error("clear", exc)
 
     async def ahas(self, key: str) -> bool:
         """
@@ -301,9 +327,379 @@ class MemcachedBackend(CacheBackend):
         try:
             value = await self._async_client.get(self._make_key(key))
             return value is not None
-        except Exception:
+        except Exception as exc:
+            self._report_error("has", exc)
+            return False
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Synchronously restarts the expiration of an entry with ``touch``.
+
+        Args:
+            key (str): The cache key to touch.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+                If None, the entry no longer expires.
+
+        Returns:
+            bool: True if the key exists, False otherwise.
+        """
+        try:
+            return bool(
+                self._sync_client.touch(
+                    self._make_key(key), expire=self._exptime(expire), noreply=False
+                )
+            )
+        except Exception as exc:
+            self._report_error("touch", exc)
+            return False
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Asynchronously restarts the expiration of an entry with ``touch``.
+
+        Args:
+            key (str): The cache key to touch.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+                If None, the entry no longer expires.
+
+        Returns:
+            bool: True if the key exists, False otherwise.
+        """
+        try:
+            return bool(
+                await self._async_client.touch(
+                    self._make_key(key), self._exptime(expire)
+                )
+            )
+        except Exception as exc:
+            self._report_error("touch", exc)
+            return False
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Synchronously retrieves a value and restarts its expiration.
+
+        Notes:
+            - Neither client exposes ``gat``, so this is a ``get`` followed by a
+              ``touch``; the value is not sent back.
+        """
+        value = self.get(key)
+        if value is not None:
+            self.touch(key, expire)
+        return value
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Asynchronously retrieves a value and restarts its expiration.
+
+        Notes:
+            - A ``get`` followed by a ``touch``, see `get_and_touch`.
+        """
+        value = await self.aget(key)
+        if value is not None:
+            await self.atouch(key, expire)
+        return value
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Synchronously retrieves a value with its CAS token using ``gets``.
+
+        Args:
+            key (str): The cache key to retrieve.
+
+        Returns:
+            Optional[VersionedValue]: The value and its CAS token, or None if
+            not found.
+        """
+        try:
+            value, token = self._sync_client.gets(self._make_key(key))
+            return VersionedValue(self._loads(value), token) if value else None
+        except Exception as exc:
+            self._report_error("get", exc)
+            return None
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Asynchronously retrieves a value with its CAS token using ``gets``.
+
+        See `get_versioned`.
+        """
+        try:
+            value, token = await self._async_client.gets(self._make_key(key))
+            return VersionedValue(self._loads(value), token) if value else None
+        except Exception as exc:
+            self._report_error("get", exc)
+            return None
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[int],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Synchronously stores a value only if its CAS token is still ``version``.
+
+        Args:
+            key (str): The cache key to store the value under.
+            value (Any): The Python object to cache.
+            version (Optional[int]): The CAS token from `get_versioned`, or
+                None to store the value only if the key does not exist.
+            expire (Optional[Union[int, timedelta]], optional): The expiration time.
+
+        Returns:
+            bool: True if the value was stored, False if the key changed or
+            the call failed.
+
+        Notes:
+            - Uses ``cas``, or ``add`` when ``version`` is None; Memcached
+              checks the token and writes in one command.
+        """
+        k = self._make_key(key)
+        try:
+            if version is None:
+                return bool(
+                    self._sync_client.add(
+                        k,
+                        self._dumps(value),
+                        expire=self._exptime(expire),
+                        noreply=False,
+                    )
+                )
+            return bool(
+                self._sync_client.cas(
+                    k,
+                    self._dumps(value),
+                    version,
+                    expire=self._exptime(expire),
+                    noreply=False,
+                )
+            )
+        except Exception as exc:
+            self._report_error("set", exc)
+            return False
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[int],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Asynchronously stores a value only if its CAS token is still ``version``.
+
+        See `set_if_version`.
+        """
+        k = self._make_key(key)
+        try:
+            if version is None:
+                return bool(
+                    await self._async_client.add(
+                        k, self._dumps(value), exptime=self._exptime(expire)
+                    )
+                )
+            return bool(
+                await self._async_client.cas(
+                    k, self._dumps(value), version, exptime=self._exptime(expire)
+                )
+            )
+        except Exception as exc:
+            self._report_error("set", exc)
             return False
 
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """
+        Synchronously adds ``delta`` to a counter with ``incr`` or ``decr``.
+
+        A missing counter is created with ``add``; if another client creates
+        it first, the increment is retried.
+
+        Args:
+            key (str): The counter key.
+            delta (int): The amount to add; negative to decrement. Defaults to 1.
+            expire (Optional[Union[int, timedelta]]): Expiration time of a new
+                counter; an existing counter keeps its expiry.
+
+        Returns:
+            Optional[int]: The new value, or None if the call failed.
+
+        Notes:
+            - Memcached counters are unsigned: decrementing stops at 0.
+        """
+        k = self._make_key(key)
+        try:
+            for _ in range(2):
+                if delta >= 0:
+                    value = self._sync_client.incr(k, delta, noreply=False)
+                else:
+                    value = self._sync_client.decr(k, -delta, noreply=False)
+                if value is not None:
+                    return int(value)
+                initial = max(delta, 0)
+                if self._sync_client.add(
+                    k,
+                    str(initial).encode(),
+                    expire=self._exptime(expire),
+                    noreply=False,
+                ):
+                    return initial
+        except Exception as exc:
+            self._report_error("incr", exc)
+        return None
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """
+        Asynchronously adds ``delta`` to a counter with ``incr`` or ``decr``.
+
+        See `incr`.
+        """
+        k = self._make_key(key)
+        try:
+            for _ in range(2):
+                if delta >= 0:
+                    value = await self._async_client.incr(k, delta)
+                else:
+                    value = await self._async_client.decr(k, -delta)
+                if value is not None:
+                    return int(value)
+                initial = max(delta, 0)
+                if await self._async_client.add(
+                    k, str(initial).encode(), exptime=self._exptime(expire)
+                ):
+                    return initial
+        except Exception as exc:
+            self._report_error("incr", exc)
+        return None
+
+    @staticmethod
+    def _exptime(expire: Optional[Union[int, timedelta]]) -> int:
+        """
+        Converts an expiration into the integer seconds Memcached expects.
+
+        Args:
+            expire (Optional[Union[int, timedelta]]): The expiration time.
+
+        Returns:
+            int: Seconds until expiry, or 0 for no expiration.
+        """
+        return (
+            int(expire.total_seconds())
+            if isinstance(expire, timedelta)
+            else (expire or 0)
+        )
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Synchronously retrieves several values with a single multi-get.
+
+        Args:
+            keys (Sequence[str]): The cache keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The values of the keys that were found.
+
+        Notes:
+            - Uses the Memcached `get k1 k2 ...` command in one round trip.
+        """
+        if not keys:
+            return {}
+        try:
+            mapping = {self._make_key(key): key for key in keys}
+            values = self._sync_client.get_many(list(mapping))
+            return {mapping[k]: self._loads(v) for k, v in values.items() if v}
+        except Exception as exc:
+            self._report_error("get_many", exc)
+            return {}
+
+    def set_many(
+        self, items: Mapping[str, Any], expire: Optional[Union[int, timedelta]] = None
+    ) -> None:
+        """
+        Synchronously stores several values in one batched write.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]], optional): The expiration time
+                applied to every item.
+        """
+        if not items:
+            return
+        try:
+            self._sync_client.set_many(
+                {self._make_key(k): self._dumps(v) for k, v in items.items()},
+                expire=self._exptime(expire),
+            )
+        except Exception as exc:
+            self._report_error("set_many", exc)
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Asynchronously retrieves several values with a single multi-get.
+
+        Args:
+            keys (Sequence[str]): The cache keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The values of the keys that were found.
+        """
+        if not keys:
+            return {}
+        try:
+            values = await self._async_client.multi_get(
+                *(self._make_key(key) for key in keys)
+            )
+            return {
+                key: self._loads(value) for key, value in zip(keys, values) if value
+            }
+        except Exception as exc:
+            self._report_error("get_many", exc)
+            return {}
+
+    async def aset_many(
+        self, items: Mapping[str, Any], expire: Optional[Union[int, timedelta]] = None
+    ) -> None:
+        """
+        Asynchronously stores several values concurrently over the connection pool.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]], optional): The expiration time
+                applied to every item.
+
+        Notes:
+            - aiomcache has no multi-set, so the writes are issued concurrently.
+        """
+        if not items:
+            return
+        try:
+            exptime = self._exptime(expire)
+            await asyncio.gather(
+                *(
+                    self._async_client.set(
+                        self._make_key(k), self._dumps(v), exptime=exptime
+                    )
+                    for k, v in items.items()
+                )
+            )
+        except Exception as exc:
+            self._report_error("set_many", exc)
+
     async def close(self) -> None:
         """
         Asynchronously closes both the async and sync Memcached clients.
@@ -320,3 +716,77 @@ class MemcachedBackend(CacheBackend):
             self._sync_client.close()
         except Exception:
             pass
+
+    def _acquire_lock(self, key: str, timeout: float) -> Optional[bytes]:
+        """
+        Take a key's compute lock with ``add``, which fails if the lock exists.
+
+        Args:
+            key (str): The cache key the lock guards.
+            timeout (float): Seconds until Memcached expires the lock, rounded
+                up to whole seconds.
+
+        Returns:
+            Optional[bytes]: The lock token, or None if the lock is held.
+        """
+        token = uuid.uuid4().hex.encode()
+        try:
+            acquired = self._sync_client.add(
+                self._make_key(f"__lock__:{key}"),
+                token,
+                expire=max(1, math.ceil(timeout)),
+                noreply=False,
+            )
+        except Exception as exc:
+            self._report_error("lock", exc)
+            raise
+        return token if acquired else None
+
+    def _release_lock(self, key: str, token: bytes) -> None:
+        """
+        Delete a compute lock if ``token`` still owns it.
+
+        The check and the delete are two commands, so a lock that expired and
+        was taken by another caller in between can be deleted early.
+        """
+        lock_key = self._make_key(f"__lock__:{key}")
+        try:
+            if self._sync_client.get(lock_key) == token:
+                self._sync_client.delete(lock_key)
+        except Exception as exc:
+            self._report_error("lock", exc)
+
+    async def _aacquire_lock(self, key: str, timeout: float) -> Optional[bytes]:
+        """
+        Asynchronously take a key's compute lock with ``add``.
+
+        Args:
+            key (str): The cache key the lock guards.
+            timeout (float): Seconds until Memcached expires the lock, rounded
+                up to whole seconds.
+
+        Returns:
+            Optional[bytes]: The lock token, or None if the lock is held.
+        """
+        token = uuid.uuid4().hex.encode()
+        try:
+            acquired = await self._async_client.add(
+                self._make_key(f"__lock__:{key}"),
+                token,
+                exptime=max(1, math.ceil(timeout)),
+            )
+        except Exception as exc:
+            self._report_error("lock", exc)
+            raise
+        return token if acquired else None
+
+    async def _arelease_lock(self, key: str, token: bytes) -> None:
+        """
+        Asynchronously delete a compute lock if ``token`` still owns it.
+        """
+        lock_key = self._make_key(f"__lock__:{key}")
+        try:
+            if await self._async_client.get(lock_key) == token:
+                await self._async_client.delete(lock_key)
+        except Exception as exc:
+            self._report_error("lock", exc)
@@ -1,13 +1,178 @@
-import asyncio
+import heapq
+import itertools
+import sys
 import threading
 import time
+from bisect import bisect_left, bisect_right
 from collections import OrderedDict
 from datetime import timedelta
-from typing import Any, Optional, Union, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from apscheduler.schedulers.background import BackgroundScheduler
 
-from .backend import CacheBackend
+from .backend import _INTERNAL_PREFIXES, CacheBackend, CacheEntry, VersionedValue
+
+
+class _SortedKeys:
+    """
+    A sorted set of keys, split in blocks of a few hundred keys.
+
+    Adding or removing a key moves at most one block, so the index stays
+    cheap to maintain however many keys the cache holds.
+    """
+
+    _BLOCK = 512
+
+    def __init__(self) -> None:
+        self._blocks: List[List[str]] = []
+        # Largest key of each block, for bisecting to the block of a key.
+        self._maxes: List[str] = []
+
+    def add(self, key: str) -> None:
+        if not self._maxes:
+            self._blocks.append([key])
+            self._maxes.append(key)
+            return
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            i -= 1
+            block = self._blocks[i]
+            block.append(key)
+            self._maxes[i] = key
+        else:
+            block = self._blocks[i]
+            j = bisect_left(block, key)
+            if j < len(block) and block[j] == key:
+                return
+            block.insert(j, key)
+        if len(block) > 2 * self._BLOCK:
+            half = self._BLOCK
+            self._blocks[i : i + 1] = [block[:half], block[half:]]
+            self._maxes[i : i + 1] = [block[half - 1], block[-1]]
+
+    def discard(self, key: str) -> None:
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return
+        block = self._blocks[i]
+        j = bisect_left(block, key)
+        if j < len(block) and block[j] == key:
+            del block[j]
+            if block:
+                self._maxes[i] = block[-1]
+            else:
+                del self._blocks[i]
+                del self._maxes[i]
+
+    def clear(self) -> None:
+        self._blocks.clear()
+        self._maxes.clear()
+
+    def slice(self, start: str, inclusive: bool, limit: int) -> List[str]:
+        """
+        Up to ``limit`` keys from ``start`` on, in order.
+
+        Args:
+            start (str): The key to start at.
+            inclusive (bool): Whether ``start`` itself is included.
+            limit (int): The maximum number of keys returned.
+
+        Returns:
+            List[str]: The keys.
+        """
+        position = bisect_left if inclusive else bisect_right
+        i = position(self._maxes, start)
+        keys: List[str] = []
+        while i < len(self._blocks) and len(keys) < limit:
+            block = self._blocks[i]
+            j = 0 if keys else position(block, start)
+            keys.extend(block[j : j + limit - len(keys)])
+            i += 1
+        return keys
+
+
+class _Cost:
+    """
+    Eviction metadata of an entry: its measured cost, size, references and
+    GreedyDual-Size-Frequency priority.
+    """
+
+    __slots__ = ("cost", "size", "hits", "priority", "seq")
+
+    def __init__(self) -> None:
+        self.cost: Optional[float] = None
+        self.size = 1
+        self.hits = 0
+        self.priority = 0.0
+        # Identifies the entry's current heap item; older items are stale.
+        self.seq = -1
+
+
+def _approximate_size(value: Any) -> int:
+    """
+    Default size estimate of a cached value for cost-aware eviction.
+
+    Strings and bytes count their length; other objects their shallow
+    `sys.getsizeof`.
+    """
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class _IndexedDict(OrderedDict):
+    """
+    An `OrderedDict` whose keys are also kept sorted in ``index``, and whose
+    eviction metadata in ``costs`` is dropped together with the key.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.index = _SortedKeys()
+        self.costs: Dict[str, _Cost] = {}
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self:
+            self.index.add(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.index.discard(key)
+        self.costs.pop(key, None)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            self.index.discard(key)
+            self.costs.pop(key, None)
+        return super().pop(key, *default)
+
+    def popitem(self, last: bool = True) -> Tuple[str, Any]:
+        key, value = super().popitem(last)
+        self.index.discard(key)
+        self.costs.pop(key, None)
+        return key, value
+
+    def clear(self) -> None:
+        super().clear()
+        self.index.clear()
+        self.costs.clear()
+
+
+EVICTION_POLICIES = ("lru", "gdsf")
 
 
 class InMemoryBackend(CacheBackend):
@@ -25,36 +190,92 @@ class InMemoryBackend(CacheBackend):
         max_size (Optional[int], optional): The maximum number of items to store in the
             cache. If set, the cache will evict the least recently used items when the
             limit is exceeded. If None, the cache size is unlimited. Defaults to None.
-        cleanup_interval (int, optional): The interval, in seconds, at which the
-            background cleanup job runs to remove expired cache entries. Defaults to 30.
+        cleanup_interval (Optional[int], optional): The interval, in seconds, at which the
+            background cleanup job runs to remove expired cache entries. If None, no
+            background job is started and expired entries are only removed on access.
+            Defaults to 30.
+        clock (Callable[[], float], optional): The clock used for expiration times.
+            Defaults to `time.monotonic`. The trace replay simulator passes a virtual
+            clock here.
+        eviction (str, optional): ``"lru"`` evicts the least recently used
+            entry. ``"gdsf"`` (GreedyDual-Size-Frequency) evicts the entry with
+            the lowest ``L + references * cost / size``, where ``cost`` is the
+            recompute time passed to `set` and ``L`` rises to the priority of
+            each evicted entry, so expensive, small and frequently used entries
+            stay while idle ones age out. Defaults to ``"lru"``.
+        sizer (Optional[Callable[[Any], int]], optional): Estimates the size of
+            a value for ``"gdsf"``. Defaults to the length of strings and bytes
+            and the shallow `sys.getsizeof` of other objects.
+
+    Raises:
+        ValueError: If ``eviction`` is not a known policy.
 
     Notes:
         - The backend uses an OrderedDict to maintain LRU order.
+        - Entries written without a cost count the average measured cost (1
+          second until one is measured) for ``"gdsf"``.
         - Both synchronous (thread-safe) and asynchronous (asyncio-safe) operations are supported.
         - Expired items are removed automatically by a background scheduler.
         - This backend is not suitable for multi-process or distributed environments.
     """
 
+    cost_aware = True
+
     def __init__(
         self,
         namespace: str = "fastapi-cache",
         max_size: Optional[int] = None,
-        cleanup_interval: int = 30,
+        cleanup_interval: Optional[int] = 30,
+        clock: Callable[[], float] = time.monotonic,
+        eviction: str = "lru",
+        sizer: Optional[Callable[[Any], int]] = None,
     ) -> None:
         """
         Initialize the in-memory cache backend.
 
         Args:
             namespace: Namespace prefix for all keys.
-            max_size: Optional maximum number of items (LRU eviction if set).
-            cleanup_interval: Interval in seconds for background cleanup.
+            max_size: Optional maximum number of items (evicted by ``eviction`` if set).
+            cleanup_interval: Interval in seconds for background cleanup, or None.
+            clock: Clock used for expiration times.
+            eviction: ``"lru"`` or ``"gdsf"``.
+            sizer: Size estimate of values for ``"gdsf"``.
         """
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Invalid eviction policy {eviction!r}; expected one of {EVICTION_POLICIES}"
+            )
         self._namespace = namespace
-        self._cache: OrderedDict[str, Tuple[Any, Optional[float]]] = OrderedDict()
+        # key -> (value, expire time, creation time, version), both times on
+        # `clock`; every write of a value takes the next version.
+        # `_IndexedDict` also keeps the keys sorted, for prefix scans.
+        self._cache: OrderedDict[str, Tuple[Any, Optional[float], float, int]] = (
+            _IndexedDict()
+        )
+        self._versions = itertools.count()
+        # tag -> keys and key -> tags, both with namespaced keys.
+        self._tags: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, Tuple[str, ...]] = {}
+        # One lock guards the entries and every index over them, for sync and
+        # async callers and the cleanup thread alike. Async methods hold it
+        # without awaiting, so the event loop only waits for short sections.
         self._lock = threading.Lock()
-        self._async_lock = asyncio.Lock()
         self._max_size = max_size
         self._cleanup_interval = cleanup_interval
+        self._clock = clock
+
+        self._eviction = eviction
+        self._sizer = sizer or _approximate_size
+        # GDSF priority queue of (priority, seq, key); items whose seq is not
+        # the entry's current one are stale and skipped. Guarded by ``_lock``
+        # like the entries: every read and write reprioritizes an entry.
+        self._heap: List[Tuple[float, int, str]] = []
+        self._heap_seq = itertools.count()
+        self._inflation = 0.0
+        self._cost_total = 0.0
+        self._cost_count = 0
+        self._evictions = 0
+        self._saved_compute = 0.0
 
         self._scheduler = None
         self._scheduler_lock = threading.Lock()
@@ -66,7 +287,7 @@ class InMemoryBackend(CacheBackend):
 
         This method launches a background job that periodically deletes expired
         cache entries from the in-memory store. If the scheduler is already running,
-        this method does nothing.
+        or `cleanup_interval` is None, this method does nothing.
 
         Thread-safe: uses a lock to prevent concurrent scheduler starts.
 
@@ -78,7 +299,7 @@ class InMemoryBackend(CacheBackend):
             - The scheduler is started automatically on initialization.
         """
         with self._scheduler_lock:
-            if self._scheduler is not None:
+            if self._scheduler is not None or self._cleanup_interval is None:
                 return
             self._scheduler = BackgroundScheduler()
             self._scheduler.add_job(
@@ -119,19 +340,19 @@ class InMemoryBackend(CacheBackend):
 
         Notes:
             - This method is not intended to be called directly.
-            - Uses a monotonic clock for expiration checks.
+            - Uses the backend's clock (monotonic by default) for expiration checks.
             - Only entries with a non-null expiration time and an expiration
               time earlier than the current time are deleted.
         """
-        while True:
-            now = time.monotonic()
+        with self._lock:
+            now = self._clock()
             keys_to_delete = [
                 k
-                for k, (_, exp) in list(self._cache.items())
+                for k, (_, exp, _, _) in list(self._cache.items())
                 if exp is not None and now > exp
             ]
             for k in keys_to_delete:
-                self._cache.pop(k, None)
+                self._remove_locked(k)
 
     def _make_key(self, key: str) -> str:
         """
@@ -167,7 +388,7 @@ class InMemoryBackend(CacheBackend):
         """
         if expire_time is None:
             return False
-        return time.monotonic() > expire_time
+        return self._clock() > expire_time
 
     def _get_expire_time(
         self, expire: Optional[Union[int, timedelta]]
@@ -189,14 +410,15 @@ class InMemoryBackend(CacheBackend):
         if expire is None:
             return None
         seconds = expire.total_seconds() if isinstance(expire, timedelta) else expire
-        return time.monotonic() + seconds
+        return self._clock() + seconds
 
     def _evict_if_needed(self):
         """
-        Evicts the least recently used items if the cache exceeds max_size.
+        Evicts items by the eviction policy if the cache exceeds max_size.
 
         If the cache size exceeds the configured maximum, this method removes
-        the oldest (least recently used) items until the size constraint is met.
+        the least recently used items (``"lru"``) or the items with the lowest
+        priority (``"gdsf"``) until the size constraint is met.
 
         Notes:
             - Only applies if max_size is set.
@@ -204,7 +426,131 @@ class InMemoryBackend(CacheBackend):
         """
         if self._max_size is not None:
             while len(self._cache) > self._max_size:
-                self._cache.popitem(last=False)  # Remove oldest (LRU)
+                if self._eviction == "gdsf":
+                    k = self._cheapest_locked()
+                else:
+                    k = next(iter(self._cache))  # Remove oldest (LRU)
+                self._remove_locked(k)
+                self._evictions += 1
+
+    def _cheapest_locked(self) -> str:
+        """
+        Pops the entry with the lowest GDSF priority off the heap and raises the
+        inflation value to it; the caller must hold the lock.
+
+        Returns:
+            str: The namespaced key to evict.
+        """
+        while self._heap:
+            priority, seq, k = heapq.heappop(self._heap)
+            meta = self._cache.costs.get(k)
+            if meta is not None and meta.seq == seq:
+                self._inflation = priority
+                return k
+        # Every entry has a heap item under GDSF; fall back to LRU order.
+        return next(iter(self._cache))
+
+    def _prioritize_locked(self, k: str, meta: _Cost) -> None:
+        """
+        Recomputes the GDSF priority of an entry; the caller must hold the lock.
+        """
+        cost = meta.cost
+        if cost is None:
+            cost = self._cost_total / self._cost_count if self._cost_count else 1.0
+        meta.priority = self._inflation + meta.hits * cost / meta.size
+        meta.seq = next(self._heap_seq)
+        heapq.heappush(self._heap, (meta.priority, meta.seq, k))
+        if len(self._heap) > 2 * len(self._cache) + 64:
+            # Drop the stale items left behind by reprioritized entries.
+            self._heap = [
+                (entry.priority, entry.seq, key)
+                for key, entry in self._cache.costs.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def _access_locked(self, k: str, served: bool = True) -> None:
+        """
+        Records a use of a live entry; the caller must hold the lock.
+
+        Args:
+            k (str): The namespaced key.
+            served (bool): Whether the value is served to the caller, saving
+                its recompute.
+        """
+        self._cache.move_to_end(k)
+        meta = self._cache.costs.get(k)
+        if meta is None:
+            return
+        meta.hits += 1
+        if served and meta.cost is not None:
+            self._saved_compute += meta.cost
+        if self._eviction == "gdsf":
+            self._prioritize_locked(k, meta)
+
+    def _stored_locked(self, k: str, value: Any, cost: Optional[float]) -> None:
+        """
+        Records a write of an entry; the caller must hold the lock.
+
+        Args:
+            k (str): The namespaced key.
+            value (Any): The value written.
+            cost (Optional[float]): Seconds the value took to compute, or None
+                to keep the cost of an earlier write.
+        """
+        self._cache.move_to_end(k)
+        if cost is not None:
+            self._cost_total += cost
+            self._cost_count += 1
+        meta = self._cache.costs.get(k)
+        if meta is None:
+            if cost is None and self._eviction == "lru":
+                return
+            meta = self._cache.costs[k] = _Cost()
+        meta.hits += 1
+        if cost is not None:
+            meta.cost = cost
+        if self._eviction == "gdsf":
+            meta.size = max(1, self._sizer(value))
+            self._prioritize_locked(k, meta)
+
+    def _remove_locked(self, k: str) -> None:
+        """
+        Removes a namespaced key and its tags; the caller must hold the lock.
+
+        Every removal (delete, expiry, eviction, invalidation) goes through
+        here so the tag index never outlives the entries it points to.
+        """
+        self._cache.pop(k, None)
+        self._untag_locked(k)
+
+    def _untag_locked(self, k: str) -> None:
+        """
+        Removes a namespaced key from the tag index; the caller must hold the lock.
+        """
+        for tag in self._key_tags.pop(k, ()):
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(k)
+                if not keys:
+                    del self._tags[tag]
+
+    def _tag_locked(self, k: str, tags: Sequence[str]) -> None:
+        """
+        Replaces the tags of a namespaced key; the caller must hold the lock.
+        """
+        self._untag_locked(k)
+        if tags:
+            self._key_tags[k] = tuple(tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(k)
+
+    def _invalidate_tags_locked(self, tags: Sequence[str]) -> None:
+        """
+        Deletes the entries of several tags; the caller must hold the lock.
+        """
+        for tag in tags:
+            for k in list(self._tags.get(tag, ())):
+                self._remove_locked(k)
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -229,15 +575,20 @@ class InMemoryBackend(CacheBackend):
         with self._lock:
             item = self._cache.get(k)
             if item:
-                value, expire_time = item
+                value, expire_time, _, _ = item
                 if not self._is_expired(expire_time):
-                    self._cache.move_to_end(k)
+                    self._access_locked(k)
                     return value
-                self._cache.pop(k, None)
+                self._remove_locked(k)
             return None
 
     def set(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
     ) -> None:
         """
         Synchronously stores a value in the cache under the specified key.
@@ -253,17 +604,24 @@ class InMemoryBackend(CacheBackend):
             expire (Optional[Union[int, timedelta]], optional): The expiration time
                 for the cache entry. Can be specified as an integer (seconds) or a
                 timedelta. If None, the entry does not expire.
+            tags (Optional[Sequence[str]], optional): Tags to invalidate the
+                entry by; they replace the tags of an earlier write.
+            cost (Optional[float], optional): Seconds the value took to
+                compute. Added to ``saved_compute_seconds`` on every hit and
+                weighed by ``"gdsf"`` eviction. None keeps the cost of an
+                earlier write.
 
         Notes:
             - Thread-safe.
-            - Triggers LRU eviction if max_size is set.
+            - Triggers eviction if max_size is set.
             - Updates LRU order on set.
         """
         k = self._make_key(key)
         expire_time = self._get_expire_time(expire)
         with self._lock:
-            self._cache[k] = (value, expire_time)
-            self._cache.move_to_end(k)
+            self._cache[k] = (value, expire_time, self._clock(), next(self._versions))
+            self._stored_locked(k, value, cost)
+            self._tag_locked(k, tags or ())
             self._evict_if_needed()
 
     def delete(self, key: str) -> None:
@@ -281,7 +639,7 @@ class InMemoryBackend(CacheBackend):
         """
         k = self._make_key(key)
         with self._lock:
-            self._cache.pop(k, None)
+            self._remove_locked(k)
 
     def clear(self) -> None:
         """
@@ -298,7 +656,7 @@ class InMemoryBackend(CacheBackend):
         with self._lock:
             keys_to_delete = [k for k in self._cache if k.startswith(prefix)]
             for k in keys_to_delete:
-                self._cache.pop(k, None)
+                self._remove_locked(k)
 
     def has(self, key: str) -> bool:
         """
@@ -319,11 +677,11 @@ class InMemoryBackend(CacheBackend):
         with self._lock:
             item = self._cache.get(k)
             if item:
-                _, expire_time = item
+                _, expire_time, _, _ = item
                 if not self._is_expired(expire_time):
-                    self._cache.move_to_end(k)
+                    self._access_locked(k, served=False)
                     return True
-                self._cache.pop(k, None)
+                self._remove_locked(k)
             return False
 
     async def aget(self, key: str) -> Optional[Any]:
@@ -346,18 +704,23 @@ class InMemoryBackend(CacheBackend):
             - Updates LRU order on access.
         """
         k = self._make_key(key)
-        async with self._async_lock:
+        with self._lock:
             item = self._cache.get(k)
             if item:
-                value, expire_time = item
+                value, expire_time, _, _ = item
                 if not self._is_expired(expire_time):
-                    self._cache.move_to_end(k)
+                    self._access_locked(k)
                     return value
-                self._cache.pop(k, None)
+                self._remove_locked(k)
             return None
 
     async def aset(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
     ) -> None:
         """
         Asynchronously stores a value in the cache under the specified key.
@@ -373,17 +736,24 @@ class InMemoryBackend(CacheBackend):
             expire (Optional[Union[int, timedelta]], optional): The expiration time
                 for the cache entry. Can be specified as an integer (seconds) or a
                 timedelta. If None, the entry does not expire.
+            tags (Optional[Sequence[str]], optional): Tags to invalidate the
+                entry by; they replace the tags of an earlier write.
+            cost (Optional[float], optional): Seconds the value took to
+                compute. Added to ``saved_compute_seconds`` on every hit and
+                weighed by ``"gdsf"`` eviction. None keeps the cost of an
+                earlier write.
 
         Notes:
             - Asyncio-safe.
-            - Triggers LRU eviction if max_size is set.
+            - Triggers eviction if max_size is set.
             - Updates LRU order on set.
         """
         k = self._make_key(key)
         expire_time = self._get_expire_time(expire)
-        async with self._async_lock:
-            self._cache[k] = (value, expire_time)
-            self._cache.move_to_end(k)
+        with self._lock:
+            self._cache[k] = (value, expire_time, self._clock(), next(self._versions))
+            self._stored_locked(k, value, cost)
+            self._tag_locked(k, tags or ())
             self._evict_if_needed()
 
     async def adelete(self, key: str) -> None:
@@ -400,8 +770,8 @@ class InMemoryBackend(CacheBackend):
             - The key is automatically namespaced.
         """
         k = self._make_key(key)
-        async with self._async_lock:
-            self._cache.pop(k, None)
+        with self._lock:
+            self._remove_locked(k)
 
     async def aclear(self) -> None:
         """
@@ -415,10 +785,10 @@ class InMemoryBackend(CacheBackend):
             - This operation can be expensive if the cache is large.
         """
         prefix = f"{self._namespace}:"
-        async with self._async_lock:
+        with self._lock:
             keys_to_delete = [k for k in self._cache if k.startswith(prefix)]
             for k in keys_to_delete:
-                self._cache.pop(k, None)
+                self._remove_locked(k)
 
     async def ahas(self, key: str) -> bool:
         """
@@ -436,15 +806,686 @@ class InMemoryBackend(CacheBackend):
             - Updates LRU order on access.
         """
         k = self._make_key(key)
-        async with self._async_lock:
+        with self._lock:
             item = self._cache.get(k)
             if item:
-                _, expire_time = item
+                _, expire_time, _, _ = item
                 if not self._is_expired(expire_time):
-                    self._cache.move_to_end(k)
+                    self._access_locked(k, served=False)
                     return True
-                self._cache.pop(k, None)
+                self._remove_locked(k)
+            return False
+
+    def _get_many_locked(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Looks up several keys; the caller must hold the appropriate lock.
+
+        Args:
+            keys (Sequence[str]): The cache keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The values of the keys that are present and not expired.
+        """
+        result = {}
+        for key in keys:
+            k = self._make_key(key)
+            item = self._cache.get(k)
+            if item:
+                value, expire_time, _, _ = item
+                if not self._is_expired(expire_time):
+                    self._access_locked(k)
+                    result[key] = value
+                else:
+                    self._remove_locked(k)
+        return result
+
+    def _set_many_locked(
+        self, items: Mapping[str, Any], expire: Optional[Union[int, timedelta]]
+    ) -> None:
+        """
+        Stores several items; the caller must hold the appropriate lock.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]]): The expiration time.
+        """
+        expire_time = self._get_expire_time(expire)
+        for key, value in items.items():
+            k = self._make_key(key)
+            self._cache[k] = (value, expire_time, self._clock(), next(self._versions))
+            self._stored_locked(k, value, None)
+        self._evict_if_needed()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Synchronously retrieves several values under a single lock acquisition.
+
+        Args:
+            keys (Sequence[str]): The cache keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The values of the keys that are present and not expired.
+
+        Notes:
+            - Thread-safe.
+            - Updates LRU order for every key found.
+        """
+        with self._lock:
+            return self._get_many_locked(keys)
+
+    def set_many(
+        self, items: Mapping[str, Any], expire: Optional[Union[int, timedelta]] = None
+    ) -> None:
+        """
+        Synchronously stores several values under a single lock acquisition.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]], optional): The expiration time
+                applied to every item.
+
+        Notes:
+            - Thread-safe.
+            - Triggers LRU eviction once, after all items are stored.
+        """
+        with self._lock:
+            self._set_many_locked(items, expire)
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Asynchronously retrieves several values under a single lock acquisition.
+
+        Args:
+            keys (Sequence[str]): The cache keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The values of the keys that are present and not expired.
+
+        Notes:
+            - Asyncio-safe.
+            - Updates LRU order for every key found.
+        """
+        with self._lock:
+            return self._get_many_locked(keys)
+
+    async def aset_many(
+        self, items: Mapping[str, Any], expire: Optional[Union[int, timedelta]] = None
+    ) -> None:
+        """
+        Asynchronously stores several values under a single lock acquisition.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]], optional): The expiration time
+                applied to every item.
+
+        Notes:
+            - Asyncio-safe.
+            - Triggers LRU eviction once, after all items are stored.
+        """
+        with self._lock:
+            self._set_many_locked(items, expire)
+
+    def _entry_locked(self, key: str) -> Optional[CacheEntry]:
+        """
+        Looks up a key with its metadata; the caller must hold the appropriate lock.
+
+        Args:
+            key (str): The cache key to retrieve.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if not found or expired.
+        """
+        k = self._make_key(key)
+        item = self._cache.get(k)
+        if not item:
+            return None
+        value, expire_time, created, _ = item
+        now = self._clock()
+        if expire_time is not None and now > expire_time:
+            self._remove_locked(k)
+            return None
+        self._access_locked(k)
+        ttl = None if expire_time is None else expire_time - now
+        # The clock may not be wall time, so convert through the entry's age.
+        return CacheEntry(value, ttl, time.time() - (now - created))
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """
+        Synchronously retrieves a value with its remaining TTL and creation time.
+
+        Args:
+            key (str): The cache key to retrieve.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if not found or expired.
+
+        Notes:
+            - Thread-safe.
+            - Expired entries are removed on access.
+            - Updates LRU order on access.
+        """
+        with self._lock:
+            return self._entry_locked(key)
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """
+        Asynchronously retrieves a value with its remaining TTL and creation time.
+
+        Args:
+            key (str): The cache key to retrieve.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if not found or expired.
+
+        Notes:
+            - Asyncio-safe.
+            - Expired entries are removed on access.
+            - Updates LRU order on access.
+        """
+        with self._lock:
+            return self._entry_locked(key)
+
+    def _touch_locked(
+        self, key: str, expire: Optional[Union[int, timedelta]], read: bool = True
+    ) -> Optional[Any]:
+        """
+        Replaces the expiry of a live entry in place; the caller must hold the lock.
+
+        Args:
+            key (str): The cache key to touch.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+            read (bool): Whether the value is served to the caller.
+
+        Returns:
+            Optional[Any]: The cached value, or None if not found or expired.
+        """
+        k = self._make_key(key)
+        item = self._cache.get(k)
+        if not item:
+            return None
+        value, expire_time, created, version = item
+        if self._is_expired(expire_time):
+            self._remove_locked(k)
+            return None
+        self._cache[k] = (value, self._get_expire_time(expire), created, version)
+        self._access_locked(k, served=read)
+        return value
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Synchronously retrieves a value and restarts its expiration.
+
+        Args:
+            key (str): The cache key to retrieve.
+            expire (Optional[Union[int, timedelta]]): The new expiration time,
+                counted from now. If None, the entry no longer expires.
+
+        Returns:
+            Optional[Any]: The cached Python object, or None if not found or expired.
+
+        Notes:
+            - Thread-safe.
+            - Updates LRU order on access.
+        """
+        with self._lock:
+            return self._touch_locked(key, expire)
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Asynchronously retrieves a value and restarts its expiration.
+
+        Args:
+            key (str): The cache key to retrieve.
+            expire (Optional[Union[int, timedelta]]): The new expiration time,
+                counted from now. If None, the entry no longer expires.
+
+        Returns:
+            Optional[Any]: The cached Python object, or None if not found or expired.
+
+        Notes:
+            - Asyncio-safe.
+            - Updates LRU order on access.
+        """
+        with self._lock:
+            return self._touch_locked(key, expire)
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Synchronously restarts the expiration of an entry in place.
+
+        Args:
+            key (str): The cache key to touch.
+            expire (Optional[Union[int, timedelta]]): The new expiration time,
+                counted from now. If None, the entry no longer expires.
+
+        Returns:
+            bool: True if the key exists and is not expired, False otherwise.
+        """
+        with self._lock:
+            return self._touch_locked(key, expire, read=False) is not None
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Asynchronously restarts the expiration of an entry in place.
+
+        Args:
+            key (str): The cache key to touch.
+            expire (Optional[Union[int, timedelta]]): The new expiration time,
+                counted from now. If None, the entry no longer expires.
+
+        Returns:
+            bool: True if the key exists and is not expired, False otherwise.
+        """
+        with self._lock:
+            return self._touch_locked(key, expire, read=False) is not None
+
+    def _incr_locked(
+        self, key: str, delta: int, expire: Optional[Union[int, timedelta]]
+    ) -> int:
+        """
+        Adds to a counter in place; the caller must hold the appropriate lock.
+
+        Args:
+            key (str): The counter key.
+            delta (int): The amount to add.
+            expire (Optional[Union[int, timedelta]]): Expiration of a new counter.
+
+        Returns:
+            int: The new value.
+        """
+        k = self._make_key(key)
+        item = self._cache.get(k)
+        if item and not self._is_expired(item[1]):
+            value, expire_time, created, _ = item
+            value += delta
+        else:
+            # A new counter must not inherit the tags of an expired entry.
+            self._untag_locked(k)
+            value, expire_time = delta, self._get_expire_time(expire)
+            created = self._clock()
+        self._cache[k] = (value, expire_time, created, next(self._versions))
+        self._stored_locked(k, value, None)
+        self._evict_if_needed()
+        return value
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> int:
+        """
+        Synchronously adds ``delta`` to a counter, creating it if missing.
+
+        Args:
+            key (str): The counter key.
+            delta (int): The amount to add; negative to decrement. Defaults to 1.
+            expire (Optional[Union[int, timedelta]]): Expiration time of a new
+                counter; an existing counter keeps its expiry.
+
+        Returns:
+            int: The new value.
+
+        Notes:
+            - Thread-safe; the value is updated in place, without serialization.
+        """
+        with self._lock:
+            return self._incr_locked(key, delta, expire)
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> int:
+        """
+        Asynchronously adds ``delta`` to a counter, creating it if missing.
+
+        Args:
+            key (str): The counter key.
+            delta (int): The amount to add; negative to decrement. Defaults to 1.
+            expire (Optional[Union[int, timedelta]]): Expiration time of a new
+                counter; an existing counter keeps its expiry.
+
+        Returns:
+            int: The new value.
+
+        Notes:
+            - Asyncio-safe; the value is updated in place, without serialization.
+        """
+        with self._lock:
+            return self._incr_locked(key, delta, expire)
+
+    def invalidate_tags(self, tags: Sequence[str]) -> None:
+        """
+        Synchronously deletes every entry stored with any of ``tags``.
+
+        Args:
+            tags (Sequence[str]): The tags to invalidate.
+
+        Notes:
+            - Thread-safe.
+            - Looks the keys up in an in-memory tag index, so the cost is
+              proportional to the number of tagged entries.
+        """
+        with self._lock:
+            self._invalidate_tags_locked(tags)
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """
+        Asynchronously deletes every entry stored with any of ``tags``.
+
+        Args:
+            tags (Sequence[str]): The tags to invalidate.
+
+        Notes:
+            - Asyncio-safe.
+        """
+        with self._lock:
+            self._invalidate_tags_locked(tags)
+
+    def _key_batch_locked(
+        self, prefix: str, start: str, inclusive: bool, batch_size: int
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        Reads the next keys of a prefix scan; the caller must hold the lock.
+
+        Args:
+            prefix (str): The namespaced prefix.
+            start (str): The namespaced key to continue from.
+            inclusive (bool): Whether ``start`` itself is included.
+            batch_size (int): How many keys to examine.
+
+        Returns:
+            Tuple[List[str], Optional[str]]: The live keys found, without the
+            namespace, and the key to continue after, or None once the scan
+            is past the prefix.
+        """
+        batch = self._cache.index.slice(start, inclusive, batch_size)
+        offset = len(self._make_key(""))
+        keys = []
+        for k in batch:
+            if not k.startswith(prefix):
+                return keys, None
+            key = k[offset:]
+            if not key.startswith(_INTERNAL_PREFIXES) and not self._is_expired(
+                self._cache[k][1]
+            ):
+                keys.append(key)
+        return keys, batch[-1] if len(batch) == batch_size else None
+
+    def _delete_prefix_locked(self, prefix: str) -> int:
+        """
+        Deletes the entries under a namespaced prefix; the caller must hold the lock.
+        """
+        deleted = 0
+        while True:
+            batch = [
+                k
+                for k in self._cache.index.slice(prefix, True, 1000)
+                if k.startswith(prefix)
+            ]
+            for k in batch:
+                self._remove_locked(k)
+            deleted += len(batch)
+            if len(batch) < 1000:
+                return deleted
+
+    def iter_keys(self, prefix: str = "", batch_size: int = 100) -> Iterator[str]:
+        """
+        Synchronously iterates over the keys starting with ``prefix``, in key order.
+
+        Args:
+            prefix (str): Only list keys starting with this prefix.
+            batch_size (int): How many keys to read per lock acquisition.
+
+        Yields:
+            str: The keys of live entries, without the namespace.
+
+        Notes:
+            - Thread-safe; the lock is released between batches, and each
+              batch resumes after the last key read.
+            - Served by a sorted key index, so only the matching keys are read.
+        """
+        k_prefix = self._make_key(prefix)
+        start: Optional[str] = k_prefix
+        inclusive = True
+        while start is not None:
+            with self._lock:
+                keys, start = self._key_batch_locked(
+                    k_prefix, start, inclusive, batch_size
+                )
+            inclusive = False
+            yield from keys
+
+    async def aiter_keys(
+        self, prefix: str = "", batch_size: int = 100
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously iterates over the keys starting with ``prefix``, in key order.
+
+        Args:
+            prefix (str): Only list keys starting with this prefix.
+            batch_size (int): How many keys to read per lock acquisition.
+
+        Yields:
+            str: The keys of live entries, without the namespace.
+
+        Notes:
+            - Asyncio-safe.
+        """
+        k_prefix = self._make_key(prefix)
+        start: Optional[str] = k_prefix
+        inclusive = True
+        while start is not None:
+            with self._lock:
+                keys, start = self._key_batch_locked(
+                    k_prefix, start, inclusive, batch_size
+                )
+            inclusive = False
+            for key in keys:
+                yield key
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Synchronously deletes every entry whose key starts with ``prefix``.
+
+        Args:
+            prefix (str): The key prefix, without the namespace.
+
+        Returns:
+            int: How many entries were deleted, expired ones included.
+
+        Notes:
+            - Thread-safe.
+            - Served by the sorted key index, so only the matching keys are read.
+        """
+        with self._lock:
+            return self._delete_prefix_locked(self._make_key(prefix))
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """
+        Asynchronously deletes every entry whose key starts with ``prefix``.
+
+        Args:
+            prefix (str): The key prefix, without the namespace.
+
+        Returns:
+            int: How many entries were deleted, expired ones included.
+
+        Notes:
+            - Asyncio-safe.
+        """
+        with self._lock:
+            return self._delete_prefix_locked(self._make_key(prefix))
+
+    def _versioned_locked(
+        self, key: str, read: bool = True
+    ) -> Optional[VersionedValue]:
+        """
+        Looks up a key with its version; the caller must hold the appropriate lock.
+
+        Args:
+            key (str): The cache key to retrieve.
+            read (bool): Whether the value is served to the caller.
+
+        Returns:
+            Optional[VersionedValue]: The value and version, or None if not
+            found or expired.
+        """
+        k = self._make_key(key)
+        item = self._cache.get(k)
+        if not item:
+            return None
+        value, expire_time, _, version = item
+        if self._is_expired(expire_time):
+            self._remove_locked(k)
+            return None
+        self._access_locked(k, served=read)
+        return VersionedValue(value, version)
+
+    def _set_if_version_locked(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[int],
+        expire: Optional[Union[int, timedelta]],
+    ) -> bool:
+        """
+        Stores a value if the entry is at ``version``; the caller must hold the lock.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The Python object to cache.
+            version (Optional[int]): The expected version, or None if the key
+                must not exist.
+            expire (Optional[Union[int, timedelta]]): The expiration time.
+
+        Returns:
+            bool: True if the value was stored.
+        """
+        current = self._versioned_locked(key, read=False)
+        if (None if current is None else current.version) != version:
             return False
+        k = self._make_key(key)
+        self._cache[k] = (
+            value,
+            self._get_expire_time(expire),
+            self._clock(),
+            next(self._versions),
+        )
+        self._stored_locked(k, value, None)
+        self._evict_if_needed()
+        return True
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Synchronously retrieves a value with its version number.
+
+        Args:
+            key (str): The cache key to retrieve.
+
+        Returns:
+            Optional[VersionedValue]: The value and version, or None if not
+            found or expired.
+
+        Notes:
+            - Every write of a value takes a new version; `touch` keeps it.
+        """
+        with self._lock:
+            return self._versioned_locked(key)
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Asynchronously retrieves a value with its version number.
+
+        Args:
+            key (str): The cache key to retrieve.
+
+        Returns:
+            Optional[VersionedValue]: The value and version, or None if not
+            found or expired.
+        """
+        with self._lock:
+            return self._versioned_locked(key)
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[int],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Synchronously stores a value only if the entry is still at ``version``.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The Python object to cache.
+            version (Optional[int]): The version from `get_versioned`, or None
+                to store the value only if the key does not exist.
+            expire (Optional[Union[int, timedelta]], optional): The expiration time.
+
+        Returns:
+            bool: True if the value was stored, False if the entry changed.
+
+        Notes:
+            - Thread-safe; the check and the write happen under one lock.
+        """
+        with self._lock:
+            return self._set_if_version_locked(key, value, version, expire)
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[int],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Asynchronously stores a value only if the entry is still at ``version``.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The Python object to cache.
+            version (Optional[int]): The version from `aget_versioned`, or None
+                to store the value only if the key does not exist.
+            expire (Optional[Union[int, timedelta]], optional): The expiration time.
+
+        Returns:
+            bool: True if the value was stored, False if the entry changed.
+
+        Notes:
+            - Asyncio-safe; the check and the write happen under one lock.
+        """
+        with self._lock:
+            return self._set_if_version_locked(key, value, version, expire)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns eviction metrics.
+
+        Returns:
+            Dict[str, Any]: The ``eviction`` policy, the number of ``entries``
+            and ``evictions``, and ``saved_compute_seconds``: the summed cost
+            of every hit on an entry written with a cost, i.e. the compute
+            time the cache has saved its callers.
+
+        Notes:
+            - Thread-safe.
+        """
+        with self._lock:
+            return {
+                "eviction": self._eviction,
+                "entries": len(self._cache),
+                "evictions": self._evictions,
+                "saved_compute_seconds": self._saved_compute,
+            }
 
     def close(self) -> None:
         """
@@ -0,0 +1,575 @@
+import time
+from datetime import timedelta
+from typing import (
+    Any,
+    Dict,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ..metrics import CacheMetrics
+from .backend import (
+    CacheBackend,
+    CacheEntry,
+    VersionedValue,
+    WrapperBackend,
+    _cost_kwargs,
+    _tag_kwargs,
+)
+
+
+def _describe(backend: CacheBackend) -> Tuple[str, str]:
+    """
+    Derive backend and namespace labels, looking through wrapper backends.
+
+    Args:
+        backend (CacheBackend): The backend instance.
+
+    Returns:
+        Tuple[str, str]: The class name without the ``Backend`` suffix,
+        lowercased (e.g. ``"redis"`` for `RedisBackend`), and the namespace the
+        backend was created with.
+    """
+    while isinstance(getattr(backend, "_backend", None), CacheBackend):
+        backend = backend._backend
+    name = type(backend).__name__
+    if name.endswith("Backend") and name != "Backend":
+        name = name[: -len("Backend")]
+    return name.lower(), str(getattr(backend, "_namespace", None) or "")
+
+
+class MetricsBackend(WrapperBackend):
+    """
+    Wrapper that records metrics for every operation of another backend.
+
+    Each call is timed into a latency histogram and counted in a `CacheMetrics`
+    registry, labelled with the backend and namespace. Lookups count hits and
+    misses per key, and failures are counted as errors both when the wrapped
+    backend raises and when it swallows an exception and returns a miss (as
+    `RedisBackend`, `MemcachedBackend` and `DynamoDBBackend` do). Backends that
+    serialize values also report payload bytes read and written.
+
+    Args:
+        backend (CacheBackend): The backend to instrument.
+        metrics (Optional[CacheMetrics]): The registry to record into. A new
+            one is created if omitted.
+        name (Optional[str]): Backend label. Defaults to the class name of the
+            innermost wrapped backend without the ``Backend`` suffix, lowercased
+            (e.g. ``"redis"``).
+        namespace (Optional[str]): Namespace label. Defaults to the namespace
+            the innermost wrapped backend was created with.
+
+    Notes:
+        - `FastAPICache.init_app(..., metrics=True)` wraps the backend with this
+          class automatically.
+        - When wrapping another wrapper (e.g. `SyncToAsyncBackend`), swallowed
+          errors and payload sizes are still reported by the innermost backend.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        metrics: Optional[CacheMetrics] = None,
+        name: Optional[str] = None,
+        namespace: Optional[str] = None,
+    ) -> None:
+        super().__init__(backend)
+        self._metrics = metrics if metrics is not None else CacheMetrics()
+        default_name, default_namespace = _describe(backend)
+        self._name = name or default_name
+        self._namespace = namespace if namespace is not None else default_namespace
+        backend._add_listener(self)
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        """
+        The registry this wrapper records into.
+        """
+        return self._metrics
+
+    def on_error(self, operation: str, exc: BaseException) -> None:
+        """
+        Count an error the wrapped backend handled itself.
+
+        Args:
+            operation (str): The sync operation name.
+            exc (BaseException): The swallowed exception.
+        """
+        self._metrics.record_error(
+            operation, backend=self._name, namespace=self._namespace
+        )
+
+    def on_payload(self, operation: str, size: int, seconds: float) -> None:
+        """
+        Count payload bytes read or written by the wrapped backend.
+
+        Args:
+            operation (str): ``"get"`` or ``"set"``.
+            size (int): Payload size in bytes.
+            seconds (float): Time spent (de)serializing the payload.
+        """
+        self._metrics.record_bytes(
+            operation, size, backend=self._name, namespace=self._namespace
+        )
+
+    def _observe(
+        self, operation: str, started: float, requested: int = 0, found: int = 0
+    ) -> None:
+        """
+        Record a completed call.
+
+        Args:
+            operation (str): The sync operation name.
+            started (float): `time.perf_counter` value when the call started.
+            requested (int): Number of keys looked up, for lookups.
+            found (int): Number of keys found, for lookups.
+        """
+        self._metrics.observe(
+            operation,
+            time.perf_counter() - started,
+            hits=found,
+            misses=requested - found,
+            backend=self._name,
+            namespace=self._namespace,
+        )
+
+    def _failed(self, operation: str, started: float) -> None:
+        """
+        Record a call that raised.
+
+        Args:
+            operation (str): The sync operation name.
+            started (float): `time.perf_counter` value when the call started.
+        """
+        self._metrics.observe(
+            operation,
+            time.perf_counter() - started,
+            errors=1,
+            backend=self._name,
+            namespace=self._namespace,
+        )
+
+    def _acquire_lock(self, key: str, timeout: float) -> Optional[Any]:
+        """Take a compute lock, recording a ``lock`` call."""
+        started = time.perf_counter()
+        try:
+            token = self._backend._acquire_lock(key, timeout)
+        except Exception:
+            self._failed("lock", started)
+            raise
+        self._observe("lock", started)
+        return token
+
+    async def _aacquire_lock(self, key: str, timeout: float) -> Optional[Any]:
+        """Asynchronously take a compute lock, recording a ``lock`` call."""
+        started = time.perf_counter()
+        try:
+            token = await self._backend._aacquire_lock(key, timeout)
+        except Exception:
+            self._failed("lock", started)
+            raise
+        self._observe("lock", started)
+        return token
+
+    def _release_lock(self, key: str, token: Any) -> None:
+        """Release a compute lock, recording an ``unlock`` call."""
+        started = time.perf_counter()
+        try:
+            self._backend._release_lock(key, token)
+        except Exception:
+            self._failed("unlock", started)
+            raise
+        self._observe("unlock", started)
+
+    async def _arelease_lock(self, key: str, token: Any) -> None:
+        """Asynchronously release a compute lock, recording an ``unlock`` call."""
+        started = time.perf_counter()
+        try:
+            await self._backend._arelease_lock(key, token)
+        except Exception:
+            self._failed("unlock", started)
+            raise
+        self._observe("unlock", started)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retrieve a value, recording a hit or a miss."""
+        started = time.perf_counter()
+        try:
+            value = self._backend.get(key)
+        except Exception:
+            self._failed("get", started)
+            raise
+        self._observe("get", started, 1, int(value is not None))
+        return value
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Asynchronously retrieve a value, recording a hit or a miss."""
+        started = time.perf_counter()
+        try:
+            value = await self._backend.aget(key)
+        except Exception:
+            self._failed("get", started)
+            raise
+        self._observe("get", started, 1, int(value is not None))
+        return value
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Retrieve a value with its metadata, recording a hit or a miss."""
+        started = time.perf_counter()
+        try:
+            entry = self._backend.get_with_meta(key)
+        except Exception:
+            self._failed("get", started)
+            raise
+        self._observe("get", started, 1, int(entry is not None))
+        return entry
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Asynchronously retrieve a value with its metadata, recording a hit or a miss."""
+        started = time.perf_counter()
+        try:
+            entry = await self._backend.aget_with_meta(key)
+        except Exception:
+            self._failed("get", started)
+            raise
+        self._observe("get", started, 1, int(entry is not None))
+        return entry
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Retrieve a value and restart its expiration, recording a hit or a miss."""
+        started = time.perf_counter()
+        try:
+            value = self._backend.get_and_touch(key, expire)
+        except Exception:
+            self._failed("get", started)
+            raise
+        self._observe("get", started, 1, int(value is not None))
+        return value
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Asynchronously retrieve a value and restart its expiration, recording a hit or a miss."""
+        started = time.perf_counter()
+        try:
+            value = await self._backend.aget_and_touch(key, expire)
+        except Exception:
+            self._failed("get", started)
+            raise
+        self._observe("get", started, 1, int(value is not None))
+        return value
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Restart an entry's expiration, recording the call."""
+        started = time.perf_counter()
+        try:
+            found = self._backend.touch(key, expire)
+        except Exception:
+            self._failed("touch", started)
+            raise
+        self._observe("touch", started)
+        return found
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Asynchronously restart an entry's expiration, recording the call."""
+        started = time.perf_counter()
+        try:
+            found = await self._backend.atouch(key, expire)
+        except Exception:
+            self._failed("touch", started)
+            raise
+        self._observe("touch", started)
+        return found
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Add to a counter, recording the call."""
+        started = time.perf_counter()
+        try:
+            value = self._backend.incr(key, delta, expire)
+        except Exception:
+            self._failed("incr", started)
+            raise
+        self._observe("incr", started)
+        return value
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Asynchronously add to a counter, recording the call."""
+        started = time.perf_counter()
+        try:
+            value = await self._backend.aincr(key, delta, expire)
+        except Exception:
+            self._failed("incr", started)
+            raise
+        self._observe("incr", started)
+        return value
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Retrieve a value with its version, recording a hit or a miss."""
+        started = time.perf_counter()
+        try:
+            entry = self._backend.get_versioned(key)
+        except Exception:
+            self._failed("get", started)
+            raise
+        self._observe("get", started, 1, int(entry is not None))
+        return entry
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Asynchronously retrieve a value with its version, recording a hit or a miss."""
+        started = time.perf_counter()
+        try:
+            entry = await self._backend.aget_versioned(key)
+        except Exception:
+            self._failed("get", started)
+            raise
+        self._observe("get", started, 1, int(entry is not None))
+        return entry
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Store a value if its version is unchanged, recording the write."""
+        started = time.perf_counter()
+        try:
+            stored = self._backend.set_if_version(key, value, version, expire)
+        except Exception:
+            self._failed("set", started)
+            raise
+        self._observe("set", started)
+        return stored
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Asynchronously store a value if its version is unchanged, recording the write."""
+        started = time.perf_counter()
+        try:
+            stored = await self._backend.aset_if_version(key, value, version, expire)
+        except Exception:
+            self._failed("set", started)
+            raise
+        self._observe("set", started)
+        return stored
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Store a value, recording the write."""
+        started = time.perf_counter()
+        try:
+            self._backend.set(
+                key,
+                value,
+                expire=expire,
+                **_tag_kwargs(tags),
+                **_cost_kwargs(self._backend, cost),
+            )
+        except Exception:
+            self._failed("set", started)
+            raise
+        self._observe("set", started)
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Asynchronously store a value, recording the write."""
+        started = time.perf_counter()
+        try:
+            await self._backend.aset(
+                key,
+                value,
+                expire=expire,
+                **_tag_kwargs(tags),
+                **_cost_kwargs(self._backend, cost),
+            )
+        except Exception:
+            self._failed("set", started)
+            raise
+        self._observe("set", started)
+
+    def invalidate_tags(self, tags: Sequence[str]) -> None:
+        """Delete every key carrying one of the tags, recording the call."""
+        started = time.perf_counter()
+        try:
+            self._backend.invalidate_tags(tags)
+        except Exception:
+            self._failed("invalidate", started)
+            raise
+        self._observe("invalidate", started)
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """Asynchronously delete every key carrying one of the tags, recording the call."""
+        started = time.perf_counter()
+        try:
+            await self._backend.ainvalidate_tags(tags)
+        except Exception:
+            self._failed("invalidate", started)
+            raise
+        self._observe("invalidate", started)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete every entry whose key starts with ``prefix``, recording the call."""
+        started = time.perf_counter()
+        try:
+            deleted = self._backend.delete_prefix(prefix)
+        except Exception:
+            self._failed("delete_prefix", started)
+            raise
+        self._observe("delete_prefix", started)
+        return deleted
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """Asynchronously delete every entry whose key starts with ``prefix``, recording the call."""
+        started = time.perf_counter()
+        try:
+            deleted = await self._backend.adelete_prefix(prefix)
+        except Exception:
+            self._failed("delete_prefix", started)
+            raise
+        self._observe("delete_prefix", started)
+        return deleted
+
+    def delete(self, key: str) -> None:
+        """Delete a value, recording the call."""
+        started = time.perf_counter()
+        try:
+            self._backend.delete(key)
+        except Exception:
+            self._failed("delete", started)
+            raise
+        self._observe("delete", started)
+
+    async def adelete(self, key: str) -> None:
+        """Asynchronously delete a value, recording the call."""
+        started = time.perf_counter()
+        try:
+            await self._backend.adelete(key)
+        except Exception:
+            self._failed("delete", started)
+            raise
+        self._observe("delete", started)
+
+    def clear(self) -> None:
+        """Clear the namespace, recording the call."""
+        started = time.perf_counter()
+        try:
+            self._backend.clear()
+        except Exception:
+            self._failed("clear", started)
+            raise
+        self._observe("clear", started)
+
+    async def aclear(self) -> None:
+        """Asynchronously clear the namespace, recording the call."""
+        started = time.perf_counter()
+        try:
+            await self._backend.aclear()
+        except Exception:
+            self._failed("clear", started)
+            raise
+        self._observe("clear", started)
+
+    def has(self, key: str) -> bool:
+        """Check for a key, recording the call."""
+        started = time.perf_counter()
+        try:
+            exists = self._backend.has(key)
+        except Exception:
+            self._failed("has", started)
+            raise
+        self._observe("has", started)
+        return exists
+
+    async def ahas(self, key: str) -> bool:
+        """Asynchronously check for a key, recording the call."""
+        started = time.perf_counter()
+        try:
+            exists = await self._backend.ahas(key)
+        except Exception:
+            self._failed("has", started)
+            raise
+        self._observe("has", started)
+        return exists
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Retrieve several values, recording a hit or miss per key."""
+        started = time.perf_counter()
+        try:
+            values = self._backend.get_many(keys)
+        except Exception:
+            self._failed("get_many", started)
+            raise
+        self._observe("get_many", started, len(keys), len(values))
+        return values
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Asynchronously retrieve several values, recording a hit or miss per key."""
+        started = time.perf_counter()
+        try:
+            values = await self._backend.aget_many(keys)
+        except Exception:
+            self._failed("get_many", started)
+            raise
+        self._observe("get_many", started, len(keys), len(values))
+        return values
+
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Store several values, recording the write."""
+        started = time.perf_counter()
+        try:
+            self._backend.set_many(items, expire=expire)
+        except Exception:
+            self._failed("set_many", started)
+            raise
+        self._observe("set_many", started)
+
+    async def aset_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Asynchronously store several values, recording the write."""
+        started = time.perf_counter()
+        try:
+            await self._backend.aset_many(items, expire=expire)
+        except Exception:
+            self._failed("set_many", started)
+            raise
+        self._observe("set_many", started)
@@ -1,8 +1,24 @@
-import pickle
 import time
-from typing import Any, Optional, Union
+import uuid
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from datetime import timedelta
-from .backend import CacheBackend
+from .backend import (
+    _INTERNAL_PREFIXES,
+    CacheBackend,
+    CacheEntry,
+    VersionedValue,
+    _prefix_upper,
+)
 
 
 class MongoDBBackend(CacheBackend):
@@ -14,6 +30,9 @@ class MongoDBBackend(CacheBackend):
       - _id: the cache key (optionally namespaced)
       - value: the pickled cached value
       - expires_at: epoch time when the entry should expire
+      - created_at: epoch time when the entry was written
+      - version: random token replaced on every write, for `set_if_version`
+      - tags: the entry's tags, under a multikey index for `invalidate_tags`
 
     Expired documents are deleted automatically by MongoDB's TTL monitor,
     but expiration is also checked in code to avoid returning stale data.
@@ -43,6 +62,7 @@ class MongoDBBackend(CacheBackend):
         self._sync_db = self._sync_client.get_default_database()
         self._sync_collection = self._sync_db[self._namespace]
         self._sync_collection.create_index("expires_at", expireAfterSeconds=0)
+        self._sync_collection.create_index("tags", sparse=True)
 
         # Async client
         self._async_client = pymongo.AsyncMongoClient(uri)
@@ -74,13 +94,28 @@ class MongoDBBackend(CacheBackend):
         doc = self._sync_collection.find_one({"_id": self._make_key(key)})
         if doc and (doc.get("expires_at", float("inf")) > time.time()):
             try:
-                return pickle.loads(doc["value"])
+                return self._loads(doc["value"])
             except Exception:
                 return None
         return None
 
+    @staticmethod
+    def _tagged(
+        fields: Dict[str, Any], tags: Optional[Sequence[str]]
+    ) -> Dict[str, Any]:
+        """
+        Build the update of a write, replacing the tags of an earlier write.
+        """
+        if tags:
+            return {"$set": dict(fields, tags=list(tags))}
+        return {"$set": fields, "$unset": {"tags": ""}}
+
     def set(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Synchronously set a value in the cache.
@@ -90,15 +125,382 @@ class MongoDBBackend(CacheBackend):
             value (Any): The value to cache.
             expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
                                                      If None, the entry never expires.
+            tags (Optional[Sequence[str]]): Tags to invalidate the entry by.
         """
-        update = {"value": pickle.dumps(value)}
+        update = {
+            "value": self._dumps(value),
+            "created_at": time.time(),
+            "version": uuid.uuid4().hex,
+        }
         exptime = self._compute_expire_at(expire)
         if exptime is not None:
             update["expires_at"] = exptime
 
         self._sync_collection.update_one(
-            {"_id": self._make_key(key)}, {"$set": update}, upsert=True
+            {"_id": self._make_key(key)}, self._tagged(update, tags), upsert=True
+        )
+
+    def _touch_args(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Build the filter matching a live entry and the update of its expiry.
+        """
+        query = self._live_query(key)
+        exptime = self._compute_expire_at(expire)
+        if exptime is None:
+            return query, {"$unset": {"expires_at": ""}}
+        return query, {"$set": {"expires_at": exptime}}
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Synchronously retrieve a value and restart its expiration.
+
+        Args:
+            key (str): The cache key.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+                If None, the entry no longer expires.
+
+        Returns:
+            Optional[Any]: The cached value, or None if not found or expired.
+        """
+        query, update = self._touch_args(key, expire)
+        doc = self._sync_collection.find_one_and_update(
+            query, update, projection={"value": True}
+        )
+        return self._loads(doc["value"]) if doc else None
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Synchronously restart the expiration of an entry by updating ``expires_at``.
+
+        Args:
+            key (str): The cache key.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+                If None, the entry no longer expires.
+
+        Returns:
+            bool: True if the key exists and is not expired, False otherwise.
+        """
+        query, update = self._touch_args(key, expire)
+        return self._sync_collection.update_one(query, update).matched_count > 0
+
+    def _incr_args(
+        self, key: str, delta: int, expire: Optional[Union[int, timedelta]]
+    ) -> Dict[str, Any]:
+        """
+        Build the upsert that adds to a counter, giving a new one its expiry.
+        """
+        on_insert: Dict[str, Any] = {"created_at": time.time()}
+        exptime = self._compute_expire_at(expire)
+        if exptime is not None:
+            on_insert["expires_at"] = exptime
+        return {
+            "filter": {"_id": self._make_key(key)},
+            "update": {
+                "$inc": {"value": delta},
+                "$set": {"version": uuid.uuid4().hex},
+                "$setOnInsert": on_insert,
+            },
+            "projection": {"value": True},
+            "upsert": True,
+        }
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> int:
+        """
+        Synchronously add ``delta`` to a counter with ``$inc`` and an upsert.
+
+        A counter past its expiry is deleted first, so it restarts at
+        ``delta``.
+
+        Args:
+            key (str): The counter key.
+            delta (int): The amount to add; negative to decrement. Defaults to 1.
+            expire (Optional[Union[int, timedelta]]): Expiration time of a new
+                counter; an existing counter keeps its expiry.
+
+        Returns:
+            int: The new value.
+        """
+        from pymongo import ReturnDocument
+        from pymongo.errors import DuplicateKeyError
+
+        args = self._incr_args(key, delta, expire)
+        self._sync_collection.delete_one(
+            {"_id": args["filter"]["_id"], "expires_at": {"$lte": time.time()}}
         )
+        try:
+            doc = self._sync_collection.find_one_and_update(
+                return_document=ReturnDocument.AFTER, **args
+            )
+        except DuplicateKeyError:
+            # A concurrent upsert created the counter first; now it exists.
+            doc = self._sync_collection.find_one_and_update(
+                return_document=ReturnDocument.AFTER, **args
+            )
+        return doc["value"]
+
+    def _live_query(self, key: str) -> Dict[str, Any]:
+        """
+        Build the filter matching a key's entry while it has not expired.
+        """
+        return {
+            "_id": self._make_key(key),
+            "$or": [
+                {"expires_at": {"$exists": False}},
+                {"expires_at": {"$gt": time.time()}},
+            ],
+        }
+
+    def _version_args(
+        self, key: str, value: Any, expire: Optional[Union[int, timedelta]]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Build the document of a versioned write and the update replacing an entry with it.
+        """
+        doc: Dict[str, Any] = {
+            "_id": self._make_key(key),
+            "value": self._dumps(value),
+            "created_at": time.time(),
+            "version": uuid.uuid4().hex,
+        }
+        exptime = self._compute_expire_at(expire)
+        if exptime is not None:
+            doc["expires_at"] = exptime
+        fields = {name: field for name, field in doc.items() if name != "_id"}
+        update: Dict[str, Any] = {"$set": fields}
+        if exptime is None:
+            update["$unset"] = {"expires_at": ""}
+        return doc, update
+
+    def _to_versioned(self, doc: Optional[dict]) -> Optional[VersionedValue]:
+        """
+        Convert a document into a `VersionedValue`.
+        """
+        if doc is None:
+            return None
+        return VersionedValue(self._loads(doc["value"]), doc.get("version"))
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Synchronously retrieve a value with its ``version`` field.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[VersionedValue]: The value and its version, or None if
+            not found or expired.
+        """
+        return self._to_versioned(
+            self._sync_collection.find_one(
+                self._live_query(key), projection={"value": True, "version": True}
+            )
+        )
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Asynchronously retrieve a value with its ``version`` field.
+
+        See `get_versioned`.
+        """
+        return self._to_versioned(
+            await self._async_collection.find_one(
+                self._live_query(key), projection={"value": True, "version": True}
+            )
+        )
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[str],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Synchronously store a value only if the entry is still at ``version``.
+
+        The update filters on the ``version`` field, so MongoDB applies it
+        only to an unchanged document. Without a version, the document is
+        inserted, which fails if the key exists; an expired entry is deleted
+        first.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value to cache.
+            version (Optional[str]): The version from `get_versioned`, or None
+                to store the value only if the key does not exist.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+
+        Returns:
+            bool: True if the value was stored, False if the entry changed.
+        """
+        from pymongo.errors import DuplicateKeyError
+
+        doc, update = self._version_args(key, value, expire)
+        if version is not None:
+            query = dict(self._live_query(key), version=version)
+            return self._sync_collection.update_one(query, update).matched_count > 0
+        self._sync_collection.delete_one(
+            {"_id": doc["_id"], "expires_at": {"$lte": time.time()}}
+        )
+        try:
+            self._sync_collection.insert_one(doc)
+        except DuplicateKeyError:
+            return False
+        return True
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[str],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Asynchronously store a value only if the entry is still at ``version``.
+
+        See `set_if_version`.
+        """
+        from pymongo.errors import DuplicateKeyError
+
+        doc, update = self._version_args(key, value, expire)
+        if version is not None:
+            query = dict(self._live_query(key), version=version)
+            result = await self._async_collection.update_one(query, update)
+            return result.matched_count > 0
+        await self._async_collection.delete_one(
+            {"_id": doc["_id"], "expires_at": {"$lte": time.time()}}
+        )
+        try:
+            await self._async_collection.insert_one(doc)
+        except DuplicateKeyError:
+            return False
+        return True
+
+    def invalidate_tags(self, tags: Sequence[str]) -> None:
+        """
+        Synchronously delete every entry stored with any of ``tags``.
+
+        A single ``delete_many`` on the ``tags`` field, served by its
+        multikey index.
+
+        Args:
+            tags (Sequence[str]): The tags to invalidate.
+        """
+        self._sync_collection.delete_many({"tags": {"$in": list(tags)}})
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """
+        Asynchronously delete every entry stored with any of ``tags``.
+
+        See `invalidate_tags`.
+        """
+        await self._async_collection.delete_many({"tags": {"$in": list(tags)}})
+
+    def _prefix_query(self, prefix: str) -> Dict[str, Any]:
+        """
+        Build the filter of the keys starting with ``prefix``.
+
+        An ``_id`` range rather than a regex, so the ``_id`` index bounds the
+        scan to the matching keys.
+        """
+        k_prefix = self._make_key(prefix)
+        return {"_id": {"$gte": k_prefix, "$lt": _prefix_upper(k_prefix)}}
+
+    def _keys_cursor_args(self, prefix: str) -> Dict[str, Any]:
+        """
+        Build the `find` arguments listing the live keys starting with ``prefix``.
+        """
+        query = self._prefix_query(prefix)
+        query["$or"] = [
+            {"expires_at": {"$exists": False}},
+            {"expires_at": {"$gt": time.time()}},
+        ]
+        return {"filter": query, "projection": {"_id": 1}, "sort": [("_id", 1)]}
+
+    def iter_keys(self, prefix: str = "", batch_size: int = 100) -> Iterator[str]:
+        """
+        Synchronously iterate over the keys starting with ``prefix``, in key order.
+
+        The cursor walks the ``_id`` index and fetches ``batch_size`` keys
+        per round trip.
+
+        Args:
+            prefix (str): Only list keys starting with this prefix.
+            batch_size (int): How many keys to fetch per round trip.
+
+        Yields:
+            str: The keys of live entries, without the namespace.
+        """
+        offset = len(self._make_key(""))
+        cursor = self._sync_collection.find(**self._keys_cursor_args(prefix))
+        with cursor.batch_size(batch_size):
+            for doc in cursor:
+                key = doc["_id"][offset:]
+                if not key.startswith(_INTERNAL_PREFIXES):
+                    yield key
+
+    async def aiter_keys(
+        self, prefix: str = "", batch_size: int = 100
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously iterate over the keys starting with ``prefix``, in key order.
+
+        See `iter_keys`.
+
+        Args:
+            prefix (str): Only list keys starting with this prefix.
+            batch_size (int): How many keys to fetch per round trip.
+
+        Yields:
+            str: The keys of live entries, without the namespace.
+        """
+        offset = len(self._make_key(""))
+        cursor = self._async_collection.find(**self._keys_cursor_args(prefix))
+        try:
+            async for doc in cursor.batch_size(batch_size):
+                key = doc["_id"][offset:]
+                if not key.startswith(_INTERNAL_PREFIXES):
+                    yield key
+        finally:
+            await cursor.close()
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Synchronously delete every entry whose key starts with ``prefix``.
+
+        Args:
+            prefix (str): The key prefix, without the namespace.
+
+        Returns:
+            int: How many documents were deleted, expired ones included.
+        """
+        return self._sync_collection.delete_many(
+            self._prefix_query(prefix)
+        ).deleted_count
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """
+        Asynchronously delete every entry whose key starts with ``prefix``.
+
+        See `delete_prefix`.
+
+        Args:
+            prefix (str): The key prefix, without the namespace.
+
+        Returns:
+            int: How many documents were deleted, expired ones included.
+        """
+        result = await self._async_collection.delete_many(self._prefix_query(prefix))
+        return result.deleted_count
 
     def delete(self, key: str) -> None:
         """
@@ -128,6 +530,58 @@ class MongoDBBackend(CacheBackend):
         doc = self._sync_collection.find_one({"_id": self._make_key(key)})
         return bool(doc and (doc.get("expires_at", float("inf")) > time.time()))
 
+    def _to_entry(self, doc: Optional[dict]) -> Optional[CacheEntry]:
+        """
+        Turn a fetched document into a `CacheEntry`, skipping expired ones.
+
+        Args:
+            doc (Optional[dict]): The document, or None if not found.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if missing, expired or
+            undecodable.
+        """
+        now = time.time()
+        if not doc or doc.get("expires_at", float("inf")) <= now:
+            return None
+        try:
+            value = self._loads(doc["value"])
+        except Exception:
+            return None
+        expires_at = doc.get("expires_at")
+        ttl = None if expires_at is None else expires_at - now
+        return CacheEntry(value, ttl, doc.get("created_at"))
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """
+        Synchronously retrieve a value with its remaining TTL and creation time.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[CacheEntry]: The entry from a single document read, or None
+            if not found or expired.
+        """
+        return self._to_entry(
+            self._sync_collection.find_one({"_id": self._make_key(key)})
+        )
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """
+        Asynchronously retrieve a value with its remaining TTL and creation time.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[CacheEntry]: The entry from a single document read, or None
+            if not found or expired.
+        """
+        return self._to_entry(
+            await self._async_collection.find_one({"_id": self._make_key(key)})
+        )
+
     async def aget(self, key: str) -> Optional[Any]:
         """
         Asynchronously retrieve a value from the cache.
@@ -141,13 +595,17 @@ class MongoDBBackend(CacheBackend):
         doc = await self._async_collection.find_one({"_id": self._make_key(key)})
         if doc and (doc.get("expires_at", float("inf")) > time.time()):
             try:
-                return pickle.loads(doc["value"])
+                return self._loads(doc["value"])
             except Exception:
                 return None
         return None
 
     async def aset(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Asynchronously set a value in the cache.
@@ -157,15 +615,72 @@ class MongoDBBackend(CacheBackend):
             value (Any): The value to cache.
             expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
                                                      If None, the entry never expires.
+            tags (Optional[Sequence[str]]): Tags to invalidate the entry by.
         """
-        update = {"value": pickle.dumps(value)}
+        update = {
+            "value": self._dumps(value),
+            "created_at": time.time(),
+            "version": uuid.uuid4().hex,
+        }
         exptime = self._compute_expire_at(expire)
         if exptime is not None:
             update["expires_at"] = exptime
 
         await self._async_collection.update_one(
-            {"_id": self._make_key(key)}, {"$set": update}, upsert=True
+            {"_id": self._make_key(key)}, self._tagged(update, tags), upsert=True
+        )
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Asynchronously retrieve a value and restart its expiration.
+
+        See `get_and_touch`.
+        """
+        query, update = self._touch_args(key, expire)
+        doc = await self._async_collection.find_one_and_update(
+            query, update, projection={"value": True}
         )
+        return self._loads(doc["value"]) if doc else None
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Asynchronously restart the expiration of an entry.
+
+        See `touch`.
+        """
+        query, update = self._touch_args(key, expire)
+        result = await self._async_collection.update_one(query, update)
+        return result.matched_count > 0
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> int:
+        """
+        Asynchronously add ``delta`` to a counter with ``$inc`` and an upsert.
+
+        See `incr`.
+        """
+        from pymongo import ReturnDocument
+        from pymongo.errors import DuplicateKeyError
+
+        args = self._incr_args(key, delta, expire)
+        await self._async_collection.delete_one(
+            {"_id": args["filter"]["_id"], "expires_at": {"$lte": time.time()}}
+        )
+        try:
+            doc = await self._async_collection.find_one_and_update(
+                return_document=ReturnDocument.AFTER, **args
+            )
+        except DuplicateKeyError:
+            doc = await self._async_collection.find_one_and_update(
+                return_document=ReturnDocument.AFTER, **args
+            )
+        return doc["value"]
 
     async def adelete(self, key: str) -> None:
         """
@@ -197,6 +712,120 @@ class MongoDBBackend(CacheBackend):
         doc = await self._async_collection.find_one({"_id": self._make_key(key)})
         return bool(doc and (doc.get("expires_at", float("inf")) > time.time()))
 
+    def _update_ops(
+        self, items: Mapping[str, Any], expire: Optional[Union[int, timedelta]]
+    ) -> list:
+        """
+        Build the upsert operations for a bulk write.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]]): Expiration time.
+
+        Returns:
+            list: `UpdateOne` operations, one per item.
+        """
+        from pymongo import UpdateOne
+
+        exptime = self._compute_expire_at(expire)
+        ops = []
+        for key, value in items.items():
+            update = {
+                "value": self._dumps(value),
+                "created_at": time.time(),
+                "version": uuid.uuid4().hex,
+            }
+            if exptime is not None:
+                update["expires_at"] = exptime
+            ops.append(
+                UpdateOne({"_id": self._make_key(key)}, {"$set": update}, upsert=True)
+            )
+        return ops
+
+    def _decode_docs(self, docs: list, mapping: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Turn fetched documents into a key/value mapping, skipping expired ones.
+
+        Args:
+            docs (list): Documents returned by the `$in` query.
+            mapping (Dict[str, str]): Namespaced key to original key.
+
+        Returns:
+            Dict[str, Any]: The decoded values.
+        """
+        now = time.time()
+        result = {}
+        for doc in docs:
+            if doc.get("expires_at", float("inf")) > now:
+                try:
+                    result[mapping[doc["_id"]]] = self._loads(doc["value"])
+                except Exception:
+                    continue
+        return result
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Synchronously retrieve several values with a single `$in` query.
+
+        Args:
+            keys (Sequence[str]): The cache keys.
+
+        Returns:
+            Dict[str, Any]: The values of the keys that exist and are not expired.
+        """
+        if not keys:
+            return {}
+        mapping = {self._make_key(key): key for key in keys}
+        docs = list(self._sync_collection.find({"_id": {"$in": list(mapping)}}))
+        return self._decode_docs(docs, mapping)
+
+    def set_many(
+        self, items: Mapping[str, Any], expire: Optional[Union[int, timedelta]] = None
+    ) -> None:
+        """
+        Synchronously set several values with one unordered bulk write.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+        """
+        if items:
+            self._sync_collection.bulk_write(
+                self._update_ops(items, expire), ordered=False
+            )
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Asynchronously retrieve several values with a single `$in` query.
+
+        Args:
+            keys (Sequence[str]): The cache keys.
+
+        Returns:
+            Dict[str, Any]: The values of the keys that exist and are not expired.
+        """
+        if not keys:
+            return {}
+        mapping = {self._make_key(key): key for key in keys}
+        cursor = self._async_collection.find({"_id": {"$in": list(mapping)}})
+        docs = await cursor.to_list(length=None)
+        return self._decode_docs(docs, mapping)
+
+    async def aset_many(
+        self, items: Mapping[str, Any], expire: Optional[Union[int, timedelta]] = None
+    ) -> None:
+        """
+        Asynchronously set several values with one unordered bulk write.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+        """
+        if items:
+            await self._async_collection.bulk_write(
+                self._update_ops(items, expire), ordered=False
+            )
+
     def close(self) -> None:
         """
         Close the synchronous MongoDB client.
@@ -218,3 +847,73 @@ class MongoDBBackend(CacheBackend):
             else:
                 return int(time.time() + expire)
         return None
+
+    def _lock_document(self, key: str, timeout: float) -> Dict[str, Any]:
+        """
+        Build a lock document; its ``_id`` is unique per key.
+        """
+        return {
+            "_id": self._make_key(f"__lock__:{key}"),
+            "token": uuid.uuid4().hex,
+            "expires_at": time.time() + timeout,
+        }
+
+    def _acquire_lock(self, key: str, timeout: float) -> Optional[str]:
+        """
+        Take a key's compute lock by inserting a document with a fixed ``_id``.
+
+        The insert fails with a duplicate key error while another caller holds
+        the lock. A lock past its expiry is deleted first so it can be taken.
+
+        Args:
+            key (str): The cache key the lock guards.
+            timeout (float): Seconds until the lock expires.
+
+        Returns:
+            Optional[str]: The lock token, or None if the lock is held.
+        """
+        from pymongo.errors import DuplicateKeyError
+
+        lock = self._lock_document(key, timeout)
+        self._sync_collection.delete_one(
+            {"_id": lock["_id"], "expires_at": {"$lte": time.time()}}
+        )
+        try:
+            self._sync_collection.insert_one(lock)
+        except DuplicateKeyError:
+            return None
+        return lock["token"]
+
+    def _release_lock(self, key: str, token: str) -> None:
+        """
+        Delete a compute lock if ``token`` still owns it.
+        """
+        self._sync_collection.delete_one(
+            {"_id": self._make_key(f"__lock__:{key}"), "token": token}
+        )
+
+    async def _aacquire_lock(self, key: str, timeout: float) -> Optional[str]:
+        """
+        Asynchronously take a key's compute lock with a conditional insert.
+
+        See `_acquire_lock`.
+        """
+        from pymongo.errors import DuplicateKeyError
+
+        lock = self._lock_document(key, timeout)
+        await self._async_collection.delete_one(
+            {"_id": lock["_id"], "expires_at": {"$lte": time.time()}}
+        )
+        try:
+            await self._async_collection.insert_one(lock)
+        except DuplicateKeyError:
+            return None
+        return lock["token"]
+
+    async def _arelease_lock(self, key: str, token: str) -> None:
+        """
+        Asynchronously delete a compute lock if ``token`` still owns it.
+        """
+        await self._async_collection.delete_one(
+            {"_id": self._make_key(f"__lock__:{key}"), "token": token}
+        )
@@ -1,12 +1,28 @@
-import pickle
 import re
 import threading
+import uuid
 from datetime import datetime, timezone, timedelta
-from typing import Any, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from apscheduler.schedulers.background import BackgroundScheduler
 
-from .backend import CacheBackend
+from .backend import (
+    _INTERNAL_PREFIXES,
+    CacheBackend,
+    CacheEntry,
+    VersionedValue,
+    _prefix_upper,
+)
 
 
 def _validate_namespace(namespace: str) -> str:
@@ -170,24 +186,34 @@ class PostgresBackend(CacheBackend):
 
         The table is created as UNLOGGED for better performance, as cache data can
         be regenerated if lost. An index is created on the `expire_at` column to
-        speed up cleanup operations.
+        speed up cleanup operations, and a GIN index on the `tags` column serves
+        `invalidate_tags`. Keys use the "C" collation, so the primary-key index
+        orders them by code point and serves prefix ranges.
 
         Notes:
             - The table name is derived from the namespace.
             - This method is called automatically during initialization.
             - The table schema includes:
-                - key (TEXT, primary key)
+                - key (TEXT COLLATE "C", primary key)
                 - value (BYTEA, pickled Python object)
                 - expire_at (TIMESTAMPTZ, nullable)
+                - tags (TEXT[], nullable)
+            - Tables created before tags existed gain the `tags` column. Their
+              keys keep the database collation, so prefix scans on them are
+              correct but cannot use the primary-key index.
         """
         create_sql = f"""
         CREATE UNLOGGED TABLE IF NOT EXISTS {self._table_name} (
-            key TEXT PRIMARY KEY,
+            key TEXT COLLATE "C" PRIMARY KEY,
             value BYTEA NOT NULL,
-            expire_at TIMESTAMPTZ
+            expire_at TIMESTAMPTZ,
+            tags TEXT[]
         );
+        ALTER TABLE {self._table_name} ADD COLUMN IF NOT EXISTS tags TEXT[];
         CREATE INDEX IF NOT EXISTS idx_{self._table_name}_expire_at
         ON {self._table_name} (expire_at);
+        CREATE INDEX IF NOT EXISTS idx_{self._table_name}_tags
+        ON {self._table_name} USING GIN (tags);
         """
         with self._sync_pool.connection() as conn:
             with conn.cursor() as cur:
@@ -200,8 +226,18 @@ class PostgresBackend(CacheBackend):
     def _is_expired(self, expire_at: Optional[datetime]) -> bool:
         return expire_at is not None and expire_at < datetime.now(timezone.utc)
 
+    @staticmethod
+    def _remaining(expire_at: Optional[datetime]) -> Optional[float]:
+        if expire_at is None:
+            return None
+        return (expire_at - datetime.now(timezone.utc)).total_seconds()
+
     def set(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Stores a value in the cache under the specified key.
@@ -216,6 +252,8 @@ class PostgresBackend(CacheBackend):
             expire (Optional[Union[int, timedelta]], optional): The expiration time
                 for the cache entry. Can be specified as an integer (seconds) or a
                 timedelta. If None, the entry does not expire.
+            tags (Optional[Sequence[str]], optional): Tags to invalidate the
+                entry by, stored in the row's `tags` column.
 
         Notes:
             - The key is automatically namespaced.
@@ -226,13 +264,19 @@ class PostgresBackend(CacheBackend):
             with conn.cursor() as cur:
                 cur.execute(
                     f"""
-                    INSERT INTO {self._table_name} (key, value, expire_at)
-                    VALUES (%s, %s, %s)
+                    INSERT INTO {self._table_name} (key, value, expire_at, tags)
+                    VALUES (%s, %s, %s, %s)
                     ON CONFLICT (key)
                     DO UPDATE SET value = EXCLUDED.value,
-                                  expire_at = EXCLUDED.expire_at;
+                                  expire_at = EXCLUDED.expire_at,
+                                  tags = EXCLUDED.tags;
                     """,
-                    (self._make_key(key), pickle.dumps(value), expire_at),
+                    (
+                        self._make_key(key),
+                        self._dumps(value),
+                        expire_at,
+                        list(tags) if tags else None,
+                    ),
                 )
                 conn.commit()
 
@@ -266,7 +310,499 @@ class PostgresBackend(CacheBackend):
                 if self._is_expired(expire_at):
                     self.delete(key)  # Lazy delete
                     return None
-                return pickle.loads(value)
+                return self._loads(value)
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """
+        Retrieves a value and its remaining TTL with a single SELECT.
+
+        The table does not record when an entry was written, so ``created_at``
+        is None.
+
+        Args:
+            key (str): The cache key to retrieve.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if not found or expired.
+
+        Notes:
+            - Expired entries are removed on access.
+        """
+        with self._sync_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"SELECT value, expire_at FROM {self._table_name} WHERE key = %s;",
+                    (self._make_key(key),),
+                )
+                row = cur.fetchone()
+                if not row:
+                    return None
+                value, expire_at = row
+                if self._is_expired(expire_at):
+                    self.delete(key)  # Lazy delete
+                    return None
+                return CacheEntry(self._loads(value), self._remaining(expire_at))
+
+    def _touch_query(self, returning: str) -> str:
+        """
+        Build the UPDATE that restarts the expiry of a live entry.
+        """
+        return f"""
+            UPDATE {self._table_name} SET expire_at = %s
+            WHERE key = %s AND (expire_at IS NULL OR expire_at > NOW())
+            RETURNING {returning};
+        """
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Retrieves a value and restarts its expiration with a single UPDATE.
+
+        Args:
+            key (str): The cache key to retrieve.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+                If None, the entry no longer expires.
+
+        Returns:
+            Optional[Any]: The cached Python object, or None if not found or expired.
+        """
+        with self._sync_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    self._touch_query("value"),
+                    (self._compute_expire_at(expire), self._make_key(key)),
+                )
+                row = cur.fetchone()
+                conn.commit()
+                return self._loads(row[0]) if row else None
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Restarts the expiration of an entry with an UPDATE of ``expire_at``.
+
+        Args:
+            key (str): The cache key to touch.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+                If None, the entry no longer expires.
+
+        Returns:
+            bool: True if the key exists and is not expired, False otherwise.
+        """
+        with self._sync_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    self._touch_query("key"),
+                    (self._compute_expire_at(expire), self._make_key(key)),
+                )
+                found = cur.fetchone() is not None
+                conn.commit()
+                return found
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Asynchronously retrieves a value and restarts its expiration.
+
+        See `get_and_touch`.
+        """
+        await self._ensure_async_pool_open()
+        async with self._async_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    self._touch_query("value"),
+                    (self._compute_expire_at(expire), self._make_key(key)),
+                )
+                row = await cur.fetchone()
+                await conn.commit()
+                return self._loads(row[0]) if row else None
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Asynchronously restarts the expiration of an entry.
+
+        See `touch`.
+        """
+        await self._ensure_async_pool_open()
+        async with self._async_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    self._touch_query("key"),
+                    (self._compute_expire_at(expire), self._make_key(key)),
+                )
+                found = await cur.fetchone() is not None
+                await conn.commit()
+                return found
+
+    def _incr_query(self) -> str:
+        """
+        Build the upsert that adds to a counter, restarting it once expired.
+
+        Counters are stored as decimal text in the ``value`` column, so the
+        database can add to them.
+        """
+        table = self._table_name
+        expired = f"({table}.expire_at IS NOT NULL AND {table}.expire_at < NOW())"
+        return f"""
+            INSERT INTO {table} (key, value, expire_at) VALUES (%s, %s, %s)
+            ON CONFLICT (key) DO UPDATE SET
+                value = CASE WHEN {expired} THEN EXCLUDED.value ELSE convert_to(
+                    (convert_from({table}.value, 'UTF8')::bigint + %s)::text, 'UTF8'
+                ) END,
+                expire_at = CASE WHEN {expired}
+                    THEN EXCLUDED.expire_at ELSE {table}.expire_at END
+            RETURNING convert_from(value, 'UTF8')::bigint;
+        """
+
+    def _incr_params(
+        self, key: str, delta: int, expire: Optional[Union[int, timedelta]]
+    ) -> tuple:
+        """
+        Build the parameters of `_incr_query`.
+        """
+        return (
+            self._make_key(key),
+            str(delta).encode(),
+            self._compute_expire_at(expire),
+            delta,
+        )
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> int:
+        """
+        Adds ``delta`` to a counter with a single upsert.
+
+        Args:
+            key (str): The counter key.
+            delta (int): The amount to add; negative to decrement. Defaults to 1.
+            expire (Optional[Union[int, timedelta]]): Expiration time of a new
+                counter; an existing counter keeps its expiry.
+
+        Returns:
+            int: The new value.
+
+        Raises:
+            psycopg.errors.DataError: If the key holds a value that is not a counter.
+        """
+        with self._sync_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(self._incr_query(), self._incr_params(key, delta, expire))
+                value = cur.fetchone()[0]
+                conn.commit()
+                return value
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> int:
+        """
+        Asynchronously adds ``delta`` to a counter with a single upsert.
+
+        See `incr`.
+        """
+        await self._ensure_async_pool_open()
+        async with self._async_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    self._incr_query(), self._incr_params(key, delta, expire)
+                )
+                value = (await cur.fetchone())[0]
+                await conn.commit()
+                return value
+
+    def _versioned_query(self) -> str:
+        """
+        Build the SELECT of a live entry with its row version.
+        """
+        return f"""
+            SELECT value, xmin::text FROM {self._table_name}
+            WHERE key = %s AND (expire_at IS NULL OR expire_at > NOW());
+        """
+
+    def _set_if_version_query(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[str],
+        expire: Optional[Union[int, timedelta]],
+    ) -> tuple:
+        """
+        Build the conditional write of `set_if_version` and its parameters.
+
+        With a version, the UPDATE matches only a live row whose ``xmin`` is
+        still that version. Without one, the upsert replaces only an expired
+        row.
+        """
+        table = self._table_name
+        params = (self._dumps(value), self._compute_expire_at(expire))
+        if version is None:
+            query = f"""
+                INSERT INTO {table} (key, value, expire_at) VALUES (%s, %s, %s)
+                ON CONFLICT (key) DO UPDATE SET
+                    value = EXCLUDED.value, expire_at = EXCLUDED.expire_at
+                WHERE {table}.expire_at IS NOT NULL AND {table}.expire_at < NOW()
+                RETURNING key;
+            """
+            return query, (self._make_key(key),) + params
+        query = f"""
+            UPDATE {table} SET value = %s, expire_at = %s
+            WHERE key = %s AND xmin::text = %s
+              AND (expire_at IS NULL OR expire_at > NOW())
+            RETURNING key;
+        """
+        return query, params + (self._make_key(key), version)
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Retrieves a value with its row version.
+
+        The version is the row's ``xmin`` system column, which changes with
+        every write of the row, so no version column is needed.
+
+        Args:
+            key (str): The cache key to retrieve.
+
+        Returns:
+            Optional[VersionedValue]: The value and its version, or None if
+            not found or expired.
+
+        Notes:
+            - `touch` rewrites the row too, so it also changes the version.
+        """
+        with self._sync_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(self._versioned_query(), (self._make_key(key),))
+                row = cur.fetchone()
+                return VersionedValue(self._loads(row[0]), row[1]) if row else None
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Asynchronously retrieves a value with its row version.
+
+        See `get_versioned`.
+        """
+        await self._ensure_async_pool_open()
+        async with self._async_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(self._versioned_query(), (self._make_key(key),))
+                row = await cur.fetchone()
+                return VersionedValue(self._loads(row[0]), row[1]) if row else None
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[str],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Stores a value only if the row is still at ``version``.
+
+        Args:
+            key (str): The cache key to store the value under.
+            value (Any): The Python object to cache.
+            version (Optional[str]): The version from `get_versioned`, or None
+                to store the value only if the key does not exist.
+            expire (Optional[Union[int, timedelta]], optional): The expiration time.
+
+        Returns:
+            bool: True if the value was stored, False if the row changed.
+        """
+        with self._sync_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(*self._set_if_version_query(key, value, version, expire))
+                stored = cur.fetchone() is not None
+                conn.commit()
+                return stored
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[str],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Asynchronously stores a value only if the row is still at ``version``.
+
+        See `set_if_version`.
+        """
+        await self._ensure_async_pool_open()
+        async with self._async_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    *self._set_if_version_query(key, value, version, expire)
+                )
+                stored = (await cur.fetchone()) is not None
+                await conn.commit()
+                return stored
+
+    def _invalidate_query(self) -> str:
+        """
+        Build the DELETE of the rows sharing a tag, served by the GIN index.
+        """
+        return f"DELETE FROM {self._table_name} WHERE tags && %s::text[];"
+
+    def invalidate_tags(self, tags: Sequence[str]) -> None:
+        """
+        Deletes every entry stored with any of ``tags`` in a single DELETE.
+
+        Args:
+            tags (Sequence[str]): The tags to invalidate.
+        """
+        with self._sync_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(self._invalidate_query(), (list(tags),))
+                conn.commit()
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """
+        Asynchronously deletes every entry stored with any of ``tags``.
+
+        See `invalidate_tags`.
+        """
+        await self._ensure_async_pool_open()
+        async with self._async_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(self._invalidate_query(), (list(tags),))
+                await conn.commit()
+
+    def _range_args(self, prefix: str) -> Tuple[str, str]:
+        """
+        Bounds of the keys starting with ``prefix``, namespaced.
+        """
+        k_prefix = self._make_key(prefix)
+        return k_prefix, _prefix_upper(k_prefix)
+
+    def _keys_query(self) -> str:
+        """
+        Build the SELECT of the next page of live keys in a prefix range.
+
+        Pages are keyset-paginated on the primary-key index: each starts
+        after the last key of the previous one instead of using OFFSET.
+        """
+        return f"""
+            SELECT key FROM {self._table_name}
+            WHERE key COLLATE "C" >= %s AND key COLLATE "C" < %s
+              AND key COLLATE "C" > %s
+              AND (expire_at IS NULL OR expire_at > NOW())
+            ORDER BY key COLLATE "C"
+            LIMIT %s;
+        """
+
+    def _delete_prefix_query(self) -> str:
+        """
+        Build the DELETE of a prefix range, served by the primary-key index.
+        """
+        return f"""
+            DELETE FROM {self._table_name}
+            WHERE key COLLATE "C" >= %s AND key COLLATE "C" < %s;
+        """
+
+    def iter_keys(self, prefix: str = "", batch_size: int = 100) -> Iterator[str]:
+        """
+        Iterates over the keys starting with ``prefix``, in key order.
+
+        Each page is a range scan of the primary-key index (not ``LIKE``),
+        starting after the last key of the previous page, and a connection is
+        only held while a page is read.
+
+        Args:
+            prefix (str): Only list keys starting with this prefix.
+            batch_size (int): How many keys to read per query.
+
+        Yields:
+            str: The keys of live entries, without the namespace.
+        """
+        lower, upper = self._range_args(prefix)
+        offset = len(self._make_key(""))
+        after = ""
+        while True:
+            with self._sync_pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(self._keys_query(), (lower, upper, after, batch_size))
+                    rows = cur.fetchall()
+            for (k,) in rows:
+                if not k.startswith(_INTERNAL_PREFIXES, offset):
+                    yield k[offset:]
+            if len(rows) < batch_size:
+                return
+            after = rows[-1][0]
+
+    async def aiter_keys(
+        self, prefix: str = "", batch_size: int = 100
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously iterates over the keys starting with ``prefix``, in key order.
+
+        See `iter_keys`.
+
+        Args:
+            prefix (str): Only list keys starting with this prefix.
+            batch_size (int): How many keys to read per query.
+
+        Yields:
+            str: The keys of live entries, without the namespace.
+        """
+        await self._ensure_async_pool_open()
+        lower, upper = self._range_args(prefix)
+        offset = len(self._make_key(""))
+        after = ""
+        while True:
+            async with self._async_pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        self._keys_query(), (lower, upper, after, batch_size)
+                    )
+                    rows = await cur.fetchall()
+            for (k,) in rows:
+                if not k.startswith(_INTERNAL_PREFIXES, offset):
+                    yield k[offset:]
+            if len(rows) < batch_size:
+                return
+            after = rows[-1][0]
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Deletes every entry whose key starts with ``prefix`` in a single DELETE.
+
+        Args:
+            prefix (str): The key prefix, without the namespace.
+
+        Returns:
+            int: How many rows were deleted, expired ones included.
+        """
+        with self._sync_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(self._delete_prefix_query(), self._range_args(prefix))
+                conn.commit()
+                return cur.rowcount
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """
+        Asynchronously deletes every entry whose key starts with ``prefix``.
+
+        See `delete_prefix`.
+
+        Args:
+            prefix (str): The key prefix, without the namespace.
+
+        Returns:
+            int: How many rows were deleted, expired ones included.
+        """
+        await self._ensure_async_pool_open()
+        async with self._async_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(self._delete_prefix_query(), self._range_args(prefix))
+                await conn.commit()
+                return cur.rowcount
 
     def delete(self, key: str) -> None:
         """
@@ -335,7 +871,11 @@ class PostgresBackend(CacheBackend):
                 conn.commit()
 
     async def aset(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Asynchronously stores a value in the cache under the specified key.
@@ -350,6 +890,8 @@ class PostgresBackend(CacheBackend):
             expire (Optional[Union[int, timedelta]], optional): The expiration time
                 for the cache entry. Can be specified as an integer (seconds) or a
                 timedelta. If None, the entry does not expire.
+            tags (Optional[Sequence[str]], optional): Tags to invalidate the
+                entry by, stored in the row's `tags` column.
 
         Notes:
             - Uses the asynchronous connection pool.
@@ -361,13 +903,19 @@ class PostgresBackend(CacheBackend):
             async with conn.cursor() as cur:
                 await cur.execute(
                     f"""
-                    INSERT INTO {self._table_name} (key, value, expire_at)
-                    VALUES (%s, %s, %s)
+                    INSERT INTO {self._table_name} (key, value, expire_at, tags)
+                    VALUES (%s, %s, %s, %s)
                     ON CONFLICT (key)
                     DO UPDATE SET value = EXCLUDED.value,
-                                  expire_at = EXCLUDED.expire_at;
+                                  expire_at = EXCLUDED.expire_at,
+                                  tags = EXCLUDED.tags;
                     """,
-                    (self._make_key(key), pickle.dumps(value), expire_at),
+                    (
+                        self._make_key(key),
+                        self._dumps(value),
+                        expire_at,
+                        list(tags) if tags else None,
+                    ),
                 )
                 await conn.commit()
 
@@ -403,7 +951,40 @@ class PostgresBackend(CacheBackend):
                 if self._is_expired(expire_at):
                     await self.adelete(key)  # Lazy delete
                     return None
-                return pickle.loads(value)
+                return self._loads(value)
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """
+        Asynchronously retrieves a value and its remaining TTL with a single SELECT.
+
+        The table does not record when an entry was written, so ``created_at``
+        is None.
+
+        Args:
+            key (str): The cache key to retrieve.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if not found or expired.
+
+        Notes:
+            - Uses the asynchronous connection pool.
+            - Expired entries are removed on access.
+        """
+        await self._ensure_async_pool_open()
+        async with self._async_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    f"SELECT value, expire_at FROM {self._table_name} WHERE key = %s;",
+                    (self._make_key(key),),
+                )
+                row = await cur.fetchone()
+                if not row:
+                    return None
+                value, expire_at = row
+                if self._is_expired(expire_at):
+                    await self.adelete(key)  # Lazy delete
+                    return None
+                return CacheEntry(self._loads(value), self._remaining(expire_at))
 
     async def adelete(self, key: str) -> None:
         """
@@ -476,6 +1057,136 @@ class PostgresBackend(CacheBackend):
                 )
                 await conn.commit()
 
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Retrieves several values with a single SELECT.
+
+        Args:
+            keys (Sequence[str]): The cache keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The values of the keys that are present and not expired.
+
+        Notes:
+            - Uses `key = ANY(...)`, which is served by the primary-key index.
+            - Expired rows are skipped and left to the cleanup job.
+        """
+        if not keys:
+            return {}
+        mapping = {self._make_key(key): key for key in keys}
+        with self._sync_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"SELECT key, value, expire_at FROM {self._table_name} WHERE key = ANY(%s);",
+                    (list(mapping),),
+                )
+                rows = cur.fetchall()
+        return {
+            mapping[k]: self._loads(value)
+            for k, value, expire_at in rows
+            if not self._is_expired(expire_at)
+        }
+
+    def set_many(
+        self, items: Mapping[str, Any], expire: Optional[Union[int, timedelta]] = None
+    ) -> None:
+        """
+        Stores several values in one pipelined batch of upserts.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]], optional): The expiration time
+                applied to every item.
+
+        Notes:
+            - psycopg pipelines `executemany`, so the batch costs one round trip.
+        """
+        if not items:
+            return
+        expire_at = self._compute_expire_at(expire)
+        with self._sync_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.executemany(
+                    f"""
+                    INSERT INTO {self._table_name} (key, value, expire_at)
+                    VALUES (%s, %s, %s)
+                    ON CONFLICT (key)
+                    DO UPDATE SET value = EXCLUDED.value,
+                                  expire_at = EXCLUDED.expire_at;
+                    """,
+                    [
+                        (self._make_key(k), self._dumps(v), expire_at)
+                        for k, v in items.items()
+                    ],
+                )
+                conn.commit()
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Asynchronously retrieves several values with a single SELECT.
+
+        Args:
+            keys (Sequence[str]): The cache keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The values of the keys that are present and not expired.
+
+        Notes:
+            - Uses the asynchronous connection pool.
+            - Expired rows are skipped and left to the cleanup job.
+        """
+        if not keys:
+            return {}
+        await self._ensure_async_pool_open()
+        mapping = {self._make_key(key): key for key in keys}
+        async with self._async_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    f"SELECT key, value, expire_at FROM {self._table_name} WHERE key = ANY(%s);",
+                    (list(mapping),),
+                )
+                rows = await cur.fetchall()
+        return {
+            mapping[k]: self._loads(value)
+            for k, value, expire_at in rows
+            if not self._is_expired(expire_at)
+        }
+
+    async def aset_many(
+        self, items: Mapping[str, Any], expire: Optional[Union[int, timedelta]] = None
+    ) -> None:
+        """
+        Asynchronously stores several values in one pipelined batch of upserts.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]], optional): The expiration time
+                applied to every item.
+
+        Notes:
+            - Uses the asynchronous connection pool.
+        """
+        if not items:
+            return
+        await self._ensure_async_pool_open()
+        expire_at = self._compute_expire_at(expire)
+        async with self._async_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.executemany(
+                    f"""
+                    INSERT INTO {self._table_name} (key, value, expire_at)
+                    VALUES (%s, %s, %s)
+                    ON CONFLICT (key)
+                    DO UPDATE SET value = EXCLUDED.value,
+                                  expire_at = EXCLUDED.expire_at;
+                    """,
+                    [
+                        (self._make_key(k), self._dumps(v), expire_at)
+                        for k, v in items.items()
+                    ],
+                )
+                await conn.commit()
+
     async def aclose(self) -> None:
         """
         Asynchronously closes the connection pools and stops the cleanup scheduler.
@@ -544,3 +1255,91 @@ class PostgresBackend(CacheBackend):
         """
         if not self._async_pool._opened:
             await self._async_pool.open()
+
+    def _lock_query(self) -> str:
+        """
+        Build the upsert that takes a compute lock unless a live one exists.
+
+        A conflicting row is only overwritten once it has expired, so the
+        statement returns a row exactly when the caller got the lock.
+        """
+        return f"""
+            INSERT INTO {self._table_name} (key, value, expire_at)
+            VALUES (%s, %s, %s)
+            ON CONFLICT (key) DO UPDATE
+            SET value = EXCLUDED.value, expire_at = EXCLUDED.expire_at
+            WHERE {self._table_name}.expire_at < NOW()
+            RETURNING key;
+        """
+
+    def _lock_args(self, key: str, timeout: float) -> Tuple[str, bytes, datetime]:
+        """
+        Arguments of `_lock_query`: the lock row's key, a new token, and its expiry.
+        """
+        return (
+            self._make_key(f"__lock__:{key}"),
+            uuid.uuid4().hex.encode(),
+            self._compute_expire_at(timedelta(seconds=timeout)),
+        )
+
+    def _acquire_lock(self, key: str, timeout: float) -> Optional[bytes]:
+        """
+        Take a key's compute lock by inserting an expiring lock row.
+
+        The connection is returned to the pool right away, so lock holders
+        never keep one checked out while their loader runs.
+
+        Args:
+            key (str): The cache key the lock guards.
+            timeout (float): Seconds until the lock expires.
+
+        Returns:
+            Optional[bytes]: The lock token, or None if the lock is held.
+        """
+        args = self._lock_args(key, timeout)
+        with self._sync_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(self._lock_query(), args)
+                acquired = cur.fetchone() is not None
+                conn.commit()
+        return args[1] if acquired else None
+
+    def _release_lock(self, key: str, token: bytes) -> None:
+        """
+        Delete a compute lock if ``token`` still owns it.
+        """
+        with self._sync_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"DELETE FROM {self._table_name} WHERE key = %s AND value = %s;",
+                    (self._make_key(f"__lock__:{key}"), token),
+                )
+                conn.commit()
+
+    async def _aacquire_lock(self, key: str, timeout: float) -> Optional[bytes]:
+        """
+        Asynchronously take a key's compute lock by inserting a lock row.
+
+        See `_acquire_lock`.
+        """
+        await self._ensure_async_pool_open()
+        args = self._lock_args(key, timeout)
+        async with self._async_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(self._lock_query(), args)
+                acquired = await cur.fetchone() is not None
+                await conn.commit()
+        return args[1] if acquired else None
+
+    async def _arelease_lock(self, key: str, token: bytes) -> None:
+        """
+        Asynchronously delete a compute lock if ``token`` still owns it.
+        """
+        await self._ensure_async_pool_open()
+        async with self._async_pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    f"DELETE FROM {self._table_name} WHERE key = %s AND value = %s;",
+                    (self._make_key(f"__lock__:{key}"), token),
+                )
+                await conn.commit()
@@ -0,0 +1,438 @@
+import hashlib
+import pickle
+import time
+from datetime import timedelta
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from ..recording import TraceRecord, TraceWriter
+from .backend import (
+    CacheBackend,
+    CacheEntry,
+    VersionedValue,
+    WrapperBackend,
+    _cost_kwargs,
+    _tag_kwargs,
+)
+
+
+def _ttl(expire: Optional[Union[int, timedelta]]) -> Optional[float]:
+    """
+    Convert an expiration to seconds.
+    """
+    if expire is None:
+        return None
+    if isinstance(expire, timedelta):
+        return expire.total_seconds()
+    return float(expire)
+
+
+def _size(value: Any) -> int:
+    """
+    Pickled size of a value in bytes, or 0 if it cannot be pickled.
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+
+class RecordingBackend(WrapperBackend):
+    """
+    Wrapper that records an access trace of another backend.
+
+    Every sampled operation is written to a `TraceWriter` as a `TraceRecord`
+    with a timestamp, the operation, the hashed key, the value size and the
+    TTL. Traces can be replayed offline with ``python -m fast_cache.bench
+    simulate`` to size caches and pick TTLs from real traffic.
+
+    Sampling is per key, not per operation: a key is either always recorded or
+    never, so each recorded key's full access history is kept and replayed hit
+    ratios stay representative.
+
+    Args:
+        backend (CacheBackend): The backend to record.
+        destination (Union[str, IO[str], TraceWriter]): Trace file path
+            (gzip-compressed when it ends in ``.gz``), open text stream, or a
+            writer shared between several backends.
+        sample_rate (float): Fraction of keys to record, between 0 and 1.
+            Defaults to 1.0 (every key).
+        clock (Callable[[], float]): Source of timestamps. Defaults to
+            `time.time`.
+
+    Raises:
+        ValueError: If ``sample_rate`` is not between 0 and 1.
+
+    Notes:
+        - Value sizes are measured by pickling sampled values (bytes are
+          measured as is), which costs one extra ``pickle.dumps`` per recorded
+          write and hit. Keep ``sample_rate`` low on hot paths.
+        - Multi-key operations are recorded as one record per key.
+        - The wrapper is always `cost_aware`: measured costs are recorded with
+          writes, and passed on only if the wrapped backend accepts them.
+        - Records are written synchronously to a buffered file; call `close`
+          (or `aclose`) to flush them.
+    """
+
+    cost_aware = True
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        destination: Union[str, IO[str], TraceWriter],
+        sample_rate: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        super().__init__(backend)
+        # Costs are recorded even when the wrapped backend does not take them.
+        self.cost_aware = True
+        if isinstance(destination, TraceWriter):
+            self._writer = destination
+            self._owns_writer = False
+        else:
+            self._writer = TraceWriter(destination)
+            self._owns_writer = True
+        self._threshold = int(sample_rate * 2**64)
+        self._clock = clock
+
+    @property
+    def writer(self) -> TraceWriter:
+        """
+        The writer records are sent to.
+        """
+        return self._writer
+
+    def _sampled(self, key: str) -> Optional[str]:
+        """
+        Hash a key and decide whether it is recorded.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[str]: The hashed key if the key is sampled, else None.
+        """
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        if int.from_bytes(digest, "big") >= self._threshold:
+            return None
+        return digest.hex()
+
+    def _record(
+        self,
+        op: str,
+        key: str,
+        value: Any = None,
+        expire: Optional[Union[int, timedelta]] = None,
+        hit: Optional[bool] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """
+        Write a record for a key if it is sampled.
+
+        Args:
+            op (str): The operation name.
+            key (str): The cache key.
+            value (Any): The value written or found, if any.
+            expire (Optional[Union[int, timedelta]]): The expiration of a write.
+            hit (Optional[bool]): Whether a lookup found the key.
+            cost (Optional[float]): Seconds the value of a write took to compute.
+        """
+        hashed = self._sampled(key)
+        if hashed is None:
+            return
+        self._writer.write(
+            TraceRecord(
+                ts=self._clock(),
+                op=op,
+                key=hashed,
+                size=_size(value) if value is not None else 0,
+                ttl=_ttl(expire),
+                hit=hit,
+                cost=cost,
+            )
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retrieve a value, recording the lookup."""
+        value = self._backend.get(key)
+        self._record("get", key, value, hit=value is not None)
+        return value
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Asynchronously retrieve a value, recording the lookup."""
+        value = await self._backend.aget(key)
+        self._record("get", key, value, hit=value is not None)
+        return value
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Retrieve a value with its metadata, recording the lookup as a ``get``."""
+        entry = self._backend.get_with_meta(key)
+        value = None if entry is None else entry.value
+        self._record("get", key, value, hit=entry is not None)
+        return entry
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Asynchronously retrieve a value with its metadata, recording the lookup."""
+        entry = await self._backend.aget_with_meta(key)
+        value = None if entry is None else entry.value
+        self._record("get", key, value, hit=entry is not None)
+        return entry
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Retrieve a value and restart its expiration, recording a ``get`` and a ``touch``."""
+        value = self._backend.get_and_touch(key, expire)
+        self._record("get", key, value, hit=value is not None)
+        if value is not None:
+            self._record("touch", key, expire=expire, hit=True)
+        return value
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Asynchronously retrieve a value and restart its expiration, recording both."""
+        value = await self._backend.aget_and_touch(key, expire)
+        self._record("get", key, value, hit=value is not None)
+        if value is not None:
+            self._record("touch", key, expire=expire, hit=True)
+        return value
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Restart an entry's expiration, recording the call."""
+        found = self._backend.touch(key, expire)
+        self._record("touch", key, expire=expire, hit=found)
+        return found
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Asynchronously restart an entry's expiration, recording the call."""
+        found = await self._backend.atouch(key, expire)
+        self._record("touch", key, expire=expire, hit=found)
+        return found
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Add to a counter, recording the call."""
+        value = self._backend.incr(key, delta, expire)
+        self._record("incr", key, value, expire)
+        return value
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Asynchronously add to a counter, recording the call."""
+        value = await self._backend.aincr(key, delta, expire)
+        self._record("incr", key, value, expire)
+        return value
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Retrieve a value with its version, recording the lookup as a ``get``."""
+        entry = self._backend.get_versioned(key)
+        value = None if entry is None else entry.value
+        self._record("get", key, value, hit=entry is not None)
+        return entry
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Asynchronously retrieve a value with its version, recording the lookup."""
+        entry = await self._backend.aget_versioned(key)
+        value = None if entry is None else entry.value
+        self._record("get", key, value, hit=entry is not None)
+        return entry
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Store a value if its version is unchanged, recording a ``set`` if it was stored."""
+        stored = self._backend.set_if_version(key, value, version, expire)
+        if stored:
+            self._record("set", key, value, expire)
+        return stored
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Asynchronously store a value if its version is unchanged, recording the write."""
+        stored = await self._backend.aset_if_version(key, value, version, expire)
+        if stored:
+            self._record("set", key, value, expire)
+        return stored
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Store a value, recording the write."""
+        self._backend.set(
+            key,
+            value,
+            expire=expire,
+            **_tag_kwargs(tags),
+            **_cost_kwargs(self._backend, cost),
+        )
+        self._record("set", key, value, expire, cost=cost)
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Asynchronously store a value, recording the write."""
+        await self._backend.aset(
+            key,
+            value,
+            expire=expire,
+            **_tag_kwargs(tags),
+            **_cost_kwargs(self._backend, cost),
+        )
+        self._record("set", key, value, expire, cost=cost)
+
+    def invalidate_tags(self, tags: Sequence[str]) -> None:
+        """
+        Delete every key carrying one of the tags.
+
+        The trace has no record of tags, so the invalidation is not recorded;
+        the keys it removed show up as misses on their next lookup.
+        """
+        self._backend.invalidate_tags(tags)
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """Asynchronously delete every key carrying one of the tags, unrecorded."""
+        await self._backend.ainvalidate_tags(tags)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Delete every entry whose key starts with ``prefix``.
+
+        Trace keys are hashed, so a prefix cannot be matched against them and
+        the deletion is not recorded, like `invalidate_tags`.
+        """
+        return self._backend.delete_prefix(prefix)
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """Asynchronously delete every entry whose key starts with ``prefix``, unrecorded."""
+        return await self._backend.adelete_prefix(prefix)
+
+    def delete(self, key: str) -> None:
+        """Delete a value, recording the call."""
+        self._backend.delete(key)
+        self._record("delete", key)
+
+    async def adelete(self, key: str) -> None:
+        """Asynchronously delete a value, recording the call."""
+        await self._backend.adelete(key)
+        self._record("delete", key)
+
+    def clear(self) -> None:
+        """Clear the namespace, recording the call."""
+        self._backend.clear()
+        self._writer.write(TraceRecord(ts=self._clock(), op="clear", key=""))
+
+    async def aclear(self) -> None:
+        """Asynchronously clear the namespace, recording the call."""
+        await self._backend.aclear()
+        self._writer.write(TraceRecord(ts=self._clock(), op="clear", key=""))
+
+    def has(self, key: str) -> bool:
+        """Check for a key, recording the lookup."""
+        exists = self._backend.has(key)
+        self._record("has", key, hit=exists)
+        return exists
+
+    async def ahas(self, key: str) -> bool:
+        """Asynchronously check for a key, recording the lookup."""
+        exists = await self._backend.ahas(key)
+        self._record("has", key, hit=exists)
+        return exists
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Retrieve several values, recording one lookup per key."""
+        values = self._backend.get_many(keys)
+        for key in keys:
+            value = values.get(key)
+            self._record("get", key, value, hit=value is not None)
+        return values
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Asynchronously retrieve several values, recording one lookup per key."""
+        values = await self._backend.aget_many(keys)
+        for key in keys:
+            value = values.get(key)
+            self._record("get", key, value, hit=value is not None)
+        return values
+
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Store several values, recording one write per key."""
+        self._backend.set_many(items, expire=expire)
+        for key, value in items.items():
+            self._record("set", key, value, expire)
+
+    async def aset_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Asynchronously store several values, recording one write per key."""
+        await self._backend.aset_many(items, expire=expire)
+        for key, value in items.items():
+            self._record("set", key, value, expire)
+
+    def close(self) -> None:
+        """
+        Close the wrapped backend and flush the trace.
+        """
+        super().close()
+        self._close_writer()
+
+    async def aclose(self) -> None:
+        """
+        Asynchronously close the wrapped backend and flush the trace.
+        """
+        await super().aclose()
+        self._close_writer()
+
+    def _close_writer(self) -> None:
+        """
+        Close the writer if this backend created it, else flush it.
+        """
+        if self._owns_writer:
+            self._writer.close()
+        else:
+            self._writer.flush()
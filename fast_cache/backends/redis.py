@@ -1,20 +1,93 @@
-from typing import Any, Optional, Union
+import asyncio
+import hashlib
+import itertools
+import random
+import re
+import threading
+import time
+import uuid
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from datetime import timedelta
-import pickle
 
-from .backend import CacheBackend
+from .backend import _INTERNAL_PREFIXES, CacheBackend, CacheEntry, VersionedValue
+
+# Characters with a meaning in SCAN MATCH patterns.
+_GLOB_CHARS = re.compile(r"[*?\[\]\\]")
+
+# Deletes a lock only if it still holds the caller's token, so a caller whose
+# lock expired cannot release a lock another caller has taken since.
+_UNLOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Adds a key to a tag set and keeps the set alive as long as its longest-lived
+# member: an expiring member only ever extends the set's expiry, and a member
+# without one (ARGV[2] == "0") makes the set persistent.
+_TAG_SCRIPT = """
+local ttl = redis.call("pttl", KEYS[1])
+redis.call("sadd", KEYS[1], ARGV[1])
+local px = tonumber(ARGV[2])
+if px == 0 then
+    redis.call("persist", KEYS[1])
+elseif ttl == -2 or (ttl >= 0 and ttl < px) then
+    redis.call("pexpire", KEYS[1], px)
+end
+return 1
+"""
+
+
+class _Replica:
+    """
+    A read replica with its clients and last known health.
+    """
+
+    def __init__(self, address: Any, sync_client: Any, async_client: Any) -> None:
+        self.address = address
+        self.sync_client = sync_client
+        self.async_client = async_client
+        self.healthy = True
 
 
 class RedisBackend(CacheBackend):
     """
     Redis cache backend implementation with namespace support.
 
+    Supports a single Redis server, a primary with read replicas (a static
+    list or discovered through Sentinel) and Redis Cluster. In cluster mode,
+    multi-key reads are split into one MGET per hash slot and pipelined per
+    node, and `clear` scans and unlinks keys on every primary node
+    (concurrently in `aclear`).
+
+    With replicas, `get`, `has` and `get_many` are load-balanced over the
+    healthy replicas and everything else goes to the primary. Replicas are
+    checked every ``replica_check_interval`` seconds; one whose replication
+    link is down, that is still syncing, or that lags more than
+    ``max_replica_lag`` is skipped until it recovers. A read that fails on a
+    replica is retried on the primary.
+
     Attributes:
         _namespace (str): Namespace prefix for all keys.
-        _sync_pool (redis.ConnectionPool): Synchronous Redis connection pool.
-        _async_pool (aioredis.ConnectionPool): Asynchronous Redis connection pool.
-        _sync_client (redis.Redis): Synchronous Redis client.
-        _async_client (aioredis.Redis): Asynchronous Redis client.
+        _sync_pool (redis.ConnectionPool): Synchronous Redis connection pool
+            (None in cluster mode).
+        _async_pool (aioredis.ConnectionPool): Asynchronous Redis connection pool
+            (None in cluster mode).
+        _sync_client (Union[redis.Redis, redis.cluster.RedisCluster]): Synchronous client.
+        _async_client (Union[aioredis.Redis, aioredis.RedisCluster]): Asynchronous client.
     """
 
     def __init__(
@@ -23,6 +96,14 @@ class RedisBackend(CacheBackend):
         namespace: str = "fastapi-cache",
         pool_size: int = 10,
         max_connections: int = 20,
+        cluster: bool = False,
+        hash_tag: bool = False,
+        replica_urls: Optional[Sequence[str]] = None,
+        sentinels: Optional[Sequence[Tuple[str, int]]] = None,
+        service_name: str = "mymaster",
+        load_balancing: str = "round_robin",
+        max_replica_lag: Optional[float] = None,
+        replica_check_interval: float = 5.0,
     ) -> None:
         """
         Initialize Redis backend with connection URL and pool settings.
@@ -31,19 +112,128 @@ class RedisBackend(CacheBackend):
             redis_url (str): Redis connection URL (e.g., "redis://localhost:6379/0").
             namespace (str): Namespace prefix for all keys (default: "fastapi-cache").
             pool_size (int): Minimum number of connections in the pool.
-            max_connections (int): Maximum number of connections in the pool.
+            max_connections (int): Maximum number of connections in the pool
+                (per node in cluster mode).
+            cluster (bool): Connect to a Redis Cluster with redis-py's cluster
+                clients; ``redis_url`` is any node of the cluster (default: False).
+            hash_tag (bool): Wrap the namespace in a hash tag (``{namespace}:key``)
+                so every key of the namespace maps to the same slot. This keeps
+                related keys on one node, at the cost of not spreading that
+                namespace across the cluster (default: False).
+            replica_urls (Optional[Sequence[str]]): Connection URLs of read
+                replicas of the ``redis_url`` primary (default: None).
+            sentinels (Optional[Sequence[Tuple[str, int]]]): Sentinel
+                ``(host, port)`` addresses. The primary and its replicas are
+                discovered through them and followed across failovers; the host
+                of ``redis_url`` is then ignored, but its database, credentials
+                and options apply to every node (default: None).
+            service_name (str): The Sentinel service name (default: "mymaster").
+            load_balancing (str): How reads are spread over healthy replicas,
+                ``"round_robin"`` or ``"random"`` (default: "round_robin").
+            max_replica_lag (Optional[float]): Seconds a replica that is behind
+                the primary may go without hearing from it before reads skip it.
+                Replicas that have caught up are always used. None only checks
+                that the replication link is up (default: None).
+            replica_check_interval (float): Seconds between replica health
+                checks and, with Sentinel, replica discovery (default: 5.0).
+
+        Raises:
+            ValueError: If replicas are combined with cluster mode, or
+                ``load_balancing`` is invalid.
         """
 
         try:
             import redis.asyncio as aioredis
             import redis
+            import redis.cluster
+            import redis.sentinel
+            import redis.asyncio.sentinel
         except ImportError:
             raise ImportError(
                 "RedisBackend requires the 'redis' package. "
                 "Install it with: pip install fast-cache[redis]"
             )
 
+        if cluster and (replica_urls or sentinels):
+            raise ValueError("Replica routing is not supported in cluster mode")
+        if load_balancing not in ("round_robin", "random"):
+            raise ValueError("load_balancing must be 'round_robin' or 'random'")
+
         self._namespace = namespace
+        self._prefix = f"{{{namespace}}}" if hash_tag else namespace
+        self._cluster = cluster
+        self._failover_errors = (
+            redis.exceptions.ConnectionError,
+            redis.exceptions.TimeoutError,
+        )
+        # None disables replica routing; reads then use the primary clients.
+        self._replicas: Optional[List[_Replica]] = None
+        self._known_replicas: Dict[Any, _Replica] = {}
+        self._sentinel = None
+        self._async_sentinel = None
+        self._service_name = service_name
+        self._load_balancing = load_balancing
+        self._max_replica_lag = max_replica_lag
+        self._replica_check_interval = replica_check_interval
+        self._next_replica_check = 0.0
+        self._replica_lock = threading.Lock()
+        self._round_robin = itertools.count()
+
+        if cluster:
+            self._sync_pool = None
+            self._async_pool = None
+            self._sync_client = redis.cluster.RedisCluster.from_url(
+                redis_url, max_connections=max_connections, decode_responses=False
+            )
+            self._async_client = aioredis.RedisCluster.from_url(
+                redis_url, max_connections=max_connections, decode_responses=False
+            )
+            return
+
+        if sentinels:
+            params = redis.connection.parse_url(redis_url)
+            async_params = aioredis.connection.parse_url(redis_url)
+            for options in (params, async_params):
+                options.pop("host", None)
+                options.pop("port", None)
+            self._sentinel = redis.sentinel.Sentinel(sentinels, **params)
+            self._async_sentinel = aioredis.sentinel.Sentinel(sentinels, **async_params)
+            self._sync_client = self._sentinel.master_for(
+                service_name, max_connections=max_connections
+            )
+            self._async_client = self._async_sentinel.master_for(
+                service_name, max_connections=max_connections
+            )
+            self._sync_pool = self._sync_client.connection_pool
+            self._async_pool = self._async_client.connection_pool
+            self._new_replica: Callable[[Any], _Replica] = lambda address: _Replica(
+                address,
+                redis.Redis(
+                    host=address[0],
+                    port=address[1],
+                    max_connections=max_connections,
+                    **params,
+                ),
+                aioredis.Redis(
+                    host=address[0],
+                    port=address[1],
+                    max_connections=max_connections,
+                    **async_params,
+                ),
+            )
+            self._replicas = []
+            return
+
+        if replica_urls:
+            self._replicas = [
+                _Replica(
+                    url,
+                    redis.Redis.from_url(url, max_connections=max_connections),
+                    aioredis.Redis.from_url(url, max_connections=max_connections),
+                )
+                for url in replica_urls
+            ]
+
         self._sync_pool = redis.ConnectionPool.from_url(
             redis_url, max_connections=max_connections, decode_responses=False
         )
@@ -68,7 +258,172 @@ class RedisBackend(CacheBackend):
         Returns:
             str: The namespaced key.
         """
-        return f"{self._namespace}:{key}"
+        return f"{self._prefix}:{key}"
+
+    def _replica_check_due(self) -> bool:
+        """
+        Claim the next replica health check if it is due.
+
+        Returns:
+            bool: True if the caller should run the check.
+        """
+        now = time.monotonic()
+        with self._replica_lock:
+            if now < self._next_replica_check:
+                return False
+            self._next_replica_check = now + self._replica_check_interval
+            return True
+
+    def _update_replicas(self, addresses: Sequence[Any]) -> None:
+        """
+        Replace the replica list with the replicas at the discovered addresses.
+
+        Args:
+            addresses (Sequence[Any]): ``(host, port)`` pairs from Sentinel.
+        """
+        replicas = []
+        for host, port in addresses:
+            address = (host.decode() if isinstance(host, bytes) else host, int(port))
+            if address not in self._known_replicas:
+                self._known_replicas[address] = self._new_replica(address)
+            replicas.append(self._known_replicas[address])
+        self._replicas = replicas
+
+    def _replica_is_fresh(self, info: Mapping[str, Any], primary_offset: int) -> bool:
+        """
+        Decide from a replica's ``INFO replication`` whether it may serve reads.
+
+        Args:
+            info (Mapping[str, Any]): The replica's replication info.
+            primary_offset (int): The primary's replication offset, read just
+                before the replica's info (0 if lag is not checked).
+
+        Returns:
+            bool: True if the replica is connected, synced and within the lag
+            tolerance.
+        """
+        if info.get("role") != "slave" or info.get("master_link_status") != "up":
+            return False
+        if info.get("master_sync_in_progress"):
+            return False
+        if self._max_replica_lag is None:
+            return True
+        if info.get("slave_repl_offset", 0) >= primary_offset:
+            return True
+        last_io = info.get("master_last_io_seconds_ago")
+        return last_io is not None and 0 <= last_io <= self._max_replica_lag
+
+    def _check_replicas(self) -> None:
+        """
+        Discover replicas (with Sentinel) and refresh their health.
+        """
+        try:
+            if self._sentinel is not None:
+                self._update_replicas(
+                    self._sentinel.discover_slaves(self._service_name)
+                )
+            primary_offset = 0
+            if self._max_replica_lag is not None:
+                info = self._sync_client.info("replication")
+                primary_offset = info.get("master_repl_offset", 0)
+        except Exception as exc:
+            self._report_error("replica_check", exc)
+            return
+        for replica in self._replicas:
+            try:
+                info = replica.sync_client.info("replication")
+                replica.healthy = self._replica_is_fresh(info, primary_offset)
+            except Exception:
+                replica.healthy = False
+
+    async def _acheck_replicas(self) -> None:
+        """
+        Asynchronously discover replicas (with Sentinel) and refresh their health.
+        """
+        try:
+            if self._async_sentinel is not None:
+                self._update_replicas(
+                    await self._async_sentinel.discover_slaves(self._service_name)
+                )
+            primary_offset = 0
+            if self._max_replica_lag is not None:
+                info = await self._async_client.info("replication")
+                primary_offset = info.get("master_repl_offset", 0)
+        except Exception as exc:
+            self._report_error("replica_check", exc)
+            return
+        replicas = self._replicas
+        results = await asyncio.gather(
+            *(replica.async_client.info("replication") for replica in replicas),
+            return_exceptions=True,
+        )
+        for replica, info in zip(replicas, results):
+            if isinstance(info, BaseException):
+                replica.healthy = False
+            else:
+                replica.healthy = self._replica_is_fresh(info, primary_offset)
+
+    def _pick_replica(self) -> Optional[_Replica]:
+        """
+        Choose a healthy replica for a read.
+
+        Returns:
+            Optional[_Replica]: The replica, or None to read from the primary.
+        """
+        healthy = [replica for replica in self._replicas if replica.healthy]
+        if not healthy:
+            return None
+        if self._load_balancing == "random":
+            return random.choice(healthy)
+        return healthy[next(self._round_robin) % len(healthy)]
+
+    def _read(self, operation: str, call: Callable[[Any], Any]) -> Any:
+        """
+        Run a read command on a replica, falling back to the primary.
+
+        Args:
+            operation (str): The cache operation, for error reports.
+            call (Callable[[Any], Any]): Runs the command on the client it is
+                given.
+
+        Returns:
+            Any: The command's result.
+        """
+        if self._replicas is not None:
+            if self._replica_check_due():
+                self._check_replicas()
+            replica = self._pick_replica()
+            if replica is not None:
+                try:
+                    return call(replica.sync_client)
+                except self._failover_errors as exc:
+                    replica.healthy = False
+                    self._report_error(operation, exc)
+        return call(self._sync_client)
+
+    async def _aread(self, operation: str, call: Callable[[Any], Any]) -> Any:
+        """
+        Asynchronously run a read command on a replica, falling back to the primary.
+
+        Args:
+            operation (str): The cache operation, for error reports.
+            call (Callable[[Any], Any]): Runs the command on the client it is
+                given and returns an awaitable.
+
+        Returns:
+            Any: The command's result.
+        """
+        if self._replicas is not None:
+            if self._replica_check_due():
+                await self._acheck_replicas()
+            replica = self._pick_replica()
+            if replica is not None:
+                try:
+                    return await call(replica.async_client)
+                except self._failover_errors as exc:
+                    replica.healthy = False
+                    self._report_error(operation, exc)
+        return await call(self._async_client)
 
     async def _scan_keys(self, pattern: str = "*") -> list[str]:
         """
@@ -93,6 +448,45 @@ class RedisBackend(CacheBackend):
                 break
         return keys
 
+    async def _aclear_node(self, node: Any) -> None:
+        """
+        Scan and unlink the namespace's keys on one cluster node.
+
+        Args:
+            node (ClusterNode): A primary node of the cluster.
+        """
+        pattern = self._make_key("*")
+        cursor = 0
+        while True:
+            cursors, keys = await self._async_client.scan(
+                cursor=cursor, match=pattern, count=500, target_nodes=node
+            )
+            if keys:
+                # UNLINK is split per slot by the cluster client.
+                await self._async_client.unlink(*keys)
+            cursor = cursors[node.name]
+            if cursor == 0:
+                break
+
+    def _clear_node(self, node: Any) -> None:
+        """
+        Scan and unlink the namespace's keys on one cluster node.
+
+        Args:
+            node (ClusterNode): A primary node of the cluster.
+        """
+        pattern = self._make_key("*")
+        cursor = 0
+        while True:
+            cursors, keys = self._sync_client.scan(
+                cursor=cursor, match=pattern, count=500, target_nodes=node
+            )
+            if keys:
+                self._sync_client.unlink(*keys)
+            cursor = cursors[node.name]
+            if cursor == 0:
+                break
+
     async def aget(self, key: str) -> Optional[Any]:
         """
         Asynchronously retrieve a value from the cache.
@@ -104,9 +498,11 @@ class RedisBackend(CacheBackend):
             Optional[Any]: The cached value, or None if not found.
         """
         try:
-            result = await self._async_client.get(self._make_key(key))
-            return pickle.loads(result) if result else None
-        except Exception:
+            k = self._make_key(key)
+            result = await self._aread("get", lambda client: client.get(k))
+            return self._loads(result) if result else None
+        except Exception as exc:
+            self._report_error("get", exc)
             return None
 
     def get(self, key: str) -> Optional[Any]:
@@ -120,13 +516,100 @@ class RedisBackend(CacheBackend):
             Optional[Any]: The cached value, or None if not found.
         """
         try:
-            result = self._sync_client.get(self._make_key(key))
-            return pickle.loads(result) if result else None
-        except Exception:
+            k = self._make_key(key)
+            result = self._read("get", lambda client: client.get(k))
+            return self._loads(result) if result else None
+        except Exception as exc:
+            self._report_error("get", exc)
+            return None
+
+    @staticmethod
+    def _get_and_pttl(client: Any, key: str) -> Any:
+        """
+        Pipeline GET and PTTL of one key in a single round trip.
+        """
+        with client.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.pttl(key)
+            return pipe.execute()
+
+    @staticmethod
+    async def _aget_and_pttl(client: Any, key: str) -> Any:
+        """
+        Asynchronously pipeline GET and PTTL of one key in a single round trip.
+        """
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.pttl(key)
+            return await pipe.execute()
+
+    def _to_entry(self, result: Optional[bytes], pttl: int) -> Optional[CacheEntry]:
+        """
+        Build a `CacheEntry` from a GET result and its PTTL.
+
+        Args:
+            result (Optional[bytes]): The stored payload.
+            pttl (int): Remaining milliseconds; -1 if the key has no expiry.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if the key was not found.
+        """
+        if not result:
+            return None
+        return CacheEntry(self._loads(result), pttl / 1000 if pttl >= 0 else None)
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """
+        Asynchronously retrieve a value and its remaining TTL in one round trip.
+
+        GET and PTTL are pipelined. Redis does not record when a key was
+        written, so ``created_at`` is None.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if not found.
+        """
+        try:
+            k = self._make_key(key)
+            result, pttl = await self._aread(
+                "get", lambda client: self._aget_and_pttl(client, k)
+            )
+            return self._to_entry(result, pttl)
+        except Exception as exc:
+            self._report_error("get", exc)
+            return None
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """
+        Synchronously retrieve a value and its remaining TTL in one round trip.
+
+        GET and PTTL are pipelined. Redis does not record when a key was
+        written, so ``created_at`` is None.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if not found.
+        """
+        try:
+            k = self._make_key(key)
+            result, pttl = self._read(
+                "get", lambda client: self._get_and_pttl(client, k)
+            )
+            return self._to_entry(result, pttl)
+        except Exception as exc:
+            self._report_error("get", exc)
             return None
 
     async def aset(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Asynchronously set a value in the cache.
@@ -135,31 +618,566 @@ class RedisBackend(CacheBackend):
             key (str): The key under which to store the value.
             value (Any): The value to store.
             expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+            tags (Optional[Sequence[str]]): Tags to invalidate the entry by.
         """
         try:
             ex = expire.total_seconds() if isinstance(expire, timedelta) else expire
-            await self._async_client.set(
-                self._make_key(key), pickle.dumps(value), ex=ex
-            )
-        except Exception:
-            pass
+            k = self._make_key(key)
+            if not tags:
+                await self._async_client.set(k, self._dumps(value), ex=ex)
+                return
+            async with self._async_client.pipeline(transaction=False) as pipe:
+                pipe.set(k, self._dumps(value), ex=ex)
+                self._queue_tags(pipe, k, tags, expire)
+                await pipe.execute()
+        except Exception as exc:
+            self._report_error("set", exc)
 
     def set(
-        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Synchronously set a value in the cache.
 
+        With tags, the key is added to one Redis set per tag, pipelined with
+        the SET. Each tag set expires no earlier than its longest-lived member.
+
         Args:
             key (str): The key under which to store the value.
             value (Any): The value to store.
             expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+            tags (Optional[Sequence[str]]): Tags to invalidate the entry by.
         """
         try:
             ex = expire.total_seconds() if isinstance(expire, timedelta) else expire
-            self._sync_client.set(self._make_key(key), pickle.dumps(value), ex=ex)
-        except Exception:
-            pass
+            k = self._make_key(key)
+            if not tags:
+                self._sync_client.set(k, self._dumps(value), ex=ex)
+                return
+            with self._sync_client.pipeline(transaction=False) as pipe:
+                pipe.set(k, self._dumps(value), ex=ex)
+                self._queue_tags(pipe, k, tags, expire)
+                pipe.execute()
+        except Exception as exc:
+            self._report_error("set", exc)
+
+    def _tag_set(self, tag: str) -> str:
+        """
+        Key of the Redis set holding a tag's keys.
+        """
+        return self._make_key(self._tag_key(tag))
+
+    def _queue_tags(
+        self,
+        pipe: Any,
+        k: str,
+        tags: Sequence[str],
+        expire: Optional[Union[int, timedelta]],
+    ) -> None:
+        """
+        Queue the addition of ``k`` to its tag sets, extending their expiry.
+        """
+        px = self._expiry(expire).get("px", 0)
+        for tag in tags:
+            pipe.eval(_TAG_SCRIPT, 1, self._tag_set(tag), k, px)
+
+    @staticmethod
+    def _queue_invalidation(pipe: Any, tag_sets: List[str], members: List[set]) -> None:
+        """
+        Queue the UNLINK of the tagged keys and their removal from the tag sets.
+
+        Only the members read are removed, so keys tagged meanwhile stay in
+        the set for the next invalidation.
+        """
+        unlinked: set = set()
+        for tag_set, keys in zip(tag_sets, members):
+            if keys:
+                # One UNLINK per key, since keys may live in different slots.
+                for k in keys - unlinked:
+                    pipe.unlink(k)
+                unlinked |= keys
+                pipe.srem(tag_set, *keys)
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """
+        Asynchronously delete every entry stored with any of ``tags``.
+
+        See `invalidate_tags`.
+
+        Args:
+            tags (Sequence[str]): The tags to invalidate.
+        """
+        try:
+            tag_sets = [self._tag_set(tag) for tag in tags]
+            async with self._async_client.pipeline(transaction=False) as pipe:
+                for tag_set in tag_sets:
+                    pipe.smembers(tag_set)
+                members = await pipe.execute()
+            async with self._async_client.pipeline(transaction=False) as pipe:
+                self._queue_invalidation(pipe, tag_sets, members)
+                await pipe.execute()
+        except Exception as exc:
+            self._report_error("invalidate", exc)
+
+    def invalidate_tags(self, tags: Sequence[str]) -> None:
+        """
+        Synchronously delete every entry stored with any of ``tags``.
+
+        The tag sets are read in one pipeline, then the keys are unlinked in a
+        second. Tag sets expire with their longest-lived member, shrink when
+        invalidated, and `clear` removes them with the namespace.
+
+        Args:
+            tags (Sequence[str]): The tags to invalidate.
+        """
+        try:
+            tag_sets = [self._tag_set(tag) for tag in tags]
+            with self._sync_client.pipeline(transaction=False) as pipe:
+                for tag_set in tag_sets:
+                    pipe.smembers(tag_set)
+                members = pipe.execute()
+            with self._sync_client.pipeline(transaction=False) as pipe:
+                self._queue_invalidation(pipe, tag_sets, members)
+                pipe.execute()
+        except Exception as exc:
+            self._report_error("invalidate", exc)
+
+    def _prefix_pattern(self, prefix: str) -> str:
+        """
+        Build the SCAN MATCH pattern of the keys starting with ``prefix``.
+        """
+        return self._make_key(_GLOB_CHARS.sub(r"\\\g<0>", prefix) + "*")
+
+    def iter_keys(self, prefix: str = "", batch_size: int = 100) -> Iterator[str]:
+        """
+        Synchronously iterate over the keys starting with ``prefix``.
+
+        Uses SCAN with MATCH and ``batch_size`` as its COUNT hint, on every
+        primary in cluster mode. SCAN may return a key more than once, and
+        lists keys in no particular order.
+
+        Args:
+            prefix (str): Only list keys starting with this prefix.
+            batch_size (int): COUNT hint of each SCAN call.
+
+        Yields:
+            str: The keys, without the namespace.
+        """
+        offset = len(self._make_key(""))
+        try:
+            for k in self._sync_client.scan_iter(
+                match=self._prefix_pattern(prefix), count=batch_size
+            ):
+                key = k.decode()[offset:]
+                if not key.startswith(_INTERNAL_PREFIXES):
+                    yield key
+        except Exception as exc:
+            self._report_error("iter_keys", exc)
+
+    async def aiter_keys(
+        self, prefix: str = "", batch_size: int = 100
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously iterate over the keys starting with ``prefix``.
+
+        See `iter_keys`.
+
+        Args:
+            prefix (str): Only list keys starting with this prefix.
+            batch_size (int): COUNT hint of each SCAN call.
+
+        Yields:
+            str: The keys, without the namespace.
+        """
+        offset = len(self._make_key(""))
+        try:
+            async for k in self._async_client.scan_iter(
+                match=self._prefix_pattern(prefix), count=batch_size
+            ):
+                key = k.decode()[offset:]
+                if not key.startswith(_INTERNAL_PREFIXES):
+                    yield key
+        except Exception as exc:
+            self._report_error("iter_keys", exc)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Synchronously delete every entry whose key starts with ``prefix``.
+
+        Keys are SCANned 500 at a time and each batch is UNLINKed as it
+        arrives, so memory stays constant however many keys match.
+
+        Args:
+            prefix (str): The key prefix, without the namespace.
+
+        Returns:
+            int: How many keys were deleted.
+        """
+        deleted = 0
+        batch: List[bytes] = []
+        try:
+            for k in self._sync_client.scan_iter(
+                match=self._prefix_pattern(prefix), count=500
+            ):
+                batch.append(k)
+                if len(batch) == 500:
+                    deleted += self._sync_client.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += self._sync_client.unlink(*batch)
+        except Exception as exc:
+            self._report_error("delete_prefix", exc)
+        return deleted
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """
+        Asynchronously delete every entry whose key starts with ``prefix``.
+
+        See `delete_prefix`.
+
+        Args:
+            prefix (str): The key prefix, without the namespace.
+
+        Returns:
+            int: How many keys were deleted.
+        """
+        deleted = 0
+        batch: List[bytes] = []
+        try:
+            async for k in self._async_client.scan_iter(
+                match=self._prefix_pattern(prefix), count=500
+            ):
+                batch.append(k)
+                if len(batch) == 500:
+                    deleted += await self._async_client.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += await self._async_client.unlink(*batch)
+        except Exception as exc:
+            self._report_error("delete_prefix", exc)
+        return deleted
+
+    @staticmethod
+    def _expiry(expire: Optional[Union[int, timedelta]]) -> Dict[str, Any]:
+        """
+        Build the GETEX arguments that restart or remove a key's expiry.
+        """
+        if expire is None:
+            return {"persist": True}
+        seconds = expire.total_seconds() if isinstance(expire, timedelta) else expire
+        return {"px": max(1, int(seconds * 1000))}
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Asynchronously retrieve a value and restart its expiration with GETEX.
+
+        The command changes the key, so it always runs on the primary.
+
+        Args:
+            key (str): The key to retrieve.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+                If None, the key no longer expires.
+
+        Returns:
+            Optional[Any]: The cached value, or None if not found.
+        """
+        try:
+            result = await self._async_client.getex(
+                self._make_key(key), **self._expiry(expire)
+            )
+            return self._loads(result) if result else None
+        except Exception as exc:
+            self._report_error("get", exc)
+            return None
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """
+        Synchronously retrieve a value and restart its expiration with GETEX.
+
+        The command changes the key, so it always runs on the primary.
+
+        Args:
+            key (str): The key to retrieve.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+                If None, the key no longer expires.
+
+        Returns:
+            Optional[Any]: The cached value, or None if not found.
+        """
+        try:
+            result = self._sync_client.getex(
+                self._make_key(key), **self._expiry(expire)
+            )
+            return self._loads(result) if result else None
+        except Exception as exc:
+            self._report_error("get", exc)
+            return None
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Asynchronously restart a key's expiration with PEXPIRE, or PERSIST.
+
+        Args:
+            key (str): The key to touch.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+                If None, the key no longer expires.
+
+        Returns:
+            bool: True if the key exists, False otherwise.
+        """
+        try:
+            k = self._make_key(key)
+            expiry = self._expiry(expire)
+            if "px" in expiry:
+                return bool(await self._async_client.pexpire(k, expiry["px"]))
+            # PERSIST also returns 0 for keys without an expiry.
+            async with self._async_client.pipeline(transaction=False) as pipe:
+                pipe.persist(k)
+                pipe.exists(k)
+                return bool((await pipe.execute())[1])
+        except Exception as exc:
+            self._report_error("touch", exc)
+            return False
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """
+        Synchronously restart a key's expiration with PEXPIRE, or PERSIST.
+
+        Args:
+            key (str): The key to touch.
+            expire (Optional[Union[int, timedelta]]): The new expiration time.
+                If None, the key no longer expires.
+
+        Returns:
+            bool: True if the key exists, False otherwise.
+        """
+        try:
+            k = self._make_key(key)
+            expiry = self._expiry(expire)
+            if "px" in expiry:
+                return bool(self._sync_client.pexpire(k, expiry["px"]))
+            # PERSIST also returns 0 for keys without an expiry.
+            with self._sync_client.pipeline(transaction=False) as pipe:
+                pipe.persist(k)
+                pipe.exists(k)
+                return bool(pipe.execute()[1])
+        except Exception as exc:
+            self._report_error("touch", exc)
+            return False
+
+    def _queue_incr(
+        self,
+        pipe: Any,
+        key: str,
+        delta: int,
+        expire: Optional[Union[int, timedelta]],
+    ) -> None:
+        """
+        Queue an INCRBY, preceded by a SET NX that gives a new counter its expiry.
+        """
+        if expire is not None:
+            pipe.set(key, 0, nx=True, px=self._expiry(expire)["px"])
+        pipe.incrby(key, delta)
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """
+        Asynchronously add ``delta`` to a counter with INCRBY.
+
+        With ``expire``, a ``SET NX PX`` creating the counter is pipelined
+        before the INCRBY, so both take one round trip and an existing
+        counter keeps its expiry.
+
+        Args:
+            key (str): The counter key.
+            delta (int): The amount to add; negative to decrement. Defaults to 1.
+            expire (Optional[Union[int, timedelta]]): Expiration time of a new counter.
+
+        Returns:
+            Optional[int]: The new value, or None if the command failed.
+        """
+        try:
+            async with self._async_client.pipeline(transaction=False) as pipe:
+                self._queue_incr(pipe, self._make_key(key), delta, expire)
+                return (await pipe.execute())[-1]
+        except Exception as exc:
+            self._report_error("incr", exc)
+            return None
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """
+        Synchronously add ``delta`` to a counter with INCRBY.
+
+        With ``expire``, a ``SET NX PX`` creating the counter is pipelined
+        before the INCRBY, so both take one round trip and an existing
+        counter keeps its expiry.
+
+        Args:
+            key (str): The counter key.
+            delta (int): The amount to add; negative to decrement. Defaults to 1.
+            expire (Optional[Union[int, timedelta]]): Expiration time of a new counter.
+
+        Returns:
+            Optional[int]: The new value, or None if the command failed.
+        """
+        try:
+            with self._sync_client.pipeline(transaction=False) as pipe:
+                self._queue_incr(pipe, self._make_key(key), delta, expire)
+                return pipe.execute()[-1]
+        except Exception as exc:
+            self._report_error("incr", exc)
+            return None
+
+    @staticmethod
+    def _version(payload: Optional[bytes]) -> Optional[str]:
+        """
+        Version token of a stored payload: its SHA-1 digest.
+        """
+        return None if payload is None else hashlib.sha1(payload).hexdigest()
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Asynchronously retrieve a value with its version from the primary.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            Optional[VersionedValue]: The value and its version, or None if
+            not found.
+        """
+        try:
+            result = await self._async_client.get(self._make_key(key))
+            if result is None:
+                return None
+            return VersionedValue(self._loads(result), self._version(result))
+        except Exception as exc:
+            self._report_error("get", exc)
+            return None
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """
+        Synchronously retrieve a value with its version from the primary.
+
+        The version is a digest of the stored bytes, so it changes whenever
+        a different value is written.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            Optional[VersionedValue]: The value and its version, or None if
+            not found.
+        """
+        try:
+            result = self._sync_client.get(self._make_key(key))
+            if result is None:
+                return None
+            return VersionedValue(self._loads(result), self._version(result))
+        except Exception as exc:
+            self._report_error("get", exc)
+            return None
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[str],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Asynchronously store a value only if the key is still at ``version``.
+
+        Args:
+            key (str): The key to store the value under.
+            value (Any): The value to store.
+            version (Optional[str]): The version from `aget_versioned`, or None
+                to store the value only if the key does not exist.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+
+        Returns:
+            bool: True if the value was stored, False if the key changed or
+            the command failed.
+        """
+        from redis.exceptions import WatchError
+
+        k = self._make_key(key)
+        expiry = {} if expire is None else self._expiry(expire)
+        try:
+            async with self._async_client.pipeline(transaction=True) as pipe:
+                await pipe.watch(k)
+                if self._version(await pipe.get(k)) != version:
+                    return False
+                pipe.multi()
+                pipe.set(k, self._dumps(value), **expiry)
+                await pipe.execute()
+                return True
+        except WatchError:
+            return False
+        except Exception as exc:
+            self._report_error("set", exc)
+            return False
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Optional[str],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Synchronously store a value only if the key is still at ``version``.
+
+        The key is WATCHed while its version is compared, and the SET runs in
+        a MULTI/EXEC transaction that Redis aborts if the key changed in
+        between.
+
+        Args:
+            key (str): The key to store the value under.
+            value (Any): The value to store.
+            version (Optional[str]): The version from `get_versioned`, or None
+                to store the value only if the key does not exist.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+
+        Returns:
+            bool: True if the value was stored, False if the key changed or
+            the command failed.
+        """
+        from redis.exceptions import WatchError
+
+        k = self._make_key(key)
+        expiry = {} if expire is None else self._expiry(expire)
+        try:
+            with self._sync_client.pipeline(transaction=True) as pipe:
+                pipe.watch(k)
+                if self._version(pipe.get(k)) != version:
+                    return False
+                pipe.multi()
+                pipe.set(k, self._dumps(value), **expiry)
+                pipe.execute()
+                return True
+        except WatchError:
+            return False
+        except Exception as exc:
+            self._report_error("set", exc)
+            return False
 
     async def adelete(self, key: str) -> None:
         """
@@ -170,8 +1188,8 @@ class RedisBackend(CacheBackend):
         """
         try:
             await self._async_client.delete(self._make_key(key))
-        except Exception:
-            pass
+        except Exception as exc:
+            self._report_error("delete", exc)
 
     def delete(self, key: str) -> None:
         """
@@ -182,25 +1200,41 @@ class RedisBackend(CacheBackend):
         """
         try:
             self._sync_client.delete(self._make_key(key))
-        except Exception:
-            pass
+        except Exception as exc:
+            self._report_error("delete", exc)
 
     async def aclear(self) -> None:
         """
         Asynchronously clear all values from the namespace.
+
+        In cluster mode every primary node is scanned concurrently.
         """
         try:
+            if self._cluster:
+                await asyncio.gather(
+                    *(
+                        self._aclear_node(node)
+                        for node in self._async_client.get_primaries()
+                    )
+                )
+                return
             keys = await self._scan_keys()
             if keys:
                 await self._async_client.delete(*keys)
-        except Exception:
-            pass
+        except Exception as exc:
+            self._report_error("clear", exc)
 
     def clear(self) -> None:
         """
         Synchronously clear all values from the namespace.
+
+        In cluster mode every primary node is scanned in turn.
         """
         try:
+            if self._cluster:
+                for node in self._sync_client.get_primaries():
+                    self._clear_node(node)
+                return
             cursor = 0
             namespace_pattern = self._make_key("*")
 
@@ -212,8 +1246,8 @@ class RedisBackend(CacheBackend):
                     self._sync_client.delete(*keys)
                 if cursor == 0:
                     break
-        except Exception:
-            pass
+        except Exception as exc:
+            self._report_error("clear", exc)
 
     async def ahas(self, key: str) -> bool:
         """
@@ -226,8 +1260,10 @@ class RedisBackend(CacheBackend):
             bool: True if the key exists, False otherwise.
         """
         try:
-            return await self._async_client.exists(self._make_key(key)) > 0
-        except Exception:
+            k = self._make_key(key)
+            return await self._aread("has", lambda client: client.exists(k)) > 0
+        except Exception as exc:
+            self._report_error("has", exc)
             return False
 
     def has(self, key: str) -> bool:
@@ -241,15 +1277,201 @@ class RedisBackend(CacheBackend):
             bool: True if the key exists, False otherwise.
         """
         try:
-            return self._sync_client.exists(self._make_key(key)) > 0
-        except Exception:
+            k = self._make_key(key)
+            return self._read("has", lambda client: client.exists(k)) > 0
+        except Exception as exc:
+            self._report_error("has", exc)
             return False
 
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Asynchronously retrieve several values with a single MGET.
+
+        In cluster mode the keys are grouped by hash slot and one MGET per slot
+        is pipelined to each node.
+
+        Args:
+            keys (Sequence[str]): The keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The cached values of the keys that were found.
+        """
+        if not keys:
+            return {}
+        try:
+            namespaced = [self._make_key(key) for key in keys]
+            if self._cluster:
+                results = await self._async_client.mget_nonatomic(namespaced)
+            else:
+                results = await self._aread(
+                    "get_many", lambda client: client.mget(namespaced)
+                )
+            return {
+                key: self._loads(result) for key, result in zip(keys, results) if result
+            }
+        except Exception as exc:
+            self._report_error("get_many", exc)
+            return {}
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """
+        Synchronously retrieve several values with a single MGET.
+
+        In cluster mode the keys are grouped by hash slot and one MGET per slot
+        is pipelined to each node.
+
+        Args:
+            keys (Sequence[str]): The keys to retrieve.
+
+        Returns:
+            Dict[str, Any]: The cached values of the keys that were found.
+        """
+        if not keys:
+            return {}
+        try:
+            namespaced = [self._make_key(key) for key in keys]
+            if self._cluster:
+                results = self._sync_client.mget_nonatomic(namespaced)
+            else:
+                results = self._read("get_many", lambda client: client.mget(namespaced))
+            return {
+                key: self._loads(result) for key, result in zip(keys, results) if result
+            }
+        except Exception as exc:
+            self._report_error("get_many", exc)
+            return {}
+
+    async def aset_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """
+        Asynchronously set several values in one pipelined round trip.
+
+        In cluster mode the pipeline sends each node its own commands.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+        """
+        if not items:
+            return
+        try:
+            ex = expire.total_seconds() if isinstance(expire, timedelta) else expire
+            async with self._async_client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(self._make_key(key), self._dumps(value), ex=ex)
+                await pipe.execute()
+        except Exception as exc:
+            self._report_error("set_many", exc)
+
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """
+        Synchronously set several values in one pipelined round trip.
+
+        In cluster mode the pipeline sends each node its own commands.
+
+        Args:
+            items (Mapping[str, Any]): The keys and values to store.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+        """
+        if not items:
+            return
+        try:
+            ex = expire.total_seconds() if isinstance(expire, timedelta) else expire
+            with self._sync_client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(self._make_key(key), self._dumps(value), ex=ex)
+                pipe.execute()
+        except Exception as exc:
+            self._report_error("set_many", exc)
+
     async def close(self) -> None:
         """
         Close Redis connections and clean up pools.
         """
+        if self._cluster:
+            # redis-py < 5.0.1 only has the deprecated close().
+            close = getattr(self._async_client, "aclose", self._async_client.close)
+            await close()
+            self._sync_client.close()
+            return
         await self._async_client.close()
         await self._async_pool.disconnect()
         self._sync_client.close()
         self._sync_pool.disconnect()
+        replicas = self._known_replicas.values() if self._sentinel else self._replicas
+        for replica in replicas or ():
+            await replica.async_client.close()
+            replica.sync_client.close()
+
+    def _lock_key(self, key: str) -> str:
+        """
+        Create the key of a compute lock; `clear` removes it with the namespace.
+        """
+        return self._make_key(f"__lock__:{key}")
+
+    def _acquire_lock(self, key: str, timeout: float) -> Optional[str]:
+        """
+        Take a key's compute lock with ``SET NX PX``.
+
+        Args:
+            key (str): The cache key the lock guards.
+            timeout (float): Seconds until Redis expires the lock.
+
+        Returns:
+            Optional[str]: The lock token, or None if the lock is held.
+        """
+        token = uuid.uuid4().hex
+        try:
+            acquired = self._sync_client.set(
+                self._lock_key(key), token, nx=True, px=max(1, int(timeout * 1000))
+            )
+        except Exception as exc:
+            self._report_error("lock", exc)
+            raise
+        return token if acquired else None
+
+    def _release_lock(self, key: str, token: str) -> None:
+        """
+        Delete a compute lock with a Lua script, only if ``token`` still owns it.
+        """
+        try:
+            self._sync_client.eval(_UNLOCK_SCRIPT, 1, self._lock_key(key), token)
+        except Exception as exc:
+            self._report_error("lock", exc)
+
+    async def _aacquire_lock(self, key: str, timeout: float) -> Optional[str]:
+        """
+        Asynchronously take a key's compute lock with ``SET NX PX``.
+
+        Args:
+            key (str): The cache key the lock guards.
+            timeout (float): Seconds until Redis expires the lock.
+
+        Returns:
+            Optional[str]: The lock token, or None if the lock is held.
+        """
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self._async_client.set(
+                self._lock_key(key), token, nx=True, px=max(1, int(timeout * 1000))
+            )
+        except Exception as exc:
+            self._report_error("lock", exc)
+            raise
+        return token if acquired else None
+
+    async def _arelease_lock(self, key: str, token: str) -> None:
+        """
+        Asynchronously delete a compute lock if ``token`` still owns it.
+        """
+        try:
+            await self._async_client.eval(_UNLOCK_SCRIPT, 1, self._lock_key(key), token)
+        except Exception as exc:
+            self._report_error("lock", exc)
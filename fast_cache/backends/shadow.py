@@ -0,0 +1,687 @@
+import asyncio
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ..metrics import LatencyHistogram
+from .backend import (
+    CacheBackend,
+    CacheEntry,
+    VersionedValue,
+    WrapperBackend,
+    _aclose_backend,
+    _close_backend,
+    _cost_kwargs,
+    _tag_kwargs,
+)
+
+
+class ShadowBackend(WrapperBackend):
+    """
+    Wrapper that serves from a primary backend and mirrors traffic to a shadow.
+
+    Every call is answered by the primary. A sample of operations is then
+    replayed against the shadow on a dedicated thread pool, fire-and-forget,
+    and the two outcomes are compared: hit/miss agreement and value mismatches
+    for lookups, and latency of both backends per operation. Use it to try a
+    new backend, or a new configuration of one, on real traffic before
+    switching.
+
+    Args:
+        primary (CacheBackend): The backend that serves every request.
+        shadow (CacheBackend): The backend under evaluation.
+        sample_rate (float): Fraction of keys whose operations are mirrored,
+            between 0 and 1. Defaults to 1.0.
+        max_concurrency (int): Threads running mirrored operations. Defaults to 4.
+        max_pending (int): Mirrored operations allowed to wait or run at once;
+            further operations are dropped (and counted) rather than queued.
+            Defaults to 1000.
+        compare_values (bool): Whether to compare the values of keys found in
+            both backends. Defaults to True.
+
+    Raises:
+        ValueError: If ``sample_rate`` is not between 0 and 1.
+
+    Notes:
+        - The shadow never adds latency to the primary path: mirrored calls use
+          the shadow's sync methods on the wrapper's own threads, async callers
+          never await them, and a full queue drops mirrors instead of blocking.
+          Shadow errors, raised or swallowed, are counted and otherwise ignored.
+        - Sampling is per key, so a sampled key's writes and reads are all
+          mirrored and hit agreement stays meaningful.
+        - The shadow only receives mirrored writes, so it starts cold; expect
+          ``primary_only_hits`` until it has warmed up. Mirrored operations may
+          run out of order when ``max_concurrency`` is above 1.
+        - Primary latency is measured around the primary call only for
+          sampled keys, so both histograms cover the same operations.
+        - Key iteration and the compute locks of `get_or_set` use the primary
+          only.
+    """
+
+    def __init__(
+        self,
+        primary: CacheBackend,
+        shadow: CacheBackend,
+        sample_rate: float = 1.0,
+        max_concurrency: int = 4,
+        max_pending: int = 1000,
+        compare_values: bool = True,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        super().__init__(primary)
+        self._shadow = shadow
+        self._threshold = int(sample_rate * 2**64)
+        self._compare_values = compare_values
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="fast-cache-shadow"
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = dict.fromkeys(
+            (
+                "mirrored",
+                "dropped",
+                "shadow_errors",
+                "lookups",
+                "agreements",
+                "primary_only_hits",
+                "shadow_only_hits",
+                "value_mismatches",
+            ),
+            0,
+        )
+        self._latency: Dict[str, Tuple[LatencyHistogram, LatencyHistogram]] = {}
+        shadow._add_listener(self)
+
+    @property
+    def shadow(self) -> CacheBackend:
+        """
+        The backend under evaluation.
+        """
+        return self._shadow
+
+    def on_error(self, operation: str, exc: BaseException) -> None:
+        """
+        Count an error the shadow handled itself (e.g. returned as a miss).
+
+        Args:
+            operation (str): The sync operation name.
+            exc (BaseException): The swallowed exception.
+        """
+        with self._lock:
+            self._counters["shadow_errors"] += 1
+
+    def on_payload(self, operation: str, size: int, seconds: float) -> None:
+        """
+        Ignore payloads of the shadow.
+        """
+
+    def _sampled(self, key: str) -> bool:
+        """
+        Decide whether operations on a key are mirrored.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            bool: True if the key is sampled.
+        """
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big") < self._threshold
+
+    def _histograms(self, op: str) -> Tuple[LatencyHistogram, LatencyHistogram]:
+        """
+        Primary and shadow latency histograms of an operation; lock held.
+        """
+        histograms = self._latency.get(op)
+        if histograms is None:
+            histograms = self._latency[op] = (LatencyHistogram(), LatencyHistogram())
+        return histograms
+
+    def _mirror(
+        self,
+        op: str,
+        primary_seconds: float,
+        call: Callable[[], Any],
+        primary_result: Any = None,
+    ) -> None:
+        """
+        Schedule a mirrored call on the shadow, or drop it if the queue is full.
+
+        Args:
+            op (str): The sync operation name.
+            primary_seconds (float): Latency of the primary call.
+            call (Callable[[], Any]): Runs the operation on the shadow.
+            primary_result (Any): The primary's result, compared for lookups;
+                for ``get_many`` the sampled keys and the values found.
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._counters["dropped"] += 1
+            return
+        try:
+            self._executor.submit(
+                self._run_mirror, op, primary_seconds, call, primary_result
+            )
+        except RuntimeError:
+            # The executor was shut down by close().
+            self._slots.release()
+
+    def _run_mirror(
+        self,
+        op: str,
+        primary_seconds: float,
+        call: Callable[[], Any],
+        primary_result: Any,
+    ) -> None:
+        """
+        Run a mirrored call on a worker thread and record the comparison.
+        """
+        try:
+            started = time.perf_counter()
+            try:
+                result = call()
+            except Exception:
+                with self._lock:
+                    self._counters["shadow_errors"] += 1
+                return
+            shadow_seconds = time.perf_counter() - started
+
+            with self._lock:
+                self._counters["mirrored"] += 1
+                primary_histogram, shadow_histogram = self._histograms(op)
+                primary_histogram.record(primary_seconds)
+                shadow_histogram.record(shadow_seconds)
+                if op == "get":
+                    self._compare(primary_result, result)
+                elif op == "get_many":
+                    keys, found = primary_result
+                    for key in keys:
+                        self._compare(found.get(key), result.get(key))
+        finally:
+            self._slots.release()
+
+    def _compare(self, primary_value: Any, shadow_value: Any) -> None:
+        """
+        Compare one lookup of both backends; lock held.
+        """
+        self._counters["lookups"] += 1
+        if primary_value is None and shadow_value is None:
+            self._counters["agreements"] += 1
+        elif shadow_value is None:
+            self._counters["primary_only_hits"] += 1
+        elif primary_value is None:
+            self._counters["shadow_only_hits"] += 1
+        else:
+            self._counters["agreements"] += 1
+            if self._compare_values:
+                try:
+                    equal = bool(primary_value == shadow_value)
+                except Exception:
+                    equal = False
+                if not equal:
+                    self._counters["value_mismatches"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report how the shadow compares to the primary.
+
+        Returns:
+            Dict[str, Any]: Counters ``mirrored``, ``dropped``, ``shadow_errors``,
+            ``lookups``, ``agreements``, ``primary_only_hits``,
+            ``shadow_only_hits`` and ``value_mismatches``; ``hit_agreement``
+            (agreements / lookups); and per-operation ``latency`` with
+            ``primary`` and ``shadow`` histogram snapshots and the
+            ``p50_delta``/``p99_delta`` in seconds (shadow minus primary).
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            latency = {}
+            for op, (primary, shadow) in self._latency.items():
+                primary_summary = primary.snapshot()
+                shadow_summary = shadow.snapshot()
+                latency[op] = {
+                    "primary": primary_summary,
+                    "shadow": shadow_summary,
+                    "p50_delta": shadow_summary["p50"] - primary_summary["p50"],
+                    "p99_delta": shadow_summary["p99"] - primary_summary["p99"],
+                }
+        stats["hit_agreement"] = (
+            stats["agreements"] / stats["lookups"] if stats["lookups"] else 1.0
+        )
+        stats["latency"] = latency
+        return stats
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retrieve a value from the primary, mirroring the lookup."""
+        if not self._sampled(key):
+            return self._backend.get(key)
+        started = time.perf_counter()
+        value = self._backend.get(key)
+        elapsed = time.perf_counter() - started
+        self._mirror("get", elapsed, lambda: self._shadow.get(key), value)
+        return value
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Asynchronously retrieve a value from the primary, mirroring the lookup."""
+        if not self._sampled(key):
+            return await self._backend.aget(key)
+        started = time.perf_counter()
+        value = await self._backend.aget(key)
+        elapsed = time.perf_counter() - started
+        self._mirror("get", elapsed, lambda: self._shadow.get(key), value)
+        return value
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Retrieve a value with its metadata from the primary, mirroring a get."""
+        if not self._sampled(key):
+            return self._backend.get_with_meta(key)
+        started = time.perf_counter()
+        entry = self._backend.get_with_meta(key)
+        elapsed = time.perf_counter() - started
+        value = None if entry is None else entry.value
+        self._mirror("get", elapsed, lambda: self._shadow.get(key), value)
+        return entry
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Asynchronously retrieve a value with its metadata, mirroring a get."""
+        if not self._sampled(key):
+            return await self._backend.aget_with_meta(key)
+        started = time.perf_counter()
+        entry = await self._backend.aget_with_meta(key)
+        elapsed = time.perf_counter() - started
+        value = None if entry is None else entry.value
+        self._mirror("get", elapsed, lambda: self._shadow.get(key), value)
+        return entry
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Retrieve a value and restart its expiration in the primary, mirroring the call."""
+        if not self._sampled(key):
+            return self._backend.get_and_touch(key, expire)
+        started = time.perf_counter()
+        value = self._backend.get_and_touch(key, expire)
+        elapsed = time.perf_counter() - started
+        self._mirror(
+            "get", elapsed, lambda: self._shadow.get_and_touch(key, expire), value
+        )
+        return value
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Asynchronously retrieve a value and restart its expiration, mirroring the call."""
+        if not self._sampled(key):
+            return await self._backend.aget_and_touch(key, expire)
+        started = time.perf_counter()
+        value = await self._backend.aget_and_touch(key, expire)
+        elapsed = time.perf_counter() - started
+        self._mirror(
+            "get", elapsed, lambda: self._shadow.get_and_touch(key, expire), value
+        )
+        return value
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Restart an entry's expiration in the primary, mirroring the call."""
+        if not self._sampled(key):
+            return self._backend.touch(key, expire)
+        started = time.perf_counter()
+        found = self._backend.touch(key, expire)
+        elapsed = time.perf_counter() - started
+        self._mirror("touch", elapsed, lambda: self._shadow.touch(key, expire))
+        return found
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Asynchronously restart an entry's expiration in the primary, mirroring the call."""
+        if not self._sampled(key):
+            return await self._backend.atouch(key, expire)
+        started = time.perf_counter()
+        found = await self._backend.atouch(key, expire)
+        elapsed = time.perf_counter() - started
+        self._mirror("touch", elapsed, lambda: self._shadow.touch(key, expire))
+        return found
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Add to a counter in the primary, mirroring the call."""
+        if not self._sampled(key):
+            return self._backend.incr(key, delta, expire)
+        started = time.perf_counter()
+        value = self._backend.incr(key, delta, expire)
+        elapsed = time.perf_counter() - started
+        self._mirror("incr", elapsed, lambda: self._shadow.incr(key, delta, expire))
+        return value
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Asynchronously add to a counter in the primary, mirroring the call."""
+        if not self._sampled(key):
+            return await self._backend.aincr(key, delta, expire)
+        started = time.perf_counter()
+        value = await self._backend.aincr(key, delta, expire)
+        elapsed = time.perf_counter() - started
+        self._mirror("incr", elapsed, lambda: self._shadow.incr(key, delta, expire))
+        return value
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Retrieve a value with its version from the primary, mirroring a get."""
+        if not self._sampled(key):
+            return self._backend.get_versioned(key)
+        started = time.perf_counter()
+        entry = self._backend.get_versioned(key)
+        elapsed = time.perf_counter() - started
+        value = None if entry is None else entry.value
+        self._mirror("get", elapsed, lambda: self._shadow.get(key), value)
+        return entry
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Asynchronously retrieve a value with its version, mirroring a get."""
+        if not self._sampled(key):
+            return await self._backend.aget_versioned(key)
+        started = time.perf_counter()
+        entry = await self._backend.aget_versioned(key)
+        elapsed = time.perf_counter() - started
+        value = None if entry is None else entry.value
+        self._mirror("get", elapsed, lambda: self._shadow.get(key), value)
+        return entry
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        Store a value in the primary if its version is unchanged.
+
+        Versions belong to the primary, so a successful write is mirrored as a
+        plain set.
+        """
+        if not self._sampled(key):
+            return self._backend.set_if_version(key, value, version, expire)
+        started = time.perf_counter()
+        stored = self._backend.set_if_version(key, value, version, expire)
+        elapsed = time.perf_counter() - started
+        if stored:
+            self._mirror(
+                "set", elapsed, lambda: self._shadow.set(key, value, expire=expire)
+            )
+        return stored
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Asynchronously store a value in the primary if its version is unchanged."""
+        if not self._sampled(key):
+            return await self._backend.aset_if_version(key, value, version, expire)
+        started = time.perf_counter()
+        stored = await self._backend.aset_if_version(key, value, version, expire)
+        elapsed = time.perf_counter() - started
+        if stored:
+            self._mirror(
+                "set", elapsed, lambda: self._shadow.set(key, value, expire=expire)
+            )
+        return stored
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Store a value in the primary, mirroring the write."""
+        tag_kwargs = _tag_kwargs(tags)
+        cost_kwargs = _cost_kwargs(self._backend, cost)
+        if not self._sampled(key):
+            return self._backend.set(
+                key, value, expire=expire, **tag_kwargs, **cost_kwargs
+            )
+        started = time.perf_counter()
+        self._backend.set(key, value, expire=expire, **tag_kwargs, **cost_kwargs)
+        elapsed = time.perf_counter() - started
+        self._mirror(
+            "set",
+            elapsed,
+            lambda: self._shadow.set(
+                key,
+                value,
+                expire=expire,
+                **tag_kwargs,
+                **_cost_kwargs(self._shadow, cost),
+            ),
+        )
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Asynchronously store a value in the primary, mirroring the write."""
+        tag_kwargs = _tag_kwargs(tags)
+        cost_kwargs = _cost_kwargs(self._backend, cost)
+        if not self._sampled(key):
+            return await self._backend.aset(
+                key, value, expire=expire, **tag_kwargs, **cost_kwargs
+            )
+        started = time.perf_counter()
+        await self._backend.aset(key, value, expire=expire, **tag_kwargs, **cost_kwargs)
+        elapsed = time.perf_counter() - started
+        self._mirror(
+            "set",
+            elapsed,
+            lambda: self._shadow.set(
+                key,
+                value,
+                expire=expire,
+                **tag_kwargs,
+                **_cost_kwargs(self._shadow, cost),
+            ),
+        )
+
+    def invalidate_tags(self, tags: Sequence[str]) -> None:
+        """Delete tagged keys from the primary, mirroring the call."""
+        started = time.perf_counter()
+        self._backend.invalidate_tags(tags)
+        self._mirror(
+            "invalidate",
+            time.perf_counter() - started,
+            lambda: self._shadow.invalidate_tags(tags),
+        )
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """Asynchronously delete tagged keys from the primary, mirroring the call."""
+        started = time.perf_counter()
+        await self._backend.ainvalidate_tags(tags)
+        self._mirror(
+            "invalidate",
+            time.perf_counter() - started,
+            lambda: self._shadow.invalidate_tags(tags),
+        )
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete the entries under ``prefix`` from the primary, mirroring the call."""
+        started = time.perf_counter()
+        deleted = self._backend.delete_prefix(prefix)
+        self._mirror(
+            "delete_prefix",
+            time.perf_counter() - started,
+            lambda: self._shadow.delete_prefix(prefix),
+        )
+        return deleted
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """Asynchronously delete the entries under ``prefix``, mirroring the call."""
+        started = time.perf_counter()
+        deleted = await self._backend.adelete_prefix(prefix)
+        self._mirror(
+            "delete_prefix",
+            time.perf_counter() - started,
+            lambda: self._shadow.delete_prefix(prefix),
+        )
+        return deleted
+
+    def delete(self, key: str) -> None:
+        """Delete a value from the primary, mirroring the call."""
+        if not self._sampled(key):
+            return self._backend.delete(key)
+        started = time.perf_counter()
+        self._backend.delete(key)
+        elapsed = time.perf_counter() - started
+        self._mirror("delete", elapsed, lambda: self._shadow.delete(key))
+
+    async def adelete(self, key: str) -> None:
+        """Asynchronously delete a value from the primary, mirroring the call."""
+        if not self._sampled(key):
+            return await self._backend.adelete(key)
+        started = time.perf_counter()
+        await self._backend.adelete(key)
+        elapsed = time.perf_counter() - started
+        self._mirror("delete", elapsed, lambda: self._shadow.delete(key))
+
+    def clear(self) -> None:
+        """Clear the primary namespace, mirroring the call."""
+        started = time.perf_counter()
+        self._backend.clear()
+        self._mirror("clear", time.perf_counter() - started, self._shadow.clear)
+
+    async def aclear(self) -> None:
+        """Asynchronously clear the primary namespace, mirroring the call."""
+        started = time.perf_counter()
+        await self._backend.aclear()
+        self._mirror("clear", time.perf_counter() - started, self._shadow.clear)
+
+    def has(self, key: str) -> bool:
+        """Check for a key in the primary, mirroring the call."""
+        if not self._sampled(key):
+            return self._backend.has(key)
+        started = time.perf_counter()
+        exists = self._backend.has(key)
+        elapsed = time.perf_counter() - started
+        self._mirror("has", elapsed, lambda: self._shadow.has(key))
+        return exists
+
+    async def ahas(self, key: str) -> bool:
+        """Asynchronously check for a key in the primary, mirroring the call."""
+        if not self._sampled(key):
+            return await self._backend.ahas(key)
+        started = time.perf_counter()
+        exists = await self._backend.ahas(key)
+        elapsed = time.perf_counter() - started
+        self._mirror("has", elapsed, lambda: self._shadow.has(key))
+        return exists
+
+    def _mirror_get_many(
+        self, keys: Sequence[str], values: Dict[str, Any], elapsed: float
+    ) -> None:
+        """
+        Mirror the sampled keys of a multi-key lookup.
+        """
+        sampled = [key for key in keys if self._sampled(key)]
+        if sampled:
+            found = {key: values[key] for key in sampled if key in values}
+            self._mirror(
+                "get_many",
+                elapsed,
+                lambda: self._shadow.get_many(sampled),
+                (sampled, found),
+            )
+
+    def _mirror_set_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]],
+        elapsed: float,
+    ) -> None:
+        """
+        Mirror the sampled items of a multi-key write.
+        """
+        sampled = {key: value for key, value in items.items() if self._sampled(key)}
+        if sampled:
+            self._mirror(
+                "set_many",
+                elapsed,
+                lambda: self._shadow.set_many(sampled, expire=expire),
+            )
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Retrieve several values from the primary, mirroring sampled keys."""
+        started = time.perf_counter()
+        values = self._backend.get_many(keys)
+        self._mirror_get_many(keys, values, time.perf_counter() - started)
+        return values
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Asynchronously retrieve several values, mirroring sampled keys."""
+        started = time.perf_counter()
+        values = await self._backend.aget_many(keys)
+        self._mirror_get_many(keys, values, time.perf_counter() - started)
+        return values
+
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Store several values in the primary, mirroring sampled items."""
+        started = time.perf_counter()
+        self._backend.set_many(items, expire=expire)
+        self._mirror_set_many(items, expire, time.perf_counter() - started)
+
+    async def aset_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Asynchronously store several values, mirroring sampled items."""
+        started = time.perf_counter()
+        await self._backend.aset_many(items, expire=expire)
+        self._mirror_set_many(items, expire, time.perf_counter() - started)
+
+    def close(self) -> None:
+        """
+        Wait for pending mirrored calls, then close both backends.
+        """
+        self._executor.shutdown(wait=True)
+        super().close()
+        _close_backend(self._shadow)
+
+    async def aclose(self) -> None:
+        """
+        Asynchronously wait for pending mirrored calls and close both backends.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        await super().aclose()
+        await _aclose_backend(self._shadow)
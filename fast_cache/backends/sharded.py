@@ -0,0 +1,583 @@
+import asyncio
+import bisect
+import contextvars
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .backend import (
+    CacheBackend,
+    CacheEntry,
+    VersionedValue,
+    _aclose_backend,
+    _close_backend,
+    _cost_kwargs,
+    _tag_kwargs,
+)
+
+
+def _hash(value: str) -> int:
+    """
+    64-bit hash of a string, stable across processes.
+    """
+    digest = hashlib.blake2b(value.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class HashRing:
+    """
+    Consistent-hash ring mapping keys to named nodes.
+
+    Each node is placed on the ring at ``vnodes * weight`` pseudo-random
+    points; a key belongs to the node owning the first point at or after the
+    key's hash. Adding or removing a node only moves the keys of the ring
+    segments it gains or loses, roughly ``1 / nodes`` of all keys.
+
+    Args:
+        vnodes (int): Points per unit of weight. More points spread keys more
+            evenly. Defaults to 160.
+    """
+
+    def __init__(self, vnodes: int = 160) -> None:
+        self._vnodes = vnodes
+        self._weights: Dict[str, float] = {}
+        self._points: List[int] = []
+        self._owners: List[str] = []
+
+    @property
+    def nodes(self) -> Dict[str, float]:
+        """
+        The nodes on the ring and their weights.
+        """
+        return dict(self._weights)
+
+    def copy(self) -> "HashRing":
+        """
+        Return an independent copy of the ring.
+        """
+        ring = HashRing(self._vnodes)
+        ring._weights = dict(self._weights)
+        ring._points = list(self._points)
+        ring._owners = list(self._owners)
+        return ring
+
+    def add(self, node: str, weight: float = 1.0) -> None:
+        """
+        Place a node on the ring.
+
+        Args:
+            node (str): Node name; it determines the node's points, so keep
+                names stable across restarts.
+            weight (float): Relative share of keys. Defaults to 1.0.
+
+        Raises:
+            ValueError: If the node is already on the ring or the weight is
+                not positive.
+        """
+        if node in self._weights:
+            raise ValueError(f"Node {node!r} is already on the ring")
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self._weights[node] = weight
+        self._rebuild()
+
+    def remove(self, node: str) -> None:
+        """
+        Take a node off the ring.
+
+        Args:
+            node (str): Node name.
+
+        Raises:
+            KeyError: If the node is not on the ring.
+        """
+        del self._weights[node]
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """
+        Recompute the sorted ring points from the nodes and weights.
+        """
+        points: List[Tuple[int, str]] = []
+        for node, weight in self._weights.items():
+            for replica in range(max(1, round(self._vnodes * weight))):
+                points.append((_hash(f"{node}#{replica}"), node))
+        points.sort()
+        self._points = [point for point, _ in points]
+        self._owners = [node for _, node in points]
+
+    def get(self, key: str) -> str:
+        """
+        Find the node owning a key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str: The node name.
+
+        Raises:
+            LookupError: If the ring is empty.
+        """
+        if not self._points:
+            raise LookupError("The hash ring has no nodes")
+        index = bisect.bisect(self._points, _hash(key))
+        return self._owners[index % len(self._owners)]
+
+
+class ShardedBackend(CacheBackend):
+    """
+    Backend that spreads keys over several backends with consistent hashing.
+
+    Every key lives on exactly one shard, chosen by a `HashRing`, so capacity
+    and throughput grow with the number of shards. Multi-key operations are
+    split per shard and the parts run concurrently; `clear` runs on every
+    shard. Shards can be added or removed at runtime, and only the keys of the
+    ring segments that change owner move (they are misses until refilled).
+
+    Args:
+        shards (Union[Sequence[CacheBackend], Mapping[str, CacheBackend]]):
+            The shard backends. A mapping names them explicitly; a sequence
+            names them ``shard-0``, ``shard-1``, ... by position. Names decide
+            key placement, so use a mapping if the list of shards can change.
+        weights (Optional[Mapping[str, float]]): Relative capacity per shard
+            name, e.g. ``{"big": 2}``. Unlisted shards weigh 1.
+        vnodes (int): Ring points per unit of weight. Defaults to 160.
+        max_workers (int): Threads used to run sync multi-shard operations
+            concurrently. Defaults to 8.
+
+    Raises:
+        ValueError: If no shards are given.
+
+    Notes:
+        - Instrumentation attached by `MetricsBackend` or `TracingBackend`
+          reaches every shard, including shards added later.
+    """
+
+    def __init__(
+        self,
+        shards: Union[Sequence[CacheBackend], Mapping[str, CacheBackend]],
+        weights: Optional[Mapping[str, float]] = None,
+        vnodes: int = 160,
+        max_workers: int = 8,
+    ) -> None:
+        if not isinstance(shards, Mapping):
+            shards = {f"shard-{index}": shard for index, shard in enumerate(shards)}
+        if not shards:
+            raise ValueError("ShardedBackend needs at least one shard")
+        weights = weights or {}
+
+        ring = HashRing(vnodes)
+        for name in shards:
+            ring.add(name, weights.get(name, 1.0))
+        # Ring and shards are swapped together so readers never see a ring
+        # naming a shard that is missing from the mapping.
+        self._layout: Tuple[HashRing, Dict[str, CacheBackend]] = (ring, dict(shards))
+        self._lock = threading.Lock()
+        self._listeners_added: List[Any] = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fast-cache-shard"
+        )
+        self._update_blocking_ops()
+
+    def _update_blocking_ops(self) -> None:
+        """
+        Recompute `blocking_async_ops` as the union over all shards, and
+        `cost_aware` as whether every shard is.
+        """
+        self.blocking_async_ops = frozenset().union(
+            *(shard.blocking_async_ops for shard in self._layout[1].values())
+        )
+        self.cost_aware = all(shard.cost_aware for shard in self._layout[1].values())
+
+    def _add_listener(self, listener: Any) -> None:
+        """
+        Attach instrumentation to every shard, now and when shards are added.
+
+        Args:
+            listener (Any): The listener, see `CacheBackend._add_listener`.
+        """
+        with self._lock:
+            self._listeners_added.append(listener)
+            shards = list(self._layout[1].values())
+        for shard in shards:
+            shard._add_listener(listener)
+
+    @property
+    def shards(self) -> Dict[str, CacheBackend]:
+        """
+        The shards by name.
+        """
+        return dict(self._layout[1])
+
+    def add_shard(self, name: str, backend: CacheBackend, weight: float = 1.0) -> None:
+        """
+        Add a shard; about ``weight / total weight`` of the keys move to it.
+
+        Args:
+            name (str): Shard name, unique within this backend.
+            backend (CacheBackend): The shard backend.
+            weight (float): Relative capacity. Defaults to 1.0.
+
+        Raises:
+            ValueError: If the name is taken or the weight is not positive.
+        """
+        with self._lock:
+            ring, shards = self._layout
+            ring = ring.copy()
+            ring.add(name, weight)
+            for listener in self._listeners_added:
+                backend._add_listener(listener)
+            shards = {**shards, name: backend}
+            self._layout = (ring, shards)
+            self._update_blocking_ops()
+
+    def remove_shard(self, name: str) -> CacheBackend:
+        """
+        Remove a shard; its keys move to the remaining shards.
+
+        The removed backend is returned without being closed.
+
+        Args:
+            name (str): Shard name.
+
+        Returns:
+            CacheBackend: The removed backend.
+
+        Raises:
+            KeyError: If there is no shard with this name.
+            ValueError: If it is the last shard.
+        """
+        with self._lock:
+            ring, shards = self._layout
+            if name in shards and len(shards) == 1:
+                raise ValueError("Cannot remove the last shard")
+            ring = ring.copy()
+            ring.remove(name)
+            shards = dict(shards)
+            backend = shards.pop(name)
+            self._layout = (ring, shards)
+            self._update_blocking_ops()
+        return backend
+
+    def shard_for(self, key: str) -> CacheBackend:
+        """
+        Find the shard owning a key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            CacheBackend: The shard backend.
+        """
+        ring, shards = self._layout
+        return shards[ring.get(key)]
+
+    def _acquire_lock(self, key: str, timeout: float) -> Optional[Any]:
+        """Take a key's compute lock on the key's shard."""
+        return self.shard_for(key)._acquire_lock(key, timeout)
+
+    def _release_lock(self, key: str, token: Any) -> None:
+        """Release a key's compute lock on the key's shard."""
+        self.shard_for(key)._release_lock(key, token)
+
+    async def _aacquire_lock(self, key: str, timeout: float) -> Optional[Any]:
+        """Asynchronously take a key's compute lock on the key's shard."""
+        return await self.shard_for(key)._aacquire_lock(key, timeout)
+
+    async def _arelease_lock(self, key: str, token: Any) -> None:
+        """Asynchronously release a key's compute lock on the key's shard."""
+        await self.shard_for(key)._arelease_lock(key, token)
+
+    def _group(self, keys: Sequence[str]) -> List[Tuple[CacheBackend, List[str]]]:
+        """
+        Split keys by owning shard.
+        """
+        ring, shards = self._layout
+        groups: Dict[str, List[str]] = {}
+        for key in keys:
+            groups.setdefault(ring.get(key), []).append(key)
+        return [(shards[name], part) for name, part in groups.items()]
+
+    def _fan_out(self, calls: List[Callable[[], Any]]) -> List[Any]:
+        """
+        Run sync calls concurrently on the thread pool (inline if only one).
+        """
+        if len(calls) == 1:
+            return [calls[0]()]
+        # Run in copies of the caller's context so tracing state follows.
+        futures = [
+            self._executor.submit(contextvars.copy_context().run, call)
+            for call in calls
+        ]
+        return [future.result() for future in futures]
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retrieve a value from the key's shard."""
+        return self.shard_for(key).get(key)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Asynchronously retrieve a value from the key's shard."""
+        return await self.shard_for(key).aget(key)
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Retrieve a value with its metadata from the key's shard."""
+        return self.shard_for(key).get_with_meta(key)
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Asynchronously retrieve a value with its metadata from the key's shard."""
+        return await self.shard_for(key).aget_with_meta(key)
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Retrieve a value and restart its expiration in the key's shard."""
+        return self.shard_for(key).get_and_touch(key, expire)
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Asynchronously retrieve a value and restart its expiration in the key's shard."""
+        return await self.shard_for(key).aget_and_touch(key, expire)
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Restart an entry's expiration in the key's shard."""
+        return self.shard_for(key).touch(key, expire)
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Asynchronously restart an entry's expiration in the key's shard."""
+        return await self.shard_for(key).atouch(key, expire)
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Add to a counter in the key's shard."""
+        return self.shard_for(key).incr(key, delta, expire)
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Asynchronously add to a counter in the key's shard."""
+        return await self.shard_for(key).aincr(key, delta, expire)
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Retrieve a value with its version from the key's shard."""
+        return self.shard_for(key).get_versioned(key)
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Asynchronously retrieve a value with its version from the key's shard."""
+        return await self.shard_for(key).aget_versioned(key)
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Store a value in the key's shard if its version is unchanged."""
+        return self.shard_for(key).set_if_version(key, value, version, expire)
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Asynchronously store a value in the key's shard if its version is unchanged."""
+        return await self.shard_for(key).aset_if_version(key, value, version, expire)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Store a value in the key's shard, indexing its tags there."""
+        self.shard_for(key).set(
+            key,
+            value,
+            expire=expire,
+            **_tag_kwargs(tags),
+            **_cost_kwargs(self, cost),
+        )
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Asynchronously store a value in the key's shard."""
+        await self.shard_for(key).aset(
+            key,
+            value,
+            expire=expire,
+            **_tag_kwargs(tags),
+            **_cost_kwargs(self, cost),
+        )
+
+    def delete(self, key: str) -> None:
+        """Delete a value from the key's shard."""
+        self.shard_for(key).delete(key)
+
+    async def adelete(self, key: str) -> None:
+        """Asynchronously delete a value from the key's shard."""
+        await self.shard_for(key).adelete(key)
+
+    def has(self, key: str) -> bool:
+        """Check for a key in its shard."""
+        return self.shard_for(key).has(key)
+
+    async def ahas(self, key: str) -> bool:
+        """Asynchronously check for a key in its shard."""
+        return await self.shard_for(key).ahas(key)
+
+    def clear(self) -> None:
+        """Clear the namespace on every shard concurrently."""
+        self._fan_out([shard.clear for shard in self._layout[1].values()])
+
+    async def aclear(self) -> None:
+        """Asynchronously clear the namespace on every shard concurrently."""
+        await asyncio.gather(*(shard.aclear() for shard in self._layout[1].values()))
+
+    def invalidate_tags(self, tags: Sequence[str]) -> None:
+        """Delete tagged keys on every shard concurrently."""
+        self._fan_out(
+            [
+                (lambda shard=shard: shard.invalidate_tags(tags))
+                for shard in self._layout[1].values()
+            ]
+        )
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """Asynchronously delete tagged keys on every shard concurrently."""
+        await asyncio.gather(
+            *(shard.ainvalidate_tags(tags) for shard in self._layout[1].values())
+        )
+
+    def iter_keys(self, prefix: str = "", batch_size: int = 100) -> Iterator[str]:
+        """Iterate over the keys starting with ``prefix``, one shard after another."""
+        for shard in list(self._layout[1].values()):
+            yield from shard.iter_keys(prefix, batch_size)
+
+    async def aiter_keys(
+        self, prefix: str = "", batch_size: int = 100
+    ) -> AsyncIterator[str]:
+        """Asynchronously iterate over the keys starting with ``prefix``, shard by shard."""
+        for shard in list(self._layout[1].values()):
+            async for key in shard.aiter_keys(prefix, batch_size):
+                yield key
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete the entries under ``prefix`` on every shard concurrently."""
+        return sum(
+            self._fan_out(
+                [
+                    (lambda shard=shard: shard.delete_prefix(prefix))
+                    for shard in self._layout[1].values()
+                ]
+            )
+        )
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """Asynchronously delete the entries under ``prefix`` on every shard concurrently."""
+        return sum(
+            await asyncio.gather(
+                *(shard.adelete_prefix(prefix) for shard in self._layout[1].values())
+            )
+        )
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Retrieve several values, one concurrent batch per shard."""
+        parts = self._fan_out(
+            [
+                (lambda shard=shard, part=part: shard.get_many(part))
+                for shard, part in self._group(keys)
+            ]
+        )
+        result: Dict[str, Any] = {}
+        for part in parts:
+            result.update(part)
+        return result
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Asynchronously retrieve several values, one concurrent batch per shard."""
+        parts = await asyncio.gather(
+            *(shard.aget_many(part) for shard, part in self._group(keys))
+        )
+        result: Dict[str, Any] = {}
+        for part in parts:
+            result.update(part)
+        return result
+
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Store several values, one concurrent batch per shard."""
+        self._fan_out(
+            [
+                (
+                    lambda shard=shard, part=part: shard.set_many(
+                        {key: items[key] for key in part}, expire=expire
+                    )
+                )
+                for shard, part in self._group(list(items))
+            ]
+        )
+
+    async def aset_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Asynchronously store several values, one concurrent batch per shard."""
+        await asyncio.gather(
+            *(
+                shard.aset_many({key: items[key] for key in part}, expire=expire)
+                for shard, part in self._group(list(items))
+            )
+        )
+
+    def close(self) -> None:
+        """
+        Close every shard and the thread pool.
+        """
+        self._executor.shutdown(wait=False)
+        for shard in self._layout[1].values():
+            _close_backend(shard)
+
+    async def aclose(self) -> None:
+        """
+        Asynchronously close every shard and the thread pool.
+        """
+        self._executor.shutdown(wait=False)
+        for shard in self._layout[1].values():
+            await _aclose_backend(shard)
@@ -0,0 +1,381 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from .backend import (
+    CacheBackend,
+    CacheEntry,
+    VersionedValue,
+    WrapperBackend,
+    _cost_kwargs,
+    _tag_kwargs,
+)
+
+# Async method name -> sync method name for every offloadable operation.
+_OPERATIONS = {
+    "aget": "get",
+    "aget_with_meta": "get_with_meta",
+    "aget_and_touch": "get_and_touch",
+    "atouch": "touch",
+    "aincr": "incr",
+    "aset": "set",
+    "aget_versioned": "get_versioned",
+    "aset_if_version": "set_if_version",
+    "adelete": "delete",
+    "aclear": "clear",
+    "ainvalidate_tags": "invalidate_tags",
+    "adelete_prefix": "delete_prefix",
+    "aiter_keys": "iter_keys",
+    "ahas": "has",
+    "aget_many": "get_many",
+    "aset_many": "set_many",
+    "_aacquire_lock": "_acquire_lock",
+    "_arelease_lock": "_release_lock",
+}
+
+
+def _next_batch(keys: Iterator[str], size: int) -> List[str]:
+    """Pull up to ``size`` keys from a key iterator."""
+    return list(itertools.islice(keys, size))
+
+
+class SyncToAsyncBackend(WrapperBackend):
+    """
+    Adapter that runs a backend's blocking calls on a dedicated thread pool.
+
+    Async callers (such as the async wrapper of `FastAPICache.cached`) await the
+    adapter's async methods; instead of running the wrapped backend's blocking
+    I/O on the event loop, the adapter executes the wrapped backend's sync
+    method on its own bounded `ThreadPoolExecutor`. The pool is separate from
+    Starlette's default threadpool, so a slow cache cannot starve sync endpoints
+    and vice versa.
+
+    Args:
+        backend (CacheBackend): The backend to wrap.
+        max_workers (int, optional): Size of the dedicated thread pool. Defaults to 8.
+        mode (str, optional): ``"always"`` offloads every operation to the pool.
+            ``"auto"`` offloads only the operations whose async method is not a
+            coroutine function or is listed in the backend's
+            `blocking_async_ops`, and calls the native async method otherwise.
+            Defaults to ``"always"``.
+
+    Raises:
+        ValueError: If ``mode`` is not ``"always"`` or ``"auto"``.
+
+    Notes:
+        - Sync methods are delegated directly on the calling thread, as
+          `WrapperBackend` does.
+        - `stats` reports per-operation queueing time (submit to start on a
+          worker thread), so pool saturation is visible.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        max_workers: int = 8,
+        mode: str = "always",
+    ) -> None:
+        if mode not in ("always", "auto"):
+            raise ValueError("mode must be 'always' or 'auto'")
+
+        super().__init__(backend)
+        # Blocking calls run on the pool, so no async operation blocks.
+        self.blocking_async_ops = frozenset()
+        self._max_workers = max_workers
+        self._mode = mode
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fast-cache"
+        )
+        self._offloaded = frozenset(
+            op for op in _OPERATIONS if mode == "always" or self._blocks(backend, op)
+        )
+
+        self._stats_lock = threading.Lock()
+        self._in_flight = 0
+        self._stats: Dict[str, Dict[str, float]] = {
+            _OPERATIONS[op]: {
+                "calls": 0,
+                "queue_time_total": 0.0,
+                "queue_time_max": 0.0,
+                "run_time_total": 0.0,
+            }
+            for op in self._offloaded
+        }
+
+    @staticmethod
+    def _blocks(backend: CacheBackend, op: str) -> bool:
+        """
+        Decide whether an async operation of ``backend`` would block the loop.
+
+        Args:
+            backend (CacheBackend): The wrapped backend.
+            op (str): The async method name.
+
+        Returns:
+            bool: True if the operation should run on the thread pool.
+        """
+        method = getattr(backend, op, None)
+        return (
+            method is None
+            or not (
+                inspect.iscoroutinefunction(method)
+                or inspect.isasyncgenfunction(method)
+            )
+            or op in backend.blocking_async_ops
+        )
+
+    async def _run(self, op: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run an operation, offloading it to the pool if required.
+
+        Args:
+            op (str): The async method name.
+            *args: Positional arguments for the operation.
+            **kwargs: Keyword arguments for the operation.
+
+        Returns:
+            Any: The operation result.
+        """
+        if op not in self._offloaded:
+            return await getattr(self._backend, op)(*args, **kwargs)
+
+        sync_name = _OPERATIONS[op]
+        return await self._offload(
+            sync_name,
+            functools.partial(getattr(self._backend, sync_name), *args, **kwargs),
+        )
+
+    async def _offload(self, sync_name: str, func: Callable[[], Any]) -> Any:
+        """
+        Run a blocking call on the pool, recording its queueing and run time.
+
+        Args:
+            sync_name (str): The sync operation name the time is recorded under.
+            func (Callable[[], Any]): The call to run.
+
+        Returns:
+            Any: The call result.
+        """
+        # Run in a copy of the caller's context so tracing state follows the call.
+        context = contextvars.copy_context()
+        submitted = time.perf_counter()
+
+        def call() -> Any:
+            started = time.perf_counter()
+            try:
+                return context.run(func)
+            finally:
+                self._record(
+                    sync_name, started - submitted, time.perf_counter() - started
+                )
+
+        with self._stats_lock:
+            self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, call)
+        finally:
+            with self._stats_lock:
+                self._in_flight -= 1
+
+    def _record(self, name: str, queued: float, ran: float) -> None:
+        """
+        Record the queueing and run time of one offloaded call.
+
+        Args:
+            name (str): The sync operation name.
+            queued (float): Seconds spent waiting for a worker thread.
+            ran (float): Seconds spent executing on the worker thread.
+        """
+        with self._stats_lock:
+            stats = self._stats[name]
+            stats["calls"] += 1
+            stats["queue_time_total"] += queued
+            stats["queue_time_max"] = max(stats["queue_time_max"], queued)
+            stats["run_time_total"] += ran
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return thread-pool metrics.
+
+        Returns:
+            Dict[str, Any]: ``max_workers``, ``in_flight`` (submitted and not yet
+            finished calls) and, per offloaded operation, ``calls``,
+            ``queue_time_total``, ``queue_time_max``, ``queue_time_avg`` and
+            ``run_time_total`` in seconds.
+        """
+        with self._stats_lock:
+            operations = {}
+            for name, stats in self._stats.items():
+                calls = stats["calls"]
+                operations[name] = dict(
+                    stats,
+                    queue_time_avg=stats["queue_time_total"] / calls if calls else 0.0,
+                )
+            return {
+                "max_workers": self._max_workers,
+                "in_flight": self._in_flight,
+                "operations": operations,
+            }
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Retrieve a value, on the thread pool when offloaded."""
+        return await self._run("aget", key)
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Retrieve a value with its metadata, on the thread pool when offloaded."""
+        return await self._run("aget_with_meta", key)
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Retrieve a value and restart its expiration, on the thread pool when offloaded."""
+        return await self._run("aget_and_touch", key, expire)
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Restart an entry's expiration, on the thread pool when offloaded."""
+        return await self._run("atouch", key, expire)
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Add to a counter, on the thread pool when offloaded."""
+        return await self._run("aincr", key, delta, expire)
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Retrieve a value with its version, on the thread pool when offloaded."""
+        return await self._run("aget_versioned", key)
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Store a value if its version is unchanged, on the thread pool when offloaded."""
+        return await self._run("aset_if_version", key, value, version, expire)
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Store a value, on the thread pool when offloaded."""
+        await self._run(
+            "aset",
+            key,
+            value,
+            expire=expire,
+            **_tag_kwargs(tags),
+            **_cost_kwargs(self._backend, cost),
+        )
+
+    async def adelete(self, key: str) -> None:
+        """Delete a value, on the thread pool when offloaded."""
+        await self._run("adelete", key)
+
+    async def aclear(self) -> None:
+        """Clear the namespace, on the thread pool when offloaded."""
+        await self._run("aclear")
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """Delete tagged keys, on the thread pool when offloaded."""
+        await self._run("ainvalidate_tags", tags)
+
+    async def aiter_keys(
+        self, prefix: str = "", batch_size: int = 100
+    ) -> AsyncIterator[str]:
+        """
+        Iterate over the keys starting with ``prefix``, on the thread pool when offloaded.
+
+        Offloaded iteration pulls the wrapped backend's sync iterator one batch
+        of ``batch_size`` keys per pool call, so the loop never blocks on a page
+        fetch and only one batch is held at a time.
+        """
+        if "aiter_keys" not in self._offloaded:
+            async for key in self._backend.aiter_keys(prefix, batch_size):
+                yield key
+            return
+
+        keys = self._backend.iter_keys(prefix, batch_size)
+        try:
+            while True:
+                batch: List[str] = await self._offload(
+                    "iter_keys",
+                    functools.partial(_next_batch, keys, batch_size),
+                )
+                if not batch:
+                    return
+                for key in batch:
+                    yield key
+        finally:
+            close = getattr(keys, "close", None)
+            if close is not None:
+                close()
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """Delete the entries under ``prefix``, on the thread pool when offloaded."""
+        return await self._run("adelete_prefix", prefix)
+
+    async def ahas(self, key: str) -> bool:
+        """Check for a key, on the thread pool when offloaded."""
+        return await self._run("ahas", key)
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Retrieve several values, on the thread pool when offloaded."""
+        return await self._run("aget_many", keys)
+
+    async def aset_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Store several values, on the thread pool when offloaded."""
+        await self._run("aset_many", items, expire=expire)
+
+    async def _aacquire_lock(self, key: str, timeout: float) -> Optional[Any]:
+        """Take a compute lock, on the thread pool when offloaded."""
+        return await self._run("_aacquire_lock", key, timeout)
+
+    async def _arelease_lock(self, key: str, token: Any) -> None:
+        """Release a compute lock, on the thread pool when offloaded."""
+        await self._run("_arelease_lock", key, token)
+
+    def close(self) -> None:
+        """
+        Close the wrapped backend and shut down the thread pool.
+        """
+        super().close()
+        self._executor.shutdown(wait=False)
+
+    async def aclose(self) -> None:
+        """
+        Asynchronously close the wrapped backend and shut down the thread pool.
+        """
+        await super().aclose()
+        self._executor.shutdown(wait=False)
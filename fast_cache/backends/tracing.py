@@ -0,0 +1,325 @@
+from datetime import timedelta
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from ..tracing import CacheObserver, Tracer
+from .backend import (
+    CacheBackend,
+    CacheEntry,
+    VersionedValue,
+    WrapperBackend,
+    _cost_kwargs,
+    _tag_kwargs,
+)
+from .metrics import _describe
+
+
+class TracingBackend(WrapperBackend):
+    """
+    Wrapper that reports every operation of another backend to tracing observers.
+
+    Each call emits an `OperationEvent` with the key, namespace, payload size,
+    and the time split between the backend round trip (``network_time``) and
+    pickling (``serialization_time``). Errors are attached to the event both
+    when the wrapped backend raises and when it swallows them.
+
+    Args:
+        backend (CacheBackend): The backend to trace.
+        observers (Union[Tracer, Iterable[CacheObserver]]): The observers to
+            notify, or a `Tracer` shared with `FastAPICache`.
+        name (Optional[str]): Backend label. Defaults to the class name of the
+            innermost wrapped backend without the ``Backend`` suffix, lowercased.
+        namespace (Optional[str]): Namespace label. Defaults to the namespace
+            the innermost wrapped backend was created with.
+
+    Notes:
+        - `FastAPICache.init_app(..., observers=[...])` wraps the backend with
+          this class automatically. Without observers nothing is wrapped, so
+          tracing costs nothing when unused.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        observers: Union[Tracer, Iterable[CacheObserver]],
+        name: Optional[str] = None,
+        namespace: Optional[str] = None,
+    ) -> None:
+        super().__init__(backend)
+        self._tracer = observers if isinstance(observers, Tracer) else Tracer(observers)
+        default_name, default_namespace = _describe(backend)
+        self._name = name or default_name
+        self._namespace = namespace if namespace is not None else default_namespace
+        backend._add_listener(self._tracer)
+
+    def _call(
+        self, op: str, key: Optional[str], func: Callable, *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Run a sync operation inside a traced event.
+
+        Args:
+            op (str): The operation name.
+            key (Optional[str]): The cache key, if the operation has one.
+            func (Callable): The wrapped backend method.
+            *args: Arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            Any: The method's result.
+        """
+        event = self._tracer.start(op, key, self._namespace, self._name)
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            self._tracer.finish(event, exc)
+            raise
+        if op == "get":
+            event.hit = result is not None
+        self._tracer.finish(event)
+        return result
+
+    async def _acall(
+        self, op: str, key: Optional[str], func: Callable, *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Await an async operation inside a traced event.
+
+        Args:
+            op (str): The operation name.
+            key (Optional[str]): The cache key, if the operation has one.
+            func (Callable): The wrapped backend coroutine function.
+            *args: Arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            Any: The method's result.
+        """
+        event = self._tracer.start(op, key, self._namespace, self._name)
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as exc:
+            self._tracer.finish(event, exc)
+            raise
+        if op == "get":
+            event.hit = result is not None
+        self._tracer.finish(event)
+        return result
+
+    def _acquire_lock(self, key: str, timeout: float) -> Optional[Any]:
+        """Take a compute lock inside a traced ``lock`` event."""
+        return self._call("lock", key, self._backend._acquire_lock, key, timeout)
+
+    async def _aacquire_lock(self, key: str, timeout: float) -> Optional[Any]:
+        """Asynchronously take a compute lock inside a traced ``lock`` event."""
+        return await self._acall(
+            "lock", key, self._backend._aacquire_lock, key, timeout
+        )
+
+    def _release_lock(self, key: str, token: Any) -> None:
+        """Release a compute lock inside a traced ``unlock`` event."""
+        self._call("unlock", key, self._backend._release_lock, key, token)
+
+    async def _arelease_lock(self, key: str, token: Any) -> None:
+        """Asynchronously release a compute lock inside a traced ``unlock`` event."""
+        await self._acall("unlock", key, self._backend._arelease_lock, key, token)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retrieve a value inside a traced event."""
+        return self._call("get", key, self._backend.get, key)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Asynchronously retrieve a value inside a traced event."""
+        return await self._acall("get", key, self._backend.aget, key)
+
+    def get_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Retrieve a value with its metadata inside a traced ``get`` event."""
+        return self._call("get", key, self._backend.get_with_meta, key)
+
+    async def aget_with_meta(self, key: str) -> Optional[CacheEntry]:
+        """Asynchronously retrieve a value with its metadata inside a traced event."""
+        return await self._acall("get", key, self._backend.aget_with_meta, key)
+
+    def get_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Retrieve a value and restart its expiration inside a traced ``get`` event."""
+        return self._call("get", key, self._backend.get_and_touch, key, expire)
+
+    async def aget_and_touch(
+        self, key: str, expire: Optional[Union[int, timedelta]]
+    ) -> Optional[Any]:
+        """Asynchronously retrieve a value and restart its expiration inside a traced event."""
+        return await self._acall("get", key, self._backend.aget_and_touch, key, expire)
+
+    def touch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Restart an entry's expiration inside a traced event."""
+        return self._call("touch", key, self._backend.touch, key, expire)
+
+    async def atouch(self, key: str, expire: Optional[Union[int, timedelta]]) -> bool:
+        """Asynchronously restart an entry's expiration inside a traced event."""
+        return await self._acall("touch", key, self._backend.atouch, key, expire)
+
+    def incr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Add to a counter inside a traced event."""
+        return self._call("incr", key, self._backend.incr, key, delta, expire)
+
+    async def aincr(
+        self,
+        key: str,
+        delta: int = 1,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> Optional[int]:
+        """Asynchronously add to a counter inside a traced event."""
+        return await self._acall("incr", key, self._backend.aincr, key, delta, expire)
+
+    def get_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Retrieve a value with its version inside a traced ``get`` event."""
+        return self._call("get", key, self._backend.get_versioned, key)
+
+    async def aget_versioned(self, key: str) -> Optional[VersionedValue]:
+        """Asynchronously retrieve a value with its version inside a traced event."""
+        return await self._acall("get", key, self._backend.aget_versioned, key)
+
+    def set_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Store a value if its version is unchanged inside a traced ``set`` event."""
+        return self._call(
+            "set", key, self._backend.set_if_version, key, value, version, expire
+        )
+
+    async def aset_if_version(
+        self,
+        key: str,
+        value: Any,
+        version: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """Asynchronously store a value if its version is unchanged inside a traced event."""
+        return await self._acall(
+            "set", key, self._backend.aset_if_version, key, value, version, expire
+        )
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Store a value inside a traced event."""
+        self._call(
+            "set",
+            key,
+            self._backend.set,
+            key,
+            value,
+            expire,
+            **_tag_kwargs(tags),
+            **_cost_kwargs(self._backend, cost),
+        )
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[Union[int, timedelta]] = None,
+        tags: Optional[Sequence[str]] = None,
+        cost: Optional[float] = None,
+    ) -> None:
+        """Asynchronously store a value inside a traced event."""
+        await self._acall(
+            "set",
+            key,
+            self._backend.aset,
+            key,
+            value,
+            expire,
+            **_tag_kwargs(tags),
+            **_cost_kwargs(self._backend, cost),
+        )
+
+    def invalidate_tags(self, tags: Sequence[str]) -> None:
+        """Delete every key carrying one of the tags inside a traced event."""
+        self._call("invalidate", None, self._backend.invalidate_tags, tags)
+
+    async def ainvalidate_tags(self, tags: Sequence[str]) -> None:
+        """Asynchronously delete every key carrying one of the tags inside a traced event."""
+        await self._acall("invalidate", None, self._backend.ainvalidate_tags, tags)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete every entry whose key starts with ``prefix`` inside a traced event."""
+        return self._call("delete_prefix", prefix, self._backend.delete_prefix, prefix)
+
+    async def adelete_prefix(self, prefix: str) -> int:
+        """Asynchronously delete the entries under ``prefix`` inside a traced event."""
+        return await self._acall(
+            "delete_prefix", prefix, self._backend.adelete_prefix, prefix
+        )
+
+    def delete(self, key: str) -> None:
+        """Delete a value inside a traced event."""
+        self._call("delete", key, self._backend.delete, key)
+
+    async def adelete(self, key: str) -> None:
+        """Asynchronously delete a value inside a traced event."""
+        await self._acall("delete", key, self._backend.adelete, key)
+
+    def clear(self) -> None:
+        """Clear the namespace inside a traced event."""
+        self._call("clear", None, self._backend.clear)
+
+    async def aclear(self) -> None:
+        """Asynchronously clear the namespace inside a traced event."""
+        await self._acall("clear", None, self._backend.aclear)
+
+    def has(self, key: str) -> bool:
+        """Check for a key inside a traced event."""
+        return self._call("has", key, self._backend.has, key)
+
+    async def ahas(self, key: str) -> bool:
+        """Asynchronously check for a key inside a traced event."""
+        return await self._acall("has", key, self._backend.ahas, key)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Retrieve several values inside a traced event."""
+        return self._call("get_many", None, self._backend.get_many, keys)
+
+    async def aget_many(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Asynchronously retrieve several values inside a traced event."""
+        return await self._acall("get_many", None, self._backend.aget_many, keys)
+
+    def set_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Store several values inside a traced event."""
+        self._call("set_many", None, self._backend.set_many, items, expire)
+
+    async def aset_many(
+        self,
+        items: Mapping[str, Any],
+        expire: Optional[Union[int, timedelta]] = None,
+    ) -> None:
+        """Asynchronously store several values inside a traced event."""
+        await self._acall("set_many", None, self._backend.aset_many, items, expire)
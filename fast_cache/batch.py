@@ -0,0 +1,212 @@
+import asyncio
+import functools
+import inspect
+from datetime import timedelta
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .integration import FastAPICache
+
+
+class BatchLoader:
+    """
+    DataLoader-style cached loader for functions of the shape ``load_many(ids) -> dict``.
+
+    Every ``await loader(id)`` issued within the same event-loop tick is gathered
+    into one batch. The batch is answered with a single `aget_many` against the
+    cache backend, one call to the wrapped function for the IDs that missed, and
+    a single `aset_many` to write the loaded values back. N individual lookups
+    therefore cost two round trips instead of 2N.
+
+    Instances are created with `FastAPICache.cached_batch`.
+
+    Attributes:
+        __wrapped__ (Callable): The wrapped ``load_many`` function.
+    """
+
+    def __init__(
+        self,
+        cache: "FastAPICache",
+        func: Callable[[List[Hashable]], Awaitable[Mapping[Hashable, Any]]],
+        expire: Optional[Union[int, timedelta]] = None,
+        key_builder: Optional[Callable[[Hashable], str]] = None,
+        namespace: Optional[str] = None,
+        max_batch_size: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the loader.
+
+        Args:
+            cache (FastAPICache): The cache extension providing the backend.
+            func (Callable): Async function taking a list of IDs and returning a
+                mapping of ID to value. IDs missing from the mapping are treated
+                as not found.
+            expire (Optional[Union[int, timedelta]]): Expiration time for loaded values.
+            key_builder (Optional[Callable[[Hashable], str]]): Builds the cache key
+                for one ID.
+            namespace (Optional[str]): Optional namespace for the cache keys.
+            max_batch_size (Optional[int]): Maximum number of IDs passed to one
+                call of the wrapped function.
+
+        Raises:
+            TypeError: If ``func`` is not an async function.
+        """
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError("cached_batch requires an async load_many function")
+
+        functools.update_wrapper(self, func)
+        self._cache = cache
+        self._func = func
+        self._expire = expire
+        self._key_builder = key_builder
+        self._namespace = namespace
+        self._max_batch_size = max_batch_size
+        self._pending: Dict[
+            asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future]
+        ] = {}
+        self._tasks: set = set()
+
+    def _make_key(self, item_id: Hashable) -> str:
+        """
+        Build the cache key for one ID.
+
+        Args:
+            item_id (Hashable): The ID.
+
+        Returns:
+            str: The cache key.
+        """
+        if self._key_builder is not None:
+            key = self._key_builder(item_id)
+        else:
+            key = f"{self._func.__module__}:{self._func.__name__}:{item_id!r}"
+        if self._namespace:
+            key = f"{self._namespace}:{key}"
+        return key
+
+    def __call__(self, item_id: Hashable) -> "asyncio.Future[Any]":
+        """
+        Schedule ``item_id`` to be loaded with the current batch.
+
+        Args:
+            item_id (Hashable): The ID to load.
+
+        Returns:
+            asyncio.Future: Resolves to the value, or None if it was not found.
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(loop)
+        if batch is None:
+            batch = self._pending[loop] = {}
+            loop.call_soon(self._dispatch, loop)
+
+        future = batch.get(item_id)
+        if future is None:
+            future = batch[item_id] = loop.create_future()
+        return future
+
+    async def load_many(self, item_ids: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """
+        Load several IDs as part of the current batch.
+
+        Args:
+            item_ids (Iterable[Hashable]): The IDs to load.
+
+        Returns:
+            Dict[Hashable, Any]: The values that were found, keyed by ID.
+        """
+        item_ids = list(item_ids)
+        values = await asyncio.gather(*(self(item_id) for item_id in item_ids))
+        return {
+            item_id: value
+            for item_id, value in zip(item_ids, values)
+            if value is not None
+        }
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Close the batch collected during this tick and start resolving it.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The loop the batch belongs to.
+        """
+        batch = self._pending.pop(loop, None)
+        if batch:
+            task = loop.create_task(self._resolve(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: Dict[Hashable, asyncio.Future]) -> None:
+        """
+        Answer a batch from the cache, loading and storing whatever is missing.
+
+        Args:
+            batch (Dict[Hashable, asyncio.Future]): Futures keyed by ID.
+        """
+        try:
+            values = await self._fetch(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for item_id, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(item_id))
+
+    async def _fetch(self, item_ids: List[Hashable]) -> Dict[Hashable, Any]:
+        """
+        Fetch values for ``item_ids`` in at most two cache round trips.
+
+        Args:
+            item_ids (List[Hashable]): The IDs to load.
+
+        Returns:
+            Dict[Hashable, Any]: The values that were found, keyed by ID.
+        """
+        backend = self._cache._backend
+        keys = {item_id: self._make_key(item_id) for item_id in item_ids}
+
+        cached = await backend.aget_many(list(keys.values())) if backend else {}
+        values = {
+            item_id: cached[key] for item_id, key in keys.items() if key in cached
+        }
+
+        missing = [item_id for item_id in item_ids if item_id not in values]
+        if not missing:
+            return values
+
+        size = self._max_batch_size or len(missing)
+        loaded: Dict[Hashable, Any] = {}
+        for start in range(0, len(missing), size):
+            result = await self._func(missing[start : start + size])
+            loaded.update(
+                (item_id, value)
+                for item_id, value in result.items()
+                if value is not None and item_id in keys
+            )
+
+        if backend and loaded:
+            await backend.aset_many(
+                {keys[item_id]: value for item_id, value in loaded.items()},
+                expire=self._expire or self._cache._default_expire,
+            )
+        values.update(loaded)
+        return values
@@ -0,0 +1,29 @@
+"""
+Benchmarks for cache backends.
+
+Run ``python -m fast_cache.bench --help`` for the command-line interface.
+"""
+
+from .asgi import bench_asgi, build_app
+from .backends import BACKENDS, create_backend
+from .compare import compare_results
+from .decorator import bench_decorator, compare_decorator
+from .runner import run_async, run_sync, run_workload
+from .simulate import simulate
+from .workload import Workload, parse_size
+
+__all__ = [
+    "BACKENDS",
+    "Workload",
+    "bench_asgi",
+    "bench_decorator",
+    "build_app",
+    "compare_decorator",
+    "compare_results",
+    "create_backend",
+    "parse_size",
+    "run_async",
+    "run_sync",
+    "run_workload",
+    "simulate",
+]
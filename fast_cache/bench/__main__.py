@@ -0,0 +1,374 @@
+import argparse
+import asyncio
+import inspect
+import itertools
+import json
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..backends.backend import CacheBackend
+from ..backends.memory import EVICTION_POLICIES
+from ..recording import read_trace
+from .backends import BACKENDS, create_backend
+from .asgi import ENDPOINTS, bench_asgi
+from .compare import compare_results, describe
+from .decorator import bench_decorator, compare_decorator
+from .runner import run_async, run_sync
+from .simulate import simulate
+from .workload import DISTRIBUTIONS, MODES, Workload, parse_size
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def _size_list(value: str) -> List[int]:
+    return [parse_size(item) for item in value.split(",") if item]
+
+
+def _capacity_list(value: str) -> List[Optional[int]]:
+    return [
+        None if item == "unbounded" else int(item) for item in value.split(",") if item
+    ]
+
+
+def _ttl_list(value: str) -> List[Optional[float]]:
+    return [
+        None if item == "recorded" else float(item) for item in value.split(",") if item
+    ]
+
+
+def _policy_list(value: str) -> List[str]:
+    policies = [item for item in value.split(",") if item]
+    for policy in policies:
+        if policy not in EVICTION_POLICIES:
+            raise argparse.ArgumentTypeError(
+                f"invalid policy {policy!r}; expected one of {EVICTION_POLICIES}"
+            )
+    return policies
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m fast_cache.bench",
+        description="Benchmark fast_cache backends and compare results.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run workloads against a backend.")
+    run.add_argument("--backend", choices=BACKENDS, default="memory")
+    run.add_argument(
+        "--url",
+        help="Connection URL. Without it Redis uses fakeredis, DynamoDB uses moto, "
+        "and other backends connect to a server on localhost.",
+    )
+    run.add_argument("--mode", choices=MODES, default="async")
+    run.add_argument("--distribution", choices=DISTRIBUTIONS, default="zipf")
+    run.add_argument("--zipf-exponent", type=float, default=1.0)
+    run.add_argument("--keys", type=int, default=10000, help="Distinct keys.")
+    run.add_argument("--read-ratio", type=float, default=0.9)
+    run.add_argument(
+        "--value-size",
+        type=_size_list,
+        default=[1024],
+        help="Comma-separated value sizes, e.g. 100B,4KB,1MB.",
+    )
+    run.add_argument(
+        "--concurrency",
+        type=_int_list,
+        default=[16],
+        help="Comma-separated concurrency levels, e.g. 1,16,64.",
+    )
+    run.add_argument("--operations", type=int, default=20000)
+    run.add_argument("--expire", type=int, help="Expiration of written values.")
+    run.add_argument(
+        "--no-preload",
+        dest="preload",
+        action="store_false",
+        help="Do not write every key before measuring.",
+    )
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--output", help="Write results to this file instead of stdout.")
+
+    compare = commands.add_parser(
+        "compare", help="Compare two result files and report regressions."
+    )
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Tolerated relative change (default: 0.1).",
+    )
+    decorator = commands.add_parser(
+        "decorator", help="Measure the per-call overhead of FastAPICache.cached."
+    )
+    decorator.add_argument("--iterations", type=int, default=20000)
+    decorator.add_argument("--mode", choices=MODES, action="append", dest="modes")
+    decorator.add_argument("--output", help="Write results to this file.")
+    decorator.add_argument(
+        "--baseline",
+        help="Compare against this results file and exit with status 1 on regressions.",
+    )
+    decorator.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Tolerated relative growth (default: 0.25).",
+    )
+
+    asgi = commands.add_parser(
+        "asgi", help="Measure in-process requests per second of cached endpoints."
+    )
+    asgi.add_argument(
+        "--endpoint", choices=tuple(ENDPOINTS), action="append", dest="endpoints"
+    )
+    asgi.add_argument("--requests", type=int, default=5000)
+    asgi.add_argument("--concurrency", type=int, default=32)
+    asgi.add_argument("--keys", type=int, default=100, help="Distinct item IDs.")
+    asgi.add_argument("--output", help="Write results to this file.")
+
+    replay = commands.add_parser(
+        "simulate",
+        help="Replay a recorded access trace against simulated in-memory caches.",
+    )
+    replay.add_argument("trace", help="NDJSON trace written by RecordingBackend.")
+    replay.add_argument(
+        "--sizes",
+        type=_capacity_list,
+        default=[None],
+        help="Comma-separated item limits, e.g. 1000,10000,unbounded.",
+    )
+    replay.add_argument(
+        "--ttls",
+        type=_ttl_list,
+        default=[None],
+        help="Comma-separated TTLs in seconds, or 'recorded', e.g. recorded,60,300.",
+    )
+    replay.add_argument(
+        "--policies",
+        type=_policy_list,
+        default=["lru"],
+        help="Comma-separated eviction policies, e.g. lru,gdsf.",
+    )
+    replay.add_argument(
+        "--cleanup-interval",
+        type=float,
+        default=30.0,
+        help="Trace seconds between cleanups of expired items (default: 30).",
+    )
+    replay.add_argument("--output", help="Write results to this file.")
+    return parser
+
+
+def _write(results: List[Dict[str, Any]], output: Optional[str]) -> None:
+    """
+    Write results as JSON to a file, or to stdout.
+    """
+    text = json.dumps({"results": results}, indent=2)
+    if output:
+        with open(output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+def _workloads(args: argparse.Namespace) -> List[Workload]:
+    """
+    Expand the command-line options into one workload per combination.
+    """
+    return [
+        Workload(
+            num_keys=args.keys,
+            distribution=args.distribution,
+            zipf_exponent=args.zipf_exponent,
+            read_ratio=args.read_ratio,
+            value_size=value_size,
+            concurrency=concurrency,
+            mode=args.mode,
+            operations=args.operations,
+            expire=args.expire,
+            preload=args.preload,
+            seed=args.seed,
+        )
+        for value_size, concurrency in itertools.product(
+            args.value_size, args.concurrency
+        )
+    ]
+
+
+async def _close(backend: CacheBackend) -> None:
+    """
+    Close a backend whether its close method is sync or async.
+    """
+    close = getattr(backend, "aclose", None) or getattr(backend, "close", None)
+    if close is not None:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+
+
+async def _run_all_async(
+    backend: CacheBackend, name: str, workloads: Sequence[Workload]
+) -> List[Dict[str, Any]]:
+    """
+    Run every async workload on one event loop, then close the backend.
+    """
+    results = []
+    try:
+        for workload in workloads:
+            await backend.aclear()
+            results.append(await run_async(backend, workload, name))
+    finally:
+        await backend.aclear()
+        await _close(backend)
+    return results
+
+
+def _run(args: argparse.Namespace) -> int:
+    backend, stack = create_backend(args.backend, args.url)
+    workloads = _workloads(args)
+    with stack:
+        if args.mode == "async":
+            results = asyncio.run(_run_all_async(backend, args.backend, workloads))
+        else:
+            results = []
+            try:
+                for workload in workloads:
+                    backend.clear()
+                    results.append(run_sync(backend, workload, args.backend))
+                backend.clear()
+            finally:
+                asyncio.run(_close(backend))
+
+    for result in results:
+        summary = result["operations"]["all"]
+        print(
+            f"{describe(result)}: {result['throughput']:.0f} ops/s, "
+            f"p50={summary['p50'] * 1e6:.0f}us p99={summary['p99'] * 1e6:.0f}us "
+            f"p999={summary['p999'] * 1e6:.0f}us errors={result['errors']}",
+            file=sys.stderr,
+        )
+
+    _write(results, args.output)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    with open(args.baseline) as file:
+        baseline = json.load(file)["results"]
+    with open(args.current) as file:
+        current = json.load(file)["results"]
+
+    regressions = compare_results(baseline, current, args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression['name']} {regression['metric']}: "
+            f"{regression['baseline']:.6g} -> {regression['current']:.6g} "
+            f"({regression['change']:+.1%})"
+        )
+    if not regressions:
+        print("No regressions.")
+    return 1 if regressions else 0
+
+
+def _decorator(args: argparse.Namespace) -> int:
+    modes = tuple(args.modes or MODES)
+    results = bench_decorator(iterations=args.iterations, modes=modes)
+    for result in results:
+        print(
+            f"{result['mode']:5} {result['path']:4} {result['shape']:10} "
+            f"{result['ns_per_call']:9.0f} ns/call  overhead {result['overhead_ns']:8.0f} ns",
+            file=sys.stderr,
+        )
+    _write(results, args.output)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as file:
+        baseline = json.load(file)["results"]
+    regressions = compare_decorator(baseline, results, args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression['name']}: relative cost "
+            f"{regression['baseline']:.3g} -> {regression['current']:.3g} "
+            f"({regression['change']:+.1%})",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+def _asgi(args: argparse.Namespace) -> int:
+    results = asyncio.run(
+        bench_asgi(
+            endpoints=tuple(args.endpoints or ENDPOINTS),
+            requests=args.requests,
+            concurrency=args.concurrency,
+            num_keys=args.keys,
+        )
+    )
+    for result in results:
+        latency = result["latency"]
+        print(
+            f"{result['endpoint']:13} {result['rps']:8.0f} req/s  "
+            f"p50={latency['p50'] * 1e6:.0f}us p99={latency['p99'] * 1e6:.0f}us "
+            f"errors={result['errors']}",
+            file=sys.stderr,
+        )
+    _write(results, args.output)
+    return 0
+
+
+def _simulate(args: argparse.Namespace) -> int:
+    results = simulate(
+        read_trace(args.trace),
+        max_sizes=args.sizes,
+        ttls=args.ttls,
+        policies=args.policies,
+        cleanup_interval=args.cleanup_interval,
+    )
+    for result in results:
+        size = "unbounded" if result["max_size"] is None else result["max_size"]
+        ttl = "recorded" if result["ttl"] is None else f"{result['ttl']:g}s"
+        print(
+            f"max_size={size:<10} ttl={ttl:<9} policy={result['policy']:<5} "
+            f"hit ratio {result['hit_ratio']:6.1%}  "
+            f"byte hit ratio {result['byte_hit_ratio']:6.1%}  "
+            f"saved {result['saved_compute_seconds']:.3f}s",
+            file=sys.stderr,
+        )
+    _write(results, args.output)
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point of ``python -m fast_cache.bench``.
+
+    Args:
+        argv (Optional[Sequence[str]]): Arguments; defaults to ``sys.argv[1:]``.
+
+    Returns:
+        int: Exit status; 1 if ``compare`` or ``decorator --baseline`` found
+        regressions.
+    """
+    args = build_parser().parse_args(argv)
+    commands = {
+        "run": _run,
+        "compare": _compare,
+        "decorator": _decorator,
+        "asgi": _asgi,
+        "simulate": _simulate,
+    }
+    return commands[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from fastapi import FastAPI
+
+from ..backends.backend import CacheBackend
+from ..backends.memory import InMemoryBackend
+from ..integration import FastAPICache
+from ..metrics import LatencyHistogram
+
+#: Endpoints of the benchmark app, by name.
+ENDPOINTS = {
+    "uncached": "/uncached/{}",
+    "cached_async": "/cached/{}",
+    "cached_sync": "/cached-sync/{}",
+}
+
+
+def build_app(
+    backend: Optional[CacheBackend] = None, payload_items: int = 20
+) -> FastAPI:
+    """
+    Build a FastAPI app with cached and uncached versions of the same endpoint.
+
+    Args:
+        backend (Optional[CacheBackend]): The cache backend; an `InMemoryBackend`
+            by default.
+        payload_items (int): Number of items in each JSON response.
+
+    Returns:
+        FastAPI: The app.
+    """
+    app = FastAPI()
+    cache = FastAPICache()
+    cache.init_app(
+        app, backend or InMemoryBackend(namespace="asgi-bench"), default_expire=300
+    )
+
+    def payload(item_id: int) -> Dict[str, Any]:
+        return {
+            "id": item_id,
+            "items": [{"n": i, "name": f"item-{i}"} for i in range(payload_items)],
+        }
+
+    @app.get("/uncached/{item_id}")
+    async def uncached(item_id: int):
+        return payload(item_id)
+
+    @app.get("/cached/{item_id}")
+    @cache.cached()
+    async def cached_async(item_id: int):
+        return payload(item_id)
+
+    @app.get("/cached-sync/{item_id}")
+    @cache.cached()
+    def cached_sync(item_id: int):
+        return payload(item_id)
+
+    return app
+
+
+async def asgi_get(app: Any, path: str) -> int:
+    """
+    Issue one GET request directly through the ASGI interface.
+
+    Args:
+        app (Any): The ASGI application.
+        path (str): The request path.
+
+    Returns:
+        int: The response status code.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def bench_asgi(
+    app: Optional[Any] = None,
+    endpoints: Sequence[str] = tuple(ENDPOINTS),
+    requests: int = 5000,
+    concurrency: int = 32,
+    num_keys: int = 100,
+) -> List[Dict[str, Any]]:
+    """
+    Measure requests per second and latency of endpoints, in process.
+
+    Requests go straight to the ASGI callable, without sockets or an HTTP
+    client, so the numbers show the cost of routing, caching and serialization.
+    Every key is requested once before measuring, so cached endpoints are
+    measured on hits.
+
+    Args:
+        app (Optional[Any]): The app to load; `build_app()` by default. It must
+            serve the paths in `ENDPOINTS`.
+        endpoints (Sequence[str]): Names from `ENDPOINTS` to measure.
+        requests (int): Requests per endpoint.
+        concurrency (int): Concurrent in-flight requests.
+        num_keys (int): Distinct item IDs requested round-robin.
+
+    Returns:
+        List[Dict[str, Any]]: One entry per endpoint with ``rps``, ``errors``
+        (non-200 responses) and a ``latency`` summary in seconds.
+    """
+    app = app or build_app()
+    results = []
+    for name in endpoints:
+        template = ENDPOINTS[name]
+        paths = [template.format(item_id) for item_id in range(num_keys)]
+        for path in paths:
+            await asgi_get(app, path)
+
+        histogram = LatencyHistogram()
+        errors = 0
+        counter = iter(range(requests))
+
+        async def worker() -> None:
+            nonlocal errors
+            for index in counter:
+                started = time.perf_counter()
+                status = await asgi_get(app, paths[index % num_keys])
+                histogram.record(time.perf_counter() - started)
+                if status != 200:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        results.append(
+            {
+                "endpoint": name,
+                "requests": requests,
+                "concurrency": concurrency,
+                "rps": requests / elapsed,
+                "errors": errors,
+                "latency": histogram.snapshot(),
+            }
+        )
+    return results
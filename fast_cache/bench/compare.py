@@ -0,0 +1,90 @@
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Latency quantiles compared between runs; higher is worse.
+_LATENCIES = ("p50", "p99", "p999")
+
+
+def result_id(result: Dict[str, Any]) -> Tuple:
+    """
+    Identify a result by backend and workload, ignoring the version.
+
+    Args:
+        result (Dict[str, Any]): A benchmark result.
+
+    Returns:
+        Tuple: A hashable identifier.
+    """
+    return (result["backend"],) + tuple(sorted(result["workload"].items()))
+
+
+def describe(result: Dict[str, Any]) -> str:
+    """
+    Return a short human-readable name for a result.
+
+    Args:
+        result (Dict[str, Any]): A benchmark result.
+
+    Returns:
+        str: E.g. ``"redis async zipf r=0.9 1024B x16"``.
+    """
+    workload = result["workload"]
+    return (
+        f"{result['backend']} {workload['mode']} {workload['distribution']} "
+        f"r={workload['read_ratio']} {workload['value_size']}B "
+        f"x{workload['concurrency']}"
+    )
+
+
+def compare_results(
+    baseline: Sequence[Dict[str, Any]],
+    current: Sequence[Dict[str, Any]],
+    threshold: float = 0.1,
+) -> List[Dict[str, Any]]:
+    """
+    Find regressions between two sets of benchmark results.
+
+    Results are matched by backend and workload. A regression is a drop in
+    throughput, or a rise in p50/p99/p999 latency, by more than ``threshold``.
+
+    Args:
+        baseline (Sequence[Dict[str, Any]]): Results of the reference version.
+        current (Sequence[Dict[str, Any]]): Results of the version under test.
+        threshold (float): Tolerated relative change. Defaults to 0.1 (10%).
+
+    Returns:
+        List[Dict[str, Any]]: One entry per regression with ``name``,
+        ``metric``, ``baseline``, ``current`` and relative ``change``.
+    """
+    reference = {result_id(result): result for result in baseline}
+    regressions = []
+    for result in current:
+        before = reference.get(result_id(result))
+        if before is None:
+            continue
+
+        checks = [("throughput", before["throughput"], result["throughput"], -1)]
+        for quantile in _LATENCIES:
+            checks.append(
+                (
+                    f"latency_{quantile}",
+                    before["operations"]["all"][quantile],
+                    result["operations"]["all"][quantile],
+                    1,
+                )
+            )
+
+        for metric, old, new, direction in checks:
+            if not old:
+                continue
+            change = (new - old) / old
+            if change * direction > threshold:
+                regressions.append(
+                    {
+                        "name": describe(result),
+                        "metric": metric,
+                        "baseline": old,
+                        "current": new,
+                        "change": change,
+                    }
+                )
+    return regressions
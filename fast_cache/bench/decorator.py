@@ -0,0 +1,255 @@
+import asyncio
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+from fastapi import FastAPI
+
+from ..backends.backend import CacheBackend
+from ..integration import FastAPICache
+
+#: Argument shapes the decorated function is called with.
+SHAPES: Dict[str, Tuple[tuple, dict]] = {
+    "no_args": ((), {}),
+    "positional": ((1, 2, 3), {}),
+    "keyword": ((), {"user_id": 42, "page": 3, "query": "shoes"}),
+    "large": (
+        (list(range(100)),),
+        {"filters": {f"field_{i}": i for i in range(20)}},
+    ),
+}
+
+#: Decorator paths measured; ``call`` is the undecorated function.
+PATHS = ("call", "hit", "miss", "skip")
+
+
+class DictBackend(CacheBackend):
+    """
+    Minimal dict-backed backend, so measurements isolate the decorator itself.
+
+    Args:
+        always_miss (bool): If True, lookups never find anything and writes are
+            discarded, so every call takes the miss path.
+    """
+
+    def __init__(self, always_miss: bool = False) -> None:
+        self._always_miss = always_miss
+        self._data: Dict[str, Any] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored value."""
+        return None if self._always_miss else self._data.get(key)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Return the stored value."""
+        return None if self._always_miss else self._data.get(key)
+
+    def set(
+        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+    ) -> None:
+        """Store a value; expiration is ignored."""
+        if not self._always_miss:
+            self._data[key] = value
+
+    async def aset(
+        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+    ) -> None:
+        """Store a value; expiration is ignored."""
+        self.set(key, value, expire)
+
+    def delete(self, key: str) -> None:
+        """Delete a value."""
+        self._data.pop(key, None)
+
+    async def adelete(self, key: str) -> None:
+        """Delete a value."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Delete all values."""
+        self._data.clear()
+
+    async def aclear(self) -> None:
+        """Delete all values."""
+        self._data.clear()
+
+    def has(self, key: str) -> bool:
+        """Check for a key."""
+        return key in self._data
+
+    async def ahas(self, key: str) -> bool:
+        """Check for a key."""
+        return key in self._data
+
+
+def _decorate(backend: CacheBackend, func: Callable) -> Callable:
+    """
+    Decorate ``func`` with a fresh `FastAPICache` using ``backend``.
+    """
+    cache = FastAPICache()
+    cache.init_app(FastAPI(), backend, default_expire=60)
+    return cache.cached()(func)
+
+
+def _functions(mode: str, path: str) -> Callable:
+    """
+    Return the function to time for a mode and path.
+    """
+
+    def compute(*args, **kwargs):
+        return 1
+
+    async def acompute(*args, **kwargs):
+        return 1
+
+    func = acompute if mode == "async" else compute
+    if path == "call":
+        return func
+    return _decorate(DictBackend(always_miss=path == "miss"), func)
+
+
+def _time_sync(
+    func: Callable, args: tuple, kwargs: Mapping[str, Any], iterations: int
+) -> float:
+    """
+    Return the best per-call time in nanoseconds over five rounds.
+    """
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter_ns()
+        for _ in range(iterations):
+            func(*args, **kwargs)
+        best = min(best, (time.perf_counter_ns() - started) / iterations)
+    return best
+
+
+async def _time_async(
+    func: Callable, args: tuple, kwargs: Mapping[str, Any], iterations: int
+) -> float:
+    """
+    Return the best per-call time in nanoseconds over five rounds.
+    """
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter_ns()
+        for _ in range(iterations):
+            await func(*args, **kwargs)
+        best = min(best, (time.perf_counter_ns() - started) / iterations)
+    return best
+
+
+def _calibrate(iterations: int) -> float:
+    """
+    Time a fixed piece of pure-Python work, as a yardstick for the machine's speed.
+
+    Args:
+        iterations (int): Calls per timing round.
+
+    Returns:
+        float: Best nanoseconds per call of the reference work.
+    """
+    args = (1, 2, 3)
+    kwargs = {"user_id": 42, "page": 3}
+
+    def work() -> str:
+        return f"{__name__}:work:{args!s}:{kwargs!s}"
+
+    return _time_sync(work, (), {}, iterations)
+
+
+def bench_decorator(
+    iterations: int = 20000,
+    modes: Tuple[str, ...] = ("sync", "async"),
+    shapes: Optional[Mapping[str, Tuple[tuple, dict]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Measure the per-call cost of `FastAPICache.cached` on its hot paths.
+
+    For every mode and argument shape the undecorated function (``call``) is
+    timed, then the decorated function on a cache ``hit``, a ``miss`` (lookup,
+    compute and write), and with ``skip_cache=True``. A minimal dict backend is
+    used so that the numbers reflect key building, argument handling, expire
+    resolution and backend dispatch rather than storage.
+
+    Args:
+        iterations (int): Calls per timing round; the best of five rounds is kept.
+        modes (Tuple[str, ...]): ``"sync"`` and/or ``"async"``.
+        shapes (Optional[Mapping[str, Tuple[tuple, dict]]]): Argument shapes;
+            defaults to `SHAPES`.
+
+    Returns:
+        List[Dict[str, Any]]: One entry per mode, path and shape with
+        ``ns_per_call``, ``overhead_ns`` (over the undecorated call) and
+        ``relative`` (``ns_per_call`` divided by the time of a fixed reference
+        workload, which makes results comparable across machines).
+    """
+    shapes = SHAPES if shapes is None else shapes
+    reference = _calibrate(iterations)
+    results = []
+    for mode in modes:
+        for shape, (args, kwargs) in shapes.items():
+            timings = {}
+            for path in PATHS:
+                func = _functions(mode, path)
+                call_kwargs = (
+                    dict(kwargs, skip_cache=True) if path == "skip" else kwargs
+                )
+                if mode == "async":
+                    timings[path] = asyncio.run(
+                        _time_async(func, args, call_kwargs, iterations)
+                    )
+                else:
+                    timings[path] = _time_sync(func, args, call_kwargs, iterations)
+
+            for path, ns_per_call in timings.items():
+                results.append(
+                    {
+                        "mode": mode,
+                        "path": path,
+                        "shape": shape,
+                        "ns_per_call": ns_per_call,
+                        "overhead_ns": ns_per_call - timings["call"],
+                        "relative": ns_per_call / reference,
+                    }
+                )
+    return results
+
+
+def compare_decorator(
+    baseline: List[Dict[str, Any]],
+    current: List[Dict[str, Any]],
+    threshold: float = 0.25,
+) -> List[Dict[str, Any]]:
+    """
+    Find decorator paths whose relative cost grew by more than ``threshold``.
+
+    Args:
+        baseline (List[Dict[str, Any]]): Results from `bench_decorator` to compare against.
+        current (List[Dict[str, Any]]): Results of the version under test.
+        threshold (float): Tolerated relative growth. Defaults to 0.25.
+
+    Returns:
+        List[Dict[str, Any]]: One entry per regression with ``name``,
+        ``baseline``, ``current`` and ``change``.
+    """
+    reference = {
+        (result["mode"], result["path"], result["shape"]): result["relative"]
+        for result in baseline
+    }
+    regressions = []
+    for result in current:
+        name = (result["mode"], result["path"], result["shape"])
+        before = reference.get(name)
+        if before is None or result["path"] == "call":
+            continue
+        change = (result["relative"] - before) / before
+        if change > threshold:
+            regressions.append(
+                {
+                    "name": " ".join(name),
+                    "baseline": before,
+                    "current": result["relative"],
+                    "change": change,
+                }
+            )
+    return regressions
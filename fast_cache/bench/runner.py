@@ -0,0 +1,217 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from ..backends.backend import CacheBackend
+from ..metrics import LatencyHistogram
+from .workload import Workload
+
+# Number of keys written per call while preloading.
+_PRELOAD_CHUNK = 500
+
+
+class _WorkerStats:
+    """
+    Latencies and counters collected by one worker.
+    """
+
+    def __init__(self) -> None:
+        self.latency = {"get": LatencyHistogram(), "set": LatencyHistogram()}
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+
+def _version() -> Optional[str]:
+    """
+    Return the installed package version, if it can be determined.
+    """
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover
+        return None
+    try:
+        return version("fastapi-cachekit")
+    except PackageNotFoundError:
+        return None
+
+
+def _summarize(
+    workload: Workload,
+    backend_name: str,
+    workers: List[_WorkerStats],
+    elapsed: float,
+) -> Dict[str, Any]:
+    """
+    Merge worker statistics into the JSON-serializable result.
+
+    Args:
+        workload (Workload): The workload that ran.
+        backend_name (str): Label of the backend under test.
+        workers (List[_WorkerStats]): Per-worker statistics.
+        elapsed (float): Wall-clock seconds of the measured phase.
+
+    Returns:
+        Dict[str, Any]: The benchmark result.
+    """
+    merged = {"get": LatencyHistogram(), "set": LatencyHistogram()}
+    total = LatencyHistogram()
+    hits = misses = errors = 0
+    for stats in workers:
+        for op, histogram in stats.latency.items():
+            merged[op].merge(histogram)
+            total.merge(histogram)
+        hits += stats.hits
+        misses += stats.misses
+        errors += stats.errors
+
+    operations = {op: histogram.snapshot() for op, histogram in merged.items()}
+    operations["all"] = total.snapshot()
+    return {
+        "backend": backend_name,
+        "version": _version(),
+        "workload": workload.to_dict(),
+        "elapsed": elapsed,
+        "throughput": total.count / elapsed if elapsed else 0.0,
+        "hits": hits,
+        "misses": misses,
+        "errors": errors,
+        "operations": operations,
+    }
+
+
+def _record(stats: _WorkerStats, op: str, started: float, result: Any) -> None:
+    """
+    Record one completed operation.
+    """
+    stats.latency[op].record(time.perf_counter() - started)
+    if op == "get":
+        if result is None:
+            stats.misses += 1
+        else:
+            stats.hits += 1
+
+
+async def run_async(
+    backend: CacheBackend, workload: Workload, backend_name: str = ""
+) -> Dict[str, Any]:
+    """
+    Run a workload with the backend's async methods on the running event loop.
+
+    Args:
+        backend (CacheBackend): The backend under test.
+        workload (Workload): The workload to run.
+        backend_name (str): Label recorded in the result.
+
+    Returns:
+        Dict[str, Any]: The benchmark result; see `run_workload`.
+    """
+    value = workload.value()
+    if workload.preload:
+        keys = [workload.key(i) for i in range(workload.num_keys)]
+        for start in range(0, len(keys), _PRELOAD_CHUNK):
+            await backend.aset_many(
+                {key: value for key in keys[start : start + _PRELOAD_CHUNK]},
+                expire=workload.expire,
+            )
+
+    plans = [workload.plan(worker) for worker in range(workload.concurrency)]
+    workers = [_WorkerStats() for _ in plans]
+
+    async def worker(plan: List[tuple], stats: _WorkerStats) -> None:
+        for op, key in plan:
+            started = time.perf_counter()
+            try:
+                if op == "get":
+                    result = await backend.aget(key)
+                else:
+                    result = await backend.aset(key, value, expire=workload.expire)
+            except Exception:
+                stats.errors += 1
+                continue
+            _record(stats, op, started, result)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(plan, stats) for plan, stats in zip(plans, workers)))
+    elapsed = time.perf_counter() - started
+    return _summarize(workload, backend_name, workers, elapsed)
+
+
+def run_sync(
+    backend: CacheBackend, workload: Workload, backend_name: str = ""
+) -> Dict[str, Any]:
+    """
+    Run a workload with the backend's sync methods on a pool of threads.
+
+    Args:
+        backend (CacheBackend): The backend under test.
+        workload (Workload): The workload to run.
+        backend_name (str): Label recorded in the result.
+
+    Returns:
+        Dict[str, Any]: The benchmark result; see `run_workload`.
+    """
+    value = workload.value()
+    if workload.preload:
+        keys = [workload.key(i) for i in range(workload.num_keys)]
+        for start in range(0, len(keys), _PRELOAD_CHUNK):
+            backend.set_many(
+                {key: value for key in keys[start : start + _PRELOAD_CHUNK]},
+                expire=workload.expire,
+            )
+
+    plans = [workload.plan(worker) for worker in range(workload.concurrency)]
+    workers = [_WorkerStats() for _ in plans]
+    barrier = threading.Barrier(workload.concurrency + 1)
+
+    def worker(plan: List[tuple], stats: _WorkerStats) -> None:
+        barrier.wait()
+        for op, key in plan:
+            started = time.perf_counter()
+            try:
+                if op == "get":
+                    result = backend.get(key)
+                else:
+                    result = backend.set(key, value, expire=workload.expire)
+            except Exception:
+                stats.errors += 1
+                continue
+            _record(stats, op, started, result)
+
+    with ThreadPoolExecutor(max_workers=workload.concurrency) as executor:
+        futures = [
+            executor.submit(worker, plan, stats) for plan, stats in zip(plans, workers)
+        ]
+        barrier.wait()
+        started = time.perf_counter()
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - started
+    return _summarize(workload, backend_name, workers, elapsed)
+
+
+def run_workload(
+    backend: CacheBackend, workload: Workload, backend_name: str = ""
+) -> Dict[str, Any]:
+    """
+    Run a workload against a backend and measure throughput and latency.
+
+    Async workloads run in a new event loop, so this must not be called from
+    a running loop; use `run_async` there.
+
+    Args:
+        backend (CacheBackend): The backend under test.
+        workload (Workload): The workload to run.
+        backend_name (str): Label recorded in the result.
+
+    Returns:
+        Dict[str, Any]: ``backend``, ``version``, ``workload`` options,
+        ``elapsed`` seconds, ``throughput`` in operations per second, ``hits``,
+        ``misses``, ``errors``, and per-operation (``get``, ``set``, ``all``)
+        latency summaries with ``p50``, ``p99`` and ``p999`` in seconds.
+    """
+    if workload.mode == "async":
+        return asyncio.run(run_async(backend, workload, backend_name))
+    return run_sync(backend, workload, backend_name)
@@ -0,0 +1,204 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from ..backends.memory import InMemoryBackend
+from ..recording import TraceRecord
+
+
+class VirtualClock:
+    """
+    Clock whose time only moves when the replay advances it.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Replay:
+    """
+    Replay state of one simulated cache configuration.
+
+    Args:
+        max_size (Optional[int]): Item limit of the simulated cache.
+        ttl (Optional[float]): TTL applied to every write, or None to keep the
+            recorded TTLs.
+        policy (str): Eviction policy of the simulated cache.
+        clock (VirtualClock): The shared replay clock.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int],
+        ttl: Optional[float],
+        policy: str,
+        clock: VirtualClock,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.policy = policy
+        # Simulated values are their recorded sizes.
+        self.backend = InMemoryBackend(
+            namespace="simulation",
+            max_size=max_size,
+            cleanup_interval=None,
+            clock=clock,
+            eviction=policy,
+            sizer=lambda size: size,
+        )
+        self.requests = 0
+        self.hits = 0
+        self.bytes_requested = 0
+        self.bytes_hit = 0
+
+    def apply(
+        self,
+        record: TraceRecord,
+        size: int,
+        ttl: Optional[float],
+        cost: Optional[float],
+    ) -> None:
+        """
+        Apply one record to the simulated cache.
+
+        Args:
+            record (TraceRecord): The record.
+            size (int): The best known value size of the record's key.
+            ttl (Optional[float]): The last TTL written for the record's key.
+            cost (Optional[float]): The last recompute cost recorded for the
+                record's key.
+        """
+        if self.ttl is not None:
+            ttl = self.ttl
+        if record.op == "get":
+            self.requests += 1
+            self.bytes_requested += size
+            if self.backend.get(record.key) is not None:
+                self.hits += 1
+                self.bytes_hit += size
+            elif record.hit:
+                # Production hit, so no write follows in the trace; fill the
+                # simulated cache as the application would after its miss.
+                self.backend.set(record.key, size, expire=ttl, cost=cost)
+        elif record.op == "set":
+            self.backend.set(record.key, size, expire=ttl, cost=cost)
+        elif record.op == "has":
+            self.backend.has(record.key)
+        elif record.op == "touch":
+            self.backend.touch(record.key, ttl)
+        elif record.op == "delete":
+            self.backend.delete(record.key)
+        elif record.op == "clear":
+            self.backend.clear()
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Summarize the replay.
+
+        Returns:
+            Dict[str, Any]: The configuration, its hit ratios and the compute
+            time its hits saved.
+        """
+        saved = self.backend.stats()["saved_compute_seconds"]
+        self.backend.close()
+        return {
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "policy": self.policy,
+            "requests": self.requests,
+            "hits": self.hits,
+            "hit_ratio": self.hits / self.requests if self.requests else 0.0,
+            "bytes_requested": self.bytes_requested,
+            "bytes_hit": self.bytes_hit,
+            "byte_hit_ratio": (
+                self.bytes_hit / self.bytes_requested if self.bytes_requested else 0.0
+            ),
+            "saved_compute_seconds": saved,
+        }
+
+
+def simulate(
+    records: Iterable[TraceRecord],
+    max_sizes: Sequence[Optional[int]] = (None,),
+    ttls: Sequence[Optional[float]] = (None,),
+    policies: Sequence[str] = ("lru",),
+    cleanup_interval: Optional[float] = 30.0,
+) -> List[Dict[str, Any]]:
+    """
+    Replay an access trace against simulated `InMemoryBackend` caches.
+
+    Every combination of ``max_sizes``, ``ttls`` and ``policies`` is simulated in a single
+    pass over the records, so traces can be streamed from disk. Each
+    simulated cache uses a virtual clock driven by the record timestamps, so
+    TTLs expire as they would have in production regardless of how fast the
+    replay runs, and the periodic cleanup job runs every ``cleanup_interval``
+    seconds of trace time.
+
+    Args:
+        records (Iterable[TraceRecord]): The trace, in timestamp order.
+        max_sizes (Sequence[Optional[int]]): Item limits to simulate; None
+            means unbounded.
+        ttls (Sequence[Optional[float]]): TTLs in seconds applied to every
+            write; None keeps the TTLs recorded in the trace.
+        policies (Sequence[str]): Eviction policies to simulate, ``"lru"``
+            or ``"gdsf"``.
+        cleanup_interval (Optional[float]): Trace seconds between cleanups of
+            expired items, or None to only remove them on access.
+
+    Returns:
+        List[Dict[str, Any]]: One result per configuration with ``max_size``,
+        ``ttl``, ``policy``, ``requests``, ``hits``, ``hit_ratio``,
+        ``bytes_requested``, ``bytes_hit``, ``byte_hit_ratio`` and
+        ``saved_compute_seconds``.
+
+    Notes:
+        - Only ``get`` records count as requests; ``set`` records are replayed
+          as writes, as a decorated function writes after a miss. When a
+          simulated cache misses a key that was a hit in production, the trace
+          has no write to replay, so the key is filled with its last recorded
+          size and TTL.
+        - The size of a requested value is the size recorded with the hit, or
+          else the last size written for the key. Misses on keys never seen
+          with a value count zero bytes.
+        - Writes carry the last cost recorded for their key, so
+          ``saved_compute_seconds`` sums the recompute time of the simulated
+          hits and ``"gdsf"`` weighs entries as it would in production.
+          Values are sized by their recorded size.
+    """
+    clock = VirtualClock()
+    replays = [
+        _Replay(max_size, ttl, policy, clock)
+        for max_size in max_sizes
+        for ttl in ttls
+        for policy in policies
+    ]
+    sizes: Dict[str, int] = {}
+    costs: Dict[str, float] = {}
+    ttls_by_key: Dict[str, Optional[float]] = {}
+    next_cleanup: Optional[float] = None
+
+    for record in records:
+        clock.now = record.ts
+        if cleanup_interval is not None:
+            if next_cleanup is None:
+                next_cleanup = record.ts + cleanup_interval
+            if record.ts >= next_cleanup:
+                for replay in replays:
+                    replay.backend._run_cleanup_job()
+                missed = (record.ts - next_cleanup) // cleanup_interval
+                next_cleanup += (missed + 1) * cleanup_interval
+
+        if record.size:
+            sizes[record.key] = record.size
+        if record.cost is not None:
+            costs[record.key] = record.cost
+        if record.op in ("set", "touch"):
+            ttls_by_key[record.key] = record.ttl
+        size = sizes.get(record.key, 0)
+        ttl = ttls_by_key.get(record.key)
+        cost = costs.get(record.key)
+        for replay in replays:
+            replay.apply(record, size, ttl, cost)
+
+    return [replay.result() for replay in replays]
@@ -0,0 +1,184 @@
+import bisect
+import functools
+import itertools
+import random
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+DISTRIBUTIONS = ("uniform", "zipf")
+MODES = ("async", "sync")
+
+_SIZE_UNITS = {"": 1, "b": 1, "kb": 1024, "mb": 1024**2}
+
+
+def parse_size(size: str) -> int:
+    """
+    Parse a human-readable size such as ``"100"``, ``"4KB"`` or ``"1MB"``.
+
+    Args:
+        size (str): The size; units are B, KB and MB (powers of 1024).
+
+    Returns:
+        int: The size in bytes.
+
+    Raises:
+        ValueError: If the size cannot be parsed.
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*([kKmM]?[bB]?)\s*", str(size))
+    if match is None:
+        raise ValueError(f"Invalid size {size!r}; expected e.g. 100, 4KB or 1MB")
+    return int(match.group(1)) * _SIZE_UNITS[match.group(2).lower()]
+
+
+@functools.lru_cache(maxsize=8)
+def _zipf_cdf(num_keys: int, exponent: float) -> List[float]:
+    """
+    Return the cumulative Zipf weights of ``num_keys`` keys, shared by all workers.
+    """
+    return list(
+        itertools.accumulate(1.0 / (i + 1) ** exponent for i in range(num_keys))
+    )
+
+
+def zipf_sampler(
+    num_keys: int, exponent: float, rng: random.Random
+) -> Callable[[], int]:
+    """
+    Build a sampler of key indexes following a Zipf distribution.
+
+    Index ``i`` is drawn with probability proportional to ``1 / (i + 1) ** exponent``,
+    so a few hot keys receive most of the traffic.
+
+    Args:
+        num_keys (int): Number of distinct keys.
+        exponent (float): Skew; larger values concentrate traffic on fewer keys.
+        rng (random.Random): Source of randomness.
+
+    Returns:
+        Callable[[], int]: A function returning one index per call.
+    """
+    cumulative = _zipf_cdf(num_keys, exponent)
+    total = cumulative[-1]
+
+    def sample() -> int:
+        return bisect.bisect_left(cumulative, rng.random() * total)
+
+    return sample
+
+
+class Workload:
+    """
+    Description of a benchmark workload.
+
+    Args:
+        num_keys (int): Number of distinct keys. Defaults to 10000.
+        distribution (str): ``"zipf"`` or ``"uniform"`` key popularity.
+            Defaults to ``"zipf"``.
+        zipf_exponent (float): Skew of the Zipf distribution. Defaults to 1.0.
+        read_ratio (float): Fraction of operations that are reads; the rest are
+            writes. Defaults to 0.9.
+        value_size (int): Size of written values in bytes. Defaults to 1024.
+        concurrency (int): Concurrent tasks (async) or threads (sync). Defaults to 16.
+        mode (str): ``"async"`` uses the backend's async methods on one event
+            loop, ``"sync"`` its sync methods on a thread pool. Defaults to ``"async"``.
+        operations (int): Total operations to perform. Defaults to 20000.
+        expire (Optional[int]): Expiration in seconds for written values.
+        preload (bool): Write every key once before measuring, so reads hit.
+            Defaults to True.
+        seed (int): Random seed, for reproducible key sequences. Defaults to 0.
+
+    Raises:
+        ValueError: If an option is out of range.
+    """
+
+    def __init__(
+        self,
+        num_keys: int = 10000,
+        distribution: str = "zipf",
+        zipf_exponent: float = 1.0,
+        read_ratio: float = 0.9,
+        value_size: int = 1024,
+        concurrency: int = 16,
+        mode: str = "async",
+        operations: int = 20000,
+        expire: Optional[int] = None,
+        preload: bool = True,
+        seed: int = 0,
+    ) -> None:
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of {DISTRIBUTIONS}")
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}")
+        if not 0.0 <= read_ratio <= 1.0:
+            raise ValueError("read_ratio must be between 0 and 1")
+        if num_keys < 1 or concurrency < 1 or operations < 1:
+            raise ValueError("num_keys, concurrency and operations must be positive")
+
+        self.num_keys = num_keys
+        self.distribution = distribution
+        self.zipf_exponent = zipf_exponent
+        self.read_ratio = read_ratio
+        self.value_size = value_size
+        self.concurrency = concurrency
+        self.mode = mode
+        self.operations = operations
+        self.expire = expire
+        self.preload = preload
+        self.seed = seed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the workload options, as recorded in benchmark results.
+
+        Returns:
+            Dict[str, Any]: Option names and values.
+        """
+        return dict(vars(self))
+
+    def key(self, index: int) -> str:
+        """
+        Return the cache key for a key index.
+
+        Args:
+            index (int): The key index.
+
+        Returns:
+            str: The key.
+        """
+        return f"bench:{index}"
+
+    def value(self) -> bytes:
+        """
+        Return a value of the configured size.
+
+        Returns:
+            bytes: The value.
+        """
+        return b"x" * self.value_size
+
+    def plan(self, worker: int) -> List[tuple]:
+        """
+        Pre-generate the operations of one worker.
+
+        Generating operations up front keeps random sampling out of the
+        measured latencies.
+
+        Args:
+            worker (int): The worker number.
+
+        Returns:
+            List[tuple]: ``("get", key)`` and ``("set", key)`` tuples.
+        """
+        rng = random.Random(self.seed * 1_000_003 + worker)
+        if self.distribution == "zipf":
+            sample = zipf_sampler(self.num_keys, self.zipf_exponent, rng)
+        else:
+            sample = lambda: rng.randrange(self.num_keys)  # noqa: E731
+
+        count = self.operations // self.concurrency
+        if worker < self.operations % self.concurrency:
+            count += 1
+        return [
+            ("get" if rng.random() < self.read_ratio else "set", self.key(sample()))
+            for _ in range(count)
+        ]
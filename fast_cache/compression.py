@@ -0,0 +1,275 @@
+import gzip
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+
+
+def _load_encoders() -> Dict[str, Callable[[bytes], bytes]]:
+    """
+    Build the table of supported content encoders.
+
+    gzip is always available. Brotli and Zstandard are used when their
+    optional packages are installed.
+
+    Returns:
+        Dict[str, Callable[[bytes], bytes]]: Mapping of encoding name to encoder.
+    """
+    encoders: Dict[str, Callable[[bytes], bytes]] = {}
+
+    try:
+        import brotli
+
+        encoders["br"] = lambda data: brotli.compress(data, quality=5)
+    except ImportError:
+        pass
+
+    try:
+        import zstandard
+
+        encoders["zstd"] = lambda data: zstandard.ZstdCompressor(level=3).compress(data)
+    except ImportError:
+        pass
+
+    encoders["gzip"] = lambda data: gzip.compress(data, compresslevel=6, mtime=0)
+    return encoders
+
+
+_ENCODERS = _load_encoders()
+
+# Server-side preference, used to break ties between equal q-values.
+_PREFERENCE = ("br", "zstd", "gzip")
+
+# Bodies smaller than this are not worth compressing (same default as
+# Starlette's GZipMiddleware).
+MINIMUM_SIZE = 500
+
+# Response headers that are not stored: the body framing is rebuilt for each
+# variant, and cookies belong to the client the response was computed for.
+_UNCACHED_HEADERS = ("content-length", "content-encoding", "vary", "set-cookie")
+
+
+def available_encodings() -> tuple:
+    """
+    Return the content encodings that can be produced in this environment.
+
+    Returns:
+        tuple: Encoding names in server preference order.
+    """
+    return tuple(name for name in _PREFERENCE if name in _ENCODERS)
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """
+    Parse an ``Accept-Encoding`` header into a mapping of encoding to q-value.
+
+    Args:
+        header (Optional[str]): The raw header value.
+
+    Returns:
+        Dict[str, float]: Encodings with their quality values. Entries with
+        ``q=0`` are kept so that explicit refusals can be honoured.
+    """
+    accepted: Dict[str, float] = {}
+    if not header:
+        return accepted
+
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+    return accepted
+
+
+def select_encoding(header: Optional[str], candidates: Iterable[str]) -> Optional[str]:
+    """
+    Pick the best content encoding for a request.
+
+    Args:
+        header (Optional[str]): The request ``Accept-Encoding`` header.
+        candidates (Iterable[str]): Encodings the server is willing to send.
+
+    Returns:
+        Optional[str]: The chosen encoding, or None to send the identity body.
+    """
+    accepted = parse_accept_encoding(header)
+    if not accepted:
+        return None
+
+    wildcard = accepted.get("*", 0.0)
+    best: Optional[str] = None
+    best_q = 0.0
+    for name in candidates:
+        q = accepted.get(name, wildcard)
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+class CachedResponse:
+    """
+    A rendered HTTP response stored in the cache together with its encoded variants.
+
+    The identity body is rendered once on a cache miss. Compressed variants are
+    produced either eagerly at write time or lazily the first time a client asks
+    for a given encoding, so cache hits never pay for compression.
+
+    Attributes:
+        body (bytes): The identity (uncompressed) response body.
+        status_code (int): HTTP status code.
+        media_type (Optional[str]): The response media type.
+        headers (List[Tuple[str, str]]): Response headers to replay on hits,
+            as ``(name, value)`` pairs so repeated headers are kept.
+        variants (Dict[str, bytes]): Encoded bodies keyed by encoding name.
+        created_at (float): Unix timestamp at which the body was rendered.
+    """
+
+    __slots__ = (
+        "body",
+        "status_code",
+        "media_type",
+        "headers",
+        "variants",
+        "created_at",
+    )
+
+    def __init__(
+        self,
+        body: bytes,
+        status_code: int = 200,
+        media_type: Optional[str] = None,
+        headers: Optional[Sequence[Tuple[str, str]]] = None,
+    ) -> None:
+        self.body = body
+        self.status_code = status_code
+        self.media_type = media_type
+        self.headers = list(headers or ())
+        self.variants: Dict[str, bytes] = {}
+        self.created_at = time.time()
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @classmethod
+    def from_result(cls, result: Any) -> "CachedResponse":
+        """
+        Render an endpoint return value into a cacheable response.
+
+        Args:
+            result (Any): A Starlette ``Response`` or any JSON-encodable value.
+
+        Returns:
+            CachedResponse: The rendered response.
+
+        Raises:
+            TypeError: If ``result`` is a response without a body, such as a
+                ``StreamingResponse`` or ``FileResponse``.
+
+        Notes:
+            - ``Set-Cookie`` headers are not stored, so one client's cookies are
+              never replayed to others; see `set_cookies`.
+        """
+        if not isinstance(result, Response):
+            result = JSONResponse(content=jsonable_encoder(result))
+        elif not hasattr(result, "body"):
+            raise TypeError(
+                f"Cannot cache a {type(result).__name__} with encodings; "
+                "return a Response with a body or drop encodings="
+            )
+
+        headers = [
+            (k, v)
+            for k, v in result.headers.items()
+            if k.lower() not in _UNCACHED_HEADERS
+        ]
+        return cls(
+            body=bytes(result.body),
+            status_code=result.status_code,
+            media_type=result.media_type,
+            headers=headers,
+        )
+
+    def compressible(self, encodings: Sequence[str]) -> tuple:
+        """
+        Return the requested encodings this response can be served with.
+
+        Args:
+            encodings (Sequence[str]): Encodings configured on the decorator.
+
+        Returns:
+            tuple: Encodings that are both installed and worth applying.
+        """
+        if len(self.body) < MINIMUM_SIZE:
+            return ()
+        return tuple(name for name in encodings if name in _ENCODERS)
+
+    def encode(self, encoding: str) -> bool:
+        """
+        Produce the variant for ``encoding`` if it is not stored yet.
+
+        Args:
+            encoding (str): The encoding name.
+
+        Returns:
+            bool: True if a new variant was produced, False if it already existed.
+        """
+        if encoding in self.variants:
+            return False
+        self.variants[encoding] = _ENCODERS[encoding](self.body)
+        return True
+
+    def to_response(self, encoding: Optional[str]) -> Response:
+        """
+        Build a Starlette response for the chosen encoding.
+
+        Args:
+            encoding (Optional[str]): The encoding to send, or None for identity.
+
+        Returns:
+            Response: The response, with ``Content-Encoding`` and ``Vary`` set.
+        """
+        body = self.variants[encoding] if encoding is not None else self.body
+        typed = any(name.lower() == "content-type" for name, _ in self.headers)
+        response = Response(
+            content=body,
+            status_code=self.status_code,
+            media_type=None if typed else self.media_type,
+        )
+        for name, value in self.headers:
+            response.headers.append(name, value)
+        response.headers.append("vary", "Accept-Encoding")
+        if encoding is not None:
+            response.headers.append("content-encoding", encoding)
+        return response
+
+
+def set_cookies(result: Any) -> List[str]:
+    """
+    Return the ``Set-Cookie`` values of an endpoint return value.
+
+    `CachedResponse` does not store cookies, so the response computed on a
+    miss adds them back for the client that caused it.
+
+    Args:
+        result (Any): The endpoint return value.
+
+    Returns:
+        List[str]: The cookie headers, empty unless ``result`` is a response.
+    """
+    if not isinstance(result, Response):
+        return []
+    return result.headers.getlist("set-cookie")
@@ -1,10 +1,117 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from typing import Optional, Callable, Union, AsyncIterator, Any
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, Response
+from typing import Optional, Callable, Union, AsyncIterator, Any, Sequence, Tuple
 from datetime import timedelta
+import asyncio
+import functools
+import hashlib
 import inspect
+import math
+import time
 from functools import wraps
-from .backends.backend import CacheBackend
+from .backends.backend import CacheBackend, _cost_kwargs, _tag_kwargs
+from .batch import BatchLoader
+from .write_behind import WriteBehindQueue
+from .refresh_ahead import RefreshAheadScheduler
+from .metrics import CacheMetrics, PROMETHEUS_CONTENT_TYPE
+from .tracing import CacheObserver, OperationEvent, Tracer
+from .backends.metrics import MetricsBackend
+from .backends.tracing import TracingBackend
+from .compression import CachedResponse, select_encoding, set_cookies
+
+
+def _request_parameter(func: Callable) -> Tuple[str, bool]:
+    """
+    Find the parameter through which FastAPI passes the current `Request`.
+
+    Args:
+        func (Callable): The endpoint function.
+
+    Returns:
+        Tuple[str, bool]: The parameter name, and True if it has to be injected
+        into the wrapper signature because the endpoint does not declare one.
+    """
+    for param in inspect.signature(func).parameters.values():
+        if inspect.isclass(param.annotation) and issubclass(param.annotation, Request):
+            return param.name, False
+    return "fast_cache_request", True
+
+
+def _inject_request_parameter(wrapper: Callable, func: Callable, name: str) -> None:
+    """
+    Add a keyword-only `Request` parameter to the signature FastAPI sees.
+
+    Args:
+        wrapper (Callable): The wrapper registered as the endpoint.
+        func (Callable): The original endpoint function.
+        name (str): Name of the injected parameter.
+    """
+    signature = inspect.signature(func)
+    params = list(signature.parameters.values())
+    injected = inspect.Parameter(
+        name, inspect.Parameter.KEYWORD_ONLY, annotation=Request
+    )
+    if params and params[-1].kind is inspect.Parameter.VAR_KEYWORD:
+        params.insert(len(params) - 1, injected)
+    else:
+        params.append(injected)
+    wrapper.__signature__ = signature.replace(parameters=params)
+
+
+_MISSING = object()
+
+
+def _dependency_key_parts(
+    request: Request,
+    headers: Sequence[str],
+    path_params: Sequence[str],
+    query_params: Sequence[str],
+    key_builder: Optional[Callable[[Request], str]],
+) -> str:
+    """
+    Extract the request fields a cached dependency depends on.
+
+    Args:
+        request (Request): The current request.
+        headers (Sequence[str]): Header names to include.
+        path_params (Sequence[str]): Path parameter names to include.
+        query_params (Sequence[str]): Query parameter names to include.
+        key_builder (Optional[Callable[[Request], str]]): Custom extractor.
+
+    Returns:
+        str: A SHA-256 digest of the extracted fields, so that secrets such as
+        bearer tokens never appear verbatim in cache keys.
+    """
+    parts = [f"h:{name.lower()}={request.headers.get(name, '')}" for name in headers]
+    parts.extend(
+        f"p:{name}={request.path_params.get(name, '')}" for name in path_params
+    )
+    parts.extend(
+        f"q:{name}={request.query_params.get(name, '')}" for name in query_params
+    )
+    if key_builder is not None:
+        parts.append(f"k:{key_builder(request)}")
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def _remaining_expire(
+    expire: Optional[Union[int, timedelta]], created_at: float
+) -> Optional[int]:
+    """
+    Compute how much of an entry's lifetime is left, for write-backs.
+
+    Args:
+        expire (Optional[Union[int, timedelta]]): The configured expiration.
+        created_at (float): Unix timestamp at which the entry was created.
+
+    Returns:
+        Optional[int]: Remaining seconds (at least 1), or None if no expiration.
+    """
+    if expire is None:
+        return None
+    seconds = expire.total_seconds() if isinstance(expire, timedelta) else expire
+    return max(1, math.ceil(seconds - (time.time() - created_at)))
 
 
 class FastAPICache:
@@ -22,6 +129,10 @@ class FastAPICache:
         self._backend: Optional[CacheBackend] = None
         self._app: Optional[FastAPI] = None
         self._default_expire: Optional[Union[int, timedelta]] = None
+        self._write_behind: Optional[WriteBehindQueue] = None
+        self._refresh_ahead: Optional[RefreshAheadScheduler] = None
+        self._metrics: Optional[CacheMetrics] = None
+        self._tracer: Optional[Tracer] = None
 
     def get_cache(self) -> CacheBackend:
         """
@@ -42,6 +153,14 @@ class FastAPICache:
         expire: Optional[Union[int, timedelta]] = None,
         key_builder: Optional[Callable[..., str]] = None,
         namespace: Optional[str] = None,
+        encodings: Optional[Sequence[str]] = None,
+        lazy_encoding: bool = False,
+        write_behind: bool = False,
+        lock_timeout: Optional[float] = None,
+        sliding: bool = False,
+        tags: Optional[Union[Sequence[str], Callable[..., Sequence[str]]]] = None,
+        refresh_ahead: Optional[int] = None,
+        stale_ttl: float = 0.0,
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         """
         Decorator for caching function results.
@@ -50,10 +169,49 @@ class FastAPICache:
             expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as a timedelta.
             key_builder (Optional[Callable[..., str]]): Custom function to build the cache key.
             namespace (Optional[str]): Optional namespace for the cache key.
+            encodings (Optional[Sequence[str]]): Only for FastAPI endpoints. When set
+                (e.g. ``("br", "zstd", "gzip")``), the rendered response is cached
+                together with pre-compressed variants, and hits are served with the
+                best variant for the request's ``Accept-Encoding`` header.
+                Encodings whose optional package is not installed are skipped.
+            lazy_encoding (bool): If True, compressed variants are produced on the
+                first request asking for each encoding instead of at write time.
+            write_behind (bool): Only for async functions. If True, results are
+                handed to the background write-behind queue on a miss instead of
+                being written before the function returns.
+            lock_timeout (Optional[float]): If set, misses go through
+                `CacheBackend.get_or_set`: one caller computes the result under
+                the key's lock while concurrent callers wait up to this many
+                seconds for it. Results are then written before the lock is
+                released, so ``write_behind`` does not apply.
+            sliding (bool): If True, every hit restarts the entry's expiration
+                (`CacheBackend.get_and_touch`), so entries expire only after
+                ``expire`` seconds without being read.
+            tags (Optional[Union[Sequence[str], Callable[..., Sequence[str]]]]):
+                Tags stored with every result, so `CacheBackend.invalidate_tags`
+                can drop them together. A callable is called with the same
+                arguments as ``key_builder`` and returns the tags of that call,
+                e.g. ``lambda product_id: [f"product:{product_id}"]``. Tagged
+                results are written directly, so ``write_behind`` does not apply.
+            refresh_ahead (Optional[int]): If set, keys read at least this many
+                times within one expiration period are handed to the
+                `RefreshAheadScheduler`, which recomputes them in the background
+                shortly before they expire, so hot keys stay warm without a
+                caller paying the recompute. Keys read less often between two
+                refreshes drop out. Requires an expiration; not applied to
+                endpoints that take the `Request` themselves.
+            stale_ttl (float): Only with ``lock_timeout``. Seconds a result
+                stays servable after ``expire`` while one caller recomputes
+                it; see `CacheBackend.get_or_set`. Defaults to 0.
 
         Returns:
             Callable: A decorator that caches the function result.
+
+        Raises:
+            ValueError: If ``stale_ttl`` is set without ``lock_timeout``.
         """
+        if stale_ttl and lock_timeout is None:
+            raise ValueError("stale_ttl requires lock_timeout")
 
         def decorator(func: Callable) -> Callable[..., Any]:
             """
@@ -66,6 +224,14 @@ class FastAPICache:
                 Callable: The wrapped function with caching.
             """
             is_async = inspect.iscoroutinefunction(func)
+            request_param, inject_request = (
+                _request_parameter(func) if encodings else (None, False)
+            )
+            function_label = f"{func.__module__}:{func.__qualname__}"
+            # Endpoints reading the request cannot be recomputed without one.
+            refreshable = refresh_ahead is not None and (
+                request_param is None or inject_request
+            )
 
             def build_cache_key(*args, **kwargs) -> str:
                 """
@@ -89,6 +255,447 @@ class FastAPICache:
 
                 return key
 
+            def build_tags(*args, **kwargs) -> Optional[Sequence[str]]:
+                """
+                Resolve the tags of a function call.
+
+                Args:
+                    *args: Positional arguments for the function.
+                    **kwargs: Keyword arguments for the function.
+
+                Returns:
+                    Optional[Sequence[str]]: The tags, or None if untagged.
+                """
+                if callable(tags):
+                    return tags(*args, **kwargs)
+                return tags
+
+            def split_request(kwargs: dict) -> Tuple[Optional[Request], dict]:
+                """
+                Separate the current request from the arguments used for the key.
+
+                Args:
+                    kwargs (dict): Keyword arguments of the call.
+
+                Returns:
+                    Tuple[Optional[Request], dict]: The request (if any) and the
+                    keyword arguments without it.
+                """
+                if request_param is None:
+                    return None, kwargs
+                if inject_request:
+                    return kwargs.pop(request_param, None), kwargs
+                key_kwargs = dict(kwargs)
+                return key_kwargs.pop(request_param, None), key_kwargs
+
+            def render(result: Any) -> CachedResponse:
+                """
+                Render a computed result and, unless lazy, all of its variants.
+
+                Args:
+                    result (Any): The endpoint return value.
+
+                Returns:
+                    CachedResponse: The response to cache.
+                """
+                entry = CachedResponse.from_result(result)
+                if not lazy_encoding:
+                    for name in entry.compressible(encodings):
+                        entry.encode(name)
+                return entry
+
+            def choose_variant(
+                entry: CachedResponse, request: Request
+            ) -> Tuple[Optional[str], bool]:
+                """
+                Pick the variant to send, encoding it on demand in lazy mode.
+
+                Args:
+                    entry (CachedResponse): The cached response.
+                    request (Request): The current request.
+
+                Returns:
+                    Tuple[Optional[str], bool]: The chosen encoding (None for
+                    identity), and True if the entry gained a new variant and
+                    should be written back.
+                """
+                encoding = select_encoding(
+                    request.headers.get("accept-encoding"),
+                    entry.compressible(encodings),
+                )
+                if encoding is None:
+                    return None, False
+                return encoding, entry.encode(encoding)
+
+            def first_response(
+                entry: CachedResponse, encoding: Optional[str], result: Any
+            ) -> Response:
+                """
+                Build the response of a miss, with the cookies the entry omits.
+
+                Args:
+                    entry (CachedResponse): The rendered response.
+                    encoding (Optional[str]): The chosen encoding.
+                    result (Any): The endpoint return value ``entry`` was
+                        rendered from.
+
+                Returns:
+                    Response: The response for the client that caused the miss.
+                """
+                response = entry.to_response(encoding)
+                for cookie in set_cookies(result):
+                    response.headers.append("set-cookie", cookie)
+                return response
+
+            def observe(started: float, hit: bool) -> None:
+                """
+                Record a hit or a miss of the decorated function when metrics are on.
+
+                Args:
+                    started (float): `time.perf_counter` value when the call started.
+                    hit (bool): Whether the result was served from the cache.
+                """
+                if self._metrics is not None:
+                    self._metrics.observe(
+                        "call",
+                        time.perf_counter() - started,
+                        hits=int(hit),
+                        misses=int(not hit),
+                        namespace=namespace or "",
+                        function=function_label,
+                    )
+
+            def respond_computed(
+                result: Any, request: Optional[Request]
+            ) -> Tuple[Any, Any]:
+                """
+                Turn a computed result into the response and the value to cache.
+
+                Args:
+                    result (Any): The function return value.
+                    request (Optional[Request]): The current request, if any.
+
+                Returns:
+                    Tuple[Any, Any]: The response to return and the value to store.
+                """
+                if request is None:
+                    return result, result
+                entry = render(result)
+                encoding, _ = choose_variant(entry, request)
+                return first_response(entry, encoding, result), entry
+
+            def finish_computed(
+                started: float, loaded: dict, event: Optional[OperationEvent]
+            ) -> Any:
+                """
+                Record a miss computed under the key's lock and return its response.
+
+                Args:
+                    started (float): `time.perf_counter` value when the call started.
+                    loaded (dict): ``compute_time`` and ``response`` of the computation.
+                    event (Optional[OperationEvent]): The traced event, if tracing.
+
+                Returns:
+                    Any: The computed response.
+                """
+                observe(started, False)
+                if event is not None:
+                    event.hit = False
+                    event.compute_time = loaded["compute_time"]
+                return loaded["response"]
+
+            async def reload(args: tuple, kwargs: dict, rendered: bool) -> Any:
+                """
+                Recompute a call of an async function for refresh-ahead.
+
+                Args:
+                    args (tuple): Positional arguments of the call.
+                    kwargs (dict): Keyword arguments of the call.
+                    rendered (bool): Whether the call's result is cached rendered.
+
+                Returns:
+                    Any: The value to store.
+                """
+                result = await func(*args, **kwargs)
+                return render(result) if rendered else result
+
+            def reload_sync(args: tuple, kwargs: dict, rendered: bool) -> Any:
+                """
+                Recompute a call of a sync function for refresh-ahead.
+
+                Args:
+                    args (tuple): Positional arguments of the call.
+                    kwargs (dict): Keyword arguments of the call.
+                    rendered (bool): Whether the call's result is cached rendered.
+
+                Returns:
+                    Any: The value to store.
+                """
+                result = func(*args, **kwargs)
+                return render(result) if rendered else result
+
+            def track(
+                args: tuple,
+                kwargs: dict,
+                request: Optional[Request],
+                cache_key: str,
+                ttl: Optional[Union[int, timedelta]],
+                call_tags: Optional[Sequence[str]],
+            ) -> None:
+                """
+                Count a read for refresh-ahead and register the key once it is hot.
+
+                Args:
+                    args (tuple): Positional arguments of the call.
+                    kwargs (dict): Keyword arguments of the call.
+                    request (Optional[Request]): The current request, if any.
+                    cache_key (str): The cache key.
+                    ttl (Optional[Union[int, timedelta]]): Expiration time.
+                    call_tags (Optional[Sequence[str]]): Tags of the call's result.
+                """
+                scheduler = self._refresh_ahead
+                if not ttl or scheduler is None:
+                    return
+                period = ttl.total_seconds() if isinstance(ttl, timedelta) else ttl
+                if not scheduler.record(cache_key, refresh_ahead, period):
+                    return
+                loader = reload if is_async else reload_sync
+                scheduler.register(
+                    cache_key,
+                    functools.partial(loader, args, dict(kwargs), request is not None),
+                    ttl,
+                    tags=call_tags,
+                    threshold=refresh_ahead,
+                    loop=asyncio.get_running_loop() if is_async else None,
+                )
+
+            async def store(
+                cache_key: str,
+                value: Any,
+                ttl: Optional[Union[int, timedelta]],
+                call_tags: Optional[Sequence[str]],
+                cost: Optional[float] = None,
+            ) -> None:
+                """
+                Write a value, through the write-behind queue when enabled.
+
+                Args:
+                    cache_key (str): The cache key.
+                    value (Any): The value to store.
+                    ttl (Optional[Union[int, timedelta]]): Expiration time.
+                    call_tags (Optional[Sequence[str]]): Tags of the value; the
+                        queue batches untagged writes only.
+                    cost (Optional[float]): Seconds the value took to compute,
+                        for cost-aware backends; the queue does not carry it.
+                """
+                if (
+                    call_tags is None
+                    and write_behind
+                    and self._write_behind is not None
+                ):
+                    self._write_behind.enqueue(cache_key, value, expire=ttl)
+                else:
+                    await self._backend.aset(
+                        cache_key,
+                        value,
+                        expire=ttl,
+                        **_tag_kwargs(call_tags),
+                        **_cost_kwargs(self._backend, cost),
+                    )
+
+            async def respond(
+                args: tuple,
+                kwargs: dict,
+                request: Optional[Request],
+                cache_key: str,
+                ttl: Optional[Union[int, timedelta]],
+                call_tags: Optional[Sequence[str]],
+                event: Optional[OperationEvent],
+            ) -> Any:
+                """
+                Serve a call of an async function from the cache or compute it.
+
+                Args:
+                    args (tuple): Positional arguments of the call.
+                    kwargs (dict): Keyword arguments of the call.
+                    request (Optional[Request]): The current request, if any.
+                    cache_key (str): The cache key.
+                    ttl (Optional[Union[int, timedelta]]): Expiration time.
+                    call_tags (Optional[Sequence[str]]): Tags of the call's result.
+                    event (Optional[OperationEvent]): The traced event, if tracing.
+
+                Returns:
+                    Any: The cached or computed result.
+                """
+                # Try to get from cache
+                started = time.perf_counter()
+                loaded: dict = {}
+                if sliding and ttl is not None:
+                    cached_value = await self._backend.aget_and_touch(cache_key, ttl)
+                elif lock_timeout is None:
+                    cached_value = await self._backend.aget(cache_key)
+                else:
+                    # get_or_set below looks the key up itself.
+                    cached_value = None
+                if cached_value is None and lock_timeout is not None:
+
+                    async def load() -> Any:
+                        computed = time.perf_counter()
+                        result = await func(*args, **kwargs)
+                        loaded["compute_time"] = time.perf_counter() - computed
+                        loaded["response"], value = respond_computed(result, request)
+                        return value
+
+                    cached_value = await self._backend.aget_or_set(
+                        cache_key,
+                        load,
+                        expire=ttl,
+                        lock_timeout=lock_timeout,
+                        stale_ttl=stale_ttl,
+                        **_tag_kwargs(call_tags),
+                    )
+                if loaded:
+                    return finish_computed(started, loaded, event)
+                if cached_value is not None:
+                    observe(started, True)
+                    if event is not None:
+                        event.hit = True
+                    if request is None or not isinstance(cached_value, CachedResponse):
+                        return cached_value
+                    encoding, dirty = choose_variant(cached_value, request)
+                    if dirty:
+                        await store(
+                            cache_key,
+                            cached_value,
+                            (
+                                ttl
+                                if sliding
+                                else _remaining_expire(ttl, cached_value.created_at)
+                            ),
+                            call_tags,
+                        )
+                    return cached_value.to_response(encoding)
+
+                # Execute function and cache result
+                computed = time.perf_counter()
+                result = await func(*args, **kwargs)
+                compute_time = time.perf_counter() - computed
+                observe(started, False)
+                if event is not None:
+                    event.hit = False
+                    event.compute_time = compute_time
+                if request is None:
+                    await store(cache_key, result, ttl, call_tags, compute_time)
+                    return result
+
+                entry = render(result)
+                encoding, _ = choose_variant(entry, request)
+                await store(cache_key, entry, ttl, call_tags, compute_time)
+                return first_response(entry, encoding, result)
+
+            def respond_sync(
+                args: tuple,
+                kwargs: dict,
+                request: Optional[Request],
+                cache_key: str,
+                ttl: Optional[Union[int, timedelta]],
+                call_tags: Optional[Sequence[str]],
+                event: Optional[OperationEvent],
+            ) -> Any:
+                """
+                Serve a call of a sync function from the cache or compute it.
+
+                Args:
+                    args (tuple): Positional arguments of the call.
+                    kwargs (dict): Keyword arguments of the call.
+                    request (Optional[Request]): The current request, if any.
+                    cache_key (str): The cache key.
+                    ttl (Optional[Union[int, timedelta]]): Expiration time.
+                    call_tags (Optional[Sequence[str]]): Tags of the call's result.
+                    event (Optional[OperationEvent]): The traced event, if tracing.
+
+                Returns:
+                    Any: The cached or computed result.
+                """
+                # Try to get from cache
+                started = time.perf_counter()
+                loaded: dict = {}
+                if sliding and ttl is not None:
+                    cached_value = self._backend.get_and_touch(cache_key, ttl)
+                elif lock_timeout is None:
+                    cached_value = self._backend.get(cache_key)
+                else:
+                    # get_or_set below looks the key up itself.
+                    cached_value = None
+                if cached_value is None and lock_timeout is not None:
+
+                    def load() -> Any:
+                        computed = time.perf_counter()
+                        result = func(*args, **kwargs)
+                        loaded["compute_time"] = time.perf_counter() - computed
+                        loaded["response"], value = respond_computed(result, request)
+                        return value
+
+                    cached_value = self._backend.get_or_set(
+                        cache_key,
+                        load,
+                        expire=ttl,
+                        lock_timeout=lock_timeout,
+                        stale_ttl=stale_ttl,
+                        **_tag_kwargs(call_tags),
+                    )
+                if loaded:
+                    return finish_computed(started, loaded, event)
+                if cached_value is not None:
+                    observe(started, True)
+                    if event is not None:
+                        event.hit = True
+                    if request is None or not isinstance(cached_value, CachedResponse):
+                        return cached_value
+                    encoding, dirty = choose_variant(cached_value, request)
+                    if dirty:
+                        self._backend.set(
+                            cache_key,
+                            cached_value,
+                            expire=(
+                                ttl
+                                if sliding
+                                else _remaining_expire(ttl, cached_value.created_at)
+                            ),
+                            **_tag_kwargs(call_tags),
+                        )
+                    return cached_value.to_response(encoding)
+
+                # Execute function and cache result
+                computed = time.perf_counter()
+                result = func(*args, **kwargs)
+                compute_time = time.perf_counter() - computed
+                observe(started, False)
+                if event is not None:
+                    event.hit = False
+                    event.compute_time = compute_time
+                cost_kwargs = _cost_kwargs(self._backend, compute_time)
+                if request is None:
+                    self._backend.set(
+                        cache_key,
+                        result,
+                        expire=ttl,
+                        **_tag_kwargs(call_tags),
+                        **cost_kwargs,
+                    )
+                    return result
+
+                entry = render(result)
+                encoding, _ = choose_variant(entry, request)
+                self._backend.set(
+                    cache_key,
+                    entry,
+                    expire=ttl,
+                    **_tag_kwargs(call_tags),
+                    **cost_kwargs,
+                )
+                return first_response(entry, encoding, result)
+
             @wraps(func)
             async def async_wrapper(*args, **kwargs) -> Any:
                 """
@@ -101,25 +708,39 @@ class FastAPICache:
                 Returns:
                     Any: The cached or computed result.
                 """
+                request, key_kwargs = split_request(kwargs)
+
                 if not self._backend:
                     return await func(*args, **kwargs)
 
                 # Skip cache if explicitly requested
                 if kwargs.pop("skip_cache", False):
                     return await func(*args, **kwargs)
+                key_kwargs.pop("skip_cache", None)
 
-                cache_key = build_cache_key(*args, **kwargs)
+                cache_key = build_cache_key(*args, **key_kwargs)
+                ttl = expire or self._default_expire
+                call_tags = build_tags(*args, **key_kwargs)
+                if refreshable:
+                    track(args, kwargs, request, cache_key, ttl, call_tags)
 
-                # Try to get from cache
-                cached_value = await self._backend.aget(cache_key)
-                if cached_value is not None:
-                    return cached_value
+                tracer = self._tracer
+                if tracer is None:
+                    return await respond(
+                        args, kwargs, request, cache_key, ttl, call_tags, None
+                    )
 
-                # Execute function and cache result
-                result = await func(*args, **kwargs)
-                await self._backend.aset(
-                    cache_key, result, expire=expire or self._default_expire
+                event = tracer.start(
+                    "cached", cache_key, namespace or "", function=function_label
                 )
+                try:
+                    result = await respond(
+                        args, kwargs, request, cache_key, ttl, call_tags, event
+                    )
+                except BaseException as exc:
+                    tracer.finish(event, exc)
+                    raise
+                tracer.finish(event)
                 return result
 
             @wraps(func)
@@ -134,28 +755,242 @@ class FastAPICache:
                 Returns:
                     Any: The cached or computed result.
                 """
+                request, key_kwargs = split_request(kwargs)
+
                 if not self._backend:
                     return func(*args, **kwargs)
 
                 # Skip cache if explicitly requested
                 if kwargs.pop("skip_cache", False):
                     return func(*args, **kwargs)
+                key_kwargs.pop("skip_cache", None)
 
-                cache_key = build_cache_key(*args, **kwargs)
+                cache_key = build_cache_key(*args, **key_kwargs)
+                ttl = expire or self._default_expire
+                call_tags = build_tags(*args, **key_kwargs)
+                if refreshable:
+                    track(args, kwargs, request, cache_key, ttl, call_tags)
 
-                # Try to get from cache
-                cached_value = self._backend.get(cache_key)
-                if cached_value is not None:
-                    return cached_value
+                tracer = self._tracer
+                if tracer is None:
+                    return respond_sync(
+                        args, kwargs, request, cache_key, ttl, call_tags, None
+                    )
 
-                # Execute function and cache result
-                result = func(*args, **kwargs)
-                self._backend.set(
-                    cache_key, result, expire=expire or self._default_expire
+                event = tracer.start(
+                    "cached", cache_key, namespace or "", function=function_label
                 )
+                try:
+                    result = respond_sync(
+                        args, kwargs, request, cache_key, ttl, call_tags, event
+                    )
+                except BaseException as exc:
+                    tracer.finish(event, exc)
+                    raise
+                tracer.finish(event)
                 return result
 
-            return async_wrapper if is_async else sync_wrapper
+            wrapper = async_wrapper if is_async else sync_wrapper
+            if inject_request:
+                _inject_request_parameter(wrapper, func, request_param)
+            return wrapper
+
+        return decorator
+
+    def cached_dependency(
+        self,
+        expire: Optional[Union[int, timedelta]] = None,
+        headers: Sequence[str] = (),
+        path_params: Sequence[str] = (),
+        query_params: Sequence[str] = (),
+        key_builder: Optional[Callable[[Request], str]] = None,
+        namespace: Optional[str] = None,
+        shared: bool = True,
+        request_scoped: bool = True,
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        Decorator for caching FastAPI dependencies used with `Depends`.
+
+        Unlike `cached`, the cache key is never built from the dependency's
+        arguments (which may be a `Request`, a DB session, or other
+        sub-dependencies). It is built only from the request fields named here.
+
+        Example:
+            ```python
+            @cache.cached_dependency(expire=60, headers=["authorization"])
+            async def current_user(request: Request, db=Depends(get_db)):
+                return await introspect(request.headers["authorization"], db)
+
+            @app.get("/me")
+            async def me(user=Depends(current_user)):
+                return user
+            ```
+
+        Args:
+            expire (Optional[Union[int, timedelta]]): Expiration time for shared results.
+            headers (Sequence[str]): Request headers that identify the result.
+            path_params (Sequence[str]): Path parameters that identify the result.
+            query_params (Sequence[str]): Query parameters that identify the result.
+            key_builder (Optional[Callable[[Request], str]]): Custom function that
+                extracts additional key material from the request.
+            namespace (Optional[str]): Optional namespace for the cache key.
+            shared (bool): If True, results are shared across requests through
+                the cache backend.
+            request_scoped (bool): If True, results are memoized on the request,
+                so a dependency used by several sub-dependencies runs once.
+
+        Returns:
+            Callable: A decorator that returns the cached dependency callable.
+
+        Raises:
+            TypeError: If the dependency is a generator (``yield``) dependency.
+        """
+
+        def decorator(func: Callable) -> Callable[..., Any]:
+            if inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func):
+                raise TypeError("cached_dependency does not support yield dependencies")
+
+            is_async = inspect.iscoroutinefunction(func)
+            request_param, inject_request = _request_parameter(func)
+            prefix = f"{func.__module__}:{func.__qualname__}:dependency"
+            if namespace:
+                prefix = f"{namespace}:{prefix}"
+
+            def resolve_key(kwargs: dict) -> Tuple[Request, dict, str]:
+                """
+                Extract the request from the call and build the cache key.
+
+                Args:
+                    kwargs (dict): Keyword arguments passed by FastAPI.
+
+                Returns:
+                    Tuple[Request, dict, str]: The request, the arguments to call
+                    the dependency with, and the cache key.
+                """
+                if inject_request:
+                    request = kwargs.pop(request_param)
+                else:
+                    request = kwargs[request_param]
+                digest = _dependency_key_parts(
+                    request, headers, path_params, query_params, key_builder
+                )
+                return request, kwargs, f"{prefix}:{digest}"
+
+            def memo_for(request: Request) -> Optional[dict]:
+                """
+                Return the per-request memo, creating it on first use.
+
+                Args:
+                    request (Request): The current request.
+
+                Returns:
+                    Optional[dict]: The memo, or None if request scoping is off.
+                """
+                if not request_scoped:
+                    return None
+                memo = getattr(request.state, "fast_cache_memo", None)
+                if memo is None:
+                    memo = {}
+                    request.state.fast_cache_memo = memo
+                return memo
+
+            @wraps(func)
+            async def async_wrapper(**kwargs) -> Any:
+                request, kwargs, cache_key = resolve_key(kwargs)
+                memo = memo_for(request)
+                if memo is not None:
+                    value = memo.get(cache_key, _MISSING)
+                    if value is not _MISSING:
+                        return value
+
+                backend = self._backend if shared else None
+                value = await backend.aget(cache_key) if backend else None
+                if value is None:
+                    value = await func(**kwargs)
+                    if backend:
+                        await backend.aset(
+                            cache_key, value, expire=expire or self._default_expire
+                        )
+
+                if memo is not None:
+                    memo[cache_key] = value
+                return value
+
+            @wraps(func)
+            def sync_wrapper(**kwargs) -> Any:
+                request, kwargs, cache_key = resolve_key(kwargs)
+                memo = memo_for(request)
+                if memo is not None:
+                    value = memo.get(cache_key, _MISSING)
+                    if value is not _MISSING:
+                        return value
+
+                backend = self._backend if shared else None
+                value = backend.get(cache_key) if backend else None
+                if value is None:
+                    value = func(**kwargs)
+                    if backend:
+                        backend.set(
+                            cache_key, value, expire=expire or self._default_expire
+                        )
+
+                if memo is not None:
+                    memo[cache_key] = value
+                return value
+
+            wrapper = async_wrapper if is_async else sync_wrapper
+            if inject_request:
+                _inject_request_parameter(wrapper, func, request_param)
+            return wrapper
+
+        return decorator
+
+    def cached_batch(
+        self,
+        expire: Optional[Union[int, timedelta]] = None,
+        key_builder: Optional[Callable[[Any], str]] = None,
+        namespace: Optional[str] = None,
+        max_batch_size: Optional[int] = None,
+    ) -> Callable[[Callable[..., Any]], BatchLoader]:
+        """
+        Decorator for batched, cached loading of per-ID values (DataLoader style).
+
+        The decorated function must be async and take a list of IDs, returning a
+        mapping of ID to value. The result is a `BatchLoader`: awaiting
+        ``loader(id)`` several times within the same event-loop tick results in
+        one `aget_many`, one call to the function for the missing IDs, and one
+        `aset_many`.
+
+        Example:
+            ```python
+            @cache.cached_batch(expire=300)
+            async def get_users(ids: list[int]) -> dict[int, User]:
+                return await db.fetch_users(ids)
+
+            users = await asyncio.gather(*(get_users(i) for i in ids))
+            ```
+
+        Args:
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as a timedelta.
+            key_builder (Optional[Callable[[Any], str]]): Custom function building
+                the cache key for a single ID.
+            namespace (Optional[str]): Optional namespace for the cache keys.
+            max_batch_size (Optional[int]): Maximum number of IDs passed to one
+                call of the function.
+
+        Returns:
+            Callable: A decorator that turns the function into a `BatchLoader`.
+        """
+
+        def decorator(func: Callable[..., Any]) -> BatchLoader:
+            return BatchLoader(
+                self,
+                func,
+                expire=expire,
+                key_builder=key_builder,
+                namespace=namespace,
+                max_batch_size=max_batch_size,
+            )
 
         return decorator
 
@@ -180,6 +1015,14 @@ class FastAPICache:
         try:
             yield
         finally:
+            if self._write_behind is not None:
+                await self._write_behind.aclose()
+                self._write_behind = None
+
+            if self._refresh_ahead is not None:
+                self._refresh_ahead.close()
+                self._refresh_ahead = None
+
             if self._backend:
                 close = getattr(self._backend, "aclose", None)
                 if close:
@@ -197,6 +1040,15 @@ class FastAPICache:
         app: FastAPI,
         backend: CacheBackend,
         default_expire: Optional[Union[int, timedelta]] = None,
+        write_behind_max_size: int = 10000,
+        write_behind_batch_size: int = 100,
+        write_behind_overflow: str = "drop_newest",
+        metrics: Union[bool, CacheMetrics] = False,
+        metrics_path: Optional[str] = None,
+        observers: Sequence[CacheObserver] = (),
+        refresh_ahead_concurrency: int = 4,
+        refresh_ahead_lead: float = 0.1,
+        refresh_ahead_max_keys: int = 1000,
     ) -> None:
         """
         Initialize the cache extension.
@@ -205,7 +1057,104 @@ class FastAPICache:
             app (FastAPI): FastAPI application instance.
             backend (CacheBackend): Cache backend instance.
             default_expire (Optional[Union[int, timedelta]]): Default expiration time for cached items.
+            write_behind_max_size (int): Maximum number of pending writes in the
+                write-behind queue used by ``cached(write_behind=True)``.
+            write_behind_batch_size (int): Maximum number of writes flushed per batch.
+            write_behind_overflow (str): ``"drop_newest"`` or ``"drop_oldest"``;
+                which write to discard when the queue is full.
+            metrics (Union[bool, CacheMetrics]): If True (or a `CacheMetrics`
+                registry to record into), the backend is wrapped in a
+                `MetricsBackend` and decorated functions record hits and misses.
+            metrics_path (Optional[str]): If set together with ``metrics``, a
+                route serving the Prometheus text exposition is added at this path.
+            observers (Sequence[CacheObserver]): Tracing hooks notified of every
+                backend operation and decorated call, e.g. `OpenTelemetryObserver`.
+                When empty, tracing adds no overhead.
+            refresh_ahead_concurrency (int): Maximum number of background
+                refreshes running at once for ``cached(refresh_ahead=...)``.
+            refresh_ahead_lead (float): Fraction of an entry's expiration
+                period left when it is refreshed ahead.
+            refresh_ahead_max_keys (int): Maximum number of keys kept warm by
+                refresh-ahead.
         """
+        if metrics:
+            self._metrics = (
+                metrics if isinstance(metrics, CacheMetrics) else CacheMetrics()
+            )
+            backend = MetricsBackend(backend, self._metrics)
+            if metrics_path:
+                app.add_api_route(
+                    metrics_path, self.metrics_endpoint, include_in_schema=False
+                )
+
+        if observers:
+            self._tracer = Tracer(observers)
+            backend = TracingBackend(backend, self._tracer)
+
         self._backend = backend
         self._app = app
         self._default_expire = default_expire
+        self._write_behind = WriteBehindQueue(
+            backend,
+            max_size=write_behind_max_size,
+            batch_size=write_behind_batch_size,
+            overflow=write_behind_overflow,
+        )
+        self._refresh_ahead = RefreshAheadScheduler(
+            backend,
+            max_concurrency=refresh_ahead_concurrency,
+            lead=refresh_ahead_lead,
+            max_keys=refresh_ahead_max_keys,
+        )
+
+    def write_behind_stats(self) -> dict:
+        """
+        Get metrics of the write-behind queue.
+
+        Returns:
+            dict: Queue depth, counters and write lag; see `WriteBehindQueue.stats`.
+                Empty if the cache is not initialized.
+        """
+        if self._write_behind is None:
+            return {}
+        return self._write_behind.stats()
+
+    def refresh_ahead_stats(self) -> dict:
+        """
+        Get metrics of the refresh-ahead scheduler.
+
+        Returns:
+            dict: Registered keys and refresh counters; see
+                `RefreshAheadScheduler.stats`. Empty if the cache is not initialized.
+        """
+        if self._refresh_ahead is None:
+            return {}
+        return self._refresh_ahead.stats()
+
+    def stats(self) -> dict:
+        """
+        Get cache metrics.
+
+        Returns:
+            dict: Hits, misses, errors, sets, bytes and latency per namespace,
+                decorated function and operation; see `CacheMetrics.stats`.
+                Empty if metrics are not enabled.
+        """
+        if self._metrics is None:
+            return {}
+        return self._metrics.stats()
+
+    async def metrics_endpoint(self) -> PlainTextResponse:
+        """
+        Endpoint serving cache metrics in the Prometheus text format.
+
+        Example:
+            ```python
+            app.add_api_route("/metrics", cache.metrics_endpoint)
+            ```
+
+        Returns:
+            PlainTextResponse: The exposition; empty if metrics are not enabled.
+        """
+        body = self._metrics.render_prometheus() if self._metrics else ""
+        return PlainTextResponse(body, media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,445 @@
+import math
+import threading
+from typing import Any, Dict, List, Tuple
+
+#: Quantiles reported by `CacheMetrics.stats` and the Prometheus summaries,
+#: with their key in `LatencyHistogram.snapshot`.
+QUANTILES = {0.5: "p50", 0.9: "p90", 0.99: "p99", 0.999: "p999"}
+
+#: Content type of the Prometheus text exposition format.
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Operations whose successful calls are reported as sets.
+_WRITE_OPERATIONS = ("set", "set_many")
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+
+    Durations are bucketed by power of two of microseconds, and every power of
+    two is split into ``sub_buckets`` linear sub-buckets. Recording is a couple
+    of arithmetic operations and a dict increment, memory grows only with the
+    number of distinct buckets hit, and quantiles are accurate to within about
+    ``1 / sub_buckets`` relative error.
+
+    Args:
+        sub_buckets (int): Linear sub-buckets per power of two. Defaults to 16.
+    """
+
+    __slots__ = ("_sub_buckets", "_counts", "count", "total", "max")
+
+    def __init__(self, sub_buckets: int = 16) -> None:
+        self._sub_buckets = sub_buckets
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def _index(self, seconds: float) -> int:
+        """
+        Map a duration to its bucket index.
+
+        Args:
+            seconds (float): The duration.
+
+        Returns:
+            int: The bucket index; 0 holds everything below one microsecond.
+        """
+        micros = seconds * 1_000_000
+        if micros < 1:
+            return 0
+        mantissa, exponent = math.frexp(micros)
+        return (
+            1
+            + (exponent - 1) * self._sub_buckets
+            + int((mantissa * 2 - 1) * self._sub_buckets)
+        )
+
+    def _upper_bound(self, index: int) -> float:
+        """
+        Return the upper bound of a bucket in seconds.
+
+        Args:
+            index (int): The bucket index.
+
+        Returns:
+            float: The largest duration the bucket holds.
+        """
+        if index == 0:
+            return 1e-6
+        exponent, sub = divmod(index - 1, self._sub_buckets)
+        return 2**exponent * (1 + (sub + 1) / self._sub_buckets) / 1_000_000
+
+    def record(self, seconds: float) -> None:
+        """
+        Record one duration.
+
+        Args:
+            seconds (float): The duration in seconds.
+        """
+        index = self._index(seconds)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add the recordings of another histogram with the same precision.
+
+        Args:
+            other (LatencyHistogram): The histogram to merge in.
+        """
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile of the recorded durations.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float: The estimated duration in seconds, or 0.0 if nothing was recorded.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Summarize the histogram.
+
+        Returns:
+            Dict[str, float]: ``count``, ``sum``, ``max`` and ``p50``/``p90``/
+            ``p99``/``p999`` in seconds.
+        """
+        summary: Dict[str, float] = {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max,
+        }
+        for q, name in QUANTILES.items():
+            summary[name] = self.quantile(q)
+        return summary
+
+
+class _Series:
+    """
+    Counters and latency histogram of one labelled operation.
+    """
+
+    __slots__ = ("calls", "hits", "misses", "errors", "latency")
+
+    def __init__(self, sub_buckets: int) -> None:
+        self.calls = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.latency = LatencyHistogram(sub_buckets)
+
+
+def _escape(value: str) -> str:
+    """
+    Escape a Prometheus label value.
+
+    Args:
+        value (str): The raw value.
+
+    Returns:
+        str: The escaped value.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    """
+    Render a Prometheus label set.
+
+    Args:
+        labels (Dict[str, str]): Label names and values.
+
+    Returns:
+        str: The label set in braces.
+    """
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+class CacheMetrics:
+    """
+    Thread-safe registry of cache hit, miss, error, latency and size metrics.
+
+    Series are labelled by backend, namespace, decorated function and
+    operation. Backend operations are recorded by `MetricsBackend` with an
+    empty ``function`` label; decorated functions are recorded by
+    `FastAPICache.cached` as operation ``"call"`` with an empty ``backend``
+    label.
+
+    Args:
+        sub_buckets (int): Precision of the latency histograms; see
+            `LatencyHistogram`. Defaults to 16.
+    """
+
+    def __init__(self, sub_buckets: int = 16) -> None:
+        self._sub_buckets = sub_buckets
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str, str, str], _Series] = {}
+        self._bytes: Dict[Tuple[str, str], List[int]] = {}
+
+    def _get_series(
+        self, backend: str, namespace: str, function: str, operation: str
+    ) -> _Series:
+        """
+        Return the series for a label set, creating it on first use.
+
+        Must be called with the lock held.
+        """
+        key = (backend, namespace, function, operation)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(self._sub_buckets)
+        return series
+
+    def observe(
+        self,
+        operation: str,
+        duration: float,
+        hits: int = 0,
+        misses: int = 0,
+        errors: int = 0,
+        backend: str = "",
+        namespace: str = "",
+        function: str = "",
+    ) -> None:
+        """
+        Record one completed operation.
+
+        Args:
+            operation (str): The operation name, e.g. ``"get"`` or ``"call"``.
+            duration (float): How long the operation took, in seconds.
+            hits (int): Number of keys found.
+            misses (int): Number of keys not found.
+            errors (int): Number of errors raised by the operation.
+            backend (str): Backend label.
+            namespace (str): Namespace label.
+            function (str): Decorated function label.
+        """
+        with self._lock:
+            series = self._get_series(backend, namespace, function, operation)
+            series.calls += 1
+            series.hits += hits
+            series.misses += misses
+            series.errors += errors
+            series.latency.record(duration)
+
+    def record_error(
+        self,
+        operation: str,
+        backend: str = "",
+        namespace: str = "",
+        function: str = "",
+    ) -> None:
+        """
+        Count an error without recording a call, e.g. one a backend swallowed.
+
+        Args:
+            operation (str): The operation name.
+            backend (str): Backend label.
+            namespace (str): Namespace label.
+            function (str): Decorated function label.
+        """
+        with self._lock:
+            self._get_series(backend, namespace, function, operation).errors += 1
+
+    def record_bytes(
+        self, direction: str, size: int, backend: str = "", namespace: str = ""
+    ) -> None:
+        """
+        Count payload bytes read from or written to a backend.
+
+        Args:
+            direction (str): ``"get"`` for bytes read, ``"set"`` for bytes written.
+            size (int): Payload size in bytes.
+            backend (str): Backend label.
+            namespace (str): Namespace label.
+        """
+        with self._lock:
+            counters = self._bytes.get((backend, namespace))
+            if counters is None:
+                counters = self._bytes[(backend, namespace)] = [0, 0]
+            counters[0 if direction == "get" else 1] += size
+
+    def reset(self) -> None:
+        """
+        Discard every recorded metric.
+        """
+        with self._lock:
+            self._series.clear()
+            self._bytes.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return a snapshot of all metrics.
+
+        Returns:
+            Dict[str, Any]: ``namespaces`` maps ``"backend:namespace"`` to
+            backend-level ``hits``, ``misses``, ``hit_ratio``, ``errors``,
+            ``sets``, ``bytes_read`` and ``bytes_written``; ``functions`` maps
+            each decorated function to its ``hits``, ``misses``, ``hit_ratio``
+            and ``errors``; ``operations`` lists every labelled series with its
+            counters and a ``latency`` summary (see `LatencyHistogram.snapshot`).
+        """
+        with self._lock:
+            operations = []
+            namespaces: Dict[str, Dict[str, Any]] = {}
+            functions: Dict[str, Dict[str, Any]] = {}
+
+            for (backend, namespace, function, operation), series in sorted(
+                self._series.items()
+            ):
+                operations.append(
+                    {
+                        "backend": backend,
+                        "namespace": namespace,
+                        "function": function,
+                        "operation": operation,
+                        "calls": series.calls,
+                        "hits": series.hits,
+                        "misses": series.misses,
+                        "errors": series.errors,
+                        "latency": series.latency.snapshot(),
+                    }
+                )
+                if function:
+                    totals = functions.setdefault(
+                        function, {"hits": 0, "misses": 0, "errors": 0}
+                    )
+                else:
+                    totals = namespaces.setdefault(
+                        f"{backend}:{namespace}",
+                        {
+                            "hits": 0,
+                            "misses": 0,
+                            "errors": 0,
+                            "sets": 0,
+                            "bytes_read": 0,
+                            "bytes_written": 0,
+                        },
+                    )
+                    if operation in _WRITE_OPERATIONS:
+                        totals["sets"] += series.calls - series.errors
+                totals["hits"] += series.hits
+                totals["misses"] += series.misses
+                totals["errors"] += series.errors
+
+            for (backend, namespace), (read, written) in self._bytes.items():
+                totals = namespaces.setdefault(
+                    f"{backend}:{namespace}",
+                    {"hits": 0, "misses": 0, "errors": 0, "sets": 0},
+                )
+                totals["bytes_read"] = read
+                totals["bytes_written"] = written
+
+        for totals in (*namespaces.values(), *functions.values()):
+            lookups = totals["hits"] + totals["misses"]
+            totals["hit_ratio"] = totals["hits"] / lookups if lookups else 0.0
+
+        return {
+            "namespaces": namespaces,
+            "functions": functions,
+            "operations": operations,
+        }
+
+    def render_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition, served with `PROMETHEUS_CONTENT_TYPE`.
+        """
+        counters = {
+            "fast_cache_operations_total": ("Cache operations.", "calls", []),
+            "fast_cache_hits_total": ("Keys found in the cache.", "hits", []),
+            "fast_cache_misses_total": ("Keys not found in the cache.", "misses", []),
+            "fast_cache_errors_total": (
+                "Cache operations that failed, including errors the backend handled.",
+                "errors",
+                [],
+            ),
+        }
+        durations: List[str] = []
+        size_lines: Dict[str, List[str]] = {
+            "fast_cache_bytes_read_total": [],
+            "fast_cache_bytes_written_total": [],
+        }
+
+        with self._lock:
+            for (backend, namespace, function, operation), series in sorted(
+                self._series.items()
+            ):
+                labels = {
+                    "backend": backend,
+                    "namespace": namespace,
+                    "function": function,
+                    "operation": operation,
+                }
+                rendered = _format_labels(labels)
+                for _, attribute, lines in counters.values():
+                    lines.append(f"{rendered} {getattr(series, attribute)}")
+
+                latency = series.latency
+                for q in QUANTILES:
+                    quantile = _format_labels(dict(labels, quantile=str(q)))
+                    durations.append(
+                        f"fast_cache_operation_duration_seconds{quantile} "
+                        f"{latency.quantile(q)!r}"
+                    )
+                durations.append(
+                    f"fast_cache_operation_duration_seconds_sum{rendered} "
+                    f"{latency.total!r}"
+                )
+                durations.append(
+                    f"fast_cache_operation_duration_seconds_count{rendered} "
+                    f"{latency.count}"
+                )
+
+            for (backend, namespace), (read, written) in sorted(self._bytes.items()):
+                rendered = _format_labels({"backend": backend, "namespace": namespace})
+                size_lines["fast_cache_bytes_read_total"].append(f"{rendered} {read}")
+                size_lines["fast_cache_bytes_written_total"].append(
+                    f"{rendered} {written}"
+                )
+
+        output: List[str] = []
+        for name, (help_text, _, lines) in counters.items():
+            output.append(f"# HELP {name} {help_text}")
+            output.append(f"# TYPE {name} counter")
+            output.extend(f"{name}{line}" for line in lines)
+
+        output.append(
+            "# HELP fast_cache_operation_duration_seconds Cache operation latency."
+        )
+        output.append("# TYPE fast_cache_operation_duration_seconds summary")
+        output.extend(durations)
+
+        for name, help_text in (
+            ("fast_cache_bytes_read_total", "Payload bytes read from the backend."),
+            ("fast_cache_bytes_written_total", "Payload bytes written to the backend."),
+        ):
+            output.append(f"# HELP {name} {help_text}")
+            output.append(f"# TYPE {name} counter")
+            output.extend(f"{name}{line}" for line in size_lines[name])
+
+        return "\n".join(output) + "\n"
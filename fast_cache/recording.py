@@ -0,0 +1,146 @@
+import gzip
+import hashlib
+import json
+import threading
+from typing import IO, Iterator, NamedTuple, Optional, Union
+
+
+class TraceRecord(NamedTuple):
+    """
+    One recorded cache access.
+
+    Attributes:
+        ts (float): Wall-clock time of the access, in seconds since the epoch.
+        op (str): ``"get"``, ``"set"``, ``"has"``, ``"delete"`` or ``"clear"``.
+        key (str): Hashed cache key (see `hash_key`); empty for ``clear``.
+        size (int): Pickled size of the value written or found, in bytes;
+            0 for misses and operations without a value.
+        ttl (Optional[float]): Expiration of a write in seconds, or None.
+        hit (Optional[bool]): Whether a ``get`` or ``has`` found the key; None
+            for other operations.
+        cost (Optional[float]): Seconds the value of a write took to compute,
+            when the writer measured it (see `CacheBackend.cost_aware`).
+    """
+
+    ts: float
+    op: str
+    key: str
+    size: int = 0
+    ttl: Optional[float] = None
+    hit: Optional[bool] = None
+    cost: Optional[float] = None
+
+
+def hash_key(key: str) -> str:
+    """
+    Hash a cache key so traces can be shared without exposing key contents.
+
+    Args:
+        key (str): The cache key.
+
+    Returns:
+        str: A 16-character hex digest, stable across processes.
+    """
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    """
+    Open a trace file as text, gzip-compressed when the name ends in ``.gz``.
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class TraceWriter:
+    """
+    Thread-safe writer of NDJSON access traces.
+
+    Each record is one JSON object per line with the fields of `TraceRecord`;
+    ``size``, ``ttl``, ``hit`` and ``cost`` are omitted when empty to keep
+    lines short.
+
+    Args:
+        destination (Union[str, IO[str]]): File path (gzip-compressed when it
+            ends in ``.gz``) or an open text stream. Paths are opened in append
+            mode, so several processes can write to separate files that are
+            concatenated later.
+    """
+
+    def __init__(self, destination: Union[str, IO[str]]) -> None:
+        if isinstance(destination, str):
+            self._file: IO[str] = _open(destination, "a")
+            self._owns_file = True
+        else:
+            self._file = destination
+            self._owns_file = False
+        self._lock = threading.Lock()
+
+    def write(self, record: TraceRecord) -> None:
+        """
+        Append a record to the trace.
+
+        Args:
+            record (TraceRecord): The record.
+        """
+        data = {"ts": round(record.ts, 6), "op": record.op, "key": record.key}
+        if record.size:
+            data["size"] = record.size
+        if record.ttl is not None:
+            data["ttl"] = record.ttl
+        if record.hit is not None:
+            data["hit"] = record.hit
+        if record.cost is not None:
+            data["cost"] = round(record.cost, 6)
+        line = json.dumps(data, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def flush(self) -> None:
+        """
+        Flush buffered records to the destination.
+        """
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        """
+        Flush the trace, and close the file if this writer opened it.
+        """
+        with self._lock:
+            if self._owns_file:
+                self._file.close()
+            else:
+                self._file.flush()
+
+
+def read_trace(source: Union[str, IO[str]]) -> Iterator[TraceRecord]:
+    """
+    Read the records of an NDJSON access trace.
+
+    Args:
+        source (Union[str, IO[str]]): File path (gzip-compressed when it ends
+            in ``.gz``) or an open text stream.
+
+    Yields:
+        TraceRecord: The records, in file order. Blank lines are skipped.
+    """
+    file = _open(source, "r") if isinstance(source, str) else source
+    try:
+        for line in file:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            yield TraceRecord(
+                ts=data["ts"],
+                op=data["op"],
+                key=data.get("key", ""),
+                size=data.get("size", 0),
+                ttl=data.get("ttl"),
+                hit=data.get("hit"),
+                cost=data.get("cost"),
+            )
+    finally:
+        if isinstance(source, str):
+            file.close()
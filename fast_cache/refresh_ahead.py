@@ -0,0 +1,381 @@
+import asyncio
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .backends.backend import CacheBackend, _cost_kwargs, _tag_kwargs
+
+
+class _Entry:
+    """A hot key registered for refresh-ahead."""
+
+    __slots__ = (
+        "key",
+        "refresh",
+        "loop",
+        "expire",
+        "period",
+        "tags",
+        "threshold",
+        "hits",
+        "due",
+        "probed",
+    )
+
+    def __init__(
+        self,
+        key: str,
+        refresh: Callable[[], Any],
+        loop: Optional[asyncio.AbstractEventLoop],
+        expire: Union[int, timedelta],
+        tags: Optional[Sequence[str]],
+        threshold: int,
+        hits: int,
+    ) -> None:
+        self.key = key
+        self.refresh = refresh
+        self.loop = loop
+        self.expire = expire
+        self.period = (
+            expire.total_seconds() if isinstance(expire, timedelta) else expire
+        )
+        self.tags = tags
+        self.threshold = threshold
+        self.hits = hits
+        self.due = 0.0
+        # False until the entry's remaining lifetime has been looked up.
+        self.probed = False
+
+
+class RefreshAheadScheduler:
+    """
+    Background scheduler that recomputes hot keys shortly before they expire.
+
+    `FastAPICache.cached(refresh_ahead=...)` counts the reads of each key with
+    `record`. Once a key is read ``threshold`` times within one expiration
+    period, the decorator registers its loader with `register`, and a worker
+    thread recomputes and rewrites the entry when ``lead`` of its lifetime is
+    left, so readers of hot keys never wait for a recompute.
+
+    Args:
+        backend (CacheBackend): The backend refreshed values are written to.
+        max_concurrency (int): Maximum number of refreshes running at once.
+            Defaults to 4.
+        lead (float): Fraction of the expiration period left when a key is
+            refreshed. Defaults to 0.1.
+        max_keys (int): Maximum number of registered keys, and of keys whose
+            reads are counted. Defaults to 1000.
+
+    Raises:
+        ValueError: If ``max_concurrency`` or ``max_keys`` is not positive, or
+            ``lead`` is not between 0 and 1.
+
+    Notes:
+        - A key stays registered while it is read at least ``threshold`` times
+          between two refreshes; otherwise it is dropped and left to expire.
+        - Loaders of async functions run on the event loop they were registered
+          from; loaders of sync functions run on a pool of ``max_concurrency``
+          threads. The worker thread starts with the first registration.
+        - The first run of a new key looks up its remaining lifetime with
+          `CacheBackend.get_with_meta` instead of recomputing it.
+        - A failed refresh drops the key; it is registered again once it is hot.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        max_concurrency: int = 4,
+        lead: float = 0.1,
+        max_keys: int = 1000,
+    ) -> None:
+        if max_concurrency < 1 or max_keys < 1:
+            raise ValueError("max_concurrency and max_keys must be positive")
+        if not 0 <= lead < 1:
+            raise ValueError("lead must be in [0, 1)")
+        self._backend = backend
+        self._max_concurrency = max_concurrency
+        self._lead = lead
+        self._max_keys = max_keys
+
+        self._cond = threading.Condition()
+        # key -> [reads, window start] for keys that are not registered yet.
+        self._candidates: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._entries: Dict[str, _Entry] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._sequence = 0
+        self._running = 0
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self._refreshed = 0
+        self._failed = 0
+        self._dropped = 0
+        self._rejected = 0
+
+    def record(self, key: str, threshold: int, period: float) -> bool:
+        """
+        Count a read of a key.
+
+        Args:
+            key (str): The cache key.
+            threshold (int): Reads per period that make the key hot.
+            period (float): The key's expiration period in seconds.
+
+        Returns:
+            bool: True if the key just became hot and should be registered.
+        """
+        now = time.monotonic()
+        with self._cond:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.hits += 1
+                return False
+            if self._closed:
+                return False
+
+            window = self._candidates.get(key)
+            if window is None or now - window[1] >= period:
+                window = self._candidates[key] = [0, now]
+                self._candidates.move_to_end(key)
+                if len(self._candidates) > self._max_keys:
+                    self._candidates.popitem(last=False)
+            window[0] += 1
+            if window[0] < threshold:
+                return False
+
+            del self._candidates[key]
+            if len(self._entries) >= self._max_keys:
+                self._rejected += 1
+                return False
+            return True
+
+    def register(
+        self,
+        key: str,
+        refresh: Callable[[], Any],
+        expire: Union[int, timedelta],
+        tags: Optional[Sequence[str]] = None,
+        threshold: int = 1,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        """
+        Register a hot key for refresh-ahead.
+
+        Args:
+            key (str): The cache key.
+            refresh (Callable[[], Any]): Computes the value to store. Returns an
+                awaitable when ``loop`` is set.
+            expire (Union[int, timedelta]): Expiration of the stored value.
+            tags (Optional[Sequence[str]]): Tags of the stored value.
+            threshold (int): Reads between two refreshes that keep the key registered.
+            loop (Optional[asyncio.AbstractEventLoop]): The event loop to run an
+                async ``refresh`` on; None for a sync one.
+        """
+        with self._cond:
+            if self._closed or key in self._entries:
+                return
+            entry = _Entry(key, refresh, loop, expire, tags, threshold, threshold)
+            self._entries[key] = entry
+            self._schedule(entry, time.monotonic())
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency,
+                    thread_name_prefix="fast-cache-refresh",
+                )
+                self._thread = threading.Thread(
+                    target=self._run, name="fast-cache-refresh-ahead", daemon=True
+                )
+                self._thread.start()
+
+    def _schedule(self, entry: _Entry, due: float) -> None:
+        """
+        Queue an entry's next run; the caller must hold the condition.
+
+        Args:
+            entry (_Entry): The registered entry.
+            due (float): `time.monotonic` value at which it runs.
+        """
+        entry.due = due
+        self._sequence += 1
+        heapq.heappush(self._heap, (due, self._sequence, entry.key))
+        self._cond.notify()
+
+    def _next_due(self) -> Optional[_Entry]:
+        """
+        Wait for the next entry to run; the caller must hold the condition.
+
+        Returns:
+            Optional[_Entry]: The entry, or None once the scheduler is closed.
+        """
+        while not self._closed:
+            if not self._heap or self._running >= self._max_concurrency:
+                self._cond.wait()
+                continue
+            due, _, key = self._heap[0]
+            wait = due - time.monotonic()
+            if wait > 0:
+                self._cond.wait(wait)
+                continue
+            heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is None or entry.due != due:
+                continue
+            if entry.probed:
+                if entry.hits < entry.threshold:
+                    del self._entries[key]
+                    self._dropped += 1
+                    continue
+                entry.hits = 0
+            self._running += 1
+            return entry
+        return None
+
+    def _run(self) -> None:
+        """
+        Worker loop: hand due entries to the event loop or the thread pool.
+        """
+        while True:
+            with self._cond:
+                entry = self._next_due()
+            if entry is None:
+                return
+            try:
+                if entry.loop is None:
+                    future = self._executor.submit(self._refresh_sync, entry)
+                else:
+                    future = asyncio.run_coroutine_threadsafe(
+                        self._refresh_async(entry), entry.loop
+                    )
+            except RuntimeError as exc:
+                # The entry's event loop or the pool is closed.
+                future = Future()
+                future.set_exception(exc)
+            future.add_done_callback(
+                lambda done, entry=entry: self._finished(entry, done)
+            )
+
+    def _refresh_sync(self, entry: _Entry) -> Optional[float]:
+        """
+        Refresh a sync entry, or look up its remaining lifetime on its first run.
+
+        Args:
+            entry (_Entry): The entry to refresh.
+
+        Returns:
+            Optional[float]: Seconds until the stored value expires, or None if
+            unknown.
+        """
+        if not entry.probed:
+            meta = self._backend.get_with_meta(entry.key)
+            return None if meta is None else meta.ttl
+        started = time.perf_counter()
+        value = entry.refresh()
+        if value is not None:
+            self._backend.set(
+                entry.key,
+                value,
+                expire=entry.expire,
+                **_tag_kwargs(entry.tags),
+                **_cost_kwargs(self._backend, time.perf_counter() - started),
+            )
+        return entry.period
+
+    async def _refresh_async(self, entry: _Entry) -> Optional[float]:
+        """
+        Refresh an async entry, or look up its remaining lifetime on its first run.
+
+        Args:
+            entry (_Entry): The entry to refresh.
+
+        Returns:
+            Optional[float]: Seconds until the stored value expires, or None if
+            unknown.
+        """
+        if not entry.probed:
+            meta = await self._backend.aget_with_meta(entry.key)
+            return None if meta is None else meta.ttl
+        started = time.perf_counter()
+        value = await entry.refresh()
+        if value is not None:
+            await self._backend.aset(
+                entry.key,
+                value,
+                expire=entry.expire,
+                **_tag_kwargs(entry.tags),
+                **_cost_kwargs(self._backend, time.perf_counter() - started),
+            )
+        return entry.period
+
+    def _finished(self, entry: _Entry, future: Future) -> None:
+        """
+        Schedule an entry's next refresh once a run completes.
+
+        Args:
+            entry (_Entry): The entry that ran.
+            future (Future): The completed run.
+        """
+        with self._cond:
+            self._running -= 1
+            self._cond.notify()
+            if self._entries.get(entry.key) is not entry:
+                return
+            if future.cancelled() or future.exception() is not None:
+                del self._entries[entry.key]
+                self._failed += 1
+                return
+            if entry.probed:
+                self._refreshed += 1
+            entry.probed = True
+            remaining = future.result()
+            if remaining is None:
+                remaining = 0.0
+            self._schedule(
+                entry,
+                time.monotonic() + max(0.0, remaining - self._lead * entry.period),
+            )
+
+    def close(self) -> None:
+        """
+        Stop refreshing and forget every registered key.
+
+        Refreshes already running complete on their own.
+
+        Notes:
+            - Called automatically by `FastAPICache.lifespan_handler` on shutdown.
+        """
+        with self._cond:
+            self._closed = True
+            self._entries.clear()
+            self._candidates.clear()
+            self._heap.clear()
+            self._cond.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return scheduler metrics.
+
+        Returns:
+            Dict[str, Any]: ``keys`` (registered keys), ``tracked`` (keys whose
+            reads are counted), ``in_flight`` runs, and the ``refreshed``,
+            ``failed``, ``dropped`` (no longer hot) and ``rejected`` (over
+            ``max_keys``) counters.
+        """
+        with self._cond:
+            return {
+                "keys": len(self._entries),
+                "tracked": len(self._candidates),
+                "in_flight": self._running,
+                "refreshed": self._refreshed,
+                "failed": self._failed,
+                "dropped": self._dropped,
+                "rejected": self._rejected,
+            }
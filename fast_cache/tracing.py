@@ -0,0 +1,281 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Optional
+
+# The operation currently being traced in this context, if any.
+_current: ContextVar[Optional["OperationEvent"]] = ContextVar(
+    "fast_cache_operation", default=None
+)
+
+
+class OperationEvent:
+    """
+    Description of one traced cache operation, passed to observers.
+
+    Backend operations (``get``, ``set``, ...) are emitted by `TracingBackend`
+    and decorated calls (operation ``"cached"``) by `FastAPICache.cached`. The
+    backend operations a decorated call performs are its children, and their
+    sizes and timings are added to it, so the ``cached`` event alone shows where
+    the time of a slow request went.
+
+    Attributes:
+        op (str): Operation name.
+        key (Optional[str]): Cache key, or None for multi-key and namespace operations.
+        namespace (str): Namespace of the backend or of the decorator.
+        backend (str): Backend label; empty for decorated calls.
+        function (str): Decorated function (``module:qualname``); empty for
+            backend operations.
+        parent (Optional[OperationEvent]): The enclosing traced operation.
+        hit (Optional[bool]): Whether the lookup found a value; None for writes.
+        value_size (int): Payload bytes read or written.
+        network_time (float): Seconds spent in the backend call other than
+            (de)serialization.
+        serialization_time (float): Seconds spent pickling and unpickling.
+        compute_time (float): Seconds spent running the decorated function on a miss.
+        duration (float): Total seconds, set before `CacheObserver.after_op`.
+        error (Optional[BaseException]): The error raised, or swallowed by the
+            backend, during the operation.
+        state (Dict[Any, Any]): Scratch space for observers, e.g. to keep a span
+            between `before_op` and `after_op`.
+    """
+
+    __slots__ = (
+        "op",
+        "key",
+        "namespace",
+        "backend",
+        "function",
+        "parent",
+        "hit",
+        "value_size",
+        "network_time",
+        "serialization_time",
+        "compute_time",
+        "duration",
+        "error",
+        "state",
+        "_started",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        op: str,
+        key: Optional[str] = None,
+        namespace: str = "",
+        backend: str = "",
+        function: str = "",
+    ) -> None:
+        self.op = op
+        self.key = key
+        self.namespace = namespace
+        self.backend = backend
+        self.function = function
+        self.parent: Optional[OperationEvent] = None
+        self.hit: Optional[bool] = None
+        self.value_size = 0
+        self.network_time = 0.0
+        self.serialization_time = 0.0
+        self.compute_time = 0.0
+        self.duration = 0.0
+        self.error: Optional[BaseException] = None
+        self.state: Dict[Any, Any] = {}
+
+
+class CacheObserver:
+    """
+    Base class for tracing hooks.
+
+    Subclasses override `before_op` and/or `after_op`. Hooks run inline on the
+    calling thread or task, so they should be quick and must not raise.
+    """
+
+    def before_op(self, event: OperationEvent) -> None:
+        """
+        Called when an operation starts; only identifying fields are set.
+
+        Args:
+            event (OperationEvent): The operation.
+        """
+
+    def after_op(self, event: OperationEvent) -> None:
+        """
+        Called when an operation finished, successfully or not.
+
+        Args:
+            event (OperationEvent): The operation, with sizes and timings filled in.
+        """
+
+
+class Tracer:
+    """
+    Dispatches operation events to a fixed set of observers.
+
+    Args:
+        observers (Iterable[CacheObserver]): The observers to notify.
+    """
+
+    def __init__(self, observers: Iterable[CacheObserver]) -> None:
+        self.observers = tuple(observers)
+
+    def start(
+        self,
+        op: str,
+        key: Optional[str] = None,
+        namespace: str = "",
+        backend: str = "",
+        function: str = "",
+    ) -> OperationEvent:
+        """
+        Begin an operation and make it current for nested operations.
+
+        Args:
+            op (str): Operation name.
+            key (Optional[str]): Cache key.
+            namespace (str): Namespace label.
+            backend (str): Backend label.
+            function (str): Decorated function label.
+
+        Returns:
+            OperationEvent: The event, to be passed to `finish`.
+        """
+        event = OperationEvent(op, key, namespace, backend, function)
+        event.parent = _current.get()
+        event._token = _current.set(event)
+        for observer in self.observers:
+            observer.before_op(event)
+        event._started = time.perf_counter()
+        return event
+
+    def finish(
+        self, event: OperationEvent, error: Optional[BaseException] = None
+    ) -> None:
+        """
+        End an operation, roll its timings up into the parent and notify observers.
+
+        Args:
+            event (OperationEvent): The event returned by `start`.
+            error (Optional[BaseException]): The exception the operation raised.
+        """
+        event.duration = time.perf_counter() - event._started
+        _current.reset(event._token)
+        if error is not None:
+            event.error = error
+        if event.backend:
+            event.network_time = max(0.0, event.duration - event.serialization_time)
+
+        parent = event.parent
+        if parent is not None:
+            parent.value_size += event.value_size
+            parent.network_time += event.network_time
+            parent.serialization_time += event.serialization_time
+
+        for observer in self.observers:
+            observer.after_op(event)
+
+    @staticmethod
+    def on_payload(operation: str, size: int, seconds: float) -> None:
+        """
+        Add a payload reported by a backend to the current operation.
+
+        Args:
+            operation (str): ``"get"`` or ``"set"``.
+            size (int): Payload size in bytes.
+            seconds (float): Time spent (de)serializing the payload.
+        """
+        event = _current.get()
+        if event is not None:
+            event.value_size += size
+            event.serialization_time += seconds
+
+    @staticmethod
+    def on_error(operation: str, exc: BaseException) -> None:
+        """
+        Attach an error the backend swallowed to the current operation.
+
+        Args:
+            operation (str): The sync operation name.
+            exc (BaseException): The swallowed exception.
+        """
+        event = _current.get()
+        if event is not None:
+            event.error = exc
+
+
+class OpenTelemetryObserver(CacheObserver):
+    """
+    Observer that records every cache operation as an OpenTelemetry span.
+
+    Spans are named ``cache.<op>`` and nested under the active span, so backend
+    operations appear as children of the decorated call, which in turn is a
+    child of the request span created by an instrumented FastAPI app.
+
+    Args:
+        tracer (Optional[Any]): An OpenTelemetry tracer. Defaults to
+            ``trace.get_tracer("fast_cache")``.
+
+    Raises:
+        ImportError: If ``opentelemetry-api`` is not installed.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None) -> None:
+        try:
+            from opentelemetry import context, trace
+        except ImportError:
+            raise ImportError(
+                "OpenTelemetryObserver requires the 'opentelemetry-api' package. "
+                "Install it with: pip install fast-cache[otel]"
+            )
+
+        self._context = context
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("fast_cache")
+
+    def before_op(self, event: OperationEvent) -> None:
+        """
+        Start a span for the operation and make it the active span.
+
+        Args:
+            event (OperationEvent): The operation.
+        """
+        kind = (
+            self._trace.SpanKind.CLIENT
+            if event.backend
+            else self._trace.SpanKind.INTERNAL
+        )
+        span = self._tracer.start_span(f"cache.{event.op}", kind=kind)
+        token = self._context.attach(self._trace.set_span_in_context(span))
+        event.state[self] = (span, token)
+
+    def after_op(self, event: OperationEvent) -> None:
+        """
+        Annotate and end the operation's span.
+
+        Args:
+            event (OperationEvent): The operation.
+        """
+        span, token = event.state.pop(self)
+        attributes = {
+            "cache.operation": event.op,
+            "cache.namespace": event.namespace,
+            "cache.value_size": event.value_size,
+            "cache.network_time": event.network_time,
+            "cache.serialization_time": event.serialization_time,
+        }
+        if event.key is not None:
+            attributes["cache.key"] = event.key
+        if event.backend:
+            attributes["db.system"] = event.backend
+        if event.function:
+            attributes["code.function"] = event.function
+            attributes["cache.compute_time"] = event.compute_time
+        if event.hit is not None:
+            attributes["cache.hit"] = event.hit
+        span.set_attributes(attributes)
+
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+
+        self._context.detach(token)
+        span.end()
@@ -0,0 +1,199 @@
+import asyncio
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Any, Deque, Dict, Optional, Tuple, Union
+
+from .backends.backend import CacheBackend
+
+OVERFLOW_POLICIES = ("drop_newest", "drop_oldest")
+
+
+class WriteBehindQueue:
+    """
+    Bounded background queue that takes cache writes off the response path.
+
+    Writes are handed to the queue with `enqueue` and drained by a single worker
+    task, which groups them by expiration and stores each group with one
+    `aset_many` call, so backends with pipelines or multi-set support write a
+    whole batch in one round trip.
+
+    Args:
+        backend (CacheBackend): The backend writes are flushed to.
+        max_size (int): Maximum number of pending writes. Defaults to 10000.
+        batch_size (int): Maximum number of writes flushed per batch. Defaults to 100.
+        overflow (str): What to do when the queue is full: ``"drop_newest"``
+            rejects the incoming write, ``"drop_oldest"`` discards the oldest
+            pending write. Defaults to ``"drop_newest"``.
+
+    Raises:
+        ValueError: If ``overflow`` is not a known policy.
+
+    Notes:
+        - The worker is started lazily on the first enqueue and runs on that
+          event loop.
+        - Dropped writes only cost a future cache miss; they are counted in `stats`.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        max_size: int = 10000,
+        batch_size: int = 100,
+        overflow: str = "drop_newest",
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Invalid overflow policy {overflow!r}; expected one of {OVERFLOW_POLICIES}"
+            )
+        self._backend = backend
+        self._max_size = max_size
+        self._batch_size = batch_size
+        self._overflow = overflow
+
+        self._items: Deque[Tuple[str, Any, Optional[Union[int, timedelta]], float]] = (
+            deque()
+        )
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._closing = False
+
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+        self._total_lag = 0.0
+
+    def enqueue(
+        self, key: str, value: Any, expire: Optional[Union[int, timedelta]] = None
+    ) -> bool:
+        """
+        Queue a write to be flushed in the background.
+
+        Must be called from a running event loop.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value to store.
+            expire (Optional[Union[int, timedelta]]): Expiration time in seconds or as timedelta.
+
+        Returns:
+            bool: True if the write was queued, False if it was dropped.
+        """
+        if self._closing:
+            self._dropped += 1
+            return False
+
+        if len(self._items) >= self._max_size:
+            self._dropped += 1
+            if self._overflow == "drop_newest":
+                return False
+            self._items.popleft()
+
+        self._items.append((key, value, expire, time.monotonic()))
+        self._enqueued += 1
+        self._ensure_worker()
+        self._wakeup.set()
+        return True
+
+    def _ensure_worker(self) -> None:
+        """
+        Start the worker task on the running loop if it is not running there yet.
+        """
+        loop = asyncio.get_running_loop()
+        worker = self._worker
+        if worker is not None and not worker.done() and worker.get_loop() is loop:
+            return
+        self._wakeup = asyncio.Event()
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """
+        Worker loop: wait for writes and flush them in batches.
+        """
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._items:
+                await self._flush_batch()
+            if self._closing:
+                return
+
+    async def _flush_batch(self) -> None:
+        """
+        Pop up to `batch_size` writes and store them, grouped by expiration.
+        """
+        groups: Dict[Any, Dict[str, Any]] = {}
+        enqueued_at: Dict[Any, float] = {}
+        for _ in range(min(self._batch_size, len(self._items))):
+            key, value, expire, queued = self._items.popleft()
+            groups.setdefault(expire, {})[key] = value
+            enqueued_at.setdefault(expire, queued)
+
+        for expire, items in groups.items():
+            try:
+                await self._backend.aset_many(items, expire=expire)
+            except Exception:
+                self._failed += len(items)
+                continue
+            lag = time.monotonic() - enqueued_at[expire]
+            self._written += len(items)
+            self._batches += 1
+            self._last_lag = lag
+            self._max_lag = max(self._max_lag, lag)
+            self._total_lag += lag
+
+    async def flush(self) -> None:
+        """
+        Write every pending item now, on the calling task.
+        """
+        while self._items:
+            await self._flush_batch()
+
+    async def aclose(self) -> None:
+        """
+        Stop accepting writes, flush everything pending and stop the worker.
+
+        Notes:
+            - Called automatically by `FastAPICache.lifespan_handler` on shutdown.
+        """
+        self._closing = True
+        worker = self._worker
+        if worker is not None and not worker.done():
+            try:
+                current_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                current_loop = None
+            if worker.get_loop() is current_loop:
+                self._wakeup.set()
+                await worker
+            else:
+                worker.cancel()
+        await self.flush()
+        self._worker = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return queue metrics.
+
+        Returns:
+            Dict[str, Any]: ``depth`` (pending writes), ``enqueued``, ``written``,
+            ``dropped`` and ``failed`` counters, ``batches`` flushed, and write
+            lag in seconds between enqueue and completed write (``last_lag``,
+            ``max_lag``, ``avg_lag``).
+        """
+        return {
+            "depth": len(self._items),
+            "max_size": self._max_size,
+            "enqueued": self._enqueued,
+            "written": self._written,
+            "dropped": self._dropped,
+            "failed": self._failed,
+            "batches": self._batches,
+            "last_lag": self._last_lag,
+            "max_lag": self._max_lag,
+            "avg_lag": self._total_lag / self._batches if self._batches else 0.0,
+        }
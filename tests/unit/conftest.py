@@ -0,0 +1,25 @@
+import pytest
+
+from fast_cache import CacheBackend, InMemoryBackend
+
+
+@pytest.fixture
+def memory():
+    """Factory of in-memory backends without a cleanup thread."""
+
+    def make(namespace: str = "fastapi-cache", **kwargs):
+        return InMemoryBackend(namespace, cleanup_interval=None, **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def plain():
+    """Factory of in-memory backends using the `CacheBackend` defaults of ``methods``."""
+
+    def make(*methods: str, **kwargs):
+        defaults = {name: getattr(CacheBackend, name) for name in methods}
+        backend_class = type("PlainBackend", (InMemoryBackend,), defaults)
+        return backend_class(cleanup_interval=None, **kwargs)
+
+    return make
@@ -0,0 +1,122 @@
+import collections
+import copy
+import json
+import random
+
+import pytest
+
+from fast_cache import InMemoryBackend
+from fast_cache.bench import (
+    Workload,
+    compare_results,
+    create_backend,
+    parse_size,
+    run_workload,
+)
+from fast_cache.bench.__main__ import main
+from fast_cache.bench.workload import zipf_sampler
+
+
+@pytest.fixture
+def backend():
+    backend = InMemoryBackend(namespace="bench-test")
+    yield backend
+    backend.close()
+
+
+def test_parse_size():
+    assert parse_size("100") == 100
+    assert parse_size("100B") == 100
+    assert parse_size("4KB") == 4096
+    assert parse_size("1mb") == 1024**2
+    with pytest.raises(ValueError):
+        parse_size("lots")
+
+
+def test_zipf_is_skewed():
+    sample = zipf_sampler(1000, 1.2, random.Random(1))
+    counts = collections.Counter(sample() for _ in range(10000))
+    assert counts[0] > counts[10] > counts.get(500, 0)
+
+
+def test_workload_validation():
+    with pytest.raises(ValueError):
+        Workload(distribution="pareto")
+    with pytest.raises(ValueError):
+        Workload(read_ratio=1.5)
+
+
+def test_plan_splits_operations_between_workers():
+    workload = Workload(operations=10, concurrency=3, read_ratio=1.0)
+    plans = [workload.plan(worker) for worker in range(3)]
+    assert sorted(len(plan) for plan in plans) == [3, 3, 4]
+    assert all(op == "get" for plan in plans for op, _ in plan)
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_run_workload(backend, mode):
+    workload = Workload(
+        num_keys=100, operations=500, concurrency=4, mode=mode, value_size=64
+    )
+    result = run_workload(backend, workload, "memory")
+
+    assert result["operations"]["all"]["count"] == 500
+    assert result["hits"] == result["operations"]["get"]["count"]
+    assert result["misses"] == 0
+    assert result["errors"] == 0
+    assert result["throughput"] > 0
+    assert result["workload"]["mode"] == mode
+
+
+def test_compare_flags_regressions(backend):
+    baseline = run_workload(backend, Workload(num_keys=10, operations=100), "memory")
+    slower = copy.deepcopy(baseline)
+    slower["throughput"] = baseline["throughput"] * 0.5
+
+    regressions = compare_results([baseline], [slower], threshold=0.1)
+    assert [regression["metric"] for regression in regressions] == ["throughput"]
+    assert compare_results([baseline], [baseline]) == []
+
+
+def test_cli_run_and_compare(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    assert (
+        main(
+            [
+                "run",
+                "--keys",
+                "50",
+                "--operations",
+                "200",
+                "--concurrency",
+                "1,2",
+                "--value-size",
+                "10B,1KB",
+                "--output",
+                str(output),
+            ]
+        )
+        == 0
+    )
+    results = json.loads(output.read_text())["results"]
+    assert len(results) == 4
+
+    slower = tmp_path / "slower.json"
+    for result in results:
+        result["throughput"] /= 2
+    slower.write_text(json.dumps({"results": results}))
+
+    assert main(["compare", str(output), str(output)]) == 0
+    assert main(["compare", str(output), str(slower)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_fakeredis_stand_in():
+    pytest.importorskip("fakeredis")
+    backend, stack = create_backend("redis")
+    with stack:
+        result = run_workload(
+            backend, Workload(num_keys=20, operations=100, mode="sync"), "redis"
+        )
+    assert result["errors"] == 0
+    assert result["misses"] == 0
@@ -0,0 +1,52 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from fast_cache.bench import bench_asgi, bench_decorator, compare_decorator
+from fast_cache.bench.asgi import ENDPOINTS
+from fast_cache.bench.decorator import PATHS, SHAPES
+
+BASELINE = Path(__file__).parents[2] / "benchmarks" / "decorator_baseline.json"
+
+
+def test_bench_decorator_covers_paths_and_shapes():
+    results = bench_decorator(iterations=200)
+    assert {(r["mode"], r["path"], r["shape"]) for r in results} == {
+        (mode, path, shape)
+        for mode in ("sync", "async")
+        for path in PATHS
+        for shape in SHAPES
+    }
+    assert all(r["ns_per_call"] > 0 for r in results)
+    assert all(r["overhead_ns"] == 0 for r in results if r["path"] == "call")
+
+
+def test_compare_decorator_flags_growth():
+    baseline = [
+        {"mode": "sync", "path": "hit", "shape": "no_args", "relative": 1.0},
+        {"mode": "sync", "path": "call", "shape": "no_args", "relative": 0.1},
+    ]
+    current = [
+        {"mode": "sync", "path": "hit", "shape": "no_args", "relative": 1.5},
+        {"mode": "sync", "path": "call", "shape": "no_args", "relative": 1.0},
+    ]
+    regressions = compare_decorator(baseline, current, threshold=0.25)
+    assert [r["name"] for r in regressions] == ["sync hit no_args"]
+    assert compare_decorator(baseline, baseline) == []
+
+
+def test_overhead_within_tracked_baseline():
+    # Generous threshold: catches order-of-magnitude regressions of the wrapper
+    # hot path on noisy CI machines. Use the CLI for precise comparisons.
+    baseline = json.loads(BASELINE.read_text())["results"]
+    results = bench_decorator(iterations=2000, modes=("sync",))
+    assert compare_decorator(baseline, results, threshold=3.0) == []
+
+
+@pytest.mark.asyncio
+async def test_bench_asgi_serves_every_endpoint():
+    results = await bench_asgi(requests=50, concurrency=5, num_keys=10)
+    assert [r["endpoint"] for r in results] == list(ENDPOINTS)
+    assert all(r["errors"] == 0 and r["rps"] > 0 for r in results)
+    assert all(r["latency"]["count"] == 50 for r in results)
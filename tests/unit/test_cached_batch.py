@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+
+from fast_cache import FastAPICache, InMemoryBackend
+
+
+class CountingBackend(InMemoryBackend):
+    def __init__(self):
+        super().__init__(namespace="batch-test")
+        self.calls = []
+
+    async def aget_many(self, keys):
+        self.calls.append(("get_many", sorted(keys)))
+        return await super().aget_many(keys)
+
+    async def aset_many(self, items, expire=None):
+        self.calls.append(("set_many", sorted(items)))
+        await super().aset_many(items, expire=expire)
+
+
+@pytest.fixture
+def cache():
+    cache = FastAPICache()
+    backend = CountingBackend()
+    cache.init_app(FastAPI(), backend, default_expire=60)
+    yield cache
+    backend.close()
+
+
+@pytest.mark.asyncio
+async def test_same_tick_calls_are_batched(cache):
+    loads = []
+
+    @cache.cached_batch(key_builder=lambda user_id: f"user:{user_id}")
+    async def get_users(ids):
+        loads.append(sorted(ids))
+        return {i: {"id": i} for i in ids if i != 99}
+
+    results = await asyncio.gather(get_users(1), get_users(2), get_users(1))
+    assert results == [{"id": 1}, {"id": 2}, {"id": 1}]
+    assert loads == [[1, 2]]
+    assert cache.get_cache().calls == [
+        ("get_many", ["user:1", "user:2"]),
+        ("set_many", ["user:1", "user:2"]),
+    ]
+
+    found = await get_users.load_many([1, 2, 3, 99])
+    assert found == {1: {"id": 1}, 2: {"id": 2}, 3: {"id": 3}}
+    assert loads == [[1, 2], [3, 99]]
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_splits_loader_calls(cache):
+    loads = []
+
+    @cache.cached_batch(max_batch_size=2)
+    async def get_items(ids):
+        loads.append(list(ids))
+        return {i: i * 10 for i in ids}
+
+    assert await get_items.load_many(range(5)) == {i: i * 10 for i in range(5)}
+    assert loads == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_loader_errors_propagate_to_every_caller(cache):
+    @cache.cached_batch()
+    async def broken(ids):
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(broken(1), broken(2), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_sync_loader_rejected(cache):
+    with pytest.raises(TypeError):
+
+        @cache.cached_batch()
+        def not_async(ids):
+            return {}
+
+
+def test_in_memory_get_many_and_set_many(in_memory_cache):
+    in_memory_cache.set_many({"a": 1, "b": 2})
+    assert in_memory_cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
@@ -0,0 +1,98 @@
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+
+from fast_cache import FastAPICache, InMemoryBackend
+
+
+@pytest.fixture
+def cache():
+    cache = FastAPICache()
+    backend = InMemoryBackend(namespace="dependency-test")
+    cache.init_app(FastAPI(), backend, default_expire=60)
+    yield cache
+    backend.close()
+
+
+def test_shared_across_requests_by_header(cache):
+    app = FastAPI()
+    calls = []
+
+    @cache.cached_dependency(headers=["authorization"])
+    async def current_user(request: Request):
+        calls.append(request.headers.get("authorization"))
+        return {"token": request.headers.get("authorization")}
+
+    @app.get("/me")
+    async def me(user=Depends(current_user)):
+        return user
+
+    with TestClient(app) as client:
+        assert client.get("/me", headers={"Authorization": "a"}).json() == {
+            "token": "a"
+        }
+        assert client.get("/me", headers={"Authorization": "a"}).json() == {
+            "token": "a"
+        }
+        assert client.get("/me", headers={"Authorization": "b"}).json() == {
+            "token": "b"
+        }
+
+    assert calls == ["a", "b"]
+
+
+def test_request_scoped_memo_without_backend_sharing(cache):
+    app = FastAPI()
+    calls = []
+
+    def session():
+        return object()
+
+    @cache.cached_dependency(path_params=["tenant"], shared=False)
+    def tenant_config(db=Depends(session)):
+        calls.append(db)
+        return {"plan": "pro"}
+
+    def limits(config=Depends(tenant_config, use_cache=False)):
+        return config
+
+    def features(config=Depends(tenant_config, use_cache=False)):
+        return config
+
+    @app.get("/t/{tenant}")
+    def endpoint(a=Depends(limits), b=Depends(features)):
+        return {"same": a is b}
+
+    with TestClient(app) as client:
+        assert client.get("/t/acme").json() == {"same": True}
+        assert client.get("/t/acme").json() == {"same": True}
+
+    assert len(calls) == 2
+
+
+def test_path_param_keys_are_distinct(cache):
+    app = FastAPI()
+    calls = []
+
+    @cache.cached_dependency(path_params=["tenant"], request_scoped=False)
+    async def tenant_config(request: Request):
+        calls.append(request.path_params["tenant"])
+        return request.path_params["tenant"]
+
+    @app.get("/t/{tenant}")
+    async def endpoint(tenant_name=Depends(tenant_config)):
+        return {"tenant": tenant_name}
+
+    with TestClient(app) as client:
+        for name in ("a", "b", "a", "b"):
+            assert client.get(f"/t/{name}").json() == {"tenant": name}
+
+    assert calls == ["a", "b"]
+
+
+def test_yield_dependencies_rejected(cache):
+    with pytest.raises(TypeError):
+
+        @cache.cached_dependency()
+        def dep():
+            yield 1
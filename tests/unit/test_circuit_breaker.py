@@ -0,0 +1,164 @@
+import asyncio
+import time
+
+import pytest
+
+from fast_cache import (
+    CircuitBreaker,
+    CircuitBreakerBackend,
+    InMemoryBackend,
+    MetricsBackend,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FlakyBackend(InMemoryBackend):
+    """Backend that can stall, raise, or swallow errors like RedisBackend."""
+
+    def __init__(self):
+        super().__init__(namespace="breaker-test", cleanup_interval=None)
+        self.delay = 0.0
+        self.mode = "ok"
+        self.calls = 0
+
+    def get(self, key):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.mode == "raise":
+            raise ConnectionError("down")
+        if self.mode == "swallow":
+            self._report_error("get", ConnectionError("down"))
+            return None
+        return super().get(key)
+
+    async def aget(self, key):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.mode == "raise":
+            raise ConnectionError("down")
+        return await super().aget(key)
+
+
+def test_breaker_opens_and_recovers():
+    clock = Clock()
+    breaker = CircuitBreaker(window=4, min_calls=4, reset_timeout=10, clock=clock)
+
+    for success in (True, True, False, True):
+        assert breaker.allow()
+        breaker.record(success)
+    assert breaker.state == "closed"
+
+    # The window is now [True, False, True, False]: half of the calls failed.
+    assert breaker.allow()
+    breaker.record(False)
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()  # one probe at a time
+    breaker.record(False)
+    assert breaker.state == "open"
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record(True)
+    assert breaker.state == "closed"
+    assert breaker.stats()["times_opened"] == 2
+
+
+def test_sync_timeout_returns_miss():
+    inner = FlakyBackend()
+    inner.set("a", 1)
+    backend = CircuitBreakerBackend(inner, timeouts={"get": 0.05})
+    assert backend.get("a") == 1
+
+    inner.delay = 0.5
+    started = time.perf_counter()
+    assert backend.get("a") is None
+    assert time.perf_counter() - started < 0.3
+    assert backend.stats()["timeouts"] == 1
+    backend.close()
+
+
+@pytest.mark.asyncio
+async def test_async_timeout_returns_miss():
+    inner = FlakyBackend()
+    await inner.aset("a", 1)
+    backend = CircuitBreakerBackend(inner, timeouts=0.05)
+    assert await backend.aget("a") == 1
+
+    inner.delay = 0.5
+    started = time.perf_counter()
+    assert await backend.aget("a") is None
+    assert time.perf_counter() - started < 0.3
+    assert backend.stats()["timeouts"] == 1
+    await backend.aclose()
+
+
+@pytest.mark.parametrize("mode", ["raise", "swallow"])
+def test_open_breaker_bypasses_backend(mode):
+    inner = FlakyBackend()
+    breaker = CircuitBreaker(window=5, min_calls=5, reset_timeout=60)
+    backend = CircuitBreakerBackend(inner, breaker=breaker)
+
+    inner.mode = mode
+    for _ in range(5):
+        assert backend.get("a") is None
+    assert breaker.state == "open"
+
+    calls = inner.calls
+    assert backend.get("a") is None
+    backend.set("a", 1)
+    assert inner.calls == calls
+    assert backend.stats()["bypassed"] == 2
+    backend.close()
+
+
+def test_failures_reach_metrics():
+    inner = FlakyBackend()
+    inner.mode = "raise"
+    metrics = MetricsBackend(CircuitBreakerBackend(inner))
+    assert metrics.get("a") is None
+    stats = metrics.metrics.stats()
+    assert stats["namespaces"]["flaky:breaker-test"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_compute_locks_go_through_the_breaker():
+    backend = CircuitBreakerBackend(FlakyBackend())
+    assert await backend.aget_or_set("k", lambda: 1) == 1
+    # The miss, the lock, the check under the lock, the write and the unlock.
+    assert backend.stats()["calls"] == 5
+    backend.close()
+
+
+def test_open_breaker_falls_back_to_local_locks():
+    inner = FlakyBackend()
+    breaker = CircuitBreaker(window=1, min_calls=1, reset_timeout=60)
+    breaker.record(False)
+    backend = CircuitBreakerBackend(inner, breaker=breaker)
+
+    token = backend._acquire_lock("k", 60)
+    assert token is not None
+    assert backend._acquire_lock("k", 60) is None
+    assert inner._acquire_lock("k", 60) is not None
+    backend._release_lock("k", token)
+    assert backend._acquire_lock("k", 60) is not None
+    assert inner.calls == 0
+    assert backend.stats()["bypassed"] == 3
+    assert backend.get_or_set("other", lambda: 1) == 1
+    backend.close()
+
+
+def test_rejects_unknown_operations():
+    with pytest.raises(ValueError):
+        CircuitBreakerBackend(FlakyBackend(), timeouts={"fetch": 1})
@@ -0,0 +1,136 @@
+import gzip
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from fast_cache import FastAPICache, InMemoryBackend
+from fast_cache.compression import select_encoding
+
+
+@pytest.fixture
+def app_and_calls():
+    app = FastAPI()
+    cache = FastAPICache()
+    backend = InMemoryBackend(namespace="compression-test")
+    cache.init_app(app, backend, default_expire=60)
+    calls = {"count": 0}
+
+    @app.get("/items")
+    @cache.cached(encodings=("gzip",))
+    async def items(n: int):
+        calls["count"] += 1
+        return {"items": [f"item-{i}" for i in range(n)]}
+
+    @app.get("/lazy")
+    @cache.cached(encodings=("gzip",), lazy_encoding=True)
+    def lazy(request: Request, n: int):
+        calls["count"] += 1
+        return {"path": request.url.path, "items": list(range(n))}
+
+    yield app, calls, backend
+    backend.close()
+
+
+def test_select_encoding_prefers_highest_q():
+    assert select_encoding("gzip;q=0.5, br", ("gzip", "br")) == "br"
+    assert select_encoding("gzip, br;q=0", ("br", "gzip")) == "gzip"
+    assert select_encoding("identity", ("gzip",)) is None
+    assert select_encoding(None, ("gzip",)) is None
+    assert select_encoding("*", ("gzip",)) == "gzip"
+
+
+def test_gzip_variant_served_from_cache(app_and_calls):
+    app, calls, _ = app_and_calls
+    with TestClient(app) as client:
+        first = client.get("/items", params={"n": 200})
+        second = client.get(
+            "/items",
+            params={"n": 200},
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+    assert calls["count"] == 1
+    assert first.headers["vary"] == "Accept-Encoding"
+    assert second.headers["content-encoding"] == "gzip"
+    assert second.json() == first.json()
+
+
+def test_identity_when_not_accepted(app_and_calls):
+    app, _, _ = app_and_calls
+    with TestClient(app) as client:
+        resp = client.get(
+            "/items", params={"n": 200}, headers={"Accept-Encoding": "identity"}
+        )
+    assert "content-encoding" not in resp.headers
+    assert len(resp.json()["items"]) == 200
+
+
+def test_small_bodies_are_not_compressed(app_and_calls):
+    app, _, _ = app_and_calls
+    with TestClient(app) as client:
+        resp = client.get(
+            "/items", params={"n": 1}, headers={"Accept-Encoding": "gzip"}
+        )
+    assert "content-encoding" not in resp.headers
+
+
+def test_lazy_variant_written_back(app_and_calls):
+    app, calls, backend = app_and_calls
+    with TestClient(app) as client:
+        client.get("/lazy", params={"n": 300}, headers={"Accept-Encoding": "identity"})
+        resp = client.get(
+            "/lazy", params={"n": 300}, headers={"Accept-Encoding": "gzip"}
+        )
+
+    assert calls["count"] == 1
+    assert resp.headers["content-encoding"] == "gzip"
+    entries = [entry[0] for entry in backend._cache.values()]
+    assert len(entries) == 1
+    assert gzip.decompress(entries[0].variants["gzip"]) == entries[0].body
+
+
+def test_headers_are_replayed_without_cookies():
+    app = FastAPI()
+    cache = FastAPICache()
+    cache.init_app(app, InMemoryBackend(cleanup_interval=None), default_expire=60)
+
+    @app.get("/session")
+    @cache.cached(encodings=("gzip",))
+    async def session():
+        response = Response("x" * 1000, media_type="text/plain")
+        response.headers.append("link", "</a>; rel=preload")
+        response.headers.append("link", "</b>; rel=preload")
+        response.set_cookie("session", "first-client")
+        return response
+
+    with TestClient(app) as client:
+        first = client.get("/session", headers={"Accept-Encoding": "gzip"})
+        second = client.get("/session", headers={"Accept-Encoding": "gzip"})
+
+    assert first.headers.get_list("set-cookie")[0].startswith("session=first-client")
+    assert "set-cookie" not in second.headers
+    for resp in (first, second):
+        assert resp.headers.get_list("link") == [
+            "</a>; rel=preload",
+            "</b>; rel=preload",
+        ]
+        assert resp.headers["content-type"] == "text/plain; charset=utf-8"
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.text == "x" * 1000
+
+
+def test_streaming_responses_are_rejected():
+    app = FastAPI()
+    cache = FastAPICache()
+    cache.init_app(app, InMemoryBackend(cleanup_interval=None), default_expire=60)
+
+    @app.get("/stream")
+    @cache.cached(encodings=("gzip",))
+    async def stream():
+        return StreamingResponse(iter([b"chunk"]))
+
+    with TestClient(app) as client:
+        with pytest.raises(TypeError, match="StreamingResponse"):
+            client.get("/stream")
@@ -0,0 +1,225 @@
+import asyncio
+import io
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+
+from fast_cache import (
+    FastAPICache,
+    InMemoryBackend,
+    RecordingBackend,
+    ShardedBackend,
+    TraceRecord,
+    read_trace,
+)
+from fast_cache.bench import simulate
+from fast_cache.bench.simulate import VirtualClock
+
+
+def saved(backend):
+    return backend.stats()["saved_compute_seconds"]
+
+
+@pytest.mark.parametrize("eviction, kept", [("lru", False), ("gdsf", True)])
+def test_gdsf_keeps_expensive_entries(eviction, kept, memory):
+    backend = memory(max_size=3, eviction=eviction)
+    backend.set("report", "r", cost=5.0)
+    for i in range(10):
+        backend.set(f"cheap{i}", "c", cost=0.001)
+        backend.get(f"cheap{i}")
+    assert (backend.get("report") == "r") is kept
+    assert backend.stats()["evictions"] == 8
+    assert backend.stats()["entries"] == 3
+
+
+def test_gdsf_ages_out_idle_expensive_entries(memory):
+    backend = memory(max_size=2, eviction="gdsf")
+    backend.set("stale", "s", cost=0.05)
+    for i in range(200):
+        backend.set(f"k{i}", "v", cost=0.01)
+        backend.get(f"k{i}")
+        backend.get(f"k{i}")
+    assert backend.get("stale") is None
+
+
+def test_gdsf_weighs_value_size(memory):
+    backend = memory(max_size=2, eviction="gdsf", sizer=len)
+    backend.set("large", "x" * 1000, cost=1.0)
+    backend.set("small", "x", cost=1.0)
+    backend.set("new", "x", cost=1.0)
+    assert backend.get("large") is None
+    assert backend.get("small") == "x"
+
+
+@pytest.mark.asyncio
+async def test_saved_compute_counts_served_hits(memory):
+    backend = memory()
+    backend.set("k", 1, cost=0.5)
+    await backend.aset("unmeasured", 1)
+    assert backend.get("k") == 1
+    assert await backend.aget("k") == 1
+    assert backend.get_many(["k", "unmeasured"]) == {"k": 1, "unmeasured": 1}
+    backend.has("k")
+    backend.touch("k", 60)
+    assert saved(backend) == pytest.approx(1.5)
+
+    # A write without a cost keeps the measured one.
+    backend.set("k", 2)
+    backend.get("k")
+    assert saved(backend) == pytest.approx(2.0)
+    assert backend.stats()["eviction"] == "lru"
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda backend: backend.aset("k", 1, cost=1.0),
+        lambda backend: backend.aget("k"),
+        lambda backend: backend.aincr("n"),
+    ],
+)
+def test_async_gdsf_updates_share_the_cleanup_lock(call, memory):
+    backend = memory(max_size=1, eviction="gdsf")
+    backend.set("k", 1, cost=1.0)
+    thread = threading.Thread(target=lambda: asyncio.run(call(backend)))
+    with backend._lock:
+        thread.start()
+        thread.join(0.1)
+        assert thread.is_alive()
+    thread.join(1)
+    assert not thread.is_alive()
+
+
+@pytest.mark.asyncio
+async def test_gdsf_heap_stays_consistent_with_cleanup(memory):
+    clock = VirtualClock()
+    backend = memory(max_size=50, eviction="gdsf", clock=clock)
+    done = threading.Event()
+
+    def cleanup():
+        while not done.is_set():
+            clock.now += 1
+            backend._run_cleanup_job()
+
+    thread = threading.Thread(target=cleanup)
+    thread.start()
+    try:
+        for i in range(3000):
+            await backend.aset(f"k{i % 200}", i, expire=2, cost=i % 7 + 1)
+            await backend.aget(f"k{(i * 7) % 200}")
+    finally:
+        done.set()
+        thread.join()
+
+    heap = backend._heap
+    assert all(heap[i] <= heap[2 * i + 1] for i in range(len(heap) // 2))
+    current = {(meta.seq, k) for k, meta in backend._cache.costs.items()}
+    assert current <= {(seq, k) for _, seq, k in heap}
+    assert len(backend._cache) <= 50
+
+
+def test_get_or_set_measures_the_loader(memory):
+    backend = memory()
+
+    def load():
+        time.sleep(0.02)
+        return 1
+
+    assert backend.get_or_set("k", load) == 1
+    assert saved(backend) == 0
+    assert backend.get_or_set("k", load) == 1
+    assert saved(backend) >= 0.02
+
+
+@pytest.mark.asyncio
+async def test_decorator_passes_compute_time(memory):
+    cache = FastAPICache()
+    backend = memory(max_size=10, eviction="gdsf")
+    cache.init_app(FastAPI(), backend)
+
+    @cache.cached(expire=60)
+    async def slow(x):
+        time.sleep(0.02)
+        return x
+
+    @cache.cached(expire=60)
+    def slow_sync(x):
+        time.sleep(0.02)
+        return x
+
+    assert await slow(1) == 1
+    assert slow_sync(1) == 1
+    assert saved(backend) == 0
+    assert await slow(1) == 1
+    assert slow_sync(1) == 1
+    assert saved(backend) >= 0.04
+
+
+class PlainBackend(InMemoryBackend):
+    """A subclass overriding the writes without the ``cost`` argument."""
+
+    def set(self, key, value, expire=None, tags=None):
+        super().set(key, value, expire=expire, tags=tags)
+
+    async def aset(self, key, value, expire=None, tags=None):
+        await super().aset(key, value, expire=expire, tags=tags)
+
+
+@pytest.mark.asyncio
+async def test_cost_is_not_passed_to_backends_without_support(memory):
+    plain = PlainBackend(cleanup_interval=None)
+    mixed = ShardedBackend([memory(namespace="a"), plain])
+    assert not plain.cost_aware and not mixed.cost_aware
+    for i in range(10):
+        mixed.set(f"k{i}", i, cost=1.0)
+        await mixed.aset(f"a{i}", i, cost=1.0)
+    assert plain.get_or_set("loaded", lambda: 1) == 1
+
+    cache = FastAPICache()
+    cache.init_app(FastAPI(), plain)
+
+    @cache.cached(expire=60)
+    async def compute():
+        return 1
+
+    assert await compute() == 1
+    assert await compute() == 1
+
+
+def test_recording_writes_costs(tmp_path, memory):
+    stream = io.StringIO()
+    inner = memory()
+    recorder = RecordingBackend(inner, stream)
+    recorder.set("k", 1, cost=0.125)
+    recorder.set("unmeasured", 1)
+    recorder.get("k")
+    assert saved(inner) == pytest.approx(0.125)
+    recorder.close()
+
+    stream.seek(0)
+    costs = [record.cost for record in read_trace(stream)]
+    assert costs == [0.125, None, None]
+
+
+def test_simulate_compares_policies():
+    # A costly report read every fifth request among one-off cheap keys.
+    records = []
+    for i in range(100):
+        key, cost = ("report", 2.0) if i % 5 == 0 else (f"k{i}", 0.001)
+        hit = key == "report" and i > 0
+        records.append(TraceRecord(float(i), "get", key, 10 if hit else 0, hit=hit))
+        if not hit:
+            records.append(TraceRecord(float(i), "set", key, 10, cost=cost))
+
+    lru, gdsf = simulate(records, max_sizes=[3], policies=["lru", "gdsf"])
+    assert (lru["policy"], gdsf["policy"]) == ("lru", "gdsf")
+    assert lru["hits"] == 0 and lru["saved_compute_seconds"] == 0
+    assert gdsf["hits"] == 19
+    assert gdsf["saved_compute_seconds"] == pytest.approx(38.0)
+
+
+def test_rejects_unknown_policy(memory):
+    with pytest.raises(ValueError):
+        memory(eviction="lfu")
@@ -128,3 +128,14 @@ async def test_async_expire(async_cache):
     assert await async_cache.aget("foo") == "bar"
     await asyncio.sleep(1.1)
     assert await async_cache.aget("foo") is None
+
+
+def test_get_many_and_set_many(cache):
+    cache.set_many({"a": 1, "b": 2}, expire=60)
+    assert cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": 2}
+
+
+@pytest.mark.asyncio
+async def test_async_get_many_and_set_many(async_cache):
+    await async_cache.aset_many({"a": 1, "b": 2}, expire=60)
+    assert await async_cache.aget_many(["a", "b", "missing"]) == {"a": 1, "b": 2}
@@ -0,0 +1,179 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+
+from fast_cache import FastAPICache, MetricsBackend, ShardedBackend, SyncToAsyncBackend
+from fast_cache.bench.simulate import VirtualClock
+
+
+def test_concurrent_threads_load_once(memory):
+    backend = memory()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(backend.get_or_set("k", loader)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+    assert backend.get_or_set("k", loader) == "value"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_load_once_through_wrappers(memory):
+    backend = SyncToAsyncBackend(MetricsBackend(memory()))
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"x": 1}
+
+    results = await asyncio.gather(
+        *(backend.aget_or_set("k", loader, expire=60) for _ in range(8))
+    )
+    assert results == [{"x": 1}] * 8
+    assert len(calls) == 1
+    assert await backend.aget_or_set("k", lambda: None) == {"x": 1}
+    backend.close()
+
+
+def test_waiters_compute_after_lock_timeout(memory):
+    backend = memory()
+    token = backend._acquire_lock("k", 60)
+    assert token is not None
+
+    started = time.monotonic()
+    assert backend.get_or_set("k", lambda: 2, lock_timeout=0.05) == 2
+    assert time.monotonic() - started < 1
+    backend._release_lock("k", token)
+
+
+def test_none_results_are_not_stored(memory):
+    backend = memory()
+    assert backend.get_or_set("k", lambda: None) is None
+    assert not backend.has("k")
+    assert backend._acquire_lock("k", 1) is not None
+
+
+def test_locks_are_per_shard(memory):
+    shards = [memory(namespace="a"), memory(namespace="b")]
+    backend = ShardedBackend(shards)
+    token = backend._acquire_lock("k", 60)
+    assert backend._acquire_lock("k", 60) is None
+    owner = backend.shard_for("k")
+    assert owner._acquire_lock("k", 60) is None
+    backend._release_lock("k", token)
+    assert owner._acquire_lock("k", 60) is not None
+
+
+@pytest.mark.asyncio
+async def test_cached_with_lock_timeout_computes_once(memory):
+    cache = FastAPICache()
+    backend = memory()
+    cache.init_app(FastAPI(), backend, default_expire=60)
+    calls = []
+
+    @cache.cached(lock_timeout=5)
+    async def compute(x):
+        calls.append(x)
+        await asyncio.sleep(0.05)
+        return x * 2
+
+    assert await asyncio.gather(*(compute(3) for _ in range(5))) == [6] * 5
+    assert calls == [3]
+
+    @cache.cached(lock_timeout=5)
+    def compute_sync(x):
+        calls.append(x)
+        return x + 1
+
+    assert compute_sync(1) == 2
+    assert compute_sync(1) == 2
+    assert calls == [3, 1]
+    backend.close()
+
+
+def test_stale_values_are_served_while_one_caller_recomputes(memory):
+    clock = VirtualClock()
+    backend = memory(clock=clock)
+    assert backend.get_or_set("k", lambda: 1, expire=10, stale_ttl=5) == 1
+    clock.now += 12
+
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(1)
+        return 2
+
+    refresher = threading.Thread(
+        target=lambda: backend.get_or_set("k", slow, expire=10, stale_ttl=5)
+    )
+    refresher.start()
+    assert started.wait(1)
+    assert [
+        backend.get_or_set("k", slow, expire=10, stale_ttl=5) for _ in range(5)
+    ] == [1] * 5
+    release.set()
+    refresher.join()
+
+    assert calls == [1]
+    assert backend.get_or_set("k", slow, expire=10, stale_ttl=5) == 2
+    assert backend.get_with_meta("k").ttl == pytest.approx(15)
+    clock.now += 16
+    assert backend.get_or_set("k", lambda: 3, expire=10, stale_ttl=5) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_stale_values_are_served(memory):
+    clock = VirtualClock()
+    backend = memory(clock=clock)
+    assert await backend.aget_or_set("k", lambda: 1, expire=10, stale_ttl=5) == 1
+    clock.now += 12
+    token = backend._acquire_lock("k", 60)
+    assert await backend.aget_or_set("k", lambda: 2, expire=10, stale_ttl=5) == 1
+    backend._release_lock("k", token)
+    assert await backend.aget_or_set("k", lambda: 2, expire=10, stale_ttl=5) == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_serves_stale_results(memory):
+    clock = VirtualClock()
+    backend = memory(clock=clock)
+    cache = FastAPICache()
+    cache.init_app(FastAPI(), backend)
+    calls = []
+
+    @cache.cached(expire=10, lock_timeout=5, stale_ttl=5, key_builder=lambda: "k")
+    async def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert await compute() == 1
+    clock.now += 12
+    token = backend._acquire_lock("k", 60)
+    assert await compute() == 1
+    backend._release_lock("k", token)
+    assert await compute() == 2
+
+    with pytest.raises(ValueError):
+        cache.cached(expire=60, stale_ttl=5)
@@ -0,0 +1,45 @@
+import time
+
+import pytest
+
+from fast_cache import CacheEntry
+from fast_cache.bench.simulate import VirtualClock
+
+
+def test_in_memory_entry_has_ttl_and_creation_time(memory):
+    clock = VirtualClock()
+    backend = memory(clock=clock)
+    before = time.time()
+    backend.set("a", 1, expire=60)
+    backend.set("b", 2)
+
+    clock.now += 15
+    entry = backend.get_with_meta("a")
+    assert entry.value == 1
+    assert entry.ttl == pytest.approx(45)
+    # 15 virtual seconds have passed since the write.
+    assert entry.created_at == pytest.approx(before - 15, abs=1)
+    assert backend.get_with_meta("b").ttl is None
+
+    clock.now += 60
+    assert backend.get_with_meta("a") is None
+    assert backend.get_with_meta("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_async_entry(memory):
+    backend = memory()
+    await backend.aset("a", {"x": 1}, expire=30)
+    entry = await backend.aget_with_meta("a")
+    assert entry.value == {"x": 1}
+    assert 29 < entry.ttl <= 30
+    assert await backend.aget_with_meta("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_default_implementation_reports_no_metadata(plain):
+    backend = plain("get_with_meta", "aget_with_meta")
+    backend.set("a", 1, expire=60)
+    assert backend.get_with_meta("a") == CacheEntry(1, None, None)
+    assert await backend.aget_with_meta("a") == CacheEntry(1)
+    assert backend.get_with_meta("missing") is None
@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import pytest
+
+from fast_cache import HedgedBackend, InMemoryBackend
+
+
+class SlowBackend(InMemoryBackend):
+    def __init__(self, namespace, delay=0.0):
+        super().__init__(namespace=namespace, cleanup_interval=None)
+        self.delay = delay
+        self.fail = False
+        self.reads = 0
+        self.cancelled = 0
+
+    def get(self, key):
+        self.reads += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("down")
+        return super().get(key)
+
+    async def aget(self, key):
+        self.reads += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise ConnectionError("down")
+        return await super().aget(key)
+
+
+def pair(delay):
+    return SlowBackend("first", delay), SlowBackend("second")
+
+
+@pytest.mark.asyncio
+async def test_slow_read_is_hedged_and_loser_cancelled():
+    first, second = pair(delay=1.0)
+    backend = HedgedBackend([first, second], initial_delay=0.01)
+    await backend.aset("a", 1)
+
+    started = time.perf_counter()
+    assert await backend.aget("a") == 1
+    assert time.perf_counter() - started < 0.5
+    await asyncio.sleep(0)
+    assert first.cancelled == 1
+
+    stats = backend.stats()
+    assert (stats["reads"], stats["hedges"], stats["hedge_wins"]) == (1, 1, 1)
+    await backend.aclose()
+
+
+@pytest.mark.asyncio
+async def test_fast_reads_are_not_hedged():
+    first, second = pair(delay=0)
+    backend = HedgedBackend([first, second], initial_delay=0.5)
+    await backend.aset("a", 1)
+    for _ in range(10):
+        assert await backend.aget("a") == 1
+    assert second.reads == 0
+    assert backend.stats()["hedges"] == 0
+    await backend.aclose()
+
+
+def test_budget_caps_hedges():
+    first, second = pair(delay=0.05)
+    backend = HedgedBackend(
+        [first, second], initial_delay=0.001, max_hedge_ratio=0.1, window=10**6
+    )
+    backend.set("a", 1)
+    for _ in range(20):
+        assert backend.get("a") == 1
+
+    stats = backend.stats()
+    # One starting token plus 0.1 per read.
+    assert stats["hedges"] == 3
+    assert stats["denied"] == 17
+    backend.close()
+
+
+def test_failure_moves_to_next_backend():
+    first, second = pair(delay=0)
+    first.fail = True
+    backend = HedgedBackend([first, second], initial_delay=1.0)
+    backend.set("a", 1)
+    started = time.perf_counter()
+    assert backend.get("a") == 1
+    assert time.perf_counter() - started < 0.5
+
+    second.fail = True
+    with pytest.raises(ConnectionError):
+        backend.get("a")
+    backend.close()
+
+
+def test_delay_follows_observed_latency():
+    first, second = pair(delay=0)
+    backend = HedgedBackend(
+        [first, second], initial_delay=0.5, window=20, min_delay=0.0001
+    )
+    for _ in range(20):
+        backend.get("a")
+    assert backend.delay < 0.05
+    backend.close()
+
+
+def test_write_targets():
+    first, second = pair(delay=0)
+    HedgedBackend([first, second], write_to="first").set("a", 1)
+    assert first.has("a") and not second.has("a")
+    with pytest.raises(ValueError):
+        HedgedBackend([first])
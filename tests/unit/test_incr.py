@@ -0,0 +1,78 @@
+import asyncio
+import threading
+
+import pytest
+
+from fast_cache.bench.simulate import VirtualClock
+
+
+def test_counter_keeps_the_expiry_of_its_window(memory):
+    clock = VirtualClock()
+    backend = memory(clock=clock)
+    assert backend.incr("hits", expire=60) == 1
+    clock.now += 30
+    assert backend.incr("hits", 5, expire=60) == 6
+    assert backend.decr("hits") == 5
+    assert backend.get("hits") == 5
+
+    # The window ends 60 seconds after the first increment.
+    clock.now += 31
+    assert backend.get("hits") is None
+    assert backend.incr("hits", expire=60) == 1
+    assert backend.incr("other", -2) == -2
+
+
+def test_concurrent_increments_are_not_lost(memory):
+    backend = memory()
+
+    def work():
+        for _ in range(500):
+            backend.incr("n")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert backend.get("n") == 4000
+
+
+@pytest.mark.asyncio
+async def test_async_increments(memory):
+    backend = memory()
+    await asyncio.gather(*(backend.aincr("n", expire=60) for _ in range(100)))
+    assert await backend.aget("n") == 100
+    assert await backend.adecr("n", 40) == 60
+
+
+@pytest.mark.asyncio
+async def test_default_implementation_keeps_the_expiry(plain):
+    clock = VirtualClock()
+    backend = plain("incr", "aincr", clock=clock)
+    assert backend.incr("n", expire=10) == 1
+    clock.now += 5
+    assert await backend.aincr("n", 2, expire=10) == 3
+    clock.now += 6
+    assert backend.get("n") is None
+
+
+@pytest.mark.asyncio
+async def test_default_counters_need_ttl_metadata_to_expire(plain):
+    clock = VirtualClock()
+    backend = plain("incr", "aincr", "get_with_meta", "aget_with_meta", clock=clock)
+    assert backend.incr("n") == 1
+    assert await backend.aincr("n", 2) == 3
+    with pytest.raises(NotImplementedError, match="get_with_meta"):
+        backend.incr("n", expire=10)
+    with pytest.raises(NotImplementedError, match="aget_with_meta"):
+        await backend.aincr("window", expire=10)
+    assert backend.get("n") == 3 and backend.get("window") is None
+
+
+def test_counters_stored_as_digits_are_read_back(memory):
+    backend = memory()
+    assert backend._loads(b"42") == 42
+    assert backend._loads(b"-7") == -7
+    assert backend._loads(b"9 ") == 9
+    assert backend._loads(backend._dumps("42")) == "42"
+    assert backend._loads(backend._dumps(42)) == 42
@@ -74,3 +74,14 @@ async def test_async_expire(memcached_cache):
     assert await memcached_cache.aget("foo") == "bar"
     await asyncio.sleep(1.1)
     assert await memcached_cache.aget("foo") is None
+
+
+def test_get_many_and_set_many(memcached_cache):
+    memcached_cache.set_many({"a": 1, "b": 2}, expire=60)
+    assert memcached_cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": 2}
+
+
+@pytest.mark.asyncio
+async def test_async_get_many_and_set_many(memcached_cache):
+    await memcached_cache.aset_many({"a": 1, "b": 2}, expire=60)
+    assert await memcached_cache.aget_many(["a", "b", "missing"]) == {"a": 1, "b": 2}
@@ -0,0 +1,156 @@
+import pickle
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fast_cache import (
+    CacheMetrics,
+    FastAPICache,
+    InMemoryBackend,
+    LatencyHistogram,
+    MetricsBackend,
+)
+
+
+class PickleBackend(InMemoryBackend):
+    """In-memory backend that stores pickled payloads like remote backends do."""
+
+    def __init__(self):
+        super().__init__(namespace="metrics-test")
+        self.fail = False
+
+    def get(self, key):
+        if self.fail:
+            self._report_error("get", ConnectionError("down"))
+            return None
+        data = super().get(key)
+        return self._loads(data) if data is not None else None
+
+    def set(self, key, value, expire=None):
+        super().set(key, self._dumps(value), expire=expire)
+
+
+@pytest.fixture
+def backend():
+    backend = MetricsBackend(PickleBackend(), CacheMetrics())
+    yield backend
+    backend.close()
+
+
+def test_histogram_quantiles_are_close():
+    histogram = LatencyHistogram()
+    for micros in range(1, 10001):
+        histogram.record(micros / 1_000_000)
+
+    assert histogram.count == 10000
+    assert histogram.quantile(0.5) == pytest.approx(0.005, rel=0.07)
+    assert histogram.quantile(0.99) == pytest.approx(0.0099, rel=0.07)
+    assert histogram.quantile(1.0) == pytest.approx(0.01)
+    assert LatencyHistogram().quantile(0.5) == 0.0
+
+
+def test_hits_misses_sets_and_bytes(backend):
+    backend.set("a", "value")
+    backend.get("a")
+    backend.get("missing")
+    backend.get_many(["a", "missing"])
+
+    stats = backend.metrics.stats()
+    totals = stats["namespaces"]["pickle:metrics-test"]
+    assert totals["hits"] == 2
+    assert totals["misses"] == 2
+    assert totals["sets"] == 1
+    assert totals["hit_ratio"] == 0.5
+    assert totals["bytes_written"] == len(pickle.dumps("value"))
+    assert totals["bytes_read"] == len(pickle.dumps("value"))
+
+    get = next(op for op in stats["operations"] if op["operation"] == "get")
+    assert get["calls"] == 2
+    assert get["latency"]["count"] == 2
+
+
+def test_swallowed_errors_are_counted(backend):
+    backend._backend.fail = True
+    assert backend.get("a") is None
+
+    totals = backend.metrics.stats()["namespaces"]["pickle:metrics-test"]
+    assert totals["errors"] == 1
+    assert totals["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_raised_errors_are_counted_and_propagated(backend):
+    async def boom(key):
+        raise RuntimeError("boom")
+
+    backend._backend.aget = boom
+    with pytest.raises(RuntimeError):
+        await backend.aget("a")
+
+    assert backend.metrics.stats()["namespaces"]["pickle:metrics-test"]["errors"] == 1
+
+
+def test_redis_outage_is_reported():
+    pytest.importorskip("redis")
+    from fast_cache import RedisBackend
+
+    backend = MetricsBackend(RedisBackend("redis://127.0.0.1:1/0", namespace="down"))
+    assert backend.get("a") is None
+
+    totals = backend.metrics.stats()["namespaces"]["redis:down"]
+    assert totals["errors"] == 1
+
+
+def test_decorator_metrics_and_prometheus_endpoint():
+    app = FastAPI()
+    cache = FastAPICache()
+    cache.init_app(
+        app,
+        InMemoryBackend(namespace="metrics-app"),
+        default_expire=60,
+        metrics=True,
+        metrics_path="/metrics",
+    )
+
+    @app.get("/items/{item_id}")
+    @cache.cached(namespace="items")
+    async def item(item_id: int):
+        return {"id": item_id}
+
+    with TestClient(app) as client:
+        client.get("/items/1")
+        client.get("/items/1")
+        client.get("/items/2")
+        stats = cache.stats()
+        resp = client.get("/metrics")
+
+    function = stats["functions"][
+        f"{__name__}:test_decorator_metrics_and_prometheus_endpoint.<locals>.item"
+    ]
+    assert function["hits"] == 1
+    assert function["misses"] == 2
+
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = resp.text
+    assert "# TYPE fast_cache_hits_total counter" in body
+    assert (
+        'fast_cache_hits_total{backend="inmemory",namespace="metrics-app",'
+        'function="",operation="get"} 1'
+    ) in body
+    assert 'quantile="0.99"' in body
+    assert "fast_cache_operation_duration_seconds_count{" in body
+
+
+def test_compute_locks_are_recorded(backend):
+    assert backend.get_or_set("k", lambda: "value") == "value"
+    operations = {
+        op["operation"]: op["calls"] for op in backend.metrics.stats()["operations"]
+    }
+    assert operations["lock"] == operations["unlock"] == 1
+
+
+def test_stats_empty_without_metrics():
+    cache = FastAPICache()
+    cache.init_app(FastAPI(), InMemoryBackend(namespace="no-metrics"))
+    assert cache.stats() == {}
@@ -90,3 +90,14 @@ async def test_async_expire(cache):
     assert await cache.aget("foo") == "bar"
     await asyncio.sleep(1.1)
     assert await cache.aget("foo") is None
+
+
+def test_get_many_and_set_many(cache):
+    cache.set_many({"a": 1, "b": 2}, expire=60)
+    assert cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": 2}
+
+
+@pytest.mark.asyncio
+async def test_async_get_many_and_set_many(cache):
+    await cache.aset_many({"a": 1, "b": 2}, expire=60)
+    assert await cache.aget_many(["a", "b", "missing"]) == {"a": 1, "b": 2}
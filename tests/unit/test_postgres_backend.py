@@ -1,6 +1,9 @@
 import pytest
 import time
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from fast_cache import PostgresBackend
 
 
 # ---- SYNC TESTS ----
@@ -74,3 +77,76 @@ async def test_async_expire(async_postgres_cache):
     assert await async_postgres_cache.aget("foo") == "bar"
     await asyncio.sleep(1.1)
     assert await async_postgres_cache.aget("foo") is None
+
+
+def test_get_many_and_set_many(postgres_cache):
+    postgres_cache.set_many({"a": 1, "b": 2}, expire=60)
+    assert postgres_cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": 2}
+
+
+@pytest.mark.asyncio
+async def test_async_get_many_and_set_many(async_postgres_cache):
+    await async_postgres_cache.aset_many({"a": 1, "b": 2}, expire=60)
+    assert await async_postgres_cache.aget_many(["a", "b", "missing"]) == {
+        "a": 1,
+        "b": 2,
+    }
+
+
+def test_get_or_set_with_more_misses_than_connections(postgres_dsn):
+    backend = PostgresBackend(
+        postgres_dsn, namespace="pytest_locks", max_size=2, auto_cleanup=False
+    )
+    try:
+        backend.clear()
+
+        def load(i):
+            def loader():
+                time.sleep(0.2)
+                return i
+
+            return backend.get_or_set(f"k{i}", loader, expire=60, lock_timeout=5)
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            assert list(pool.map(load, range(6))) == list(range(6))
+        assert time.monotonic() - started < 5
+        assert list(backend.iter_keys()) == [f"k{i}" for i in range(6)]
+    finally:
+        backend.clear()
+        backend.close()
+
+
+@pytest.mark.asyncio
+async def test_async_get_or_set_with_more_misses_than_connections(postgres_dsn):
+    backend = PostgresBackend(
+        postgres_dsn, namespace="pytest_alocks", max_size=2, auto_cleanup=False
+    )
+    try:
+        await backend.aclear()
+
+        def loader(i):
+            async def load():
+                await asyncio.sleep(0.2)
+                return i
+
+            return load
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(
+                    backend.aget_or_set(f"k{i}", loader(i), expire=60, lock_timeout=5)
+                    for i in range(6)
+                )
+            ),
+            timeout=5,
+        )
+        assert results == list(range(6))
+        token = await backend._aacquire_lock("k0", 0.1)
+        assert await backend._aacquire_lock("k0", 60) is None
+        await asyncio.sleep(0.2)
+        assert await backend._aacquire_lock("k0", 60) is not None
+        await backend._arelease_lock("k0", token)
+    finally:
+        await backend.aclear()
+        await backend.aclose()
@@ -0,0 +1,112 @@
+import asyncio
+import threading
+
+import pytest
+
+from fast_cache import HedgedBackend, SyncToAsyncBackend
+from fast_cache.bench.simulate import VirtualClock
+
+
+async def collect(keys):
+    return [key async for key in keys]
+
+
+@pytest.mark.asyncio
+async def test_iter_keys_lists_live_keys_in_batches(memory):
+    clock = VirtualClock()
+    backend = memory(namespace="ns", clock=clock)
+    for i in range(250):
+        backend.set(f"user:{i:03d}", i)
+    backend.set("user:expiring", 1, expire=5)
+    backend.set("users", 1)
+    backend.set("order:1", 1)
+    assert backend._acquire_lock("user:000", 60) is not None
+    clock.now += 10
+
+    expected = [f"user:{i:03d}" for i in range(250)]
+    assert list(backend.iter_keys("user:", batch_size=7)) == expected
+    assert await collect(backend.aiter_keys("user:", batch_size=100)) == expected
+    assert len(list(backend.iter_keys())) == 252
+    assert list(backend.iter_keys("missing")) == []
+
+
+def test_iteration_survives_concurrent_deletes(memory):
+    backend = memory()
+    for i in range(20):
+        backend.set(f"k{i:02d}", i)
+
+    seen = []
+    for key in backend.iter_keys("k", batch_size=3):
+        seen.append(key)
+        backend.delete(key)
+        backend.delete("k19")
+    assert seen == [f"k{i:02d}" for i in range(19)]
+
+
+@pytest.mark.asyncio
+async def test_delete_prefix_only_touches_matching_keys(memory):
+    clock = VirtualClock()
+    backend = memory(clock=clock)
+    for i in range(1500):
+        backend.set(f"a:{i}", i)
+    backend.set("a:expired", 1, expire=1)
+    backend.set("b:1", 1)
+    backend.set("a", 1)
+    clock.now += 2
+
+    assert backend.delete_prefix("a:") == 1501
+    assert backend.get("b:1") == 1 and backend.get("a") == 1
+    assert backend.delete_prefix("a:") == 0
+    assert await backend.adelete_prefix("") == 2
+    assert not backend._cache and list(backend.iter_keys()) == []
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda backend: backend.aset("k", 1),
+        lambda backend: backend.adelete_prefix("k"),
+        lambda backend: collect(backend.aiter_keys()),
+    ],
+)
+def test_async_methods_share_the_cleanup_lock(call, memory):
+    backend = memory()
+    thread = threading.Thread(target=lambda: asyncio.run(call(backend)))
+    # The cleanup thread holds the lock while it rewrites the key index.
+    with backend._lock:
+        thread.start()
+        thread.join(0.1)
+        assert thread.is_alive()
+    thread.join(1)
+    assert not thread.is_alive()
+
+
+@pytest.mark.asyncio
+async def test_default_delete_prefix_deletes_listed_keys(plain):
+    backend = plain("delete_prefix", "adelete_prefix")
+    backend.set_many({f"p{i}": i for i in range(5)})
+    backend.set("q", 1)
+    assert backend.delete_prefix("p") == 5
+    backend.set("p", 1)
+    assert await backend.adelete_prefix("p") == 1
+    assert list(backend.iter_keys()) == ["q"]
+
+
+@pytest.mark.asyncio
+async def test_auto_mode_iterates_natively(memory):
+    backend = SyncToAsyncBackend(memory(), mode="auto")
+    backend.set("k", 1)
+    assert await collect(backend.aiter_keys()) == ["k"]
+    assert "iter_keys" not in backend.stats()["operations"]
+    backend.close()
+
+
+def test_hedged_backend_deletes_prefix_on_every_writer(memory):
+    first, second = memory(namespace="a"), memory(namespace="b")
+    backend = HedgedBackend([first, second], write_to="all")
+    backend.set("p:1", 1)
+    backend.set("q:1", 1)
+    assert list(backend.iter_keys("p:")) == ["p:1"]
+    assert backend.delete_prefix("p:") == 1
+    assert second.get("p:1") is None and second.get("q:1") == 1
+    backend.close()
@@ -0,0 +1,153 @@
+import io
+import pickle
+
+import pytest
+
+from fast_cache import (
+    InMemoryBackend,
+    RecordingBackend,
+    TraceRecord,
+    TraceWriter,
+    read_trace,
+)
+from fast_cache.bench import simulate
+from fast_cache.bench.__main__ import main
+from fast_cache.recording import hash_key
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def backend():
+    backend = InMemoryBackend(namespace="recording-test", cleanup_interval=None)
+    yield backend
+    backend.close()
+
+
+def test_records_operations(backend):
+    stream = io.StringIO()
+    clock = Clock()
+    recorder = RecordingBackend(backend, stream, clock=clock)
+
+    recorder.set("a", {"x": 1}, expire=60)
+    clock.now += 1
+    assert recorder.get("a") == {"x": 1}
+    assert recorder.get("missing") is None
+    recorder.set_many({"b": 1, "c": 2})
+    recorder.delete("a")
+    recorder.clear()
+    recorder.close()
+
+    stream.seek(0)
+    records = list(read_trace(stream))
+    assert [record.op for record in records] == [
+        "set",
+        "get",
+        "get",
+        "set",
+        "set",
+        "delete",
+        "clear",
+    ]
+    size = len(pickle.dumps({"x": 1}, protocol=pickle.HIGHEST_PROTOCOL))
+    assert records[0] == TraceRecord(1000.0, "set", hash_key("a"), size, 60.0)
+    assert records[1] == TraceRecord(1001.0, "get", hash_key("a"), size, None, True)
+    assert records[2].hit is False
+    assert records[2].size == 0
+    assert "missing" not in stream.getvalue()
+
+
+def test_sampling_is_per_key(backend):
+    stream = io.StringIO()
+    recorder = RecordingBackend(backend, stream, sample_rate=0.5)
+    keys = [f"key-{i}" for i in range(200)]
+    for key in keys:
+        recorder.set(key, 1)
+        recorder.get(key)
+
+    stream.seek(0)
+    records = list(read_trace(stream))
+    recorded = {record.key for record in records}
+    assert 50 < len(recorded) < 150
+    # Every recorded key keeps its whole history.
+    assert len(records) == 2 * len(recorded)
+
+    with pytest.raises(ValueError):
+        RecordingBackend(backend, stream, sample_rate=2)
+
+
+def test_gzip_round_trip(tmp_path):
+    path = str(tmp_path / "trace.ndjson.gz")
+    writer = TraceWriter(path)
+    writer.write(TraceRecord(1.0, "set", "k", 10, 5.0))
+    writer.close()
+    assert list(read_trace(path)) == [TraceRecord(1.0, "set", "k", 10, 5.0)]
+
+
+def _trace(keys, ttl=None, step=1.0):
+    """Demand-filled trace: a miss is followed by a write, like the decorator."""
+    records = []
+    seen = set()
+    for i, key in enumerate(keys):
+        ts = i * step
+        if key in seen:
+            records.append(TraceRecord(ts, "get", key, 100, None, True))
+        else:
+            records.append(TraceRecord(ts, "get", key, 0, None, False))
+            records.append(TraceRecord(ts, "set", key, 100, ttl))
+            seen.add(key)
+    return records
+
+
+def test_simulate_capacity_curve():
+    # Cycling over 10 keys: LRU with fewer than 10 slots never hits.
+    keys = [f"k{i % 10}" for i in range(100)]
+    small, large, unbounded = simulate(_trace(keys), max_sizes=[5, 10, None])
+
+    assert small["requests"] == 100
+    assert small["hits"] == 0
+    assert large["hits"] == 90
+    assert unbounded["hit_ratio"] == pytest.approx(0.9)
+    assert large["byte_hit_ratio"] == 1.0
+
+
+def test_simulate_ttl_uses_trace_time():
+    # Each key is reread 10 trace-seconds later; replay runs instantly.
+    keys = [f"k{i % 10}" for i in range(30)]
+    recorded, short = simulate(_trace(keys, ttl=60), ttls=[None, 5])
+
+    assert recorded["hits"] == 20
+    assert short["hits"] == 0
+
+
+def test_cli_simulate(tmp_path, capsys):
+    path = tmp_path / "trace.ndjson"
+    writer = TraceWriter(str(path))
+    for record in _trace([f"k{i % 4}" for i in range(20)]):
+        writer.write(record)
+    writer.close()
+
+    output = tmp_path / "curve.json"
+    assert (
+        main(
+            [
+                "simulate",
+                str(path),
+                "--sizes",
+                "2,unbounded",
+                "--ttls",
+                "recorded,30",
+                "--output",
+                str(output),
+            ]
+        )
+        == 0
+    )
+    assert "hit ratio" in capsys.readouterr().err
+    assert output.exists()
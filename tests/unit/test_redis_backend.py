@@ -83,3 +83,145 @@ async def test_async_expire(cache):
     assert await cache.aget("foo") == "bar"
     await asyncio.sleep(1.1)
     assert await cache.aget("foo") is None
+
+
+def test_get_many_and_set_many(cache):
+    cache.set_many({"a": 1, "b": 2}, expire=60)
+    assert cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": 2}
+
+
+@pytest.mark.asyncio
+async def test_async_get_many_and_set_many(cache):
+    await cache.aset_many({"a": 1, "b": 2}, expire=60)
+    assert await cache.aget_many(["a", "b", "missing"]) == {"a": 1, "b": 2}
+
+
+def test_hash_tag_keeps_namespace_in_one_slot(redis_url):
+    from redis.crc import key_slot
+
+    backend = RedisBackend(redis_url, namespace="tagged", hash_tag=True)
+    assert backend._make_key("a") == "{tagged}:a"
+    assert key_slot(b"{tagged}:a") == key_slot(b"{tagged}:b")
+
+    backend.set("a", 1)
+    assert backend.get("a") == 1
+    backend.clear()
+    assert backend.get("a") is None
+
+
+def test_reads_fail_over_to_primary_when_replicas_are_down(redis_url):
+    backend = RedisBackend(
+        redis_url,
+        namespace="replicas",
+        replica_urls=["redis://127.0.0.1:1/0"],
+    )
+    backend.set("a", 1)
+    assert backend.get("a") == 1
+    assert backend.has("a")
+    assert backend.get_many(["a", "b"]) == {"a": 1}
+    assert backend._pick_replica() is None
+    backend.clear()
+
+
+def test_primary_is_not_used_as_a_replica(redis_url):
+    backend = RedisBackend(redis_url, namespace="replicas", replica_urls=[redis_url])
+    backend.set("a", 1)
+    assert backend.get("a") == 1
+    # The listed node reports role "master", so the health check skips it.
+    assert backend._replicas[0].healthy is False
+
+
+def test_replicas_are_rejected_in_cluster_mode():
+    with pytest.raises(ValueError):
+        RedisBackend("redis://localhost:7000", cluster=True, replica_urls=["redis://x"])
+
+
+@pytest.mark.asyncio
+async def test_get_with_meta(cache):
+    cache.set("a", 1, expire=60)
+    cache.set("b", 2)
+    entry = cache.get_with_meta("a")
+    assert entry.value == 1 and 59 < entry.ttl <= 60
+    assert entry.created_at is None
+    assert (await cache.aget_with_meta("b")).ttl is None
+    assert await cache.aget_with_meta("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_touch(cache):
+    cache.set("a", 1, expire=5)
+    assert cache.touch("a", 60)
+    assert 59 < cache.get_with_meta("a").ttl <= 60
+    assert await cache.aget_and_touch("a", None) == 1
+    assert cache.get_with_meta("a").ttl is None
+    assert await cache.atouch("a", None)
+    assert not cache.touch("missing", 60)
+    assert cache.get_and_touch("missing", 60) is None
+
+
+@pytest.mark.asyncio
+async def test_incr(cache):
+    assert cache.incr("n", expire=60) == 1
+    assert await cache.aincr("n", 4, expire=5) == 5
+    assert 59 < cache.get_with_meta("n").ttl <= 60
+    assert cache.decr("n", 2) == 3
+    assert cache.get("n") == 3
+    assert cache.incr("plain") == 1
+    assert cache.get_with_meta("plain").ttl is None
+
+
+@pytest.mark.asyncio
+async def test_versioned_writes(cache):
+    assert cache.set_if_version("v", 1, None, expire=60)
+    assert not cache.set_if_version("v", 2, None)
+    entry = cache.get_versioned("v")
+    assert entry.value == 1
+    assert cache.set_if_version("v", 2, entry.version, expire=60)
+    assert not await cache.aset_if_version("v", 3, entry.version)
+    current = await cache.aget_versioned("v")
+    assert current.value == 2
+    assert await cache.aset_if_version("v", 3, current.version)
+    assert cache.get("v") == 3
+    assert cache.get_versioned("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_tags(cache):
+    cache.set("p1", 1, expire=60, tags=["product:1", "listing"])
+    await cache.aset("p2", 2, tags=["product:2", "listing"])
+    cache.set("other", 3)
+    await cache.ainvalidate_tags(["product:1"])
+    assert cache.get("p1") is None
+    assert cache.get("p2") == 2
+    cache.invalidate_tags(["listing", "unknown"])
+    assert cache.get("p2") is None
+    assert cache.get("other") == 3
+
+
+@pytest.mark.asyncio
+async def test_tag_sets_expire_with_their_longest_member(cache):
+    tag_set = cache._tag_set("listing")
+    cache.set("short", 1, expire=10, tags=["listing"])
+    assert 0 < cache._sync_client.pttl(tag_set) <= 10_000
+    await cache.aset("long", 2, expire=60, tags=["listing"])
+    assert cache._sync_client.pttl(tag_set) > 10_000
+    cache.set("shorter", 3, expire=5, tags=["listing"])
+    assert cache._sync_client.pttl(tag_set) > 10_000
+    cache.set("forever", 4, tags=["listing"])
+    assert cache._sync_client.pttl(tag_set) == -1
+    cache.set("again", 5, expire=5, tags=["listing"])
+    assert cache._sync_client.pttl(tag_set) == -1
+
+
+@pytest.mark.asyncio
+async def test_prefix(cache):
+    cache.set_many({f"user:{i}": i for i in range(30)})
+    cache.set("user*[x]", 1)
+    cache.set("other", 1)
+    assert cache._acquire_lock("user:0", 60) is not None
+    keys = sorted(set(cache.iter_keys("user:", batch_size=7)))
+    assert keys == sorted(f"user:{i}" for i in range(30))
+    assert [key async for key in cache.aiter_keys("user*")] == ["user*[x]"]
+    assert cache.delete_prefix("user:1") == 11
+    assert await cache.adelete_prefix("user") == 20
+    assert cache.get("other") == 1
@@ -0,0 +1,117 @@
+import asyncio
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+from fastapi import FastAPI
+
+from fast_cache import FastAPICache, RefreshAheadScheduler
+
+TTL = timedelta(milliseconds=400)
+
+
+@pytest.mark.asyncio
+async def test_hot_keys_are_refreshed_before_expiry(memory):
+    cache = FastAPICache()
+    backend = memory()
+    app = FastAPI()
+    cache.init_app(app, backend, refresh_ahead_lead=0.5, metrics=True)
+    calls = []
+
+    @cache.cached(expire=TTL, refresh_ahead=2, tags=["t"])
+    async def compute(x):
+        calls.append(x)
+        return len(calls)
+
+    assert await compute(1) == 1
+    assert await compute(1) == 1
+    assert cache.refresh_ahead_stats()["keys"] == 1
+
+    # Keep reading for three lifetimes: every read is a hit.
+    deadline = time.monotonic() + 1.2
+    while time.monotonic() < deadline:
+        await compute(1)
+        await compute(1)
+        await asyncio.sleep(0.05)
+    assert cache.refresh_ahead_stats()["refreshed"] >= 3
+    assert len(calls) >= 4
+    (function,) = cache.stats()["functions"].values()
+    assert function["misses"] == 1
+
+    # Unread keys drop out and expire.
+    await asyncio.sleep(0.6)
+    assert cache.refresh_ahead_stats()["keys"] == 0
+    assert cache.refresh_ahead_stats()["dropped"] == 1
+    assert await backend.aget(f"{compute.__module__}:compute:(1,):{{}}") is None
+
+    async with cache.lifespan_handler(app):
+        pass
+    assert cache.refresh_ahead_stats() == {}
+
+
+def test_sync_functions_refresh_on_the_pool(memory):
+    cache = FastAPICache()
+    cache.init_app(FastAPI(), memory(), refresh_ahead_lead=0.5)
+    threads = []
+
+    @cache.cached(expire=TTL, refresh_ahead=1)
+    def compute():
+        threads.append(threading.current_thread().name)
+        return len(threads)
+
+    assert compute() == 1
+    time.sleep(0.3)
+    assert compute() == 2
+    assert threads[1].startswith("fast-cache-refresh")
+    cache._refresh_ahead.close()
+
+
+def test_cold_keys_are_not_registered(memory):
+    cache = FastAPICache()
+    cache.init_app(FastAPI(), memory(), refresh_ahead_max_keys=1)
+
+    @cache.cached(expire=60, refresh_ahead=3)
+    def compute(x):
+        return x
+
+    for x in range(5):
+        compute(x)
+        compute(x)
+    assert cache.refresh_ahead_stats()["keys"] == 0
+    assert cache.refresh_ahead_stats()["tracked"] == 1
+    compute(4)
+    compute(3)
+    compute(3)
+    compute(3)
+    assert cache.refresh_ahead_stats()["keys"] == 1
+    cache._refresh_ahead.close()
+
+
+def test_failed_refresh_drops_the_key(memory):
+    backend = memory()
+    scheduler = RefreshAheadScheduler(backend, lead=0.5)
+    done = threading.Event()
+
+    def refresh():
+        done.set()
+        raise RuntimeError("boom")
+
+    assert scheduler.record("k", 1, 60)
+    scheduler.register("k", refresh, 60)
+    assert done.wait(1)
+    for _ in range(50):
+        if scheduler.stats()["failed"]:
+            break
+        time.sleep(0.01)
+    assert scheduler.stats()["failed"] == 1
+    assert scheduler.stats()["keys"] == 0
+    scheduler.close()
+    assert not scheduler.record("k", 1, 60)
+
+
+def test_rejects_invalid_settings(memory):
+    with pytest.raises(ValueError):
+        RefreshAheadScheduler(memory(), lead=1)
+    with pytest.raises(ValueError):
+        RefreshAheadScheduler(memory(), max_concurrency=0)
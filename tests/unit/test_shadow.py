@@ -0,0 +1,86 @@
+import threading
+import time
+
+import pytest
+
+from fast_cache import InMemoryBackend, ShadowBackend
+
+
+class SlowBackend(InMemoryBackend):
+    def __init__(self):
+        super().__init__(namespace="slow", cleanup_interval=None)
+        self.release = threading.Event()
+
+    def get(self, key):
+        self.release.wait(5)
+        return super().get(key)
+
+
+def test_mirrors_and_compares(memory):
+    primary, shadow = memory("primary"), memory("shadow")
+    backend = ShadowBackend(primary, shadow, max_concurrency=1)
+
+    primary.set("cold", 1)  # present only in the primary
+    primary.set("b", 1)
+    shadow.set("b", 2)  # present in both with different values
+    backend.set("a", {"x": 1})
+    assert backend.get("a") == {"x": 1}
+    assert backend.get("cold") == 1
+    assert backend.get("missing") is None
+    assert backend.get("b") == 1
+    backend.get_many(["a", "missing"])
+    backend.close()
+
+    stats = backend.stats()
+    assert stats["lookups"] == 6
+    assert stats["primary_only_hits"] == 1
+    assert stats["shadow_only_hits"] == 0
+    assert stats["value_mismatches"] == 1
+    assert stats["hit_agreement"] == pytest.approx(5 / 6)
+    assert stats["latency"]["get"]["shadow"]["count"] == 4
+    assert set(stats["latency"]) == {"get", "set", "get_many"}
+    assert stats["dropped"] == stats["shadow_errors"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_shadow_does_not_delay_primary(memory):
+    slow = SlowBackend()
+    backend = ShadowBackend(memory("primary"), slow, max_concurrency=1, max_pending=2)
+
+    started = time.perf_counter()
+    for _ in range(5):
+        assert await backend.aget("a") is None
+    assert time.perf_counter() - started < 1
+
+    slow.release.set()
+    await backend.aclose()
+    stats = backend.stats()
+    assert stats["dropped"] == 3
+    assert stats["mirrored"] == 2
+
+
+def test_shadow_errors_are_counted(memory):
+    shadow = memory("shadow")
+
+    def boom(*args, **kwargs):
+        raise ConnectionError("down")
+
+    shadow.set = boom
+    backend = ShadowBackend(memory("primary"), shadow)
+    backend.set("a", 1)
+    assert backend.get("a") == 1
+    backend.close()
+    assert backend.stats()["shadow_errors"] == 1
+
+
+def test_sampling_is_per_key(memory):
+    primary, shadow = memory("primary"), memory("shadow")
+    backend = ShadowBackend(primary, shadow, sample_rate=0.5)
+    for i in range(100):
+        backend.set(f"key-{i}", i)
+    backend.close()
+
+    mirrored = backend.stats()["latency"]["set"]["shadow"]["count"]
+    assert 20 < mirrored < 80
+    with pytest.raises(ValueError):
+        ShadowBackend(primary, shadow, sample_rate=-1)
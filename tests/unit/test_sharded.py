@@ -0,0 +1,92 @@
+import collections
+
+import pytest
+
+from fast_cache import HashRing, InMemoryBackend, MetricsBackend, ShardedBackend
+
+KEYS = [f"key-{i}" for i in range(5000)]
+
+
+def test_ring_spreads_keys_by_weight():
+    ring = HashRing()
+    ring.add("a")
+    ring.add("b")
+    ring.add("c", weight=2)
+    counts = collections.Counter(ring.get(key) for key in KEYS)
+    assert counts["c"] / len(KEYS) == pytest.approx(0.5, abs=0.08)
+    assert counts["a"] / len(KEYS) == pytest.approx(0.25, abs=0.08)
+
+    with pytest.raises(ValueError):
+        ring.add("a")
+    with pytest.raises(LookupError):
+        HashRing().get("key")
+
+
+def test_adding_a_node_moves_few_keys():
+    ring = HashRing()
+    for node in ("a", "b", "c", "d"):
+        ring.add(node)
+    before = {key: ring.get(key) for key in KEYS}
+
+    grown = ring.copy()
+    grown.add("e")
+    moved = [key for key in KEYS if grown.get(key) != before[key]]
+    assert len(moved) / len(KEYS) == pytest.approx(0.2, abs=0.08)
+    assert all(grown.get(key) == "e" for key in moved)
+
+    assert {key: ring.get(key) for key in KEYS} == before
+
+
+def test_operations_route_to_one_shard(memory):
+    shards = {"a": memory("a"), "b": memory("b"), "c": memory("c")}
+    backend = ShardedBackend(shards)
+
+    backend.set_many({key: key for key in KEYS[:300]})
+    assert backend.get_many(KEYS[:300] + ["missing"]) == {
+        key: key for key in KEYS[:300]
+    }
+    for key in KEYS[:300]:
+        owners = [name for name, shard in shards.items() if shard.has(key)]
+        assert owners == [backend._layout[0].get(key)]
+
+    backend.delete(KEYS[0])
+    assert not backend.has(KEYS[0])
+    backend.clear()
+    assert backend.get_many(KEYS[:300]) == {}
+    backend.close()
+
+
+@pytest.mark.asyncio
+async def test_async_operations(memory):
+    backend = ShardedBackend([memory("a"), memory("b")])
+    await backend.aset_many({key: 1 for key in KEYS[:100]})
+    assert len(await backend.aget_many(KEYS[:100])) == 100
+    await backend.aset("x", 2)
+    assert await backend.aget("x") == 2
+    await backend.aclear()
+    assert await backend.ahas("x") is False
+    await backend.aclose()
+
+
+def test_add_and_remove_shards(memory):
+    backend = ShardedBackend({"a": memory("a"), "b": memory("b")})
+    backend.set_many({key: key for key in KEYS[:1000]})
+
+    backend.add_shard("c", memory("c"))
+    hits = backend.get_many(KEYS[:1000])
+    assert len(hits) / 1000 == pytest.approx(2 / 3, abs=0.1)
+
+    removed = backend.remove_shard("c")
+    assert isinstance(removed, InMemoryBackend)
+    assert len(backend.get_many(KEYS[:1000])) == 1000
+
+    with pytest.raises(ValueError):
+        ShardedBackend({"only": memory("only")}).remove_shard("only")
+
+
+def test_metrics_reach_added_shards(memory):
+    backend = ShardedBackend({"a": memory("a")})
+    metrics = MetricsBackend(backend)
+    backend.add_shard("b", memory("b"))
+    assert len(backend.shards["b"]._listeners) == 1
+    assert metrics.get("key") is None
@@ -0,0 +1,78 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from fast_cache import InMemoryBackend, SyncToAsyncBackend
+
+
+class BlockingBackend(InMemoryBackend):
+    """In-memory backend whose async get blocks like a sync client would."""
+
+    blocking_async_ops = frozenset({"aget"})
+
+    def __init__(self):
+        super().__init__(namespace="sync-to-async-test")
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(0.05)
+        return super().get(key)
+
+
+@pytest.fixture
+def backend():
+    backend = BlockingBackend()
+    yield backend
+    backend.close()
+
+
+@pytest.mark.asyncio
+async def test_always_mode_runs_on_dedicated_pool(backend):
+    adapter = SyncToAsyncBackend(backend, max_workers=2)
+    await adapter.aset("foo", "bar")
+    assert await adapter.aget("foo") == "bar"
+    assert backend.threads[0].startswith("fast-cache")
+
+    stats = adapter.stats()
+    assert stats["operations"]["get"]["calls"] == 1
+    assert stats["operations"]["set"]["calls"] == 1
+    adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_auto_mode_only_offloads_blocking_ops(backend):
+    adapter = SyncToAsyncBackend(backend, mode="auto")
+    assert set(adapter.stats()["operations"]) == {"get"}
+    await adapter.aset("foo", "bar")
+    assert await adapter.aget("foo") == "bar"
+    adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_loop_stays_responsive_and_queueing_is_reported(backend):
+    adapter = SyncToAsyncBackend(backend, max_workers=1)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.gather(*(adapter.aget(f"k{i}") for i in range(4)))
+    task.cancel()
+
+    assert ticks > 10
+    get_stats = adapter.stats()["operations"]["get"]
+    assert get_stats["calls"] == 4
+    assert get_stats["queue_time_max"] >= 0.1
+    adapter.close()
+
+
+def test_invalid_mode(backend):
+    with pytest.raises(ValueError):
+        SyncToAsyncBackend(backend, mode="sometimes")
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import FastAPI
+
+from fast_cache import CacheBackend, FastAPICache, HedgedBackend, InMemoryBackend
+from fast_cache.bench.simulate import VirtualClock
+
+
+def test_invalidate_tags_deletes_every_tagged_key(memory):
+    backend = memory()
+    backend.set("p1", 1, tags=["product:1", "listing"])
+    backend.set("p2", 2, tags=["product:2", "listing"])
+    backend.set("other", 3)
+
+    backend.invalidate_tags(["product:1"])
+    assert backend.get("p1") is None
+    assert backend.get("p2") == 2
+
+    backend.invalidate_tags(["listing", "unknown"])
+    assert backend.get("p2") is None
+    assert backend.get("other") == 3
+
+
+def test_rewrites_and_deletes_update_the_index(memory):
+    backend = memory()
+    backend.set("k", 1, tags=["a"])
+    backend.set("k", 2, tags=["b"])
+    backend.invalidate_tags(["a"])
+    assert backend.get("k") == 2
+
+    backend.set("k", 3)
+    backend.invalidate_tags(["b"])
+    assert backend.get("k") == 3
+
+    backend.set("k", 4, tags=["c"])
+    backend.delete("k")
+    backend.set("k", 5)
+    backend.invalidate_tags(["c"])
+    assert backend.get("k") == 5
+    assert not backend._tags and not backend._key_tags
+
+
+@pytest.mark.asyncio
+async def test_expired_keys_leave_the_index(memory):
+    clock = VirtualClock()
+    backend = memory(clock=clock)
+    for key in ("get", "aget", "has", "touch", "versioned", "many"):
+        backend.set(key, 1, expire=1, tags=["t"])
+    clock.now += 2
+
+    assert backend.get("get") is None
+    assert await backend.aget("aget") is None
+    assert not backend.has("has")
+    assert not backend.touch("touch", 60)
+    assert backend.get_versioned("versioned") is None
+    assert backend.get_many(["many"]) == {}
+    assert not backend._tags and not backend._key_tags
+
+
+def test_counters_do_not_inherit_expired_tags(memory):
+    clock = VirtualClock()
+    backend = memory(clock=clock)
+    backend.set("c", 1, expire=1, tags=["u"])
+    clock.now += 2
+
+    assert backend.incr("c") == 1
+    backend.invalidate_tags(["u"])
+    assert backend.get("c") == 1
+
+
+class PlainBackend(InMemoryBackend):
+    """A backend relying on the base-class tag index."""
+
+    invalidate_tags = CacheBackend.invalidate_tags
+    ainvalidate_tags = CacheBackend.ainvalidate_tags
+
+    def set(self, key, value, expire=None, tags=None):
+        super().set(key, value, expire=expire)
+        if tags:
+            self._add_tags(key, tags)
+
+    async def aset(self, key, value, expire=None, tags=None):
+        await super().aset(key, value, expire=expire)
+        if tags:
+            await self._aadd_tags(key, tags)
+
+
+@pytest.mark.asyncio
+async def test_default_index_survives_concurrent_writers():
+    backend = PlainBackend(cleanup_interval=None)
+
+    def write(start):
+        for i in range(start, start + 25):
+            backend.set(f"k{i}", i, tags=["t"])
+
+    threads = [threading.Thread(target=write, args=(n * 25,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    await backend.aset("async", 1, tags=["t", "u"])
+    assert len(backend.get("__tag__:t")) == 101
+
+    await backend.ainvalidate_tags(["t"])
+    assert backend.get_many([f"k{i}" for i in range(100)] + ["async"]) == {}
+    assert backend.get("__tag__:t") == frozenset()
+    backend.invalidate_tags(["u"])
+
+
+def test_hedged_backend_invalidates_every_writer(memory):
+    first, second = memory(namespace="a"), memory(namespace="b")
+    backend = HedgedBackend([first, second], write_to="all")
+    backend.set("k", 1, tags=["t"])
+    assert second.get("k") == 1
+    backend.invalidate_tags(["t"])
+    assert first.get("k") is None and second.get("k") is None
+    backend.close()
+
+
+@pytest.mark.asyncio
+async def test_cached_tags_from_arguments(memory):
+    cache = FastAPICache()
+    backend = memory()
+    cache.init_app(FastAPI(), backend, default_expire=60)
+    calls = []
+
+    @cache.cached(tags=lambda product_id: [f"product:{product_id}"])
+    async def product(product_id):
+        calls.append(product_id)
+        return {"id": product_id}
+
+    @cache.cached(tags=["listing"], lock_timeout=5)
+    def listing():
+        calls.append("listing")
+        return ["p1", "p2"]
+
+    assert await asyncio.gather(product(1), product(2)) == [{"id": 1}, {"id": 2}]
+    assert listing() == listing()
+    assert calls == [1, 2, "listing"]
+
+    await backend.ainvalidate_tags(["product:1", "listing"])
+    assert await product(1) == {"id": 1}
+    assert await product(2) == {"id": 2}
+    assert listing() == ["p1", "p2"]
+    assert calls == [1, 2, "listing", 1, "listing"]
+    backend.close()
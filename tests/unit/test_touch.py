@@ -0,0 +1,80 @@
+import pytest
+from fastapi import FastAPI
+
+from fast_cache import FastAPICache
+from fast_cache.bench.simulate import VirtualClock
+
+
+def test_touch_restarts_expiration(memory):
+    clock = VirtualClock()
+    backend = memory(clock=clock)
+    backend.set("a", 1, expire=10)
+
+    clock.now += 8
+    assert backend.touch("a", 10)
+    clock.now += 8
+    assert backend.get("a") == 1
+    assert backend.get_with_meta("a").ttl == pytest.approx(2)
+
+    assert backend.get_and_touch("a", None) == 1
+    clock.now += 1000
+    assert backend.get("a") == 1
+
+    backend.set("b", 2, expire=1)
+    clock.now += 2
+    assert not backend.touch("b", 10)
+    assert backend.get_and_touch("b", 10) is None
+    assert not backend.touch("missing", 10)
+
+
+@pytest.mark.asyncio
+async def test_async_touch(memory):
+    clock = VirtualClock()
+    backend = memory(clock=clock)
+    await backend.aset("a", {"x": 1}, expire=5)
+    clock.now += 4
+    assert await backend.aget_and_touch("a", 5) == {"x": 1}
+    clock.now += 4
+    assert await backend.atouch("a", 5)
+    assert await backend.aget("a") == {"x": 1}
+    assert not await backend.atouch("missing", 5)
+
+
+def test_default_implementation_rewrites_the_value(plain):
+    clock = VirtualClock()
+    backend = plain("get_and_touch", "touch", clock=clock)
+    backend.set("a", 1, expire=10)
+    clock.now += 8
+    assert backend.touch("a", 10)
+    clock.now += 8
+    assert backend.get("a") == 1
+    assert not backend.touch("missing", 10)
+
+
+@pytest.mark.asyncio
+async def test_cached_sliding_extends_entries_on_hits(memory):
+    clock = VirtualClock()
+    backend = memory(clock=clock)
+    cache = FastAPICache()
+    cache.init_app(FastAPI(), backend)
+    calls = []
+
+    @cache.cached(expire=10, sliding=True)
+    async def session(user):
+        calls.append(user)
+        return {"user": user}
+
+    @cache.cached(expire=10, sliding=True)
+    def session_sync(user):
+        calls.append(user)
+        return {"user": user}
+
+    for _ in range(5):
+        assert await session("a") == {"user": "a"}
+        assert session_sync("b") == {"user": "b"}
+        clock.now += 8
+    assert calls == ["a", "b"]
+
+    clock.now += 11
+    await session("a")
+    assert calls == ["a", "b", "a"]
@@ -0,0 +1,155 @@
+import pickle
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fast_cache import (
+    CacheObserver,
+    FastAPICache,
+    InMemoryBackend,
+    OpenTelemetryObserver,
+    SyncToAsyncBackend,
+    TracingBackend,
+)
+
+
+class PickleBackend(InMemoryBackend):
+    """In-memory backend that stores pickled payloads like remote backends do."""
+
+    def __init__(self):
+        super().__init__(namespace="tracing-test")
+        self.fail = False
+
+    def get(self, key):
+        if self.fail:
+            self._report_error("get", ConnectionError("down"))
+            return None
+        data = super().get(key)
+        return self._loads(data) if data is not None else None
+
+    async def aget(self, key):
+        return self.get(key)
+
+    def set(self, key, value, expire=None):
+        super().set(key, self._dumps(value), expire=expire)
+
+    async def aset(self, key, value, expire=None):
+        self.set(key, value, expire=expire)
+
+
+class Recorder(CacheObserver):
+    def __init__(self):
+        self.started = []
+        self.events = []
+
+    def before_op(self, event):
+        self.started.append(event.op)
+
+    def after_op(self, event):
+        self.events.append(event)
+
+
+def test_backend_events_report_size_and_timings():
+    recorder = Recorder()
+    backend = TracingBackend(PickleBackend(), [recorder])
+
+    backend.set("a", {"x": 1})
+    assert backend.get("a") == {"x": 1}
+    assert backend.get("missing") is None
+
+    assert recorder.started == ["set", "get", "get"]
+    set_event, hit, miss = recorder.events
+    size = len(pickle.dumps({"x": 1}))
+    assert set_event.value_size == size
+    assert set_event.hit is None
+    assert (hit.hit, hit.value_size, hit.key) == (True, size, "a")
+    assert miss.hit is False
+    assert hit.backend == "pickle"
+    assert hit.namespace == "tracing-test"
+    assert hit.serialization_time > 0
+    assert hit.network_time + hit.serialization_time == pytest.approx(hit.duration)
+
+
+def test_swallowed_and_raised_errors_are_attached():
+    recorder = Recorder()
+    inner = PickleBackend()
+    backend = TracingBackend(inner, [recorder])
+
+    inner.fail = True
+    assert backend.get("a") is None
+    assert isinstance(recorder.events[-1].error, ConnectionError)
+
+    def boom():
+        raise RuntimeError("boom")
+
+    inner.clear = boom
+    with pytest.raises(RuntimeError):
+        backend.clear()
+    assert isinstance(recorder.events[-1].error, RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_context_follows_thread_pool_offload():
+    recorder = Recorder()
+    backend = TracingBackend(SyncToAsyncBackend(PickleBackend()), [recorder])
+
+    await backend.aset("a", "value")
+    assert await backend.aget("a") == "value"
+
+    assert recorder.events[-1].value_size == len(pickle.dumps("value"))
+    await backend.aclose()
+
+
+def test_decorator_event_attributes_compute_and_backend_time():
+    recorder = Recorder()
+    app = FastAPI()
+    cache = FastAPICache()
+    cache.init_app(app, PickleBackend(), default_expire=60, observers=[recorder])
+
+    @app.get("/items/{item_id}")
+    @cache.cached(namespace="items")
+    async def item(item_id: int):
+        return {"id": item_id}
+
+    with TestClient(app) as client:
+        client.get("/items/1")
+        client.get("/items/1")
+
+    cached = [event for event in recorder.events if event.op == "cached"]
+    assert [event.hit for event in cached] == [False, True]
+    miss, hit = cached
+    assert miss.function.endswith("item")
+    assert miss.namespace == "items"
+    assert miss.compute_time > 0
+    assert miss.value_size > 0
+    assert hit.compute_time == 0
+    assert hit.value_size == miss.value_size
+
+    children = [event for event in recorder.events if event.parent is hit]
+    assert [event.op for event in children] == ["get"]
+
+
+@pytest.mark.asyncio
+async def test_compute_locks_are_traced():
+    recorder = Recorder()
+    backend = TracingBackend(PickleBackend(), [recorder])
+    assert await backend.aget_or_set("k", lambda: 1) == 1
+    ops = [event.op for event in recorder.events]
+    assert ops == ["get", "lock", "get", "set", "unlock"]
+    assert recorder.events[1].key == "k"
+
+
+def test_no_wrapping_without_observers():
+    cache = FastAPICache()
+    backend = PickleBackend()
+    cache.init_app(FastAPI(), backend)
+    assert cache.get_cache() is backend
+    assert backend._listeners == ()
+
+
+def test_opentelemetry_observer_runs():
+    pytest.importorskip("opentelemetry")
+    backend = TracingBackend(PickleBackend(), [OpenTelemetryObserver()])
+    backend.set("a", 1)
+    assert backend.get("a") == 1
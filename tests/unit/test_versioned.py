@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+from fast_cache import HedgedBackend
+from fast_cache.bench.simulate import VirtualClock
+
+
+def test_set_if_version_rejects_stale_versions(memory):
+    backend = memory()
+    assert backend.set_if_version("k", 1, None)
+    assert not backend.set_if_version("k", 2, None)
+
+    first = backend.get_versioned("k")
+    assert first.value == 1
+    assert backend.set_if_version("k", 2, first.version)
+    assert not backend.set_if_version("k", 3, first.version)
+    assert backend.get("k") == 2
+
+    # Any write, even of the same value, takes a new version.
+    current = backend.get_versioned("k")
+    backend.set("k", 2)
+    assert not backend.set_if_version("k", 3, current.version)
+    assert backend.get_versioned("missing") is None
+
+
+def test_touch_keeps_the_version_and_expiry_frees_the_key(memory):
+    clock = VirtualClock()
+    backend = memory(clock=clock)
+    backend.set("k", "v", expire=10)
+    entry = backend.get_versioned("k")
+    assert backend.touch("k", 10)
+    assert backend.get_versioned("k") == entry
+
+    clock.now += 11
+    assert backend.get_versioned("k") is None
+    assert not backend.set_if_version("k", "new", entry.version)
+    assert backend.set_if_version("k", "new", None, expire=5)
+    clock.now += 6
+    assert backend.get("k") is None
+
+
+def test_concurrent_read_modify_write_loses_no_updates(memory):
+    backend = memory()
+    backend.set("n", 0)
+
+    def add_one():
+        for _ in range(50):
+            while True:
+                entry = backend.get_versioned("n")
+                if backend.set_if_version("n", entry.value + 1, entry.version):
+                    break
+
+    threads = [threading.Thread(target=add_one) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert backend.get("n") == 200
+
+
+@pytest.mark.asyncio
+async def test_default_implementation_versions_by_value(plain):
+    backend = plain(
+        "get_versioned", "aget_versioned", "set_if_version", "aset_if_version"
+    )
+    assert await backend.aset_if_version("k", {"a": 1}, None)
+    entry = await backend.aget_versioned("k")
+    assert entry == backend.get_versioned("k")
+    assert backend.set_if_version("k", {"a": 2}, entry.version)
+    assert not await backend.aset_if_version("k", {"a": 3}, entry.version)
+    assert backend.get("k") == {"a": 2}
+
+
+def test_hedged_backend_versions_on_the_first_backend(memory):
+    first, second = memory(namespace="a"), memory(namespace="b")
+    backend = HedgedBackend([first, second], write_to="all")
+    backend.set("k", 1)
+    entry = backend.get_versioned("k")
+    assert entry == first.get_versioned("k")
+    assert backend.set_if_version("k", 2, entry.version)
+    assert second.get("k") == 2
+    assert not backend.set_if_version("k", 3, entry.version)
+    assert second.get("k") == 2
+    backend.close()
@@ -0,0 +1,120 @@
+import inspect
+import io
+
+import pytest
+
+from fast_cache import (
+    CircuitBreakerBackend,
+    HedgedBackend,
+    InMemoryBackend,
+    MetricsBackend,
+    RecordingBackend,
+    ShadowBackend,
+    ShardedBackend,
+    SyncToAsyncBackend,
+    TracingBackend,
+)
+
+
+async def collect(keys):
+    return [key async for key in keys]
+
+
+# Method name -> a call through a wrapper that must reach it on the inner backend.
+CALLS = {
+    "get_with_meta": lambda backend: backend.get_with_meta("k"),
+    "aget_with_meta": lambda backend: backend.aget_with_meta("k"),
+    "get_and_touch": lambda backend: backend.get_and_touch("k", 60),
+    "aget_and_touch": lambda backend: backend.aget_and_touch("k", 60),
+    "touch": lambda backend: backend.touch("k", 60),
+    "atouch": lambda backend: backend.atouch("k", 60),
+    "incr": lambda backend: backend.incr("n", 2),
+    "aincr": lambda backend: backend.adecr("n"),
+    "get_versioned": lambda backend: backend.get_versioned("k"),
+    "aget_versioned": lambda backend: backend.aget_versioned("k"),
+    "set_if_version": lambda backend: backend.set_if_version("k", 2, None),
+    "aset_if_version": lambda backend: backend.aset_if_version("k", 2, None),
+    "invalidate_tags": lambda backend: backend.invalidate_tags(["t"]),
+    "ainvalidate_tags": lambda backend: backend.ainvalidate_tags(["t"]),
+    "iter_keys": lambda backend: list(backend.iter_keys("k")),
+    "aiter_keys": lambda backend: collect(backend.aiter_keys("k")),
+    "delete_prefix": lambda backend: backend.delete_prefix("k"),
+    "adelete_prefix": lambda backend: backend.adelete_prefix("k"),
+    "_acquire_lock": lambda backend: backend.get_or_set("new", lambda: 1),
+    "_release_lock": lambda backend: backend.get_or_set("new", lambda: 1),
+    "_aacquire_lock": lambda backend: backend.aget_or_set("new", lambda: 1),
+    "_arelease_lock": lambda backend: backend.aget_or_set("new", lambda: 1),
+    "set(cost)": lambda backend: backend.set("k", 1, cost=0.5),
+    "aset(cost)": lambda backend: backend.aset("k", 1, cost=0.5),
+}
+
+WRAPPERS = {
+    "metrics": lambda inner: MetricsBackend(inner[0]),
+    "tracing": lambda inner: TracingBackend(inner[0], []),
+    "recording": lambda inner: RecordingBackend(inner[0], io.StringIO()),
+    "shadow": lambda inner: ShadowBackend(
+        inner[0], InMemoryBackend("shadow", cleanup_interval=None)
+    ),
+    "circuit_breaker": lambda inner: CircuitBreakerBackend(inner[0]),
+    "hedged": lambda inner: HedgedBackend(inner),
+    "sharded": lambda inner: ShardedBackend(inner),
+    "sync_to_async": lambda inner: SyncToAsyncBackend(inner[0]),
+    "stacked": lambda inner: SyncToAsyncBackend(
+        MetricsBackend(CircuitBreakerBackend(ShardedBackend(inner)))
+    ),
+}
+
+# Calls a wrapper deliberately serves with other methods: hedged reads are
+# followed by a touch of every write backend.
+SERVED_BY = {
+    ("hedged", "get_and_touch"): "touch",
+    ("hedged", "aget_and_touch"): "atouch",
+}
+
+
+class SpyBackend(InMemoryBackend):
+    """In-memory backend logging which of the forwarded methods it serves."""
+
+    def __init__(self, namespace):
+        super().__init__(namespace, cleanup_interval=None)
+        self.calls = []
+
+    def __getattribute__(self, name):
+        if name in CALLS:
+            object.__getattribute__(self, "calls").append(name)
+        return super().__getattribute__(name)
+
+    def set(self, key, value, expire=None, tags=None, cost=None):
+        if cost is not None:
+            self.calls.append("set(cost)")
+        super().set(key, value, expire, tags=tags, cost=cost)
+
+    async def aset(self, key, value, expire=None, tags=None, cost=None):
+        if cost is not None:
+            self.calls.append("aset(cost)")
+        await super().aset(key, value, expire, tags=tags, cost=cost)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("wrapper", list(WRAPPERS))
+@pytest.mark.parametrize("method", list(CALLS))
+async def test_wrappers_forward(wrapper, method):
+    inner = [SpyBackend("a"), SpyBackend("b")]
+    for spy in inner:
+        spy.set("k", 1, expire=60, tags=["t"])
+        spy.calls.clear()
+    backend = WRAPPERS[wrapper](inner)
+
+    result = CALLS[method](backend)
+    if inspect.isawaitable(result):
+        await result
+    backend.close()
+
+    method = SERVED_BY.get((wrapper, method), method)
+    # Offloading wrappers serve async calls with the sync method.
+    if method.startswith("_a"):
+        sync_method = "_" + method[2:]
+    else:
+        sync_method = method[1:] if method.startswith("a") else method
+    calls = {name for spy in inner for name in spy.calls}
+    assert method in calls or sync_method in calls
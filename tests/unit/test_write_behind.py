@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+
+from fast_cache import FastAPICache, InMemoryBackend, WriteBehindQueue
+
+
+class RecordingBackend(InMemoryBackend):
+    def __init__(self):
+        super().__init__(namespace="write-behind-test")
+        self.batches = []
+
+    async def aset_many(self, items, expire=None):
+        self.batches.append((dict(items), expire))
+        await super().aset_many(items, expire=expire)
+
+
+@pytest.fixture
+def backend():
+    backend = RecordingBackend()
+    yield backend
+    backend.close()
+
+
+@pytest.mark.asyncio
+async def test_decorator_defers_write(backend):
+    app = FastAPI()
+    cache = FastAPICache()
+    cache.init_app(app, backend, default_expire=60)
+
+    @cache.cached(write_behind=True)
+    async def compute(x):
+        return x * 2
+
+    assert await compute(2) == 4
+    assert backend.batches == []
+
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert len(backend.batches) == 1
+    assert await compute(2) == 4
+    assert cache.write_behind_stats()["written"] == 1
+
+    async with cache.lifespan_handler(app):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_writes_are_batched_by_expire(backend):
+    queue = WriteBehindQueue(backend, batch_size=10)
+    for i in range(5):
+        queue.enqueue(f"k{i}", i, expire=30)
+    queue.enqueue("other", 1, expire=60)
+    await queue.aclose()
+
+    assert backend.batches == [
+        ({f"k{i}": i for i in range(5)}, 30),
+        ({"other": 1}, 60),
+    ]
+    stats = queue.stats()
+    assert stats["depth"] == 0
+    assert stats["written"] == 6
+
+
+@pytest.mark.asyncio
+async def test_overflow_policies(backend):
+    newest = WriteBehindQueue(backend, max_size=2, overflow="drop_newest")
+    assert newest.enqueue("a", 1)
+    assert newest.enqueue("b", 2)
+    assert not newest.enqueue("c", 3)
+    await newest.aclose()
+    assert backend.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+
+    oldest = WriteBehindQueue(backend, max_size=2, overflow="drop_oldest")
+    for key, value in (("x", 1), ("y", 2), ("z", 3)):
+        oldest.enqueue(key, value)
+    await oldest.aclose()
+    assert backend.get_many(["x", "y", "z"]) == {"y": 2, "z": 3}
+    assert oldest.stats()["dropped"] == 1
+
+
+def test_invalid_overflow_policy(backend):
+    with pytest.raises(ValueError):
+        WriteBehindQueue(backend, overflow="block")